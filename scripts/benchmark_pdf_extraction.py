@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+Benchmark serial vs process-pool PDF text extraction (core/pdf.py).
+
+Extracts every page with 1 worker (in-process, the previous behaviour) and
+with each requested worker count, and checks that the page texts are
+identical and in the same order.
+
+Usage:
+    python scripts/benchmark_pdf_extraction.py                      # synthetic 1,500-page PDF
+    python scripts/benchmark_pdf_extraction.py --pages 300 --workers 2 4
+    python scripts/benchmark_pdf_extraction.py --pdf production.pdf # a real bundle
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from evidence_toolkit.core.pdf import PAGES_PER_TASK, iter_page_texts  # noqa: E402
+
+LINE = "The witness statement dated {n} records the grievance hearing and the outcome of appeal {i}."
+
+
+def build_pdf(path: Path, page_count: int, lines_per_page: int = 45) -> Path:
+    """Write a text-layer PDF with ``page_count`` dense pages (Helvetica, no dependencies)."""
+    page_ids = [4 + 2 * i for i in range(page_count)]
+    objects = {
+        1: "<< /Type /Catalog /Pages 2 0 R >>",
+        2: f"<< /Type /Pages /Kids [{' '.join(f'{i} 0 R' for i in page_ids)}] /Count {page_count} >>",
+        3: "<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>",
+    }
+    for n, page_id in enumerate(page_ids, 1):
+        lines = " ".join(f"({LINE.format(n=n, i=i)}) '" for i in range(lines_per_page))
+        stream = f"BT /F1 9 Tf 11 TL 40 760 Td {lines} ET"
+        objects[page_id] = ("<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] "
+                            f"/Resources << /Font << /F1 3 0 R >> >> /Contents {page_id + 1} 0 R >>")
+        objects[page_id + 1] = f"<< /Length {len(stream)} >>\nstream\n{stream}\nendstream"
+
+    output = bytearray(b"%PDF-1.4\n")
+    offsets = {}
+    for object_id in sorted(objects):
+        offsets[object_id] = len(output)
+        output += f"{object_id} 0 obj\n{objects[object_id]}\nendobj\n".encode("latin-1")
+    xref = len(output)
+    output += f"xref\n0 {len(objects) + 1}\n0000000000 65535 f \n".encode("latin-1")
+    output += "".join(f"{offsets[i]:010d} 00000 n \n" for i in sorted(objects)).encode("latin-1")
+    output += f"trailer\n<< /Size {len(objects) + 1} /Root 1 0 R >>\nstartxref\n{xref}\n%%EOF\n".encode("latin-1")
+    path.write_bytes(bytes(output))
+    return path
+
+
+def time_run(pdf_path: Path, workers: int, pages_per_task: int):
+    start = time.perf_counter()
+    texts = list(iter_page_texts(pdf_path, workers=workers, pages_per_task=pages_per_task))
+    return time.perf_counter() - start, texts
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark parallel PDF text extraction")
+    parser.add_argument("--pdf", type=Path, help="PDF to extract (default: generate one)")
+    parser.add_argument("--pages", type=int, default=1500, help="Pages in the generated PDF")
+    parser.add_argument("--workers", nargs="+", type=int,
+                        default=sorted({2, 4, os.cpu_count() or 1} - {1}), help="Worker counts to compare")
+    parser.add_argument("--pages-per-task", type=int, default=PAGES_PER_TASK)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        pdf_path = args.pdf or build_pdf(Path(tmp) / "bundle.pdf", args.pages)
+        print(f"📄 {pdf_path.name}: {pdf_path.stat().st_size / 1024 / 1024:.1f} MB, "
+              f"{os.cpu_count()} CPUs")
+
+        baseline, reference = time_run(pdf_path, 1, args.pages_per_task)
+        print(f"   {'1 worker (serial)':<20} {baseline:8.2f}s  ({len(reference) / baseline:6.1f} pages/s)")
+
+        for workers in args.workers:
+            elapsed, texts = time_run(pdf_path, workers, args.pages_per_task)
+            identical = texts == reference
+            print(f"   {f'{workers} workers':<20} {elapsed:8.2f}s  ({len(texts) / elapsed:6.1f} pages/s)  "
+                  f"x{baseline / elapsed:.2f}  {'✅' if identical else '❌ output differs'}")
+            if not identical:
+                sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+Benchmark the word-frequency tokenizers on synthetic disclosure corpora.
+
+Compares DocumentAnalyzer.generate_word_frequency with:
+- tokenizer="nltk": clean_text (six re.sub passes) + nltk.word_tokenize + filter loop
+- tokenizer="fast": single-pass regex (analyzers/tokenizer.py), Counter backend
+- tokenizer="fast", counting_backend="numpy": np.unique counting
+
+and checks that all three produce identical output (same counts, same order).
+
+Usage:
+    python scripts/benchmark_tokenizer.py                 # 10 MB and 100 MB
+    python scripts/benchmark_tokenizer.py --sizes 1 10    # sizes in MB
+    python scripts/benchmark_tokenizer.py --skip-nltk     # fast paths only (no NLTK punkt data needed)
+"""
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from evidence_toolkit.analyzers.document import DocumentAnalyzer  # noqa: E402
+
+# Workplace-investigation flavoured vocabulary with the things clean_text strips
+VOCABULARY = (
+    "the meeting was held on to discuss safety concerns raised by employee regarding "
+    "building management failed respond grievance procedure disciplinary hearing manager "
+    "investigation witness statement allegation harassment retaliation policy breach "
+    "contract termination notice appeal outcome HR department confidential cannot gonna "
+    "wanna gotta lemme gimme Sarah Johnson John Smith Acme Ltd compliance deadline"
+).split()
+NOISE = [
+    "john.smith@acme.co.uk", "hr-team@example.org", "12/05/2023", "1-2-99", "14:30",
+    "09:15:00", "01234 567890", "07700900123", "£4,500", "(see para. 12)", "—", "Re:", "café",
+]
+
+
+def build_corpus(size_mb: float, seed: int = 42) -> str:
+    """Generate roughly ``size_mb`` megabytes of synthetic document text."""
+    rng = random.Random(seed)
+    target = int(size_mb * 1024 * 1024)
+    parts, length = [], 0
+    while length < target:
+        words = [rng.choice(VOCABULARY) for _ in range(rng.randint(8, 20))]
+        if rng.random() < 0.3:
+            words.insert(rng.randrange(len(words)), rng.choice(NOISE))
+        sentence = " ".join(words).capitalize() + rng.choice([". ", ".\n", "? ", ".\n\n"])
+        parts.append(sentence)
+        length += len(sentence)
+    return "".join(parts)
+
+
+def time_run(analyzer: DocumentAnalyzer, text: str):
+    start = time.perf_counter()
+    result = analyzer.generate_word_frequency(text)
+    return time.perf_counter() - start, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark word-frequency tokenizers")
+    parser.add_argument("--sizes", nargs="+", type=float, default=[10, 100], help="Corpus sizes in MB")
+    parser.add_argument("--skip-nltk", action="store_true", help="Skip the (slow) NLTK baseline")
+    args = parser.parse_args()
+
+    variants = [("fast (Counter)", dict(tokenizer="fast")),
+                ("fast (numpy)", dict(tokenizer="fast", counting_backend="numpy"))]
+    if not args.skip_nltk:
+        variants.insert(0, ("nltk (current)", dict(tokenizer="nltk")))
+
+    for size_mb in args.sizes:
+        text = build_corpus(size_mb)
+        print(f"\n📄 Corpus: {len(text) / 1024 / 1024:.1f} MB")
+
+        results = {}
+        for name, options in variants:
+            analyzer = DocumentAnalyzer(verbose=False, **options)
+            elapsed, results[name] = time_run(analyzer, text)
+            print(f"   {name:<16} {elapsed:8.2f}s  ({len(text) / 1024 / 1024 / elapsed:6.1f} MB/s)")
+
+        reference = next(iter(results.values()))
+        identical = all(list(r.items()) == list(reference.items()) for r in results.values())
+        print(f"   {'✅' if identical else '❌'} Outputs identical: {identical}")
+        if not identical:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
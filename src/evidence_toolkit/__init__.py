@@ -53,29 +53,49 @@ Reports Generated (v4.0):
 __version__ = "4.0.0"
 __author__ = "Evidence Toolkit Contributors"
 
-# Core exports
-from .core import (
-    EvidenceType,
-    EvidenceStorage,
-    UnifiedAnalysis,
-    CorrelationAnalysis,
-)
-
-# Pipeline exports
-from .pipeline import (
-    ingest_evidence,
-    analyze_evidence,
-    PackageGenerator,
-    SummaryGenerator,
-)
-
-# Analyzer exports
-from .analyzers import (
-    DocumentAnalyzer,
-    ImageAnalyzer,
-    EmailAnalyzer,
-    CorrelationAnalyzer,
-)
+import importlib
+from typing import TYPE_CHECKING
+
+# Exports are resolved on first access (PEP 562): `import evidence_toolkit`
+# and CLI startup don't load the analyzers' heavy dependencies
+_LAZY_IMPORTS = {
+    # Core
+    "EvidenceType": "evidence_toolkit.core",
+    "EvidenceStorage": "evidence_toolkit.core",
+    "UnifiedAnalysis": "evidence_toolkit.core",
+    "CorrelationAnalysis": "evidence_toolkit.core",
+
+    # Pipeline
+    "ingest_evidence": "evidence_toolkit.pipeline",
+    "analyze_evidence": "evidence_toolkit.pipeline",
+    "PackageGenerator": "evidence_toolkit.pipeline",
+    "SummaryGenerator": "evidence_toolkit.pipeline",
+
+    # Analyzers
+    "DocumentAnalyzer": "evidence_toolkit.analyzers",
+    "ImageAnalyzer": "evidence_toolkit.analyzers",
+    "EmailAnalyzer": "evidence_toolkit.analyzers",
+    "CorrelationAnalyzer": "evidence_toolkit.analyzers",
+}
+
+if TYPE_CHECKING:
+    from .core import EvidenceType, EvidenceStorage, UnifiedAnalysis, CorrelationAnalysis
+    from .pipeline import ingest_evidence, analyze_evidence, PackageGenerator, SummaryGenerator
+    from .analyzers import DocumentAnalyzer, ImageAnalyzer, EmailAnalyzer, CorrelationAnalyzer
+
+
+def __getattr__(name):
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value  # Cache - later lookups skip __getattr__
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
+
 
 __all__ = [
     # Version
@@ -19,21 +19,57 @@ All analyzers use the OpenAI Responses API for deterministic, legally-admissible
 AI analysis suitable for legal evidence processing.
 """
 
-from evidence_toolkit.analyzers.document import (
-    DocumentAnalyzer,
-    analyze_documents,
-    analyze_text_content,
-    create_schema_compliant_document_analysis,
-    ensure_nltk_data,
-)
+import importlib
+from typing import TYPE_CHECKING
+
+# Analyzers pull in matplotlib, wordcloud, nltk and openai - resolve exports
+# on first access (PEP 562) so importing the package stays cheap
+_LAZY_IMPORTS = {
+    # Document Analysis
+    "DocumentAnalyzer": "evidence_toolkit.analyzers.document",
+    "analyze_documents": "evidence_toolkit.analyzers.document",
+    "analyze_text_content": "evidence_toolkit.analyzers.document",
+    "create_schema_compliant_document_analysis": "evidence_toolkit.analyzers.document",
+    "ensure_nltk_data": "evidence_toolkit.analyzers.document",
+    "count_words": "evidence_toolkit.analyzers.tokenizer",
+
+    # Image Analysis
+    "ImageAnalyzer": "evidence_toolkit.analyzers.image",
+
+    # Email Analysis
+    "EmailAnalyzer": "evidence_toolkit.analyzers.email",
+    "EmailParser": "evidence_toolkit.analyzers.email_parser",
+
+    # Correlation Analysis
+    "CorrelationAnalyzer": "evidence_toolkit.analyzers.correlation",
+}
+
+if TYPE_CHECKING:
+    from evidence_toolkit.analyzers.document import (
+        DocumentAnalyzer,
+        analyze_documents,
+        analyze_text_content,
+        create_schema_compliant_document_analysis,
+        ensure_nltk_data,
+    )
+    from evidence_toolkit.analyzers.tokenizer import count_words
+    from evidence_toolkit.analyzers.image import ImageAnalyzer
+    from evidence_toolkit.analyzers.email import EmailAnalyzer
+    from evidence_toolkit.analyzers.email_parser import EmailParser
+    from evidence_toolkit.analyzers.correlation import CorrelationAnalyzer
 
-from evidence_toolkit.analyzers.image import ImageAnalyzer
 
-from evidence_toolkit.analyzers.email import EmailAnalyzer
+def __getattr__(name):
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value  # Cache - later lookups skip __getattr__
+    return value
 
-from evidence_toolkit.analyzers.email_parser import EmailParser
 
-from evidence_toolkit.analyzers.correlation import CorrelationAnalyzer
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
 
 
 __all__ = [
@@ -43,6 +79,7 @@ __all__ = [
     "analyze_text_content",
     "create_schema_compliant_document_analysis",
     "ensure_nltk_data",
+    "count_words",
 
     # Image Analysis
     "ImageAnalyzer",
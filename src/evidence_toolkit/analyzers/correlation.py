@@ -52,6 +52,7 @@ Usage:
         print(f"- {entity.entity_name} ({entity.occurrence_count} occurrences)")
 """
 
+import importlib.util
 import json
 import re
 import unicodedata
@@ -73,14 +74,10 @@ from evidence_toolkit.core.models import (
     Contradiction,
     CorroborationLink,
 )
-from evidence_toolkit.core.utils import read_json_safe, call_openai_structured, get_evidence_base_dir
+from evidence_toolkit.core.utils import read_json_safe, call_openai_structured, get_evidence_base_dir, shared_analysis_id
 
-# OpenAI Responses API for pattern detection (v3.1)
-try:
-    from openai import OpenAI
-    OPENAI_AVAILABLE = True
-except ImportError:
-    OPENAI_AVAILABLE = False
+# OpenAI Responses API for pattern detection (v3.1) - checked without importing
+OPENAI_AVAILABLE = importlib.util.find_spec("openai") is not None
 
 
 def canonicalize_entity_name(name: str) -> Tuple[str, str, str]:
@@ -301,6 +298,20 @@ class CorrelationAnalyzer:
                     'analysis': analysis
                 })
 
+        # Near-duplicates and thread members share one AI result: its entities
+        # are counted for one item only (the canonical evidence, or the first
+        # member of the thread part)
+        def owner_first(item: Dict[str, Any]):
+            source = shared_analysis_id(item['sha256'], item['analysis'])
+            position = (item['analysis'].get('email_metadata') or {}).get('thread_position')
+            return (source != item['sha256'], position if position is not None else 0, item['sha256'])
+
+        counted = set()
+        for item in sorted(evidence_items, key=owner_first):
+            source = shared_analysis_id(item['sha256'], item['analysis'])
+            item['shared_analysis'] = source in counted
+            counted.add(source)
+
         return evidence_items
 
     def _extract_entities_from_evidence(self, evidence_items: List[Dict[str, Any]]) -> Dict[str, List[Dict[str, Any]]]:
@@ -315,6 +326,8 @@ class CorrelationAnalyzer:
         all_entities = defaultdict(list)
 
         for item in evidence_items:
+            if item.get('shared_analysis'):
+                continue  # Entities already counted for the evidence that was analyzed
             analysis = item['analysis']
             sha256 = item['sha256']
             evidence_type = analysis.get('evidence_type')
@@ -569,17 +582,22 @@ class CorrelationAnalyzer:
             except (ValueError, KeyError):
                 pass
 
-            # Add analysis timestamp
+            # A near-duplicate adds its own file and header dates only: the AI-derived
+            # events belong to the evidence analyzed
+            near_duplicate = bool(analysis.get('duplicate_of'))
+
+            # Add analysis timestamp (none for a near-duplicate: no analysis was performed)
             try:
-                analysis_time = datetime.fromisoformat(analysis['analysis_timestamp'])
-                timeline_events.append(TimelineEvent(
-                    timestamp=analysis_time,
-                    evidence_sha256=sha256,
-                    evidence_type=evidence_type,
-                    event_type='analysis_performed',
-                    description=f"AI analysis completed for {evidence_type} evidence",
-                    confidence=1.0
-                ))
+                if not near_duplicate:
+                    analysis_time = datetime.fromisoformat(analysis['analysis_timestamp'])
+                    timeline_events.append(TimelineEvent(
+                        timestamp=analysis_time,
+                        evidence_sha256=sha256,
+                        evidence_type=evidence_type,
+                        event_type='analysis_performed',
+                        description=f"AI analysis completed for {evidence_type} evidence",
+                        confidence=1.0
+                    ))
             except (ValueError, KeyError):
                 pass
 
@@ -618,7 +636,11 @@ class CorrelationAnalyzer:
                         pass  # Malformed date
 
                 # v3.2 FIX: Extract escalation events as separate timeline entries
-                escalation_events = email_analysis.get('escalation_events', [])
+                escalation_events = [] if near_duplicate else email_analysis.get('escalation_events', [])
+                # Members of a thread share its analysis: each takes only the events at its own position
+                thread_position = email_metadata.get('thread_position')
+                if thread_position is not None:
+                    escalation_events = [e for e in escalation_events if e.get('email_position') == thread_position]
                 for esc_event in escalation_events:
                     # escalation_events have: timestamp, trigger, participants, severity
                     try:
@@ -677,7 +699,7 @@ class CorrelationAnalyzer:
                         pass  # Invalid EXIF
 
             # Extract dates mentioned in document content
-            if evidence_type == 'document' and analysis.get('document_analysis'):
+            if evidence_type == 'document' and analysis.get('document_analysis') and not near_duplicate:
                 doc_analysis = analysis['document_analysis']
 
                 # Extract document-level AI classification
@@ -1101,7 +1123,8 @@ Return structured JSON with entity groups."""
                 "",  # No system prompt needed, instructions in user prompt
                 prompt,
                 BatchEntityResolution,
-                verbose=self.verbose
+                verbose=self.verbose,
+                stage="entity_resolution"
             )
 
             if self.verbose:
@@ -1210,7 +1233,8 @@ Return structured JSON with entity groups."""
                 pattern_prompt,
                 context,
                 LegalPatternAnalysis,
-                verbose=self.verbose
+                verbose=self.verbose,
+                stage="legal_patterns"
             )
 
             if self.verbose:
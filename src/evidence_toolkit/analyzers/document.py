@@ -13,34 +13,43 @@ import re
 import time
 import json
 import hashlib
+import importlib.util
+import itertools
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from contextvars import copy_context
 from pathlib import Path
 from collections import Counter
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional, Tuple, Union
-import matplotlib
-matplotlib.use('Agg')  # Use non-interactive backend for production
-import matplotlib.pyplot as plt
-from wordcloud import WordCloud
-import nltk
-from nltk.corpus import stopwords
-from nltk.tokenize import word_tokenize
+from typing import TYPE_CHECKING, Any, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+# matplotlib, wordcloud, nltk and openai are imported on first use so that
+# importing the toolkit (and CLI startup) stays fast
+
+if TYPE_CHECKING:
+    from wordcloud import WordCloud
 
 # OpenAI Responses API integration (NOT chat completions)
-try:
-    from openai import OpenAI
-    OPENAI_AVAILABLE = True
-except ImportError:
-    OPENAI_AVAILABLE = False
+OPENAI_AVAILABLE = importlib.util.find_spec("openai") is not None
 
 # Import our structured analysis models from unified core
 try:
-    from evidence_toolkit.core.models import DocumentAnalysis, DocumentEntity
+    from evidence_toolkit.core.models import DocumentAnalysis, DocumentChunk, DocumentChunkResult, DocumentEntity
     AI_MODELS_AVAILABLE = True
 except ImportError:
     AI_MODELS_AVAILABLE = False
 
 # Import utility functions for deduplication (v3.3+)
 from evidence_toolkit.core.utils import call_openai_structured, ensure_directory
+from evidence_toolkit.core.routing import ModelRouter
+from evidence_toolkit.core import pdf as pdf_pages
+from evidence_toolkit.analyzers.tokenizer import count_words
+from evidence_toolkit.core.chunking import (
+    DEFAULT_CHUNK_TOKENS,
+    PAGE_BREAK,
+    estimate_tokens,
+    iter_chunks,
+    merge_chunk_analyses,
+)
 
 # Import validation for schema-compliant output
 # TODO: Check if validation module exists in new structure
@@ -52,8 +61,17 @@ VALIDATION_AVAILABLE = False
 #     VALIDATION_AVAILABLE = False
 
 
+_nltk_data_checked = False
+
+
 def ensure_nltk_data():
-    """Download required NLTK data if not present"""
+    """Download required NLTK data if not present (checked once per process)"""
+    global _nltk_data_checked
+    if _nltk_data_checked:
+        return
+
+    import nltk
+
     try:
         nltk.data.find('tokenizers/punkt')
     except LookupError:
@@ -64,15 +82,36 @@ def ensure_nltk_data():
     except LookupError:
         nltk.download('stopwords', quiet=True)
 
+    _nltk_data_checked = True
+
+
+def _pyplot():
+    """matplotlib.pyplot with the non-interactive backend (imported on first use)."""
+    import matplotlib
+    matplotlib.use('Agg')  # Use non-interactive backend for production
+    import matplotlib.pyplot as plt
+    return plt
 
-# Initialize NLTK data
-ensure_nltk_data()
 
 class DocumentAnalyzer:
+    DEFAULT_MODEL = "gpt-4o-mini"  # Cost-effective model with excellent quality
+    TEXT_BLOCK_CHARS = 1 << 20  # Text files are streamed in ~1M-character blocks
+    OCR_WINDOW_PAGES = 32  # PDF pages held back at most while their scanned pages are OCR'd
+
     def __init__(self,
                  custom_stop_words: Optional[set] = None,
                  min_word_length: int = 3,
-                 verbose: bool = True):
+                 verbose: bool = True,
+                 model: Optional[str] = None,
+                 router: Optional[ModelRouter] = None,
+                 openai_client: Optional[Any] = None,
+                 chunk_tokens: int = DEFAULT_CHUNK_TOKENS,
+                 chunk_cache_dir: Optional[Union[str, Path]] = None,
+                 max_concurrent_chunks: int = 4,
+                 tokenizer: str = "fast",
+                 counting_backend: str = "python",
+                 pdf_workers: Optional[int] = None,
+                 image_analyzer: Optional[Any] = None):
         """
         Initialize document analyzer
 
@@ -80,10 +119,41 @@ class DocumentAnalyzer:
             custom_stop_words: Additional words to filter out
             min_word_length: Minimum word length to include
             verbose: Whether to print progress messages
+            model: OpenAI model for AI analysis (default: DEFAULT_MODEL)
+            router: Optional model cascade (fast model first, escalate unclear items).
+                Takes precedence over model.
+            openai_client: Client to use for AI analysis (default: created from
+                OPENAI_API_KEY)
+            chunk_tokens: Texts above this many estimated tokens are analyzed
+                in chunks and merged
+            chunk_cache_dir: Directory for per-chunk results, so a failed chunk
+                can be retried alone (default: no cache)
+            max_concurrent_chunks: Chunks analyzed in parallel
+            tokenizer: "fast" (single-pass regex, see analyzers.tokenizer) or
+                "nltk" (clean_text + word_tokenize); both give identical counts
+            counting_backend: "python" or "numpy" counting for the fast tokenizer
+            pdf_workers: Processes for PDF text extraction (default: CPU
+                count, capped; 1 = in-process). Only large PDFs use the pool.
+            image_analyzer: ImageAnalyzer for scanned pages of mixed PDFs (pages
+                with no text layer); without one those pages give no text
         """
-        self.stop_words = set(stopwords.words('english'))
+        self._stop_words: Optional[set] = None  # NLTK stop words, loaded on first use
         self.min_word_length = min_word_length
         self.verbose = verbose
+        self.model = model or self.DEFAULT_MODEL
+        self.router = router
+        self.model_used = None  # Model whose result was kept by the last AI analysis
+        self.chunk_tokens = chunk_tokens
+        self.chunk_cache_dir = Path(chunk_cache_dir) if chunk_cache_dir else None
+        self.max_concurrent_chunks = max(1, max_concurrent_chunks)
+        if tokenizer not in ("fast", "nltk"):
+            raise ValueError(f"Unknown tokenizer: {tokenizer!r} (use 'fast' or 'nltk')")
+        self.tokenizer = tokenizer
+        self.counting_backend = counting_backend
+        self.pdf_workers = pdf_workers
+        self.image_analyzer = image_analyzer
+        self.ocr_pages: List[int] = []  # Pages read with vision OCR by the last PDF extraction
+        self.unread_pages: List[int] = []  # Scanned pages it could not read (no OCR text)
 
         # Default business/email stop words
         default_custom_stop_words = {
@@ -100,16 +170,19 @@ class DocumentAnalyzer:
         else:
             self.custom_stop_words = default_custom_stop_words
 
-        self.all_stop_words = self.stop_words.union(self.custom_stop_words)
 
         # Initialize OpenAI Responses API client (NOT chat completions)
         self.openai_client = None
         self.ai_enabled = False
 
-        if OPENAI_AVAILABLE and AI_MODELS_AVAILABLE:
+        if openai_client is not None and AI_MODELS_AVAILABLE:
+            self.openai_client = openai_client
+            self.ai_enabled = True
+        elif OPENAI_AVAILABLE and AI_MODELS_AVAILABLE:
             api_key = os.getenv('OPENAI_API_KEY')
             if api_key:
                 try:
+                    from openai import OpenAI
                     self.openai_client = OpenAI(api_key=api_key)
                     self.ai_enabled = True
                     if self.verbose:
@@ -122,6 +195,19 @@ class DocumentAnalyzer:
         elif self.verbose:
             print("⚠️  OpenAI dependencies not available - AI analysis disabled")
 
+    @property
+    def stop_words(self) -> set:
+        """NLTK English stop words (NLTK data is checked on first access)."""
+        if self._stop_words is None:
+            ensure_nltk_data()
+            from nltk.corpus import stopwords
+            self._stop_words = set(stopwords.words('english'))
+        return self._stop_words
+
+    @property
+    def all_stop_words(self) -> set:
+        return self.stop_words.union(self.custom_stop_words)
+
     def clean_text(self, text):
         """Clean and preprocess text for word cloud generation"""
         # Convert to lowercase
@@ -148,97 +234,199 @@ class DocumentAnalyzer:
 
     def extract_meaningful_words(self, text: str) -> List[str]:
         """Extract meaningful words from cleaned text"""
+        ensure_nltk_data()
+        from nltk.tokenize import word_tokenize
+
         words = word_tokenize(text)
+        all_stop_words = self.all_stop_words
 
         meaningful_words = []
         for word in words:
             if (len(word) >= self.min_word_length and
                 word.isalpha() and
-                word.lower() not in self.all_stop_words):
+                word.lower() not in all_stop_words):
                 meaningful_words.append(word.lower())
 
         return meaningful_words
 
-    def process_files(self, data_dir: Union[str, Path],
-                     file_pattern: str = "*.txt") -> Tuple[str, int]:
-        """Process all text files in the specified directory"""
+    def iter_pages(self, data_dir: Union[str, Path],
+                   file_pattern: str = "*.txt",
+                   stats: Optional[Dict[str, int]] = None) -> Iterator[Tuple[Path, str]]:
+        """Stream the text of matching files as (file, page) pieces.
+
+        PDF pages are yielded as they are extracted and text files in blocks
+        of TEXT_BLOCK_CHARS cut at whitespace, so memory stays bounded by one
+        page or block whatever the size of the input.
+
+        Args:
+            data_dir: Directory to read
+            file_pattern: Glob pattern of files to include
+            stats: Optional dict filled with "files" (files with text) and "errors"
+        """
         data_path = Path(data_dir)
-        all_text = ""
-        file_count = 0
-        errors = []
+        stats = stats if stats is not None else {}
+        stats.update(files=0, errors=0)
 
         if self.verbose:
             print(f"Processing files from: {data_path}")
 
         for file_path in data_path.glob(file_pattern):
+            is_pdf = file_path.suffix.lower() == '.pdf'
+            has_text = False
             try:
-                # Handle PDF text extraction
-                if file_path.suffix.lower() == '.pdf':
-                    content = self._extract_pdf_text(file_path)
-                else:
-                    # Existing text file processing
-                    with open(file_path, 'r', encoding='utf-8', errors='ignore') as file:
-                        content = file.read()
+                pages = self.iter_pdf_pages(file_path) if is_pdf else self.iter_text_blocks(file_path)
+                for page in pages:
+                    has_text = has_text or bool(page.strip())
+                    yield file_path, page
 
-                if content and content.strip():  # Only process if we got meaningful content
-                    all_text += " " + content
-                    file_count += 1
+                if has_text:
+                    stats["files"] += 1
                     if self.verbose:
                         print(f"✓ Processed: {file_path.name}")
-                elif file_path.suffix.lower() == '.pdf':
+                elif is_pdf:
                     # PDF had no extractable text - this will route to image analysis
                     if self.verbose:
                         print(f"⚠️  No text extracted from PDF: {file_path.name}")
             except Exception as e:
-                error_msg = f"Error processing {file_path.name}: {e}"
-                errors.append(error_msg)
+                stats["errors"] += 1
                 if self.verbose:
-                    print(f"✗ {error_msg}")
+                    print(f"✗ Error processing {file_path.name}: {e}")
 
         if self.verbose:
-            print(f"\n📊 Processed {file_count} files")
-            if errors:
-                print(f"⚠️  {len(errors)} files had errors")
+            print(f"\n📊 Processed {stats['files']} files")
+            if stats["errors"]:
+                print(f"⚠️  {stats['errors']} files had errors")
 
-        return all_text, file_count
+    def process_files(self, data_dir: Union[str, Path],
+                     file_pattern: str = "*.txt") -> Tuple[str, int]:
+        """Process all text files in the specified directory"""
+        parts = []
+        previous_file = None
+        stats: Dict[str, int] = {}
+
+        for file_path, page in self.iter_pages(data_dir, file_pattern, stats):
+            if file_path != previous_file:
+                parts.append(" ")
+                previous_file = file_path
+            elif file_path.suffix.lower() == '.pdf':
+                parts.append(PAGE_BREAK)
+            parts.append(page)
+
+        return "".join(parts), stats["files"]
+
+    def iter_text_blocks(self, file_path: Path) -> Iterator[str]:
+        """Yield a text file in blocks cut at whitespace (words are never split)."""
+        with open(file_path, 'r', encoding='utf-8', errors='ignore') as file:
+            carry = ""
+            while True:
+                block = file.read(self.TEXT_BLOCK_CHARS)
+                if not block:
+                    break
+                block = carry + block
+                cut = max(block.rfind(" "), block.rfind("\n"))
+                if cut < 0:
+                    carry = block
+                    continue
+                carry = block[cut + 1:]
+                yield block[:cut + 1]
+            if carry:
+                yield carry
+
+    def iter_pdf_pages(self, file_path: Path) -> Iterator[str]:
+        """Yield the text of each PDF page ("" for pages without text).
+
+        Large PDFs are extracted in parallel page ranges (see core.pdf).
+        Scanned pages are read with image_analyzer, up to its
+        MAX_CONCURRENT_PAGES at once, so a mixed PDF sends only its
+        image-only pages to vision; pages after a scanned page are held back
+        until it is read (at most OCR_WINDOW_PAGES). A scanned page that
+        cannot be rendered or read falls back to its (empty) text layer and
+        is listed in unread_pages instead of ocr_pages.
+        """
+        self.ocr_pages.clear()
+        self.unread_pages.clear()
+        window: List[pdf_pages.PdfPage] = []
+
+        def read_window() -> Iterator[str]:
+            scanned = [page.number for page in window if page.kind == "scanned"]
+            if self.verbose:
+                print(f"🖼️  Pages {', '.join(map(str, scanned))} of {file_path.name} are scanned - using vision OCR")
+            ocr_texts = self.image_analyzer.read_pdf_pages(file_path, scanned)
+            for page in window:
+                if page.number in ocr_texts:
+                    self.ocr_pages.append(page.number)
+                    yield ocr_texts[page.number]
+                else:
+                    if page.kind == "scanned":
+                        self.unread_pages.append(page.number)
+                    yield page.text
+            window.clear()
+
+        for page in pdf_pages.iter_pdf_pages(file_path, workers=self.pdf_workers):
+            if page.kind == "scanned" and self.image_analyzer is None:
+                self.unread_pages.append(page.number)
+                yield page.text
+            elif page.kind != "scanned" and not window:
+                yield page.text
+            else:
+                window.append(page)
+                scanned = sum(1 for held in window if held.kind == "scanned")
+                if scanned >= self.image_analyzer.MAX_CONCURRENT_PAGES or len(window) >= self.OCR_WINDOW_PAGES:
+                    yield from read_window()
+        if window:
+            yield from read_window()
+
+        if self.unread_pages and self.verbose:
+            print(f"⚠️  {len(self.unread_pages)} scanned page(s) in {file_path.name} have no text layer "
+                  f"and no OCR text")
 
     def _extract_pdf_text(self, file_path: Path) -> str:
         """Extract text content from PDF files"""
         try:
-            import pdfplumber
-            text_parts = []
-            with pdfplumber.open(file_path) as pdf:
-                for page in pdf.pages:
-                    text = page.extract_text()
-                    if text:
-                        text_parts.append(text)
-            return "\n".join(text_parts)
+            # Page breaks let long documents be chunked on page boundaries
+            return PAGE_BREAK.join(self.iter_pdf_pages(file_path))
         except Exception as e:
             if self.verbose:
                 print(f"⚠️  Could not extract text from PDF {file_path.name}: {e}")
             return ""
 
-    def generate_word_frequency(self, text: str, top_n: int = 20) -> Dict[str, int]:
-        """Generate word frequency analysis"""
-        cleaned_text = self.clean_text(text)
-        words = self.extract_meaningful_words(cleaned_text)
-        word_freq = Counter(words)
+    def count_page_words(self, text: str) -> Dict[str, int]:
+        """Word counts of one piece of text (pieces must be cut at whitespace)."""
+        if self.tokenizer == "nltk":
+            return Counter(self.extract_meaningful_words(self.clean_text(text)))
+        return count_words(text, self.all_stop_words, self.min_word_length, backend=self.counting_backend)
+
+    def generate_word_frequency(self, text: Union[str, Iterable[str]], top_n: int = 20) -> Dict[str, int]:
+        """Generate word frequency analysis
 
+        Args:
+            text: Document text, or an iterable of pieces (pages, blocks) to
+                count incrementally without joining them
+            top_n: Number of top words to print
+        """
+        word_freq = Counter()
+        for piece in ([text] if isinstance(text, str) else text):
+            word_freq.update(self.count_page_words(piece))
+
+        self._print_word_frequency(word_freq, top_n)
+        return dict(word_freq)
+
+    def _print_word_frequency(self, word_freq: Counter, top_n: int = 20):
         if self.verbose:
-            print(f"📝 Total words extracted: {len(words)}")
+            print(f"📝 Total words extracted: {word_freq.total()}")
             print(f"🔤 Unique words: {len(word_freq)}")
             print(f"\n🔝 Top {top_n} most frequent words:")
             for word, count in word_freq.most_common(top_n):
                 print(f"  {word}: {count}")
 
-        return dict(word_freq)
-
     def create_word_cloud(self,
                          word_freq: Dict[str, int],
                          output_file: Optional[str] = None,
                          title: str = "Document Word Cloud Analysis",
-                         **wordcloud_kwargs) -> WordCloud:
+                         **wordcloud_kwargs) -> "WordCloud":
         """Create and save word cloud visualization"""
+        from wordcloud import WordCloud
+        plt = _pyplot()
 
         # Default WordCloud parameters
         default_params = {
@@ -290,6 +478,7 @@ class DocumentAnalyzer:
                 print("⚠️  No words to chart")
             return
 
+        plt = _pyplot()
         plt.figure(figsize=(15, 10))
         words = list(top_words.keys())
         frequencies = list(top_words.values())
@@ -322,21 +511,49 @@ class DocumentAnalyzer:
                          output_dir: Optional[Union[str, Path]] = None,
                          file_pattern: str = "*.txt") -> Dict[str, Any]:
         """Run complete analysis on a directory of text files"""
+        stats: Dict[str, int] = {}
+        pages = (page for _, page in self.iter_pages(data_dir, file_pattern, stats))
+        return self.analyze_pages(pages, output_dir, stats)
+
+    def analyze_pages(self,
+                      pages: Iterable[str],
+                      output_dir: Optional[Union[str, Path]] = None,
+                      stats: Optional[Dict[str, int]] = None) -> Dict[str, Any]:
+        """Run complete analysis on streamed page texts.
+
+        Args:
+            pages: Page texts in document order (e.g. from iter_pages or
+                stored extracted text)
+            output_dir: Directory for the visualizations
+            stats: iter_pages stats dict, for 'files_processed' in the result
+        """
 
         if self.verbose:
             print("🚀 Starting Document Analysis")
             print("=" * 50)
 
-        # Process all files
-        all_text, file_count = self.process_files(data_dir, file_pattern)
+        # Stream pages once: each page is counted as it is extracted and,
+        # with AI enabled, fed to (chunked) AI analysis at the same time
+        word_counts = Counter()
+        page_stats = {"pages": 0, "text_pages": 0}
+        pages = self._counted_pages(pages, word_counts, page_stats)
+
+        ai_analysis = None
+        if self.ai_enabled:
+            if self.verbose:
+                print(f"\n🤖 Running AI analysis on extracted text...")
+            ai_analysis = self.analyze_pages_with_ai(pages)
+        for _ in pages:  # Count whatever the AI pass did not consume
+            pass
 
-        if not all_text.strip():
+        if not page_stats["text_pages"]:
             if self.verbose:
                 print("❌ No text found to process!")
             return {'status': 'error', 'message': 'No text found'}
 
         # Generate word frequency
-        word_freq = self.generate_word_frequency(all_text)
+        self._print_word_frequency(word_counts)
+        word_freq = dict(word_counts)
 
         if not word_freq:
             if self.verbose:
@@ -365,7 +582,7 @@ class DocumentAnalyzer:
 
         result = {
             'status': 'success',
-            'files_processed': file_count,
+            'files_processed': stats["files"] if stats is not None else 1,
             'total_words': sum(word_freq.values()),
             'unique_words': len(word_freq),
             'word_frequency': word_freq,
@@ -375,9 +592,6 @@ class DocumentAnalyzer:
 
         # Add AI analysis if available
         if self.ai_enabled:
-            if self.verbose:
-                print(f"\n🤖 Running AI analysis on extracted text...")
-            ai_analysis = self.analyze_with_ai(all_text)
             if ai_analysis:
                 result['ai_analysis'] = {
                     'summary': ai_analysis.summary,
@@ -393,6 +607,16 @@ class DocumentAnalyzer:
 
         return result
 
+    def _counted_pages(self, pages: Iterable[str], word_counts: Counter,
+                       page_stats: Dict[str, int]) -> Iterator[str]:
+        """Pass page texts through, adding each page's words to word_counts."""
+        for page in pages:
+            word_counts.update(self.count_page_words(page))
+            page_stats["pages"] += 1
+            if page.strip():
+                page_stats["text_pages"] += 1
+            yield page
+
     def analyze_text(self,
                     text: str,
                     output_dir: Optional[Union[str, Path]] = None) -> Dict[str, Any]:
@@ -469,6 +693,9 @@ class DocumentAnalyzer:
 
         CRITICAL: This uses OpenAI Responses API, NOT chat completions API.
 
+        Texts longer than ``chunk_tokens`` are split on page/section
+        boundaries, analyzed concurrently and merged (see core.chunking).
+
         Args:
             text: Document text to analyze
 
@@ -486,32 +713,182 @@ class DocumentAnalyzer:
             return None
 
         try:
+            if estimate_tokens(text) > self.chunk_tokens:
+                return self._analyze_chunks(iter_chunks(text.split(PAGE_BREAK), self.chunk_tokens))
+
             if self.verbose:
                 print("🤖 Analyzing document with OpenAI Responses API...")
 
-            # Import legal domain prompt
-            from evidence_toolkit.domains import legal_config
-            legal_analysis_prompt = legal_config.DOCUMENT_ANALYSIS_PROMPT
+            result, self.model_used = self._request_analysis(text, "document_analysis")
+
+            if self.verbose:
+                print(f"✅ AI analysis complete - confidence: {result.confidence_overall:.2f}")
+            return result
+
+        except Exception as e:
+            if self.verbose:
+                print(f"❌ AI analysis failed: {e}")
+            return None
+
+    def analyze_pages_with_ai(self, pages: Iterable[str]) -> Optional[DocumentAnalysis]:
+        """Streamed analyze_with_ai over page texts (PAGE_BREAK-joined document).
+
+        Pages are pulled only as chunks are submitted, so extraction of later
+        pages overlaps analysis of earlier chunks and the whole text is never
+        held in memory. A document that fits one chunk gets a single request.
 
-            # Call OpenAI Responses API using standardized utility
-            result = call_openai_structured(
+        Args:
+            pages: Page texts in document order
+
+        Returns:
+            DocumentAnalysis or None if disabled, empty or failed
+        """
+        if not self.ai_enabled:
+            return self.analyze_with_ai("")
+
+        chunks = iter_chunks(pages, self.chunk_tokens)
+        first = next(chunks, None)
+        second = next(chunks, None) if first else None
+        if second is None:
+            return self.analyze_with_ai(first.text if first else "")
+
+        # Chunk failures are handled per chunk; extraction errors propagate
+        return self._analyze_chunks(itertools.chain([first, second], chunks))
+
+    def _request_analysis(self, text: str, stage: str) -> Tuple[DocumentAnalysis, str]:
+        """Run one structured analysis call (through the router if set).
+
+        Returns:
+            (DocumentAnalysis, model whose result was kept)
+        """
+        # Import legal domain prompt
+        from evidence_toolkit.domains import legal_config
+        legal_analysis_prompt = legal_config.DOCUMENT_ANALYSIS_PROMPT
+
+        # Call OpenAI Responses API using standardized utility
+        def request(model: str) -> DocumentAnalysis:
+            return call_openai_structured(
                 self.openai_client,
-                "gpt-4o-mini",  # Cost-effective model with excellent quality (fixed from gpt-4.1-mini)
+                model,
                 legal_analysis_prompt,
                 text,
                 DocumentAnalysis,
-                verbose=self.verbose
+                verbose=self.verbose,
+                stage=stage
             )
 
-            if self.verbose:
-                print(f"✅ AI analysis complete - confidence: {result.confidence_overall:.2f}")
-            return result
+        if self.router:
+            result, decision = self.router.route(stage, request)
+            if self.verbose and decision.escalated:
+                print(f"⬆️  Escalated to {decision.model_used}: {'; '.join(decision.reasons)}")
+            return result, decision.model_used
+
+        return request(self.model), self.model
+
+    def _chunk_cache_key(self, content: str) -> str:
+        """Cache key covering the prompt, model choice and chunk content."""
+        from evidence_toolkit.domains import legal_config
 
+        if self.router:
+            model_spec = (f"cascade:{self.router.fast_model}>{self.router.strong_model}"
+                          f"@{self.router.confidence_threshold}")
+        else:
+            model_spec = self.model
+        key_source = "\0".join([legal_config.DOCUMENT_ANALYSIS_PROMPT, model_spec, content])
+        return hashlib.sha256(key_source.encode('utf-8')).hexdigest()
+
+    def _load_chunk_result(self, chunk: DocumentChunk, cache_key: str) -> Optional[DocumentChunkResult]:
+        if not self.chunk_cache_dir:
+            return None
+        cache_file = self.chunk_cache_dir / f"chunk-{chunk.index:03d}.json"
+        if not cache_file.exists():
+            return None
+        try:
+            cached = DocumentChunkResult.model_validate_json(cache_file.read_text(encoding='utf-8'))
+        except Exception:
+            return None
+        return cached if cached.cache_key == cache_key else None
+
+    def _save_chunk_result(self, chunk_result: DocumentChunkResult):
+        if not self.chunk_cache_dir:
+            return
+        try:
+            ensure_directory(self.chunk_cache_dir)
+            cache_file = self.chunk_cache_dir / f"chunk-{chunk_result.index:03d}.json"
+            cache_file.write_text(chunk_result.model_dump_json(indent=2), encoding='utf-8')
         except Exception as e:
             if self.verbose:
-                print(f"❌ AI analysis failed: {e}")
+                print(f"⚠️  Could not cache chunk {chunk_result.index + 1}: {e}")
+
+    def _analyze_chunk(self, chunk: DocumentChunk) -> DocumentChunkResult:
+        """Analyze one chunk, reusing a cached result for the same prompt/model/content."""
+        content = (f"[Part {chunk.index + 1} of a longer document, "
+                   f"pages {chunk.page_start}-{chunk.page_end}]\n\n{chunk.text}")
+        cache_key = self._chunk_cache_key(content)
+
+        cached = self._load_chunk_result(chunk, cache_key)
+        if cached:
+            return cached
+
+        analysis, model_used = self._request_analysis(content, "document_chunk_analysis")
+        chunk_result = DocumentChunkResult(
+            index=chunk.index,
+            cache_key=cache_key,
+            page_start=chunk.page_start,
+            page_end=chunk.page_end,
+            model_used=model_used,
+            analysis=analysis,
+            created_at=datetime.now()
+        )
+        self._save_chunk_result(chunk_result)
+        return chunk_result
+
+    def _analyze_chunks(self, chunks: Iterable[DocumentChunk]) -> Optional[DocumentAnalysis]:
+        """Map-reduce analysis of a long document.
+
+        Chunks run concurrently (each thread keeps the caller's usage
+        tracking context) and are pulled from ``chunks`` only while fewer
+        than 2 x max_concurrent_chunks are in flight; only chunk metadata is
+        kept for the merge. If any chunk fails, no partial result is
+        returned; successful chunks stay cached for the retry.
+        """
+        if self.verbose:
+            print(f"🤖 Analyzing long document in chunks ({self.max_concurrent_chunks} concurrent)...")
+
+        submitted: List[Tuple[DocumentChunk, Any]] = []
+        with ThreadPoolExecutor(max_workers=self.max_concurrent_chunks) as executor:
+            in_flight = set()
+            for chunk in chunks:
+                if len(in_flight) >= 2 * self.max_concurrent_chunks:
+                    _, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+                future = executor.submit(copy_context().run, self._analyze_chunk, chunk)
+                in_flight.add(future)
+                submitted.append((chunk.model_copy(update={"text": ""}), future))
+
+        chunk_results: List[DocumentChunkResult] = []
+        failed = []
+        for chunk, future in submitted:
+            try:
+                chunk_results.append(future.result())
+            except Exception as e:
+                failed.append(chunk.index)
+                if self.verbose:
+                    print(f"❌ Chunk {chunk.index + 1} (pages {chunk.page_start}-{chunk.page_end}) failed: {e}")
+
+        if failed:
+            if self.verbose:
+                cached = " - completed chunks are cached, re-run to retry" if self.chunk_cache_dir else ""
+                print(f"❌ {len(failed)} of {len(submitted)} chunks failed{cached}")
             return None
 
+        result = merge_chunk_analyses([r.analysis for r in chunk_results], [chunk for chunk, _ in submitted])
+        self.model_used = "/".join(dict.fromkeys(r.model_used for r in chunk_results if r.model_used)) or None
+
+        if self.verbose:
+            print(f"✅ AI analysis complete ({len(submitted)} chunks merged) - "
+                  f"confidence: {result.confidence_overall:.2f}")
+        return result
+
     def _generate_evidence_id(self, text: str, source_path: Optional[str] = None) -> str:
         """Generate evidence ID from content and source."""
         content_hash = hashlib.sha256(text.encode('utf-8')).hexdigest()[:12]
@@ -7,12 +7,14 @@ completions) for deterministic, legally-admissible analysis results.
 Part of Evidence Toolkit v3.0 unified architecture.
 """
 
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Tuple
 from pathlib import Path
 
 from evidence_toolkit.core.models import EmailThreadAnalysis
 from evidence_toolkit.analyzers.email_parser import EmailParser
+from evidence_toolkit.core.chunking import estimate_tokens
 from evidence_toolkit.core.utils import call_openai_structured, ensure_directory
+from evidence_toolkit.core.routing import ModelRouter
 
 
 class EmailAnalyzer:
@@ -22,15 +24,35 @@ class EmailAnalyzer:
     OpenAI Responses API patterns proven successful in document analysis.
     """
 
-    def __init__(self, openai_client, verbose: bool = True):
+    DEFAULT_MODEL = "gpt-4o-mini"  # Cost-effective model (16x cheaper than gpt-4o)
+
+    def __init__(
+        self,
+        openai_client,
+        verbose: bool = True,
+        model: Optional[str] = None,
+        router: Optional[ModelRouter] = None,
+        strip_quoted: bool = True
+    ):
         """Initialize email analyzer using same pattern as DocumentAnalyzer.
 
         Args:
             openai_client: OpenAI client instance (from openai package)
             verbose: Enable verbose output for analysis operations
+            model: OpenAI model for thread analysis (default: DEFAULT_MODEL)
+            router: Optional model cascade (fast model first, escalate unclear threads).
+                Takes precedence over model.
+            strip_quoted: Send only each email's new content - quoted replies,
+                signatures and disclaimers are left out of the AI input
+                (see EmailParser.strip_quoted_content)
         """
         self.openai_client = openai_client
         self.verbose = verbose
+        self.model = model or self.DEFAULT_MODEL
+        self.router = router
+        self.strip_quoted = strip_quoted
+        self.model_used = None  # Model whose result was kept by the last AI analysis
+        self.token_counts: Optional[Tuple[int, int]] = None  # Last thread: (full, sent) estimated tokens
         self.email_parser = EmailParser(verbose=verbose)
 
         # Check if AI analysis is enabled (same pattern as DocumentAnalyzer)
@@ -68,20 +90,40 @@ class EmailAnalyzer:
 
             # Build thread context for analysis
             thread_text = self._format_thread_for_analysis(emails)
+            if self.strip_quoted:
+                full_tokens = estimate_tokens(self._format_thread_for_analysis(emails, strip_quoted=False))
+                self.token_counts = (full_tokens, estimate_tokens(thread_text))
+                if self.verbose and self.token_counts[1] < full_tokens:
+                    saved = 1 - self.token_counts[1] / full_tokens
+                    print(f"✂️  Quoted replies/signatures stripped: {full_tokens:,} → "
+                          f"{self.token_counts[1]:,} tokens (-{saved:.0%})")
+            else:
+                self.token_counts = (estimate_tokens(thread_text),) * 2
 
             # Import legal domain prompt
             from evidence_toolkit.domains import legal_config
             email_analysis_prompt = legal_config.EMAIL_ANALYSIS_PROMPT
 
             # Call OpenAI Responses API using standardized utility
-            result = call_openai_structured(
-                self.openai_client,
-                "gpt-4o-mini",  # Cost-effective model (16x cheaper than gpt-4o, fixed from gpt-4.1-mini)
-                email_analysis_prompt,
-                thread_text,
-                EmailThreadAnalysis,
-                verbose=self.verbose
-            )
+            def request(model: str) -> EmailThreadAnalysis:
+                return call_openai_structured(
+                    self.openai_client,
+                    model,
+                    email_analysis_prompt,
+                    thread_text,
+                    EmailThreadAnalysis,
+                    verbose=self.verbose,
+                    stage="email_analysis"
+                )
+
+            if self.router:
+                result, decision = self.router.route("email_analysis", request)
+                self.model_used = decision.model_used
+                if self.verbose and decision.escalated:
+                    print(f"⬆️  Escalated to {decision.model_used}: {'; '.join(decision.reasons)}")
+            else:
+                result = request(self.model)
+                self.model_used = self.model
 
             if self.verbose:
                 print(f"✅ Email thread analysis complete - confidence: {result.confidence_overall:.2f}")
@@ -130,19 +172,30 @@ class EmailAnalyzer:
         # Analyze the thread
         return self.analyze_email_thread(threaded_emails)
 
-    def _format_thread_for_analysis(self, emails: List[Dict[str, Any]]) -> str:
+    def _format_thread_for_analysis(self, emails: List[Dict[str, Any]], strip_quoted: Optional[bool] = None) -> str:
         """Format email thread for AI analysis.
 
         Args:
             emails: List of email dictionaries in thread order
+            strip_quoted: Use each email's new content instead of its full
+                body (default: self.strip_quoted)
 
         Returns:
             Formatted thread text for AI processing
         """
+        if strip_quoted is None:
+            strip_quoted = self.strip_quoted
         thread_parts = []
 
         for i, email_data in enumerate(emails):
             headers = email_data['headers']
+            body = email_data.get('body', '').strip()
+            if strip_quoted:
+                if 'new_content' not in email_data:
+                    email_data.update(self.email_parser.strip_quoted_content(email_data.get('body', '')))
+                if email_data['stripped_ranges']:
+                    kinds = sorted({stripped['kind'].replace('_', ' ') for stripped in email_data['stripped_ranges']})
+                    body = f"{email_data['new_content']}\n\n[Omitted: {', '.join(kinds)}]"
 
             # Format email section
             email_section = f"""
@@ -158,7 +211,7 @@ To: {', '.join(headers.get('to', []))}"""
 Subject: {headers.get('subject', 'No Subject')}
 Date: {headers.get('date', 'Unknown Date')}
 
-{email_data.get('body', '').strip()}
+{body}
 
 ---"""
 
@@ -8,15 +8,132 @@ Part of Evidence Toolkit v3.0 unified architecture.
 """
 
 import email
-import mailbox
+import mimetypes
 import re
+from email import policy
 from email.message import EmailMessage
 from email.utils import parsedate_to_datetime, parseaddr
 from pathlib import Path
-from typing import List, Dict, Any, Optional, Union
+from typing import List, Dict, Any, Iterable, Iterator, Optional, Tuple, Union
 from datetime import datetime
 
 
+# Reply headers that start the quoted copy of an earlier message
+_ORIGINAL_MESSAGE = re.compile(r'^\s*-{2,}\s*Original Message\s*-{2,}\s*$', re.IGNORECASE)
+_WROTE = re.compile(r'^\s*On\b.{0,300}\bwrote:\s*$', re.IGNORECASE | re.DOTALL)  # May wrap over 3 lines
+# A real "On ... wrote:" attribution names when or who: a date, a time or an address
+_ATTRIBUTION_DETAIL = re.compile(
+    r'\d{1,4}[/.-]\d{1,2}[/.-]\d{1,4}|\d{1,2}:\d{2}|[\w.+-]+@[\w-]+\.[\w.-]+'
+    r'|\b\d{1,2}(?:st|nd|rd|th)?,? (?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*\b'
+    r'|\b(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*\.? \d{1,2}\b',
+    re.IGNORECASE
+)
+_OUTLOOK_FROM = re.compile(r'^\s*From:\s', re.IGNORECASE)
+_OUTLOOK_SENT = re.compile(r'^\s*(?:Sent|Date):\s', re.IGNORECASE)
+_FORWARD_BANNER = re.compile(r'^\s*(?:-{2,}\s*Forwarded message\s*-{2,}|Begin forwarded message:)', re.IGNORECASE)
+_OUTLOOK_SEPARATOR = re.compile(r'^\s*_{10,}\s*$')
+_QUOTED_LINE = re.compile(r'^\s*>')
+_SIGNATURE_DELIMITER = re.compile(r'^-- ?$')
+_MOBILE_FOOTER = re.compile(r'^\s*Sent from my \w[\w ]{0,30}$', re.IGNORECASE)
+_MESSAGE_ID = re.compile(r'<([^<>\s]+)>')
+_REPLY_PREFIX = re.compile(r'^\s*(?:(?:re|fwd?|fw|aw|sv)(?:\[\d+\])?:\s*)+', re.IGNORECASE)
+# Confidentiality notices: a paragraph addressed to the intended recipient, optionally
+# under a heading and followed by the usual "received in error" paragraphs
+_DISCLAIMER = re.compile(
+    r'\bintended (?:solely |only |exclusively )?for the (?:sole )?(?:use of the )?(?:named |intended )?'
+    r'(?:addressee|recipient|individual|person|entity)',
+    re.IGNORECASE
+)
+_DISCLAIMER_HEADING = re.compile(
+    r'^\s*(?:CONFIDENTIALITY NOTICE|DISCLAIMER|IMPORTANT NOTICE|LEGAL NOTICE)\s*:?\s*$', re.IGNORECASE
+)
+_DISCLAIMER_FOLLOWUP = re.compile(
+    r'received this (?:e-?mail|message|communication|transmission) in error|notify the sender'
+    r'|(?:unauthori[sz]ed|prohibited)\b.{0,60}\b(?:use|disclosure|distribution|copying)',
+    re.IGNORECASE
+)
+
+
+def iter_mbox_messages(file_path: Path) -> Iterator[Iterator[bytes]]:
+    """Stream the messages of an mbox file, one line iterator per message.
+
+    Messages start at "From " envelope lines (bodies escape their own as
+    ">From "). The envelope line and the blank line that separates messages
+    are not part of the message, so a message extracted here has the same
+    bytes (and SHA256) as the .eml it was stored from. Only one line is held
+    at a time; each message must be consumed before the next is requested
+    (an unconsumed rest is skipped).
+
+    Args:
+        file_path: Path to the .mbox file
+
+    Yields:
+        Iterator over each message's raw lines (bytes, line endings kept)
+    """
+    with open(file_path, 'rb') as f:
+        line = f.readline()
+        while line and not line.startswith(b'From '):
+            line = f.readline()  # Anything before the first envelope is not a message
+
+        while line:
+            state = {'next': b''}
+
+            def message_lines() -> Iterator[bytes]:
+                held = None
+                while True:
+                    current = f.readline()
+                    if not current or current.startswith(b'From '):
+                        state['next'] = current
+                        if held is not None and held.strip():
+                            yield held  # Drop the blank separator line only
+                        return
+                    if held is not None:
+                        yield held
+                    held = current
+
+            lines = message_lines()
+            yield lines
+            for _ in lines:
+                pass  # Skip what the consumer left unread
+            line = state['next']
+
+
+class _ThreadContainer:
+    """Node of the threading tree (JWZ): holds a message, or stands in for a missing one."""
+    __slots__ = ("message", "parent", "children")
+
+    def __init__(self):
+        self.message: Optional[Dict[str, Any]] = None
+        self.parent: Optional["_ThreadContainer"] = None
+        self.children: List["_ThreadContainer"] = []
+
+    def has_descendant(self, other: "_ThreadContainer") -> bool:
+        stack = [self]
+        while stack:
+            node = stack.pop()
+            if node is other:
+                return True
+            stack.extend(node.children)
+        return False
+
+    def set_parent(self, parent: Optional["_ThreadContainer"]) -> None:
+        if self.parent is not None:
+            self.parent.children.remove(self)
+        self.parent = parent
+        if parent is not None:
+            parent.children.append(self)
+
+    def messages(self) -> List[Dict[str, Any]]:
+        """Messages in this subtree, depth first."""
+        found, stack = [], [self]
+        while stack:
+            node = stack.pop()
+            if node.message is not None:
+                found.append(node.message)
+            stack.extend(reversed(node.children))
+        return found
+
+
 class EmailParser:
     """Parse various email formats into standardized structure.
 
@@ -59,8 +176,7 @@ class EmailParser:
                 return self.parse_msg_file(file_path)
             elif suffix == '.mbox':
                 # For .mbox files, return the first email
-                emails = self.parse_mbox_file(file_path)
-                return emails[0] if emails else None
+                return next(self.iter_mbox_file(file_path), None)
             else:
                 if self.verbose:
                     print(f"⚠️  Unsupported email format: {suffix}")
@@ -71,6 +187,58 @@ class EmailParser:
                 print(f"❌ Failed to parse {file_path}: {e}")
             return None
 
+    def parse_headers(self, file_path: Path) -> Optional[Dict[str, Any]]:
+        """Parse only the headers of an email file (for threading).
+
+        For .eml and .mbox files only the header block is read, so the body
+        and attachments are never loaded. Outlook .msg files are parsed in
+        full (extract-msg reads the whole file) and their body is dropped.
+
+        Args:
+            file_path: Path to email file
+
+        Returns:
+            Dictionary with 'headers', 'source_file' and 'file_format', or
+            None if parsing fails
+        """
+        file_path = Path(file_path)
+        suffix = file_path.suffix.lower()
+        try:
+            if suffix == '.msg':
+                email_data = self.parse_msg_file(file_path)
+                return {key: email_data[key] for key in ('headers', 'source_file', 'file_format')}
+            if suffix == '.eml':
+                with open(file_path, 'rb') as f:
+                    header_block = self._read_header_block(f)
+            elif suffix == '.mbox':
+                messages = iter_mbox_messages(file_path)
+                try:
+                    header_block = self._read_header_block(next(messages, iter(())))
+                finally:
+                    messages.close()
+            else:
+                if self.verbose:
+                    print(f"⚠️  Unsupported email format: {suffix}")
+                return None
+
+            msg = email.message_from_string(header_block.decode('utf-8', errors='replace'))
+            return {'headers': self._extract_headers(msg), 'source_file': str(file_path), 'file_format': 'eml'}
+
+        except Exception as e:
+            if self.verbose:
+                print(f"❌ Failed to parse headers of {file_path}: {e}")
+            return None
+
+    @staticmethod
+    def _read_header_block(lines: Iterable[bytes]) -> bytes:
+        """Raw lines up to the blank line that ends the headers."""
+        header_lines = []
+        for line in lines:
+            if not line.strip(b'\r\n'):
+                break
+            header_lines.append(line)
+        return b''.join(header_lines)
+
     def parse_eml_file(self, file_path: Path) -> Dict[str, Any]:
         """Parse .eml format (RFC 822).
 
@@ -105,7 +273,7 @@ class EmailParser:
         msg = extract_msg.Message(str(file_path))
 
         # Convert to standard format
-        return {
+        email_data = {
             'headers': {
                 'from': msg.sender,
                 'to': [msg.to] if msg.to else [],
@@ -123,6 +291,8 @@ class EmailParser:
             'source_file': str(file_path),
             'file_format': 'msg'
         }
+        email_data.update(self.strip_quoted_content(email_data['body']))
+        return email_data
 
     def parse_mbox_file(self, file_path: Path) -> List[Dict[str, Any]]:
         """Parse .mbox format (Unix mailbox).
@@ -133,14 +303,20 @@ class EmailParser:
         Returns:
             List of standardized email data dictionaries
         """
-        emails = []
-        mbox = mailbox.mbox(str(file_path))
+        return list(self.iter_mbox_file(file_path))
 
-        for i, msg in enumerate(mbox):
-            email_data = self._extract_email_data(msg, f"{file_path}:{i}")
-            emails.append(email_data)
+    def iter_mbox_file(self, file_path: Path) -> Iterator[Dict[str, Any]]:
+        """Parse .mbox messages one at a time (memory bounded by the largest message).
 
-        return emails
+        Args:
+            file_path: Path to .mbox file
+
+        Yields:
+            Standardized email data dictionaries
+        """
+        for i, lines in enumerate(iter_mbox_messages(file_path)):
+            msg = email.message_from_bytes(b''.join(lines))
+            yield self._extract_email_data(msg, f"{file_path}:{i}")
 
     def _extract_email_data(self, msg: EmailMessage, source: str) -> Dict[str, Any]:
         """Extract standardized data from email message.
@@ -152,6 +328,23 @@ class EmailParser:
         Returns:
             Standardized email data dictionary
         """
+        # Extract body content
+        body = self._extract_body(msg)
+        html_body = self._extract_html_body(msg)
+
+        email_data = {
+            'headers': self._extract_headers(msg),
+            'body': body,
+            'html_body': html_body,
+            'attachments': self._extract_attachments(msg),
+            'source_file': source,
+            'file_format': 'eml'
+        }
+        email_data.update(self.strip_quoted_content(body))
+        return email_data
+
+    def _extract_headers(self, msg: EmailMessage) -> Dict[str, Any]:
+        """Standardized headers of an email message."""
         # Parse date with fallback
         date_str = msg.get('Date')
         parsed_date = None
@@ -167,30 +360,163 @@ class EmailParser:
                     except ValueError:
                         pass
 
-        # Extract body content
-        body = self._extract_body(msg)
-        html_body = self._extract_html_body(msg)
-
         return {
-            'headers': {
-                'from': msg.get('From', ''),
-                'to': self._parse_address_list(msg.get_all('To') or []),
-                'cc': self._parse_address_list(msg.get_all('Cc') or []),
-                'bcc': self._parse_address_list(msg.get_all('Bcc') or []),
-                'subject': msg.get('Subject', ''),
-                'date': date_str,
-                'parsed_date': parsed_date.isoformat() if parsed_date else None,
-                'message_id': msg.get('Message-ID'),
-                'in_reply_to': msg.get('In-Reply-To'),
-                'references': msg.get('References')
-            },
-            'body': body,
-            'html_body': html_body,
-            'attachments': self._extract_attachments(msg),
-            'source_file': source,
-            'file_format': 'eml'
+            'from': msg.get('From', ''),
+            'to': self._parse_address_list(msg.get_all('To') or []),
+            'cc': self._parse_address_list(msg.get_all('Cc') or []),
+            'bcc': self._parse_address_list(msg.get_all('Bcc') or []),
+            'subject': msg.get('Subject', ''),
+            'date': date_str,
+            'parsed_date': parsed_date.isoformat() if parsed_date else None,
+            'message_id': msg.get('Message-ID'),
+            'in_reply_to': msg.get('In-Reply-To'),
+            'references': msg.get('References')
         }
 
+    def strip_quoted_content(self, body: str) -> Dict[str, Any]:
+        """Separate a message's new content from quoted replies and signatures.
+
+        Deterministic line rules, checked in order:
+        - a reply header ("On <date> ... wrote:" - or an attribution without
+          a date, time or address that is followed by "> " lines,
+          "-----Original Message-----", an
+          Outlook "From:/Sent:" block or "____" separator) starts the quoted
+          copy of the earlier message; it runs to the end of the body unless
+          the sender answered inline, in which case only the header and the
+          "> " lines are stripped
+        - runs of "> " lines anywhere are quoted text
+        - an RFC 3676 "-- " delimiter or a "Sent from my ..." footer starts a
+          signature, which runs to the end of the new content
+        - a confidentiality notice ("intended solely for the addressee")
+          closing the new content is a disclaimer; a notice followed by more
+          message text is kept
+
+        Forwarded messages are kept - they are the substance of a forward. A
+        body with nothing left after stripping is kept whole.
+
+        Args:
+            body: Plain text body
+
+        Returns:
+            Dictionary with 'new_content' (the body without stripped ranges)
+            and 'stripped_ranges' (kind, start, end character offsets into the
+            body, for audit)
+        """
+        lines = (body or '').splitlines(keepends=True)
+        offsets = [0]
+        for line in lines:
+            offsets.append(offsets[-1] + len(line))
+
+        kinds: List[Optional[str]] = [None] * len(lines)
+        end = len(lines)
+
+        # Top-posted reply: header followed by nothing but the quoted copy
+        header = self._find_reply_header(lines)
+        if header is not None:
+            quoted = [index for index in range(header + 1, len(lines)) if _QUOTED_LINE.match(lines[index])]
+            inline_reply = bool(quoted) and any(
+                lines[index].strip() and not _QUOTED_LINE.match(lines[index])
+                for index in range(quoted[0], len(lines))
+            )
+            if inline_reply:
+                kinds[header] = 'reply_header'
+            else:
+                kinds[header:] = ['quoted_reply'] * (len(lines) - header)
+                end = header
+
+        for index in range(end):
+            if _QUOTED_LINE.match(lines[index]):
+                kinds[index] = 'quoted_lines'
+
+        # Signature: from its first line to the end of the new content
+        signature = next(
+            (index for index in range(end)
+             if _SIGNATURE_DELIMITER.match(lines[index].rstrip('\r\n')) or _MOBILE_FOOTER.match(lines[index])),
+            end
+        )
+        for index in range(signature, end):
+            kinds[index] = kinds[index] or 'signature'
+
+        # Disclaimer: the notice paragraphs that close the new content (before a signature)
+        disclaimer = self._find_disclaimer(lines, signature)
+        if disclaimer is not None:
+            for index in range(disclaimer, signature):
+                kinds[index] = kinds[index] or 'disclaimer'
+
+        stripped_ranges = []
+        for index, kind in enumerate(kinds):
+            if kind is None:
+                continue
+            if stripped_ranges and stripped_ranges[-1]['kind'] == kind and stripped_ranges[-1]['end'] == offsets[index]:
+                stripped_ranges[-1]['end'] = offsets[index + 1]
+            else:
+                stripped_ranges.append({'kind': kind, 'start': offsets[index], 'end': offsets[index + 1]})
+
+        new_content = ''.join(line for line, kind in zip(lines, kinds) if kind is None).strip()
+        if not new_content:
+            return {'new_content': (body or '').strip(), 'stripped_ranges': []}
+        return {'new_content': new_content, 'stripped_ranges': stripped_ranges}
+
+    def _find_reply_header(self, lines: List[str]) -> Optional[int]:
+        """Index of the first line of a reply header, or None.
+
+        Scanning stops at a forward banner: what follows is the forwarded
+        message, including its own headers.
+        """
+        for index, line in enumerate(lines):
+            if _FORWARD_BANNER.match(line):
+                return None
+            if _ORIGINAL_MESSAGE.match(line):
+                return index
+            if _OUTLOOK_SEPARATOR.match(line):
+                if any(_OUTLOOK_FROM.match(following) for following in lines[index + 1:index + 3]):
+                    return index
+            elif _OUTLOOK_FROM.match(line) and index > 0:
+                # An Outlook header block: From: then Sent:/Date: within the next lines
+                if any(_OUTLOOK_SENT.match(following) for following in lines[index + 1:index + 4]):
+                    return index
+            elif line.lstrip().lower().startswith('on '):
+                for size in range(1, 4):
+                    attribution = ''.join(lines[index:index + size]).rstrip('\r\n')
+                    if _WROTE.match(attribution) and (
+                        _ATTRIBUTION_DETAIL.search(attribution) or self._quote_follows(lines, index + size)
+                    ):
+                        return index
+        return None
+
+    @staticmethod
+    def _quote_follows(lines: List[str], start: int) -> bool:
+        """Whether the first non-blank line from start is a "> " quoted line."""
+        following = next((line for line in lines[start:] if line.strip()), '')
+        return bool(_QUOTED_LINE.match(following))
+
+    @staticmethod
+    def _find_disclaimer(lines: List[str], end: int) -> Optional[int]:
+        """First line of the confidentiality notice that closes lines[:end], or None.
+
+        The notice is the trailing run of paragraphs that are a notice
+        heading, a notice to the intended recipient or its "received in
+        error" follow-up, and must include the notice itself.
+        """
+        paragraphs: List[Tuple[int, str]] = []  # (first line, text)
+        for index in range(end):
+            if not lines[index].strip():
+                continue
+            if index and lines[index - 1].strip() and paragraphs:
+                first, text = paragraphs[-1]
+                paragraphs[-1] = (first, f"{text} {lines[index].strip()}")
+            else:
+                paragraphs.append((index, lines[index].strip()))
+
+        start, has_notice = None, False
+        for first, text in reversed(paragraphs):
+            if _DISCLAIMER.search(text):
+                has_notice = True
+            elif not (_DISCLAIMER_HEADING.match(text) or _DISCLAIMER_FOLLOWUP.search(text)):
+                break
+            start = first
+        return start if has_notice else None
+
     def _extract_body(self, msg: EmailMessage) -> str:
         """Extract plain text body from email message."""
         if msg.is_multipart():
@@ -223,6 +549,76 @@ class EmailParser:
                         continue
         return None
 
+    def iter_attachments(self, file_path: Path) -> Iterator[Tuple[str, bytes]]:
+        """Decoded attachments of an .eml or .msg file, one at a time.
+
+        Attached emails (message/rfc822) are returned whole as .eml - their
+        own attachments are theirs to expand, so nothing is extracted twice.
+        Inline parts without an attachment disposition (signature logos,
+        embedded HTML images) are not evidence and are skipped.
+
+        Args:
+            file_path: Path to the email file
+
+        Yields:
+            (filename, content) for each attachment
+        """
+        file_path = Path(file_path)
+        if file_path.suffix.lower() == '.msg':
+            yield from self._iter_msg_attachments(file_path)
+            return
+
+        with open(file_path, 'rb') as f:
+            msg = email.message_from_binary_file(f, policy=policy.compat32)
+
+        def walk(part):
+            if part.get_content_type() == 'message/rfc822' and part is not msg:
+                yield part
+                return
+            if part.is_multipart():
+                for subpart in part.get_payload():
+                    yield from walk(subpart)
+            elif part.get_content_disposition() == 'attachment':
+                yield part
+
+        for index, part in enumerate(walk(msg), 1):
+            if part.get_content_type() == 'message/rfc822':
+                attached = part.get_payload()
+                content = (attached[0] if isinstance(attached, list) else attached).as_bytes()
+                yield self._attachment_filename(part, index, '.eml'), content
+                continue
+            content = part.get_payload(decode=True)
+            if content:
+                yield self._attachment_filename(part, index), content
+
+    def _iter_msg_attachments(self, file_path: Path) -> Iterator[Tuple[str, bytes]]:
+        """Attachments of an Outlook .msg file (requires extract-msg)."""
+        try:
+            import extract_msg
+        except ImportError:
+            if self.verbose:
+                print(f"⚠️  extract-msg not installed - attachments of {file_path.name} not extracted "
+                      "(pip install extract-msg)")
+            return
+
+        msg = extract_msg.Message(str(file_path))
+        try:
+            for index, attachment in enumerate(msg.attachments or [], 1):
+                content = attachment.data
+                if isinstance(content, bytes) and content:
+                    name = attachment.longFilename or attachment.shortFilename or f"attachment-{index}"
+                    yield Path(name).name, content
+        finally:
+            msg.close()
+
+    def _attachment_filename(self, part: EmailMessage, index: int, default_suffix: Optional[str] = None) -> str:
+        """Attachment's own file name (path parts dropped), or one from its index and type."""
+        filename = part.get_filename()
+        if filename:
+            return Path(filename.replace('\\', '/')).name
+        suffix = default_suffix or mimetypes.guess_extension(part.get_content_type()) or '.bin'
+        return f"attachment-{index}{suffix}"
+
     def _extract_attachments(self, msg: EmailMessage) -> List[str]:
         """Extract attachment filenames from email message."""
         attachments = []
@@ -255,50 +651,135 @@ class EmailParser:
             emails: List of parsed email dictionaries
 
         Returns:
-            List of emails sorted in thread order
+            List of emails grouped by thread (see build_thread_index), each
+            thread in date order
         """
-        if not emails:
-            return []
+        return [email_data for thread in self.build_thread_index(emails) for email_data in thread]
+
+    def build_thread_index(self, emails: List[Dict[str, Any]]) -> List[List[Dict[str, Any]]]:
+        """Group emails into threads from their Message-ID, In-Reply-To and References headers.
+
+        JWZ threading (https://www.jwz.org/doc/threading.html):
+        1. Each message and every ID it references gets a container; the
+           References chain links containers parent -> child (never into a
+           loop), and a message's parent is its last reference.
+        2. Containers for referenced messages that are not present and have
+           no messages below them are dropped.
+        3. Root threads with the same normalized subject are merged only
+           when the root is a reply or forward (a Re:/Fwd: subject prefix
+           or reply headers), which joins replies whose client dropped the
+           headers. Unrelated messages that
+           merely share a generic subject ("Update", "Invoice") stay apart.
+
+        Each email gets 'thread_id' (Message-ID of the thread's first
+        message without angle brackets, or a placeholder when it has none), 'thread_position', 'thread_size', 'thread_parent' (Message-ID
+        of the message it replies to, when present) and 'normalized_subject'.
 
-        # Group emails by normalized subject
-        subject_groups = {}
-        for email_data in emails:
-            subject = email_data['headers'].get('subject', '')
-            normalized_subject = self._normalize_subject(subject)
-
-            if normalized_subject not in subject_groups:
-                subject_groups[normalized_subject] = []
-            subject_groups[normalized_subject].append(email_data)
-
-        # Sort each group by date and build thread relationships
-        threaded_emails = []
-        for subject, group_emails in subject_groups.items():
-            # Sort by parsed date, then by original date string
-            group_emails.sort(key=lambda x: (
-                x['headers'].get('parsed_date') or '1970-01-01T00:00:00',
-                x['headers'].get('date') or ''
-            ))
-
-            # Add thread position information
-            for i, email_data in enumerate(group_emails):
-                email_data['thread_position'] = i
-                email_data['thread_size'] = len(group_emails)
-                email_data['normalized_subject'] = subject
+        Args:
+            emails: List of parsed email dictionaries
 
-            threaded_emails.extend(group_emails)
+        Returns:
+            Threads (lists of emails in date order), ordered by their first email
+        """
+        containers: Dict[str, _ThreadContainer] = {}
+
+        def container(message_id: str) -> _ThreadContainer:
+            if message_id not in containers:
+                containers[message_id] = _ThreadContainer()
+            return containers[message_id]
 
-        return threaded_emails
+        for index, email_data in enumerate(emails):
+            headers = email_data['headers']
+            ids = _MESSAGE_ID.findall(headers.get('message_id') or '')
+            message_id = ids[0] if ids else None
+            if message_id is None or containers.get(message_id, _ThreadContainer()).message is not None:
+                message_id = f"no-message-id-{index}"  # Missing or duplicate Message-ID
+            email_data['_message_id'] = message_id
+            node = container(message_id)
+            node.message = email_data
+
+            references = _MESSAGE_ID.findall(headers.get('references') or '')
+            in_reply_to = _MESSAGE_ID.findall(headers.get('in_reply_to') or '')
+            if in_reply_to and (not references or references[-1] != in_reply_to[0]):
+                references.append(in_reply_to[0])
+            references = [reference for reference in references if reference != message_id]
+
+            # Link the chain: each reference is the parent of the next (first link wins)
+            for parent_id, child_id in zip(references, references[1:]):
+                parent, child = container(parent_id), container(child_id)
+                if child.parent is None and child is not parent and not child.has_descendant(parent):
+                    child.set_parent(parent)
+
+            # The message itself hangs off its last reference
+            parent = container(references[-1]) if references else None
+            if parent is not None and (node.has_descendant(parent) or parent is node):
+                parent = None
+            node.set_parent(parent)
+
+        # Roots, skipping chains of missing messages down to the first real (or branching) container
+        roots = []
+        for node in containers.values():
+            if node.parent is not None:
+                continue
+            while node.message is None and len(node.children) == 1:
+                node = node.children[0]
+            if node.message is not None or node.children:
+                roots.append(node)
+
+        # Merge root threads by subject
+        def date_key(email_data: Dict[str, Any]):
+            return (
+                email_data['headers'].get('parsed_date') or '1970-01-01T00:00:00',
+                email_data['headers'].get('date') or ''
+            )
+
+        threads: Dict[str, List[Dict[str, Any]]] = {}
+        originals = set()  # Subjects already claimed by a thread started by a non-reply
+        root_threads = [members for members in (root.messages() for root in roots) if members]
+        for members in sorted(root_threads, key=lambda members: min(map(date_key, members))):
+            headers = members[0]['headers']
+            subject = headers.get('subject') or ''
+            key = self._normalize_subject(subject)
+            is_reply = (
+                _REPLY_PREFIX.match(subject) is not None
+                or bool(headers.get('references') or headers.get('in_reply_to'))
+            )
+            if not key or (not is_reply and key in originals):
+                key = f"\0{members[0]['_message_id']}"  # Not merged by subject
+            elif not is_reply:
+                originals.add(key)
+            threads.setdefault(key, []).extend(members)
+
+        ordered = []
+        for members in sorted(threads.values(), key=lambda members: min(map(date_key, members))):
+            members.sort(key=date_key)
+            thread_id = members[0]['_message_id']
+            for i, email_data in enumerate(members):
+                parent = containers[email_data['_message_id']].parent
+                while parent is not None and parent.message is None:
+                    parent = parent.parent
+                email_data['thread_id'] = thread_id
+                email_data['thread_position'] = i
+                email_data['thread_size'] = len(members)
+                parent_id = parent.message['_message_id'] if parent is not None else None
+                email_data['thread_parent'] = parent_id if parent_id and not parent_id.startswith('no-message-id-') else None
+                email_data['normalized_subject'] = self._normalize_subject(email_data['headers'].get('subject', ''))
+            ordered.append(members)
+
+        for email_data in emails:
+            email_data.pop('_message_id', None)
+        return ordered
 
     def _normalize_subject(self, subject: str) -> str:
         """Normalize email subject for thread grouping.
 
-        Removes common prefixes like 'Re:', 'Fwd:', etc.
+        Removes common prefixes like 'Re:', 'Fwd:', 'AW:', etc.
         """
         if not subject:
             return ''
 
-        # Remove common reply/forward prefixes
-        normalized = re.sub(r'^(re|fwd?|fw):\s*', '', subject.strip(), flags=re.IGNORECASE)
+        # Remove common reply/forward prefixes (repeated, e.g. "Re: Fwd: Re[2]:")
+        normalized = _REPLY_PREFIX.sub('', subject.strip())
 
         # Remove extra whitespace
         normalized = ' '.join(normalized.split())
@@ -8,96 +8,282 @@ v3.3.1 Enhancement: Async batch processing for parallel image analysis
 """
 
 import os
-import base64
 import asyncio
+import time
 from pathlib import Path
 from typing import Dict, Any, List, Optional
 from datetime import datetime
 
-import openai
-from openai import OpenAI, AsyncOpenAI
-
 from evidence_toolkit.core.models import ImageAnalysisResult, ImageAnalysisStructured
+from evidence_toolkit.core.imaging import ImagePreparer, PreparedImage
 from evidence_toolkit.core.utils import is_image_file, call_openai_structured
+from evidence_toolkit.core.usage import record_usage
+from evidence_toolkit.core.concurrency import gather_bounded
+from evidence_toolkit.core.routing import ModelRouter
 
 
 class ImageAnalyzer:
     """Analyzes images using OpenAI Vision API with async batch processing support"""
 
+    DEFAULT_MODEL = "gpt-4o-mini"  # Cost-effective vision model (fixed from gpt-4.1-mini)
+    PDF_DPI = 200  # Rasterization resolution for scanned PDF pages
+    MAX_CONCURRENT_PAGES = 5  # Scanned pages rasterized / in flight at once
+
     def __init__(
         self,
         api_key: Optional[str] = None,
-        model: str = "gpt-4o-mini",  # Cost-effective vision model with 1M+ context (fixed from gpt-4.1-mini)
+        model: Optional[str] = None,
         max_tokens: int = 1000,
-        verbose: bool = True
+        verbose: bool = True,
+        router: Optional[ModelRouter] = None,
+        client: Optional[Any] = None,
+        async_client: Optional[Any] = None,
+        image_preparer: Optional[ImagePreparer] = None
     ):
         """Initialize image analyzer with Responses API support
 
         Args:
             api_key: OpenAI API key (defaults to OPENAI_API_KEY env var)
-            model: Vision-capable model (default: gpt-4o-mini - best balance of cost/quality)
+            model: Vision-capable model (default: DEFAULT_MODEL - best balance of cost/quality)
             max_tokens: Maximum tokens for response (unused with Responses API)
             verbose: Print progress messages
+            router: Optional model cascade (fast model first, escalate unclear images).
+                Takes precedence over model unless a per-call model is given.
+            client: Client for synchronous analysis (default: created from api_key)
+            async_client: Client for async analysis - batches and scanned PDFs
+                (default: created from api_key on first use)
+            image_preparer: Orientation/downscaling/transcoding before upload
+                (default: ImagePreparer() - JPEG, auto detail, no cache)
         """
         self.api_key = api_key or os.getenv("OPENAI_API_KEY")
-        self.client = OpenAI(api_key=self.api_key)
-        self.async_client = AsyncOpenAI(api_key=self.api_key)  # For async operations
-        self.model = model
+        if client is None:
+            from openai import OpenAI
+            client = OpenAI(api_key=self.api_key)
+        self.client = client
+        self._async_client = async_client  # Created on first async use if not given
+        self.model = model or self.DEFAULT_MODEL
+        self.router = router
         self.max_tokens = max_tokens
         self.verbose = verbose
+        self.image_preparer = image_preparer or ImagePreparer()
+        self.page_texts: List[str] = []  # OCR text per page from the last analysis
+        self.ocr_pages: List[int] = []  # Pages of the last PDF read with vision
+        self.unread_pages: List[int] = []  # Scanned pages of the last PDF vision gave no text for
+
+    @property
+    def async_client(self) -> Any:
+        """Async client for batch operations (created on first use)."""
+        if self._async_client is None:
+            from openai import AsyncOpenAI
+            self._async_client = AsyncOpenAI(api_key=self.api_key)
+        return self._async_client
+
+    @staticmethod
+    def build_user_content(
+        image_base64: str,
+        mime_type: str = "image/jpeg",
+        detail: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Responses API user message carrying one base64-encoded image."""
+        image_content = {
+            "type": "input_image",  # Responses API format (not "image_url")
+            "image_url": f"data:{mime_type};base64,{image_base64}"
+        }
+        if detail:
+            image_content["detail"] = detail
+        return {"role": "user", "content": [image_content]}
+
+    @classmethod
+    def prepared_user_content(cls, prepared: PreparedImage) -> Dict[str, Any]:
+        """User message for a prepared image (real MIME type and detail level)."""
+        return cls.build_user_content(prepared.base64, prepared.mime_type, prepared.detail)
+
+    def _report_preparation(self, prepared: PreparedImage) -> None:
+        stats = prepared.stats
+        if self.verbose and (stats.transcoded or stats.cache_hit):
+            source = "cached" if stats.cache_hit else f"{stats.original_width}x{stats.original_height} →"
+            print(f"🗜️  Image prepared ({source} {stats.width}x{stats.height} {stats.mime_type}): "
+                  f"{stats.original_bytes / 1024:,.0f} KB → {stats.prepared_bytes / 1024:,.0f} KB "
+                  f"in {stats.seconds * 1000:.0f} ms")
+
+    def render_pdf_page(self, pdf_path: Path, page_number: int) -> PreparedImage:
+        """Rasterize one PDF page (1-based) and prepare it for upload, in memory.
+
+        Only the requested page is rendered (poppler first_page/last_page),
+        so memory does not grow with the page count.
+        """
+        from pdf2image import convert_from_path
+
+        page_image = convert_from_path(
+            pdf_path, dpi=self.PDF_DPI, first_page=page_number, last_page=page_number
+        )[0]
+        try:
+            return self.image_preparer.prepare_image(page_image)
+        finally:
+            page_image.close()
+
+    def analyze_pdf_page(
+        self,
+        pdf_path: Path,
+        page_number: int,
+        prompt: Optional[str] = None
+    ) -> ImageAnalysisResult:
+        """Rasterize one PDF page (1-based) and analyze it with vision AI."""
+        return self._analyze_prepared(self.render_pdf_page(pdf_path, page_number))
+
+    async def analyze_pdf_page_async(self, pdf_path: Path, page_number: int) -> ImageAnalysisResult:
+        """Rasterize one PDF page (in a worker thread) and analyze it with vision AI.
+
+        A page that cannot be rendered (poppler missing, corrupt page) or
+        analyzed gives a result without detected_text instead of raising.
+        """
+        try:
+            prepared = await asyncio.to_thread(self.render_pdf_page, pdf_path, page_number)
+            return await self._analyze_prepared_async(prepared)
+        except Exception as e:
+            return ImageAnalysisResult(
+                openai_model=self.model,
+                openai_response={"error": str(e)},
+                scene_description=f"Page analysis failed: {str(e)}",
+                analysis_confidence=0.0
+            )
+
+    def read_pdf_pages(
+        self,
+        pdf_path: Path,
+        page_numbers: List[int],
+        max_concurrent: Optional[int] = None
+    ) -> Dict[int, str]:
+        """OCR text of scanned PDF pages, read concurrently with vision AI.
+
+        At most ``max_concurrent`` pages are rendered or in flight at once.
+
+        Returns:
+            Page number -> detected text, for the pages vision could read
+            (pages that failed or gave no text are left out)
+        """
+        max_concurrent = max(1, max_concurrent or self.MAX_CONCURRENT_PAGES)
+
+        async def read_pages() -> List[ImageAnalysisResult]:
+            return await gather_bounded(
+                page_numbers, lambda page_number: self.analyze_pdf_page_async(pdf_path, page_number), max_concurrent
+            )
+
+        owns_async_client = self._async_client is None
+        try:
+            results = asyncio.run(read_pages())
+        finally:
+            if owns_async_client:
+                self._async_client = None  # Bound to the finished event loop
+        return {
+            page_number: result.detected_text
+            for page_number, result in zip(page_numbers, results)
+            if result.detected_text
+        }
 
     def analyze_pdf(
         self,
         pdf_path: Path,
         prompt: Optional[str] = None,
-        max_pages: Optional[int] = None
+        max_pages: Optional[int] = None,
+        max_concurrent: Optional[int] = None
     ) -> ImageAnalysisResult:
-        """Analyze a scanned PDF by converting pages to images and analyzing with vision AI"""
+        """Analyze a scanned PDF page by page with vision AI.
+
+        Synchronous wrapper around analyze_pdf_async.
+        """
+        owns_async_client = self._async_client is None
         try:
-            from pdf2image import convert_from_path
-            import tempfile
+            return asyncio.run(self.analyze_pdf_async(pdf_path, prompt, max_pages, max_concurrent))
+        finally:
+            if owns_async_client:
+                self._async_client = None  # Bound to the finished event loop
 
-            if self.verbose:
-                print(f"📄 Converting PDF pages to images for vision analysis...")
+    async def analyze_pdf_async(
+        self,
+        pdf_path: Path,
+        prompt: Optional[str] = None,
+        max_pages: Optional[int] = None,
+        max_concurrent: Optional[int] = None
+    ) -> ImageAnalysisResult:
+        """Analyze a scanned PDF page by page with vision AI.
 
-            # Convert PDF pages to images
-            images = convert_from_path(pdf_path, dpi=200)
+        Pages that have a text layer (mixed PDFs) are read locally instead of
+        being sent to vision. Scanned pages are rasterized one at a time in a
+        worker thread and sent concurrently: at most ``max_concurrent`` pages
+        are rendered or in flight, so memory stays flat for long scans and
+        wall time drops with concurrency.
+
+        Args:
+            pdf_path: PDF file
+            prompt: Optional custom prompt (unused, uses legal_config)
+            max_pages: Only analyze the first pages
+            max_concurrent: Scanned pages in flight (default: MAX_CONCURRENT_PAGES)
+
+        Returns:
+            Combined ImageAnalysisResult for the whole PDF
+        """
+        try:
+            from pdf2image import pdfinfo_from_path
+            from evidence_toolkit.core.pdf import PdfPage, iter_pdf_pages
+
+            try:
+                pages = await asyncio.to_thread(lambda: list(iter_pdf_pages(pdf_path, workers=1)))
+            except Exception:
+                # pdfplumber cannot read it - rasterize every page
+                page_count = pdfinfo_from_path(str(pdf_path))["Pages"]
+                pages = [PdfPage(n, "", "scanned") for n in range(1, page_count + 1)]
 
             if max_pages:
-                images = images[:max_pages]
+                pages = pages[:max_pages]
+            scanned = [page.number for page in pages if page.kind == "scanned"]
+            max_concurrent = max(1, max_concurrent or self.MAX_CONCURRENT_PAGES)
 
             if self.verbose:
-                print(f"   Found {len(images)} pages to analyze")
-
-            # Analyze each page
-            all_detected_text = []
-            all_detected_objects = []
-            scene_descriptions = []
+                print(f"📄 Analyzing {len(pages)} PDF pages ({len(scanned)} scanned, "
+                      f"{len(pages) - len(scanned)} with a text layer; {max_concurrent} concurrent)")
 
-            for i, page_image in enumerate(images, 1):
-                if self.verbose and i % 5 == 0:
-                    print(f"   Analyzing page {i}/{len(images)}...")
+            completed = 0
 
-                # Save page to temporary file
-                with tempfile.NamedTemporaryFile(suffix='.png', delete=False) as tmp:
-                    page_image.save(tmp.name, 'PNG')
-                    tmp_path = Path(tmp.name)
+            async def analyze_scanned_page(page_number: int) -> ImageAnalysisResult:
+                nonlocal completed
+                result = await self.analyze_pdf_page_async(pdf_path, page_number)
+                completed += 1
+                if self.verbose and completed % 5 == 0:
+                    print(f"   Analyzed scanned page {completed}/{len(scanned)}...")
+                return result
 
-                try:
-                    # Analyze page as image
-                    page_result = self.analyze_image(tmp_path, prompt)
+            vision_results = dict(zip(
+                scanned, await gather_bounded(scanned, analyze_scanned_page, max_concurrent)
+            ))
 
-                    # Collect results
-                    if page_result.detected_text:
-                        all_detected_text.append(f"[Page {i}] {page_result.detected_text}")
-                    if page_result.detected_objects:
-                        all_detected_objects.extend(page_result.detected_objects)
-                    if page_result.scene_description:
-                        scene_descriptions.append(f"Page {i}: {page_result.scene_description}")
+            # Combine pages in page order
+            page_texts = []
+            all_detected_text = []
+            all_detected_objects = []
+            scene_descriptions = []
 
-                finally:
-                    # Clean up temp file
-                    tmp_path.unlink(missing_ok=True)
+            for page in pages:
+                i = page.number
+                page_result = vision_results.get(i)
+                if page_result is None:
+                    # Text layer - no vision call needed
+                    page_texts.append(page.text)
+                    if page.text.strip():
+                        all_detected_text.append(f"[Page {i}] {page.text}")
+                    continue
+
+                page_texts.append(page_result.detected_text or "")
+                if page_result.detected_text:
+                    all_detected_text.append(f"[Page {i}] {page_result.detected_text}")
+                if page_result.detected_objects:
+                    all_detected_objects.extend(page_result.detected_objects)
+                if page_result.scene_description:
+                    scene_descriptions.append(f"Page {i}: {page_result.scene_description}")
+
+            self.page_texts = page_texts
+            self.ocr_pages = [i for i in scanned if vision_results[i].detected_text]
+            self.unread_pages = [i for i in scanned if not vision_results[i].detected_text]
 
             # Combine results from all pages
             combined_text = "\n\n".join(all_detected_text) if all_detected_text else None
@@ -105,13 +291,17 @@ class ImageAnalyzer:
             unique_objects = list(set(all_detected_objects)) if all_detected_objects else None
 
             if self.verbose:
-                print(f"✅ Completed PDF analysis: {len(images)} pages")
+                print(f"✅ Completed PDF analysis: {len(pages)} pages ({len(scanned)} via vision)")
                 if combined_text:
                     print(f"   Extracted text from {len(all_detected_text)} pages")
 
             return ImageAnalysisResult(
                 openai_model=self.model,
-                openai_response={"pages_analyzed": len(images), "method": "pdf2image+responses_api"},
+                openai_response={
+                    "pages_analyzed": len(pages),
+                    "vision_pages": len(scanned),
+                    "method": "pdf2image+responses_api"
+                },
                 detected_objects=unique_objects,
                 detected_text=combined_text,
                 scene_description=combined_description,
@@ -149,42 +339,50 @@ class ImageAnalyzer:
         if not image_path.exists():
             raise ValueError(f"Image file {image_path} does not exist")
 
+        return self._analyze_prepared(self.image_preparer.prepare_file(image_path))
+
+    def _analyze_prepared(self, prepared: PreparedImage) -> ImageAnalysisResult:
+        """Analyze one prepared image (synchronous Responses API call)."""
         # Import legal domain prompt
         from evidence_toolkit.domains import legal_config
         system_prompt = legal_config.IMAGE_ANALYSIS_PROMPT
+        self._report_preparation(prepared)
 
         try:
-            # Encode image to base64
-            image_base64 = self._encode_image(image_path)
-
             # Build user content with image
-            user_content = {
-                "role": "user",
-                "content": [
-                    {
-                        "type": "input_image",  # Responses API format (not "image_url")
-                        "image_url": f"data:image/jpeg;base64,{image_base64}"
-                    }
-                ]
-            }
+            user_content = self.prepared_user_content(prepared)
 
             # Call OpenAI Responses API using standardized utility
-            parsed_result = call_openai_structured(
-                self.client,
-                self.model,  # Vision-capable model (default: gpt-4o-2024-08-06)
-                system_prompt,
-                user_content,
-                ImageAnalysisStructured,
-                verbose=self.verbose
-            )
+            def request(model: str) -> ImageAnalysisStructured:
+                return call_openai_structured(
+                    self.client,
+                    model,  # Vision-capable model (default: DEFAULT_MODEL)
+                    system_prompt,
+                    user_content,
+                    ImageAnalysisStructured,
+                    verbose=self.verbose,
+                    stage="image_analysis"
+                )
+
+            if self.router:
+                parsed_result, decision = self.router.route("image_analysis", request)
+                model = decision.model_used
+                if self.verbose and decision.escalated:
+                    print(f"⬆️  Escalated to {model}: {'; '.join(decision.reasons)}")
+            else:
+                model = self.model
+                parsed_result = request(model)
 
             if self.verbose:
                 print(f"✅ Image analysis complete - confidence: {parsed_result.confidence_overall:.2f}")
 
             # Convert structured Pydantic model to legacy ImageAnalysisResult format
             return ImageAnalysisResult(
-                openai_model=self.model,
-                openai_response={"parsed": parsed_result.model_dump()},
+                openai_model=model,
+                openai_response={
+                    "parsed": parsed_result.model_dump(),
+                    "image_preparation": prepared.stats.model_dump()
+                },
                 detected_objects=parsed_result.detected_objects,
                 detected_text=parsed_result.detected_text,
                 scene_description=parsed_result.scene_description,
@@ -207,7 +405,8 @@ class ImageAnalyzer:
     async def analyze_image_async(
         self,
         image_path: Path,
-        prompt: Optional[str] = None
+        prompt: Optional[str] = None,
+        model: Optional[str] = None
     ) -> ImageAnalysisResult:
         """Async version of analyze_image for batch processing
 
@@ -217,6 +416,8 @@ class ImageAnalyzer:
         Args:
             image_path: Path to image file
             prompt: Optional custom prompt (unused, uses legal_config)
+            model: Override the analyzer's model (and cascade) for this image,
+                e.g. a budget downgrade
 
         Returns:
             ImageAnalysisResult object
@@ -227,31 +428,48 @@ class ImageAnalyzer:
         if not image_path.exists():
             raise ValueError(f"Image file {image_path} does not exist")
 
+        # Decode/resize/encode off the event loop so other requests keep flowing
+        prepared = await asyncio.to_thread(self.image_preparer.prepare_file, image_path)
+        return await self._analyze_prepared_async(prepared, model)
+
+    async def _analyze_prepared_async(self, prepared: PreparedImage, model: Optional[str] = None) -> ImageAnalysisResult:
+        """Analyze one prepared image (async Responses API call)."""
+        use_router = self.router is not None and model is None
+        model = model or self.model
+
         # Import legal domain prompt
         from evidence_toolkit.domains import legal_config
         system_prompt = legal_config.IMAGE_ANALYSIS_PROMPT
+        self._report_preparation(prepared)
 
         try:
-            # Encode image to base64 (sync operation, but fast)
-            image_base64 = self._encode_image(image_path)
-
-            # Call OpenAI Responses API with structured outputs (ASYNC)
-            response = await self.async_client.responses.parse(
-                model=self.model,
-                input=[
-                    {"role": "system", "content": system_prompt},
-                    {
-                        "role": "user",
-                        "content": [
-                            {
-                                "type": "input_image",
-                                "image_url": f"data:image/jpeg;base64,{image_base64}"
-                            }
-                        ]
-                    }
-                ],
-                text_format=ImageAnalysisStructured
-            )
+            if use_router:
+                async def request(request_model: str) -> Optional[ImageAnalysisStructured]:
+                    response = await self._parse_image_async(request_model, system_prompt, prepared)
+                    return response.output_parsed if response.status == "completed" else None
+
+                parsed_result, decision = await self.router.route_async("image_analysis", request)
+                model = decision.model_used
+                if parsed_result is None:
+                    raise Exception(f"Image analysis failed on {model}")
+                if self.verbose:
+                    if decision.escalated:
+                        print(f"⬆️  Escalated to {model}: {'; '.join(decision.reasons)}")
+                    print(f"✅ Image analysis complete - confidence: {parsed_result.confidence_overall:.2f}")
+
+                return ImageAnalysisResult(
+                    openai_model=model,
+                    openai_response={
+                        "parsed": parsed_result.model_dump(),
+                        "image_preparation": prepared.stats.model_dump()
+                    },
+                    detected_objects=parsed_result.detected_objects,
+                    detected_text=parsed_result.detected_text,
+                    scene_description=parsed_result.scene_description,
+                    analysis_confidence=parsed_result.confidence_overall
+                )
+
+            response = await self._parse_image_async(model, system_prompt, prepared)
 
             # Handle response (same pattern as sync version)
             if response.status == "completed" and response.output_parsed:
@@ -259,8 +477,11 @@ class ImageAnalyzer:
                     print(f"✅ Image analysis complete - confidence: {response.output_parsed.confidence_overall:.2f}")
 
                 return ImageAnalysisResult(
-                    openai_model=self.model,
-                    openai_response={"parsed": response.output_parsed.model_dump()},
+                    openai_model=model,
+                    openai_response={
+                        "parsed": response.output_parsed.model_dump(),
+                        "image_preparation": prepared.stats.model_dump()
+                    },
                     detected_objects=response.output_parsed.detected_objects,
                     detected_text=response.output_parsed.detected_text,
                     scene_description=response.output_parsed.scene_description,
@@ -270,7 +491,7 @@ class ImageAnalyzer:
                 if self.verbose:
                     print(f"❌ Image analysis incomplete: {response.incomplete_details}")
                 return ImageAnalysisResult(
-                    openai_model=self.model,
+                    openai_model=model,
                     openai_response={"error": f"incomplete: {response.incomplete_details}"},
                     detected_objects=None,
                     detected_text=None,
@@ -284,7 +505,7 @@ class ImageAnalyzer:
             if self.verbose:
                 print(f"❌ Image analysis error: {str(e)}")
             return ImageAnalysisResult(
-                openai_model=self.model,
+                openai_model=model,
                 openai_response={"error": str(e)},
                 detected_objects=None,
                 detected_text=None,
@@ -292,6 +513,31 @@ class ImageAnalyzer:
                 analysis_confidence=0.0
             )
 
+    async def _parse_image_async(self, model: str, system_prompt: str, prepared: PreparedImage):
+        """Send one image to the Responses API (async) and record its usage.
+
+        Returns:
+            Parsed Responses API response (``status``, ``output_parsed``)
+        """
+        start_time = time.perf_counter()
+        raw_response = await self.async_client.responses.with_raw_response.parse(
+            model=model,
+            input=[
+                {"role": "system", "content": system_prompt},
+                self.prepared_user_content(prepared)
+            ],
+            text_format=ImageAnalysisStructured
+        )
+        response = raw_response.parse()
+        record_usage(
+            "image_analysis",
+            model,
+            getattr(response, "usage", None),
+            latency_seconds=time.perf_counter() - start_time,
+            retries=getattr(raw_response, "retries_taken", 0)
+        )
+        return response
+
     async def analyze_images_batch(
         self,
         image_paths: List[Path],
@@ -322,31 +568,27 @@ class ImageAnalyzer:
         if not quiet:
             print(f"🖼️  Batch processing {len(image_paths)} images (max {max_concurrent} concurrent)...")
 
-        # Create semaphore to limit concurrent API calls
-        semaphore = asyncio.Semaphore(max_concurrent)
-
-        async def analyze_with_semaphore(path: Path, index: int) -> ImageAnalysisResult:
-            """Analyze one image with semaphore rate limiting"""
-            async with semaphore:
-                if not quiet and (index + 1) % 5 == 0:
-                    print(f"   Processing image {index + 1}/{len(image_paths)}...")
-
-                try:
-                    return await self.analyze_image_async(path)
-                except Exception as e:
-                    # Return error result instead of raising
-                    return ImageAnalysisResult(
-                        openai_model=self.model,
-                        openai_response={"error": str(e)},
-                        detected_objects=None,
-                        detected_text=None,
-                        scene_description=f"Batch analysis failed: {str(e)}",
-                        analysis_confidence=0.0
-                    )
-
-        # Process all images concurrently (with semaphore limiting)
-        tasks = [analyze_with_semaphore(path, i) for i, path in enumerate(image_paths)]
-        results = await asyncio.gather(*tasks)
+        async def analyze_one(job) -> ImageAnalysisResult:
+            """Analyze one image (at most max_concurrent run at once)"""
+            index, path = job
+            if not quiet and (index + 1) % 5 == 0:
+                print(f"   Processing image {index + 1}/{len(image_paths)}...")
+
+            try:
+                return await self.analyze_image_async(path)
+            except Exception as e:
+                # Return error result instead of raising
+                return ImageAnalysisResult(
+                    openai_model=self.model,
+                    openai_response={"error": str(e)},
+                    detected_objects=None,
+                    detected_text=None,
+                    scene_description=f"Batch analysis failed: {str(e)}",
+                    analysis_confidence=0.0
+                )
+
+        # Bounded producer/consumer: only max_concurrent images are read and in flight
+        results = await gather_bounded(enumerate(image_paths), analyze_one, max_concurrent)
 
         if not quiet:
             successful = sum(1 for r in results if r.analysis_confidence > 0.0)
@@ -354,11 +596,6 @@ class ImageAnalyzer:
 
         return results
 
-    def _encode_image(self, image_path: Path) -> str:
-        """Encode image to base64"""
-        with open(image_path, "rb") as image_file:
-            return base64.b64encode(image_file.read()).decode('utf-8')
-
     def _parse_response(self, response_content: str) -> Dict[str, Any]:
         """Parse OpenAI response, handling both JSON and text formats"""
         import json
@@ -7,15 +7,19 @@ This is a thin wrapper for argument parsing and user feedback.
 Commands:
 - process-case: Complete pipeline (ingest → analyze → correlate → package)
 - ingest: File ingestion into content-addressed storage
+- watch: Continuous ingestion and analysis of files added to a case directory
 - analyze: Evidence analysis (documents, images, emails)
 - correlate: Cross-evidence correlation and timeline analysis
 - package: Client deliverable package generation
+- case cost: AI token usage and estimated cost per case
 - version: Show version information
 
 Architecture:
 - All business logic is in pipeline modules
 - CLI only handles argument parsing and user output
 - Uses EvidenceStorage at data/storage (not "evidence")
+- Analysis modules (openai, nltk, matplotlib) are imported inside the commands
+  that need them, so --help and read-only commands start fast
 """
 
 import sys
@@ -23,80 +27,97 @@ import time
 import os
 from datetime import datetime
 from pathlib import Path
-from typing import Optional
+from typing import List, Optional, Tuple
 
 import click
 
 from evidence_toolkit.core.storage import EvidenceStorage
 from evidence_toolkit.core.models import EvidenceType, ChainOfCustodyEvent
-from evidence_toolkit.pipeline import (
-    ingest_path,
-    print_ingestion_summary,
-    analyze_evidence,
-    SummaryGenerator,
-    PackageGenerator,
+from evidence_toolkit.core.imaging import DETAIL_LEVELS, FORMATS, ImagePreparer
+from evidence_toolkit.core.similarity import DEFAULT_CONTAINMENT_THRESHOLD, DEFAULT_MAX_DISTANCE
+from evidence_toolkit.pipeline.ingest import ingest_path, print_ingestion_summary
+from evidence_toolkit.pipeline.budget import BudgetController, BudgetDecision, parse_duration, prioritize_images
+from evidence_toolkit.pipeline.watch import DEFAULT_POLL_INTERVAL, DEFAULT_SETTLE_SECONDS
+from evidence_toolkit.core.routing import (
+    ModelRouter,
+    DEFAULT_FAST_MODEL,
+    DEFAULT_STRONG_MODEL,
+    DEFAULT_CONFIDENCE_THRESHOLD,
 )
-from evidence_toolkit.analyzers.correlation import CorrelationAnalyzer
-from evidence_toolkit.core.utils import get_evidence_base_dir
+from evidence_toolkit.core.utils import get_evidence_base_dir, detect_file_type
 
 
-# Default storage location for v3.0
-DEFAULT_STORAGE_PATH = Path("data/storage")
-
-
-@click.group()
-@click.version_option(version="4.0.0", prog_name="evidence-toolkit")
-def cli():
-    """Evidence Toolkit - AI-powered legal evidence analysis suite."""
-    pass
+def _default_model_for(evidence_type: EvidenceType) -> str:
+    """Model an evidence type is analyzed with unless overridden."""
+    from evidence_toolkit.analyzers.document import DocumentAnalyzer
+    from evidence_toolkit.analyzers.email import EmailAnalyzer
+    from evidence_toolkit.analyzers.image import ImageAnalyzer
 
+    return {
+        EvidenceType.DOCUMENT: DocumentAnalyzer.DEFAULT_MODEL,
+        EvidenceType.EMAIL: EmailAnalyzer.DEFAULT_MODEL,
+        EvidenceType.IMAGE: ImageAnalyzer.DEFAULT_MODEL,
+    }.get(evidence_type, DocumentAnalyzer.DEFAULT_MODEL)
 
-@cli.command(name="process-case")
-@click.argument('case_directory', type=click.Path(exists=True, path_type=Path))
-@click.option('--case-id', required=True, help='Case ID for this evidence collection')
-@click.option('--storage-dir', default=str(DEFAULT_STORAGE_PATH), help='Evidence storage directory (default: data/storage)')
-@click.option('--output-dir', default='./data/packages', help='Output directory for client package (default: ./data/packages)')
-@click.option('--skip-package', is_flag=True, help='Skip package generation (only ingest, analyze, correlate)')
-@click.option('--ai-resolve', is_flag=True, help='Use AI to resolve ambiguous entity matches (v3.2 feature)')
-@click.option('--case-type', type=click.Choice(['generic', 'workplace', 'employment', 'contract']),
-              default='generic', help='Case type for domain-specific analysis (default: generic, v3.2 feature)')
-@click.option('--max-concurrent', default=5, type=int, help='Max concurrent image analyses (default: 5, v3.3.1 feature)')
-@click.option('--actor', default='system', help='Actor performing the processing (default: system)')
-@click.option('--quiet', '-q', is_flag=True, help='Suppress verbose output')
-def process_case(case_directory: Path, case_id: str, storage_dir: str, output_dir: str,
-                skip_package: bool, ai_resolve: bool, case_type: str, max_concurrent: int, actor: str, quiet: bool):
-    """Complete pipeline: ingest → analyze → correlate → package
-
-    Process all evidence files in CASE_DIRECTORY through the complete analysis pipeline.
-    """
-    start_time = time.time()
-    storage = EvidenceStorage(Path(storage_dir))
 
-    if not quiet:
-        click.echo("🔬 Evidence Toolkit v3.0 - Automated Case Processing Pipeline")
-        click.echo("=" * 60)
-        click.echo(f"📁 Case Directory: {case_directory}")
-        click.echo(f"🆔 Case ID: {case_id}")
-        click.echo(f"💾 Storage: {storage_dir}")
-        click.echo("=" * 60)
-        click.echo()
-
-    # Step 1: Ingest Evidence
-    if not quiet:
-        click.echo("📥 [1/4] Ingesting evidence files...")
-
-    try:
-        results = ingest_path(case_directory, storage, case_id=case_id, actor=actor, quiet=quiet)
-        print_ingestion_summary(results, quiet=quiet)
-    except Exception as e:
-        click.echo(f"❌ Ingestion failed: {e}", err=True)
-        sys.exit(1)
+# Default storage location for v3.0
+DEFAULT_STORAGE_PATH = Path("data/storage")
 
-    # Step 2: Analyze all evidence
-    if not quiet:
-        click.echo("\n🔍 [2/4] Analyzing evidence with AI...")
 
-    # Initialize OpenAI client if available
+def cascade_options(command):
+    """Add the model cascade options (--cascade, --fast-model, ...) to a command."""
+    options = [
+        click.option('--cascade', is_flag=True,
+                     help='Analyze with a fast model first, escalate unclear or high-risk items'),
+        click.option('--fast-model', default=DEFAULT_FAST_MODEL, show_default=True,
+                     help='Cascade first-pass model'),
+        click.option('--strong-model', default=DEFAULT_STRONG_MODEL, show_default=True,
+                     help='Cascade escalation model'),
+        click.option('--confidence-threshold', default=DEFAULT_CONFIDENCE_THRESHOLD, show_default=True,
+                     type=click.FloatRange(0.0, 1.0), help='Escalate when confidence is below this'),
+    ]
+    for option in reversed(options):
+        command = option(command)
+    return command
+
+
+def image_options(command):
+    """Add the vision upload options (--image-detail, --image-format, near-duplicate reuse) to a command."""
+    options = [
+        click.option('--image-detail', type=click.Choice(DETAIL_LEVELS), default='auto', show_default=True,
+                     help='Vision detail level; low sends 512px images (fewest tokens)'),
+        click.option('--image-format', type=click.Choice(FORMATS), default='jpeg', show_default=True,
+                     help='Format images are transcoded to before upload'),
+        click.option('--image-dedup-distance', type=click.IntRange(0, 32), default=DEFAULT_MAX_DISTANCE,
+                     show_default=True, help='Perceptual hash distance (of 64 bits) for near-duplicate images'),
+        click.option('--no-image-dedup', is_flag=True,
+                     help='Analyze near-duplicate images instead of reusing the first copy\'s analysis'),
+    ]
+    for option in reversed(options):
+        command = option(command)
+    return command
+
+
+def _build_image_deduplicator(storage: EvidenceStorage, case_id: Optional[str], no_image_dedup: bool,
+                               image_dedup_distance: int):
+    """ImageDeduplicator for the image options, or None with --no-image-dedup."""
+    if no_image_dedup:
+        return None
+    from evidence_toolkit.pipeline.dedup import ImageDeduplicator
+
+    return ImageDeduplicator(storage, max_distance=image_dedup_distance, case_id=case_id)
+
+
+def _build_router(cascade: bool, fast_model: str, strong_model: str,
+                  confidence_threshold: float) -> Optional[ModelRouter]:
+    """ModelRouter for --cascade, or None when the cascade is off."""
+    if not cascade:
+        return None
+    return ModelRouter(fast_model, strong_model, confidence_threshold)
+
+
+def _init_openai_client(quiet: bool):
+    """OpenAI client from OPENAI_API_KEY, or None (AI analysis disabled)."""
     openai_client = None
     try:
         import openai
@@ -111,12 +132,29 @@ def process_case(case_directory: Path, case_id: str, storage_dir: str, output_di
     except ImportError:
         if not quiet:
             click.echo("   ⚠️  OpenAI package not available - AI analysis disabled")
+    return openai_client
+
+
+def _analyze_ingested(storage: EvidenceStorage, ingested_sha256s: List[str], openai_client, case_id: str,
+                      actor: str, quiet: bool, budget: Optional[BudgetController] = None,
+                      router: Optional[ModelRouter] = None, max_concurrent: int = 5, no_pack: bool = False,
+                      no_email_threads: bool = False, no_text_dedup: bool = False,
+                      text_dedup_threshold: float = DEFAULT_CONTAINMENT_THRESHOLD,
+                      pdf_workers: Optional[int] = None, image_preparer: Optional[ImagePreparer] = None,
+                      image_deduplicator=None) -> Tuple[int, int]:
+    """Analyze just-ingested evidence: email threads, near-duplicates, packing, then one by one and image batches.
+
+    Shared by process-case and watch. Evidence already analyzed for the case is skipped.
+
+    Returns:
+        (items analyzed, items skipped as already analyzed)
+    """
+    from evidence_toolkit.pipeline.analyze import analyze_evidence
+    from evidence_toolkit.pipeline.packing import analyze_packed
 
     analyzed_count = 0
     skipped_count = 0
 
-    # Get only the evidence that was just ingested (from results)
-    ingested_sha256s = [r.sha256 for r in results if r.success]
 
     # v3.3.1: Separate images for batch processing
     image_sha256s = []
@@ -129,8 +167,142 @@ def process_case(case_directory: Path, case_id: str, storage_dir: str, output_di
         else:
             non_image_sha256s.append(sha256)
 
+    def analyze_sequentially(sha256_list):
+        """Analyze evidence one item at a time (documents, emails, batch fallback)."""
+        nonlocal analyzed_count, skipped_count
+
+        for sha256 in sha256_list:
+            # Check if already analyzed
+            sha256_dir = get_evidence_base_dir(storage.derived_dir, sha256)
+            analysis_file = sha256_dir / "analysis.v1.json"
+
+            if analysis_file.exists():
+                # Check if already associated with this case
+                existing_analysis = storage.get_analysis(sha256)
+                if existing_analysis and case_id in existing_analysis.case_ids:
+                    skipped_count += 1
+                    continue
+                elif existing_analysis and case_id not in existing_analysis.case_ids:
+                    # Add to new case without re-analyzing
+                    existing_analysis.case_ids.append(case_id)
+
+                    # Add custody event
+                    custody_event = ChainOfCustodyEvent(
+                        timestamp=datetime.now(),
+                        event_type='case_association',
+                        actor=actor,
+                        description=f"Associated with case {case_id}",
+                        metadata={'previous_cases': existing_analysis.case_ids[:-1]}
+                    )
+                    storage._add_custody_event(sha256, custody_event)
+
+                    # Save updated analysis
+                    storage.save_analysis(existing_analysis)
+                    skipped_count += 1  # Changed from analyzed_count - this is a skip, not new analysis
+                    continue
+
+            # Budget check before any AI work on this item
+            model = None
+            if budget and openai_client:
+                original_file = storage.get_original_file_path(sha256)
+                evidence_type = EvidenceType(detect_file_type(original_file))
+                decision = budget.decide(
+                    sha256,
+                    evidence_type,
+                    router.fast_model if router else _default_model_for(evidence_type),
+                    file_size=original_file.stat().st_size,
+                    filename=original_file.name
+                )
+                if not decision.should_run:
+                    continue
+                if decision.action == BudgetDecision.DOWNGRADE:
+                    model = decision.model  # Downgrades bypass the cascade
+
+            # Analyze new evidence (not yet analyzed)
+            try:
+                analysis = analyze_evidence(
+                    sha256=sha256,
+                    storage=storage,
+                    openai_client=openai_client,
+                    case_id=case_id,
+                    evidence_type='auto',
+                    quiet=True,
+                    model=model,
+                    router=router,
+                    pdf_workers=pdf_workers,
+                    image_preparer=image_preparer,
+                    image_deduplicator=image_deduplicator
+                )
+                analyzed_count += 1
+                if budget and openai_client:
+                    budget.record_completed(sha256, analysis.evidence_type)
+
+                if not quiet and analyzed_count % 5 == 0:
+                    click.echo(f"   Analyzed {analyzed_count} items...")
+            except Exception as e:
+                if not quiet:
+                    click.echo(f"   ⚠️  Failed to analyze {sha256[:8]}: {e}")
+
+    # Emails in multi-message threads: one analysis per thread, saved for each new member
+    if openai_client and not no_email_threads:
+        from evidence_toolkit.pipeline.threads import analyze_email_threads
+
+        pending = [
+            sha256 for sha256 in non_image_sha256s
+            if not (get_evidence_base_dir(storage.derived_dir, sha256) / "analysis.v1.json").exists()
+        ]
+        threaded, unthreaded = analyze_email_threads(
+            storage, pending, openai_client,
+            case_id=case_id, quiet=quiet, router=router, budget=budget
+        )
+        analyzed_count += len(threaded)
+        handled = set(pending) - set(unthreaded)
+        non_image_sha256s = [sha256 for sha256 in non_image_sha256s if sha256 not in handled]
+
+    # Near-duplicate documents/emails: analyze one representative per group, link the rest after
+    text_deduplicator = None
+    if openai_client and not no_text_dedup:
+        from evidence_toolkit.pipeline.dedup import TextDeduplicator
+
+        text_deduplicator = TextDeduplicator(storage, threshold=text_dedup_threshold)
+        text_deduplicator.plan(
+            sha256 for sha256 in non_image_sha256s
+            if not (get_evidence_base_dir(storage.derived_dir, sha256) / "analysis.v1.json").exists()
+        )
+        non_image_sha256s = [sha256 for sha256 in non_image_sha256s if sha256 not in text_deduplicator.links]
+        if not quiet and text_deduplicator.links:
+            groups = len({link.canonical_sha256 for link in text_deduplicator.links.values()})
+            click.echo(f"   ♻️  {len(text_deduplicator.links)} near-duplicate documents/emails in {groups} groups "
+                       f"- analyzing one per group")
+
+    # Pack small, not-yet-analyzed documents and emails into shared requests
+    if openai_client and not no_pack:
+        pending = [
+            sha256 for sha256 in non_image_sha256s
+            if not (get_evidence_base_dir(storage.derived_dir, sha256) / "analysis.v1.json").exists()
+        ]
+        packed, unpacked = analyze_packed(
+            storage, pending, openai_client,
+            case_id=case_id, quiet=quiet, router=router, budget=budget
+        )
+        analyzed_count += len(packed)
+        # Budget skips made while packing are final; the rest run one by one
+        handled = set(pending) - set(unpacked)
+        non_image_sha256s = [sha256 for sha256 in non_image_sha256s if sha256 not in handled]
+
+    # Documents and emails first - under a budget they carry most of the case value
+    analyze_sequentially(non_image_sha256s)
+
+    if text_deduplicator:
+        # Members whose representative has no analysis (failed, budget) are analyzed themselves
+        unlinked = [sha256 for sha256 in text_deduplicator.links if not text_deduplicator.link(sha256, case_id)]
+        analyze_sequentially(unlinked)
+
     # Batch process images if we have any
     if image_sha256s and openai_client:
+        if budget:
+            image_sha256s = prioritize_images(storage, image_sha256s)
+
         if not quiet:
             click.echo(f"\n   ⚡ Batch processing {len(image_sha256s)} images ({max_concurrent} concurrent)...")
 
@@ -144,7 +316,11 @@ def process_case(case_directory: Path, case_id: str, storage_dir: str, output_di
                 storage,
                 case_id=case_id,
                 max_concurrent=max_concurrent,
-                quiet=quiet
+                quiet=quiet,
+                budget=budget,
+                router=router,
+                image_preparer=image_preparer,
+                image_deduplicator=image_deduplicator
             ))
 
             analyzed_count += len([r for r in batch_results.values() if r.image_analysis])
@@ -155,60 +331,224 @@ def process_case(case_directory: Path, case_id: str, storage_dir: str, output_di
             if not quiet:
                 click.echo(f"   ⚠️  Batch processing failed, falling back to sequential: {e}")
             # Fall back to sequential processing
-            for sha256 in image_sha256s:
-                non_image_sha256s.append(sha256)
-
-    # Process non-image evidence sequentially
-    for sha256 in non_image_sha256s:
-        # Check if already analyzed
-        sha256_dir = get_evidence_base_dir(storage.derived_dir, sha256)
-        analysis_file = sha256_dir / "analysis.v1.json"
-
-        if analysis_file.exists():
-            # Check if already associated with this case
-            existing_analysis = storage.get_analysis(sha256)
-            if existing_analysis and case_id in existing_analysis.case_ids:
-                skipped_count += 1
-                continue
-            elif existing_analysis and case_id not in existing_analysis.case_ids:
-                # Add to new case without re-analyzing
-                existing_analysis.case_ids.append(case_id)
-
-                # Add custody event
-                custody_event = ChainOfCustodyEvent(
-                    timestamp=datetime.now(),
-                    event_type='case_association',
-                    actor=actor,
-                    description=f"Associated with case {case_id}",
-                    metadata={'previous_cases': existing_analysis.case_ids[:-1]}
-                )
-                storage._add_custody_event(sha256, custody_event)
+            analyze_sequentially(image_sha256s)
+    else:
+        analyze_sequentially(image_sha256s)
 
-                # Save updated analysis
-                storage.save_analysis(existing_analysis)
-                skipped_count += 1  # Changed from analyzed_count - this is a skip, not new analysis
-                continue
+    if not quiet:
+        click.echo(f"   ✅ Analyzed {analyzed_count} new items (skipped {skipped_count} existing)")
+        if budget and budget.skipped:
+            click.echo(f"   💸 Budget skipped {len(budget.skipped)} items")
+        if router:
+            analyses = [storage.get_analysis(sha256) for sha256 in ingested_sha256s]
+            decisions = [d for analysis in analyses if analysis for d in analysis.routing_decisions]
+            escalated = sum(1 for d in decisions if d.escalated)
+            click.echo(f"   🪜 Cascade: {escalated}/{len(decisions)} AI analyses escalated to {router.strong_model}")
+        if image_deduplicator and image_deduplicator.reused:
+            click.echo(f"   ♻️  Near-duplicates: {len(image_deduplicator.reused)} image analyses reused "
+                       f"({len(image_deduplicator.reused)} vision calls saved)")
+        if text_deduplicator and text_deduplicator.reused:
+            click.echo(f"   ♻️  Near-duplicates: {len(text_deduplicator.reused)} document/email analyses reused "
+                       f"({len(text_deduplicator.reused)} AI calls saved)")
+
+    return analyzed_count, skipped_count
 
-        # Analyze new evidence (not yet analyzed)
+
+@click.group()
+@click.version_option(version="4.0.0", prog_name="evidence-toolkit")
+def cli():
+    """Evidence Toolkit - AI-powered legal evidence analysis suite."""
+    pass
+
+
+@cli.command(name="process-case")
+@click.argument('case_directory', type=click.Path(exists=True, path_type=Path))
+@click.option('--case-id', required=True, help='Case ID for this evidence collection')
+@click.option('--storage-dir', default=str(DEFAULT_STORAGE_PATH), help='Evidence storage directory (default: data/storage)')
+@click.option('--output-dir', default='./data/packages', help='Output directory for client package (default: ./data/packages)')
+@click.option('--skip-package', is_flag=True, help='Skip package generation (only ingest, analyze, correlate)')
+@click.option('--ai-resolve', is_flag=True, help='Use AI to resolve ambiguous entity matches (v3.2 feature)')
+@click.option('--case-type', type=click.Choice(['generic', 'workplace', 'employment', 'contract']),
+              default='generic', help='Case type for domain-specific analysis (default: generic, v3.2 feature)')
+@click.option('--max-concurrent', default=5, type=int, help='Max concurrent image analyses (default: 5, v3.3.1 feature)')
+@click.option('--max-cost', type=float, help='AI spend limit in USD; work is downgraded/skipped as it approaches')
+@click.option('--deadline', help='Wall-time limit for the run, e.g. 90s, 45m, 2h')
+@cascade_options
+@click.option('--no-pack', is_flag=True, help='Send every small document/email as its own AI request')
+@click.option('--no-email-threads', is_flag=True, help='Analyze every email on its own instead of once per thread')
+@click.option('--text-dedup-threshold', type=click.FloatRange(0.5, 1.0), default=DEFAULT_CONTAINMENT_THRESHOLD,
+              show_default=True, help="Share of a document/email's text found in another for it to count as a near-duplicate")
+@click.option('--no-text-dedup', is_flag=True, help='Analyze every near-duplicate document/email separately')
+@click.option('--pdf-workers', type=click.IntRange(min=1),
+              help='Processes for PDF text extraction (default: CPU count, max 8; 1 = no pool)')
+@image_options
+@click.option('--resume', 'resume_run_id', metavar='RUN_ID',
+              help='Continue a failed or interrupted run, skipping the stages and items it finished')
+@click.option('--actor', default='system', help='Actor performing the processing (default: system)')
+@click.option('--quiet', '-q', is_flag=True, help='Suppress verbose output')
+def process_case(case_directory: Path, case_id: str, storage_dir: str, output_dir: str,
+                skip_package: bool, ai_resolve: bool, case_type: str, max_concurrent: int,
+                max_cost: Optional[float], deadline: Optional[str], cascade: bool, fast_model: str,
+                strong_model: str, confidence_threshold: float, no_pack: bool, no_email_threads: bool,
+                text_dedup_threshold: float,
+                no_text_dedup: bool, pdf_workers: Optional[int],
+                image_detail: str, image_format: str, image_dedup_distance: int, no_image_dedup: bool,
+                resume_run_id: Optional[str], actor: str, quiet: bool):
+    """Complete pipeline: ingest → analyze → correlate → package
+
+    Process all evidence files in CASE_DIRECTORY through the complete analysis pipeline.
+
+    With --max-cost/--deadline, documents and emails are analyzed before images,
+    models are downgraded near the limit, low-value images are skipped, and AI
+    work stops at the limit. Everything skipped is reported.
+
+    With --cascade, each item is analyzed with --fast-model first and re-run
+    with --strong-model when confidence is low or risk flags such as
+    retaliation or harassment appear.
+
+    Emails are threaded from their Message-ID/In-Reply-To/References headers
+    and analyzed once per thread (with the case's earlier emails as context)
+    unless --no-email-threads is given. Small documents and emails are
+    packed several to a request unless --no-pack is given.
+
+    Near-identical images (the same screenshot twice, resized copies) reuse
+    the analysis of the first copy unless --no-image-dedup is given. Likewise
+    near-duplicate documents and emails (forwards, quoted replies, .eml/.msg
+    copies) are analyzed once per group unless --no-text-dedup is given.
+
+    Each run is journaled in storage under runs/<run-id>. After a failure,
+    --resume <run-id> skips ingestion, analyzes only the items the run had
+    not finished and reuses the case summary if packaging failed.
+    """
+    from evidence_toolkit.pipeline.summary import SummaryGenerator
+    from evidence_toolkit.pipeline.package import PackageGenerator
+    from evidence_toolkit.pipeline.journal import RunJournal
+
+    start_time = time.time()
+    storage = EvidenceStorage(Path(storage_dir))
+    router = _build_router(cascade, fast_model, strong_model, confidence_threshold)
+    # Prepared images are cached in derived storage per sha256 and settings
+    image_preparer = ImagePreparer(format=image_format, detail=image_detail, cache_dir=storage.derived_dir)
+    # Near-identical images (same screenshot twice, resized copies) reuse one analysis
+    image_deduplicator = _build_image_deduplicator(storage, case_id, no_image_dedup, image_dedup_distance)
+
+    # Budget controller (optional) - clock starts now, spend counted from every AI call
+    budget = None
+    if max_cost is not None or deadline:
         try:
-            analyze_evidence(
-                sha256=sha256,
-                storage=storage,
-                openai_client=openai_client,
-                case_id=case_id,
-                evidence_type='auto',
-                quiet=True
+            budget = BudgetController(
+                case_id,
+                max_cost=max_cost,
+                deadline_seconds=parse_duration(deadline) if deadline else None
             )
-            analyzed_count += 1
+        except ValueError as e:
+            raise click.BadParameter(str(e))
+        budget.start()
+
+    # Run journal - records finished stages and items so a failed run can be resumed
+    try:
+        if resume_run_id:
+            journal = RunJournal.resume(storage, resume_run_id, case_id=case_id)
+        else:
+            journal = RunJournal.start(storage, case_id, case_directory.resolve())
+    except ValueError as e:
+        raise click.BadParameter(str(e), param_hint='--resume')
+    except RuntimeError as e:
+        click.echo(f"❌ {e}", err=True)
+        sys.exit(1)
+    if resume_run_id and journal.run.case_directory != str(case_directory.resolve()):
+        journal.release()
+        raise click.BadParameter(f"Run {resume_run_id} processed {journal.run.case_directory}",
+                                 param_hint='CASE_DIRECTORY')
+
+    def fail_run(stage: str, error: Exception, message: str):
+        journal.fail(stage, error)
+        click.echo(f"❌ {message}: {error}", err=True)
+        click.echo(f"   Resume with: evidence-toolkit process-case {case_directory} --case-id {case_id} "
+                   f"--resume {journal.run_id}", err=True)
+        sys.exit(1)
+
+    if not quiet:
+        click.echo("🔬 Evidence Toolkit v3.0 - Automated Case Processing Pipeline")
+        click.echo("=" * 60)
+        click.echo(f"📁 Case Directory: {case_directory}")
+        click.echo(f"🆔 Case ID: {case_id}")
+        click.echo(f"💾 Storage: {storage_dir}")
+        click.echo(f"🧾 Run: {journal.run_id}{' (resumed)' if resume_run_id else ''}")
+        if budget:
+            limits = []
+            if budget.max_cost:
+                limits.append(f"${budget.max_cost:.2f}")
+            if budget.deadline_seconds:
+                limits.append(f"{budget.deadline_seconds:.0f}s")
+            click.echo(f"💸 Budget: {' / '.join(limits)}")
+        if router:
+            click.echo(f"🪜 Cascade: {router.fast_model} → {router.strong_model} "
+                       f"(confidence < {router.confidence_threshold:.2f} or risk flags)")
+        click.echo("=" * 60)
+        click.echo()
 
-            if not quiet and analyzed_count % 5 == 0:
-                click.echo(f"   Analyzed {analyzed_count} items...")
+    # Step 1: Ingest Evidence
+    if not quiet:
+        click.echo("📥 [1/4] Ingesting evidence files...")
+
+    if journal.is_done("ingest"):
+        # Mailboxes are analyzed through their messages; an attachment shared by
+        # several emails is one evidence item
+        ingested_sha256s = journal.items("ingest")
+        if not quiet:
+            click.echo(f"   ⏭️  Already ingested in this run ({len(ingested_sha256s)} evidence items)")
+    else:
+        journal.start_stage("ingest")
+        try:
+            results = ingest_path(case_directory, storage, case_id=case_id, actor=actor, quiet=quiet)
+            print_ingestion_summary(results, quiet=quiet)
         except Exception as e:
-            if not quiet:
-                click.echo(f"   ⚠️  Failed to analyze {sha256[:8]}: {e}")
+            fail_run("ingest", e, "Ingestion failed")
 
+        # Get only the evidence that was just ingested (from results)
+        # Mailboxes are analyzed through their messages; an attachment shared by
+        # several emails is one evidence item
+        ingested_sha256s = list(dict.fromkeys(r.sha256 for r in results if r.success and not r.container_only))
+        journal.complete_stage("ingest", items=ingested_sha256s)
+
+    # Step 2: Analyze all evidence
     if not quiet:
-        click.echo(f"   ✅ Analyzed {analyzed_count} new items (skipped {skipped_count} existing)")
+        click.echo("\n🔍 [2/4] Analyzing evidence with AI...")
+
+    openai_client = _init_openai_client(quiet)
+
+    # Items with an analysis saved earlier in this run are not re-checked; failed ones are retried
+    finished = set(journal.items("analyze"))
+    pending_sha256s = [sha256 for sha256 in ingested_sha256s if sha256 not in finished]
+    if not quiet and finished:
+        click.echo(f"   ⏭️  {len(finished)} items already analyzed in this run")
+    journal.start_stage("analyze")
+    try:
+        analyzed_count, skipped_count = _analyze_ingested(
+            storage, pending_sha256s, openai_client, case_id, actor, quiet,
+            budget=budget, router=router, max_concurrent=max_concurrent, no_pack=no_pack,
+            no_email_threads=no_email_threads, no_text_dedup=no_text_dedup,
+            text_dedup_threshold=text_dedup_threshold, pdf_workers=pdf_workers,
+            image_preparer=image_preparer, image_deduplicator=image_deduplicator
+        )
+    except Exception as e:
+        fail_run("analyze", e, "Analysis failed")
+    finally:
+        # Saved analyses count as finished even if the stage is interrupted
+        newly_analyzed = [
+            sha256 for sha256 in pending_sha256s
+            if (get_evidence_base_dir(storage.derived_dir, sha256) / "analysis.v1.json").exists()
+        ]
+        journal.record_items("analyze", newly_analyzed)
+        if newly_analyzed:
+            journal.invalidate_case_summary()  # A summary from an earlier attempt misses them
+    skipped_count += len(finished)
+    journal.complete_stage("analyze")
+
+    # Snapshot the budget report now so the package metadata includes it
+    if budget:
+        storage.save_budget_report(budget.report())
 
     # Step 3: Cross-evidence correlation (integrated into package generation)
     if not quiet:
@@ -222,13 +562,41 @@ def process_case(case_directory: Path, case_id: str, storage_dir: str, output_di
         if not quiet:
             click.echo("\n📦 [4/4] Generating client package...")
 
+        # Under a budget, the executive summary may be downgraded or dropped to rule-based only
+        package_client = openai_client
+        summary_model = None
+        if budget and openai_client:
+            summary_model = budget.downgrade_model(SummaryGenerator.DEFAULT_MODEL)
+            if summary_model is None:
+                package_client = None
+                if not quiet:
+                    click.echo(f"   💸 Budget exhausted - packaging without AI ({budget.stopped_reason or 'limit reached'})")
+
+        package_generator = PackageGenerator(storage, package_client, case_type=case_type, ai_resolve=ai_resolve,
+                                             summary_model=summary_model)
+
+        # Correlation + executive summary, checkpointed so a packaging failure does not repeat them
+        case_summary = journal.load_case_summary()
+        if case_summary is not None:
+            if not quiet:
+                click.echo("   ⏭️  Reusing the case summary generated earlier in this run")
+        else:
+            journal.start_stage("summary")
+            try:
+                case_summary = package_generator.generate_case_summary(case_id)
+            except Exception as e:
+                fail_run("summary", e, "Case summary failed")
+            journal.save_case_summary(case_summary)
+            journal.complete_stage("summary")
+
+        journal.start_stage("package")
         try:
-            package_generator = PackageGenerator(storage, openai_client, case_type=case_type, ai_resolve=ai_resolve)
             result = package_generator.create_client_package(
                 case_id=case_id,
                 output_directory=Path(output_dir),
                 include_raw_evidence=True,
-                package_format='zip'
+                package_format='zip',
+                case_summary=case_summary
             )
 
             if result["success"] and not quiet:
@@ -236,8 +604,28 @@ def process_case(case_directory: Path, case_id: str, storage_dir: str, output_di
                 package_size = Path(result['package_path']).stat().st_size / (1024 * 1024)
                 click.echo(f"   📊 Size: {package_size:.1f} MB")
         except Exception as e:
-            click.echo(f"❌ Package generation failed: {e}", err=True)
-            sys.exit(1)
+            fail_run("package", e, "Package generation failed")
+        journal.complete_stage("package", package_path=result["package_path"])
+
+    # Final budget report (includes packaging spend): show exactly what was skipped or downgraded
+    if budget:
+        budget.stop()
+        budget_report = budget.report()
+        report_file = storage.save_budget_report(budget_report)
+        if not quiet:
+            click.echo(f"\n💸 Budget: spent ${budget_report.spent_usd:.4f}"
+                       f"{f' of ${budget_report.max_cost_usd:.2f}' if budget_report.max_cost_usd else ''}"
+                       f" in {budget_report.elapsed_seconds:.0f}s")
+            if budget_report.stopped_reason:
+                click.echo(f"   ⛔ AI work stopped: {budget_report.stopped_reason}")
+            for action in budget_report.downgraded:
+                click.echo(f"   ↘️  Downgraded {action.filename or action.sha256[:12]}: "
+                           f"{action.model_from} → {action.model_to} ({action.reason})")
+            for action in budget_report.skipped:
+                click.echo(f"   ⏭️  Skipped {action.filename or action.sha256[:12]}: {action.reason}")
+            click.echo(f"   📄 Budget report: {report_file}")
+
+    journal.complete()
 
     # Summary
     elapsed_time = time.time() - start_time
@@ -247,9 +635,88 @@ def process_case(case_directory: Path, case_id: str, storage_dir: str, output_di
         click.echo("=" * 60)
         click.echo(f"⏱️  Total time: {elapsed_time:.1f} seconds")
         click.echo(f"📊 Evidence processed: {analyzed_count + skipped_count} items")
+        cost_report = storage.get_case_cost_report(case_id)
+        if cost_report.total.calls:
+            click.echo(f"💰 AI usage: {cost_report.total.calls} calls, "
+                       f"est. ${cost_report.total.estimated_cost_usd:.4f} "
+                       f"(see: evidence-toolkit case cost {case_id})")
         click.echo()
 
 
+@cli.command(name="watch")
+@click.argument('case_directory', type=click.Path(exists=True, file_okay=False, path_type=Path))
+@click.option('--case-id', required=True, help='Case ID the new evidence is ingested into')
+@click.option('--storage-dir', default=str(DEFAULT_STORAGE_PATH), help='Evidence storage directory (default: data/storage)')
+@click.option('--interval', default=DEFAULT_POLL_INTERVAL, type=click.FloatRange(min=0.1), show_default=True,
+              help='Seconds between checks for new files')
+@click.option('--settle', 'settle_seconds', default=DEFAULT_SETTLE_SECONDS, type=click.FloatRange(min=0.0),
+              show_default=True, help='Seconds a file must stay unchanged before it is ingested')
+@click.option('--once', is_flag=True, help='Ingest and analyze the files that have settled, then exit (e.g. from cron)')
+@click.option('--no-analyze', is_flag=True, help='Only ingest new files')
+@click.option('--max-concurrent', default=5, type=int, help='Max concurrent image analyses (default: 5)')
+@cascade_options
+@click.option('--no-pack', is_flag=True, help='Send every small document/email as its own AI request')
+@click.option('--no-email-threads', is_flag=True, help='Analyze every email on its own instead of once per thread')
+@click.option('--no-text-dedup', is_flag=True, help='Analyze every near-duplicate document/email separately')
+@click.option('--pdf-workers', type=click.IntRange(min=1),
+              help='Processes for PDF text extraction and OCR (default: CPU count, capped)')
+@image_options
+@click.option('--actor', default='system', help='Actor performing the ingestion (default: system)')
+@click.option('--quiet', '-q', is_flag=True, help='Suppress verbose output')
+def watch_cmd(case_directory: Path, case_id: str, storage_dir: str, interval: float, settle_seconds: float,
+              once: bool, no_analyze: bool, max_concurrent: int, cascade: bool, fast_model: str,
+              strong_model: str, confidence_threshold: float, no_pack: bool, no_email_threads: bool,
+              no_text_dedup: bool, pdf_workers: Optional[int], image_detail: str, image_format: str,
+              image_dedup_distance: int, no_image_dedup: bool, actor: str, quiet: bool):
+    """Ingest and analyze new files as they are added to CASE_DIRECTORY
+
+    Polls the directory every --interval seconds. Files are ingested once they
+    have stopped changing for --settle seconds (partially copied files are not
+    hashed), and only files new or changed since the last ingestion are read -
+    a restarted watcher picks up where it stopped. Each batch of new evidence
+    is analyzed with the process-case stages (email threads, near-duplicates,
+    packing, image batches). Run process-case or package to build the client
+    package. Stop with Ctrl+C.
+    """
+    from evidence_toolkit.pipeline.watch import watch_directory
+
+    storage = EvidenceStorage(Path(storage_dir))
+    openai_client = None if no_analyze else _init_openai_client(quiet)
+    router = _build_router(cascade, fast_model, strong_model, confidence_threshold)
+    image_preparer = ImagePreparer(format=image_format, detail=image_detail, cache_dir=storage.derived_dir)
+    image_deduplicator = _build_image_deduplicator(storage, case_id, no_image_dedup, image_dedup_distance)
+
+    def analyze_batch(results):
+        if no_analyze:
+            return
+        ingested_sha256s = list(dict.fromkeys(r.sha256 for r in results if r.success and not r.container_only))
+        if image_deduplicator:
+            image_deduplicator.reused = {}  # Report reuse per batch; the hash index is kept
+        _analyze_ingested(
+            storage, ingested_sha256s, openai_client, case_id, actor, quiet,
+            router=router, max_concurrent=max_concurrent, no_pack=no_pack,
+            no_email_threads=no_email_threads, no_text_dedup=no_text_dedup, pdf_workers=pdf_workers,
+            image_preparer=image_preparer, image_deduplicator=image_deduplicator
+        )
+
+    if not quiet:
+        click.echo(f"👀 Watching {case_directory} for case {case_id} "
+                   f"(every {interval:g}s, files settle after {settle_seconds:g}s)")
+
+    ingested = watch_directory(
+        case_directory, storage, case_id,
+        on_ingested=analyze_batch,
+        interval=interval,
+        settle_seconds=settle_seconds,
+        actor=actor,
+        quiet=quiet,
+        max_polls=1 if once else None
+    )
+
+    if not quiet:
+        click.echo(f"✅ {ingested} new files ingested into case {case_id}")
+
+
 @cli.command(name="ingest")
 @click.argument('input_path', type=click.Path(exists=True, path_type=Path))
 @click.option('--case-id', help='Case ID to associate with this evidence')
@@ -278,8 +745,15 @@ def ingest_cmd(input_path: Path, case_id: Optional[str], actor: str, storage_dir
 @click.option('--type', 'evidence_type', type=click.Choice(['auto', 'document', 'image', 'email']),
               default='auto', help='Evidence type (default: auto-detect)')
 @click.option('--force', is_flag=True, help='Force re-analysis even if analysis exists')
+@cascade_options
+@click.option('--pdf-workers', type=click.IntRange(min=1),
+              help='Processes for PDF text extraction (default: CPU count, max 8; 1 = no pool)')
+@image_options
 @click.option('--quiet', '-q', is_flag=True, help='Suppress verbose output')
-def analyze_cmd(sha256: str, case_id: Optional[str], storage_dir: str, evidence_type: str, force: bool, quiet: bool):
+def analyze_cmd(sha256: str, case_id: Optional[str], storage_dir: str, evidence_type: str, force: bool,
+                cascade: bool, fast_model: str, strong_model: str, confidence_threshold: float,
+                pdf_workers: Optional[int], image_detail: str, image_format: str, image_dedup_distance: int,
+                no_image_dedup: bool, quiet: bool):
     """Analyze evidence by SHA256 hash
 
     Performs AI-powered analysis on ingested evidence:
@@ -290,6 +764,8 @@ def analyze_cmd(sha256: str, case_id: Optional[str], storage_dir: str, evidence_
     Use --force to re-analyze evidence that already has an analysis.
     Previous analysis will be backed up before being overwritten.
     """
+    from evidence_toolkit.pipeline.analyze import analyze_evidence
+
     storage = EvidenceStorage(Path(storage_dir))
 
     # Initialize OpenAI client
@@ -313,7 +789,11 @@ def analyze_cmd(sha256: str, case_id: Optional[str], storage_dir: str, evidence_
             case_id=case_id,
             evidence_type=evidence_type,
             force=force,
-            quiet=quiet
+            quiet=quiet,
+            router=_build_router(cascade, fast_model, strong_model, confidence_threshold),
+            pdf_workers=pdf_workers,
+            image_preparer=ImagePreparer(format=image_format, detail=image_detail, cache_dir=storage.derived_dir),
+            image_deduplicator=_build_image_deduplicator(storage, case_id, no_image_dedup, image_dedup_distance)
         )
 
         if not quiet:
@@ -337,6 +817,8 @@ def correlate_cmd(case_id: str, storage_dir: str, json_output: Optional[Path], a
     - Timeline reconstruction from all evidence
     - Pattern detection across documents, emails, and images
     """
+    from evidence_toolkit.analyzers.correlation import CorrelationAnalyzer
+
     storage = EvidenceStorage(Path(storage_dir))
     # v3.1: Try to get OpenAI client for pattern detection (optional)
     openai_client = None
@@ -424,6 +906,8 @@ def package_cmd(case_id: str, storage_dir: str, output_dir: str, include_raw: bo
     - Timeline visualization
     - Optional: Original evidence files
     """
+    from evidence_toolkit.pipeline.package import PackageGenerator
+
     storage = EvidenceStorage(Path(storage_dir))
 
     # Initialize OpenAI client for executive summary
@@ -783,6 +1267,73 @@ def case_evidence_cmd(case_id: str, storage_dir: str, full_hash: bool):
         sys.exit(1)
 
 
+@case_group.command(name="cost")
+@click.argument('case_id')
+@click.option('--storage-dir', default=str(DEFAULT_STORAGE_PATH), help='Evidence storage directory')
+@click.option('--json-output', type=click.Path(path_type=Path), help='Save cost report as JSON')
+@click.option('--top', default=10, type=int, help='Number of most expensive evidence items to list (default: 10)')
+def case_cost_cmd(case_id: str, storage_dir: str, json_output: Optional[Path], top: int):
+    """Show AI token usage and estimated cost for a case
+
+    Rolls up per-evidence usage (recorded at analysis time) and case-level
+    usage (correlation, executive summary) by stage and by model.
+    """
+    storage = EvidenceStorage(Path(storage_dir))
+
+    try:
+        if not storage.list_evidence(case_id):
+            click.echo(f"❌ Case not found: {case_id}", err=True)
+            sys.exit(1)
+
+        report = storage.get_case_cost_report(case_id)
+        total = report.total
+
+        click.echo(f"💰 AI Usage: {case_id}")
+        click.echo("=" * 80)
+        click.echo(f"Evidence items:      {report.evidence_count} ({report.evidence_with_usage} with AI calls)")
+        click.echo(f"AI calls:            {total.calls} ({total.retries} retries)")
+        click.echo(f"Input tokens:        {total.input_tokens:,} ({total.cached_input_tokens:,} cached)")
+        click.echo(f"Output tokens:       {total.output_tokens:,}")
+        click.echo(f"API latency:         {total.latency_seconds:.1f}s")
+        click.echo(f"Estimated cost:      ${total.estimated_cost_usd:.4f}")
+        if report.duplicates_reused:
+            click.echo(f"Near-duplicates:     {report.duplicates_reused} analyses reused "
+                       f"({report.duplicates_reused} AI calls saved)")
+        if total.unpriced_calls:
+            click.echo(f"⚠️  {total.unpriced_calls} call(s) used models without pricing - not included in cost")
+
+        if total.by_stage:
+            click.echo(f"\n{'Stage':<22} {'Calls':>6} {'In tokens':>12} {'Out tokens':>11} {'Latency':>9} {'Cost':>10}")
+            click.echo("-" * 80)
+            for stage, stage_totals in sorted(total.by_stage.items(), key=lambda x: x[1].estimated_cost_usd, reverse=True):
+                click.echo(
+                    f"{stage:<22} {stage_totals.calls:>6} {stage_totals.input_tokens:>12,} "
+                    f"{stage_totals.output_tokens:>11,} {stage_totals.latency_seconds:>8.1f}s "
+                    f"{'$' + format(stage_totals.estimated_cost_usd, '.4f'):>10}"
+                )
+
+        if total.by_model:
+            click.echo(f"\n{'Model':<22} {'Calls':>6} {'Cost':>10}")
+            click.echo("-" * 40)
+            for model, model_totals in sorted(total.by_model.items(), key=lambda x: x[1].estimated_cost_usd, reverse=True):
+                click.echo(f"{model:<22} {model_totals.calls:>6} {'$' + format(model_totals.estimated_cost_usd, '.4f'):>10}")
+
+        if report.per_evidence and top > 0:
+            click.echo(f"\nMost expensive evidence (top {top}):")
+            ranked = sorted(report.per_evidence.items(), key=lambda x: x[1].estimated_cost_usd, reverse=True)
+            for sha256, evidence_totals in ranked[:top]:
+                click.echo(f"  {sha256[:16]}...  ${evidence_totals.estimated_cost_usd:.4f}  ({evidence_totals.calls} calls)")
+
+        if json_output:
+            with open(json_output, 'w') as f:
+                f.write(report.model_dump_json(indent=2))
+            click.echo(f"\n📄 Cost report saved to: {json_output}")
+
+    except Exception as e:
+        click.echo(f"❌ Failed to build cost report: {e}", err=True)
+        sys.exit(1)
+
+
 # =============================================================================
 # RE-ANALYSIS COMMANDS (v3.0 CLI Extensions)
 # =============================================================================
@@ -793,17 +1344,36 @@ def case_evidence_cmd(case_id: str, storage_dir: str, full_hash: bool):
 @click.option('--evidence-type', type=click.Choice(['all', 'document', 'image', 'email']),
               default='all', help='Filter by evidence type (default: all)')
 @click.option('--dry-run', is_flag=True, help='Preview what would be re-analyzed')
+@click.option('--offline', is_flag=True, help='Submit AI requests as one discounted Batch API job (results within 24h)')
+@click.option('--no-wait', is_flag=True, help='With --offline: submit and exit; collect later with --job-id')
+@click.option('--job-id', help='Collect (poll and hydrate) a previously submitted offline job')
+@click.option('--poll-interval', default=60.0, type=float, show_default=True,
+              help='Seconds between offline batch status checks')
 @click.option('--quiet', '-q', is_flag=True, help='Suppress verbose output')
-def reanalyze_cmd(case_id: str, storage_dir: str, evidence_type: str, dry_run: bool, quiet: bool):
+def reanalyze_cmd(case_id: str, storage_dir: str, evidence_type: str, dry_run: bool, offline: bool,
+                  no_wait: bool, job_id: Optional[str], poll_interval: float, quiet: bool):
     """Batch re-analyze all evidence in a case
 
     Re-runs AI analysis on all evidence items in the specified case.
     Previous analysis results are backed up before being overwritten.
 
     Use --dry-run to preview what would be re-analyzed without making changes.
+
+    Use --offline for overnight work: every request goes into one Batch API
+    job, which is polled and then hydrated into storage. With --no-wait the
+    job is only submitted; run again with --job-id to collect it. Emails in
+    threads are analyzed interactively, one request per thread.
     """
+    from evidence_toolkit.pipeline.analyze import analyze_evidence
+    from evidence_toolkit.pipeline.offline import THREADED_EMAIL_REASON, submit_batch_job
+    from evidence_toolkit.pipeline.threads import analyze_email_threads
+
     storage = EvidenceStorage(Path(storage_dir))
 
+    if job_id:
+        _collect_offline_job(storage, job_id, poll_interval, quiet)
+        return
+
     try:
         evidence_sha256s = storage.list_evidence(case_id)
 
@@ -851,6 +1421,33 @@ def reanalyze_cmd(case_id: str, storage_dir: str, evidence_type: str, dry_run: b
             if not quiet:
                 click.echo("⚠️  OpenAI package not available - AI analysis may be limited")
 
+        if offline:
+            if openai_client is None:
+                click.echo("❌ --offline requires OPENAI_API_KEY", err=True)
+                sys.exit(1)
+
+            job = submit_batch_job(storage, openai_client, case_id, evidence_sha256s, quiet=quiet)
+
+            # Email threads are analyzed now, one request per thread
+            threaded = [sha256 for sha256, reason in job.not_batched.items() if reason == THREADED_EMAIL_REASON]
+            if threaded:
+                if not quiet:
+                    click.echo(f"🧵 Analyzing {len(threaded)} threaded emails interactively...")
+                analyze_email_threads(storage, threaded, openai_client, case_id=case_id, quiet=quiet)
+
+            for sha256, reason in job.not_batched.items():
+                if reason != THREADED_EMAIL_REASON:
+                    click.echo(f"  ⚠️  Not batched {sha256[:12]}...: {reason} (run reanalyze without --offline)")
+
+            if no_wait or not job.requests:
+                if job.requests and not quiet:
+                    click.echo(f"\n📤 Submitted. Collect with: evidence-toolkit reanalyze --case-id {case_id} "
+                               f"--job-id {job.job_id}")
+                return
+
+            _collect_offline_job(storage, job.job_id, poll_interval, quiet, openai_client)
+            return
+
         # Re-analyze each piece
         successful = 0
         failed = 0
@@ -884,6 +1481,35 @@ def reanalyze_cmd(case_id: str, storage_dir: str, evidence_type: str, dry_run: b
         sys.exit(1)
 
 
+def _collect_offline_job(storage: EvidenceStorage, job_id: str, poll_interval: float, quiet: bool,
+                         openai_client=None):
+    """Poll an offline batch job until it finishes, then hydrate its results."""
+    from evidence_toolkit.pipeline.offline import poll_batch_job, hydrate_batch_job
+
+    job = storage.get_batch_job(job_id)
+    if job is None:
+        click.echo(f"❌ Offline batch job not found: {job_id}", err=True)
+        sys.exit(1)
+
+    if job.status == "hydrated":
+        click.echo(f"✅ Job {job_id} already hydrated ({len(job.hydrated)} analyses)")
+        return
+
+    if openai_client is None:
+        import openai
+        openai_client = openai.OpenAI()
+
+    try:
+        job = poll_batch_job(storage, openai_client, job, poll_interval=poll_interval, quiet=quiet)
+        hydrated = hydrate_batch_job(storage, openai_client, job, quiet=quiet)
+    except Exception as e:
+        click.echo(f"❌ Offline batch collection failed: {e}", err=True)
+        sys.exit(1)
+
+    if not quiet:
+        click.echo(f"\n✅ Offline re-analysis complete: {len(hydrated)} successful, {len(job.failed)} failed")
+
+
 @cli.command(name="version")
 def version_cmd():
     """Show version information"""
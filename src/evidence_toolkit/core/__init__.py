@@ -29,6 +29,13 @@ from .models import (
     # Operation Results
     IngestionResult,
     ExportResult,
+
+    # AI Usage Accounting
+    UsageRecord,
+    CaseCostReport,
+
+    # Model Routing
+    RoutingDecision,
 )
 
 from .utils import (
@@ -39,6 +46,10 @@ from .utils import (
     ensure_directory,
 )
 
+from .usage import track_usage, estimate_cost
+
+from .routing import ModelRouter
+
 from .storage import EvidenceStorage
 
 __all__ = [
@@ -54,6 +65,9 @@ __all__ = [
     "CorrelationAnalysis",
     "IngestionResult",
     "ExportResult",
+    "UsageRecord",
+    "CaseCostReport",
+    "RoutingDecision",
 
     # Utils
     "calculate_sha256",
@@ -62,6 +76,13 @@ __all__ = [
     "detect_file_type",
     "ensure_directory",
 
+    # Usage
+    "track_usage",
+    "estimate_cost",
+
+    # Routing
+    "ModelRouter",
+
     # Storage
     "EvidenceStorage",
 ]
@@ -0,0 +1,241 @@
+#!/usr/bin/env python3
+"""Token-budgeted chunking and deterministic merging for long documents.
+
+A 400-page bundle does not fit one request (or fails as a whole when it
+does). DocumentAnalyzer splits such text into chunks that stay under a token
+budget, cutting on page breaks first, then blank lines (sections and
+paragraphs), then lines, and only as a last resort mid-line. Chunks are
+analyzed independently and the results merged back into one DocumentAnalysis:
+
+- entities (including dates) are de-duplicated by type and normalized name,
+  keeping the most confident occurrence, in order of first appearance
+- risk flags are unioned in order of first appearance
+- legal significance takes the most severe chunk; sentiment is hostile if any
+  chunk is hostile, otherwise the majority
+- confidence is the token-weighted mean
+
+Merging depends only on the chunk results and their order, so re-running with
+cached chunk results reproduces the same analysis.
+"""
+
+import re
+from collections import Counter
+from typing import Dict, Iterable, Iterator, List, Sequence, Tuple
+
+from .models import DocumentAnalysis, DocumentChunk, DocumentEntity
+
+
+# Page separator written by DocumentAnalyzer._extract_pdf_text
+PAGE_BREAK = "\f"
+
+# Documents above this many estimated tokens are analyzed in chunks
+DEFAULT_CHUNK_TOKENS = 24000
+
+# Rough average for English text with the GPT-4o tokenizers
+CHARS_PER_TOKEN = 4
+
+_SIGNIFICANCE_ORDER = ["low", "medium", "high", "critical"]
+
+# Separators tried in order when a unit is too large for one chunk
+_SPLIT_PATTERNS = [
+    re.compile(r"\n\s*\n"),   # Sections / paragraphs
+    re.compile(r"\n"),        # Lines
+    re.compile(r"(?<=[.!?])\s+"),  # Sentences
+]
+
+
+def _tokens_for_length(length: int) -> int:
+    return length // CHARS_PER_TOKEN + 1
+
+
+def estimate_tokens(text: str) -> int:
+    """Rough token estimate (~4 characters per token for English text)."""
+    return _tokens_for_length(len(text))
+
+
+def _split_unit(text: str, start: int, max_tokens: int, level: int = 0) -> List[Tuple[int, int]]:
+    """Split text[...] (starting at absolute offset ``start``) into spans that fit the budget."""
+    if estimate_tokens(text) <= max_tokens:
+        return [(start, start + len(text))]
+
+    if level >= len(_SPLIT_PATTERNS):
+        # No natural boundary left - hard split
+        width = max_tokens * CHARS_PER_TOKEN
+        return [(start + i, start + min(i + width, len(text))) for i in range(0, len(text), width)]
+
+    # Cut after each separator so no text is lost between spans
+    cuts = [match.end() for match in _SPLIT_PATTERNS[level].finditer(text)]
+    if not cuts:
+        return _split_unit(text, start, max_tokens, level + 1)
+
+    spans = []
+    previous = 0
+    for cut in cuts + [len(text)]:
+        if cut > previous:
+            spans.extend(_split_unit(text[previous:cut], start + previous, max_tokens, level + 1))
+        previous = cut
+    return spans
+
+
+def iter_chunks(pages: Iterable[str], max_tokens: int = DEFAULT_CHUNK_TOKENS) -> Iterator[DocumentChunk]:
+    """Yield chunks of at most ``max_tokens`` estimated tokens from streamed pages.
+
+    Pages are consumed one at a time (with one page of lookahead), so only
+    the chunk being built is held in memory. Offsets refer to the pages
+    joined with PAGE_BREAK.
+
+    Args:
+        pages: Page texts in document order
+        max_tokens: Token budget per chunk
+
+    Yields:
+        Chunks in document order
+    """
+    if max_tokens < 1:
+        raise ValueError("max_tokens must be positive")
+
+    index = 0
+    offset = 0
+    parts: List[str] = []
+    chunk_start = 0
+    chunk_length = 0
+    first_page = last_page = 0
+
+    def flush() -> DocumentChunk:
+        chunk_text = "".join(parts)
+        return DocumentChunk(
+            index=index,
+            text=chunk_text,
+            start_offset=chunk_start,
+            end_offset=chunk_start + chunk_length,
+            page_start=first_page,
+            page_end=last_page,
+            estimated_tokens=estimate_tokens(chunk_text)
+        )
+
+    # Each page keeps its trailing PAGE_BREAK, except the last one
+    def with_breaks() -> Iterator[Tuple[int, str]]:
+        previous = None
+        for page_number, page_text in enumerate(pages, 1):
+            if previous is not None:
+                yield previous[0], previous[1] + PAGE_BREAK
+            previous = (page_number, page_text)
+        if previous is not None:
+            yield previous
+
+    for page_number, page_text in with_breaks():
+        for start, end in _split_unit(page_text, 0, max_tokens):
+            if parts and _tokens_for_length(chunk_length + end - start) > max_tokens:
+                yield flush()
+                index += 1
+                parts, chunk_length = [], 0
+            if not parts:
+                chunk_start, first_page = offset + start, page_number
+            parts.append(page_text[start:end])
+            chunk_length += end - start
+            last_page = page_number
+        offset += len(page_text)
+
+    if parts:
+        yield flush()
+
+
+def split_into_chunks(text: str, max_tokens: int = DEFAULT_CHUNK_TOKENS) -> List[DocumentChunk]:
+    """Split document text into chunks of at most ``max_tokens`` estimated tokens.
+
+    Pages (separated by PAGE_BREAK) are kept whole when they fit; adjacent
+    pages and sections are packed together up to the budget.
+
+    Args:
+        text: Full document text
+        max_tokens: Token budget per chunk
+
+    Returns:
+        Chunks in document order (concatenated, they reproduce ``text``)
+    """
+    return list(iter_chunks(text.split(PAGE_BREAK), max_tokens))
+
+
+def _entity_key(entity: DocumentEntity) -> Tuple[str, str]:
+    return entity.type, " ".join(entity.name.split()).casefold()
+
+
+def _page_label(chunk: DocumentChunk) -> str:
+    if chunk.page_start == chunk.page_end:
+        return f"page {chunk.page_start}"
+    return f"pages {chunk.page_start}-{chunk.page_end}"
+
+
+def merge_chunk_analyses(
+    results: Sequence[DocumentAnalysis],
+    chunks: Sequence[DocumentChunk]
+) -> DocumentAnalysis:
+    """Merge per-chunk analyses into one DocumentAnalysis.
+
+    Args:
+        results: Analysis of each chunk, in chunk order
+        chunks: The chunks (for page ranges and weights)
+
+    Returns:
+        Merged DocumentAnalysis
+    """
+    if len(results) != len(chunks) or not results:
+        raise ValueError("need one analysis per chunk")
+    if len(results) == 1:
+        return results[0]
+
+    # Entities: most confident occurrence per (type, name), first-appearance order
+    entities: Dict[Tuple[str, str], DocumentEntity] = {}
+    for result in results:
+        for entity in result.entities:
+            key = _entity_key(entity)
+            if key not in entities:
+                entities[key] = entity
+            elif entity.confidence > entities[key].confidence:
+                # Keep first-appearance position, replace with the more confident occurrence
+                entities[key] = entity
+
+    risk_flags = list(dict.fromkeys(flag for result in results for flag in result.risk_flags))
+
+    legal_significance = max(
+        (result.legal_significance for result in results), key=_SIGNIFICANCE_ORDER.index
+    )
+
+    sentiments = [result.sentiment for result in results]
+    if "hostile" in sentiments:
+        sentiment = "hostile"
+    else:
+        counts = Counter(sentiments)
+        sentiment = max(sentiments, key=lambda value: (counts[value], -sentiments.index(value)))
+
+    document_types = [result.document_type for result in results]
+    type_counts = Counter(document_types)
+    document_type = max(document_types, key=lambda value: (type_counts[value], -document_types.index(value)))
+
+    weights = [chunk.estimated_tokens for chunk in chunks]
+    confidence = sum(r.confidence_overall * w for r, w in zip(results, weights)) / sum(weights)
+
+    summary = "\n\n".join(
+        f"[Part {i}/{len(results)}, {_page_label(chunk)}] {result.summary}"
+        for i, (result, chunk) in enumerate(zip(results, chunks), 1)
+    )
+
+    return DocumentAnalysis(
+        summary=summary,
+        entities=list(entities.values()),
+        document_type=document_type,
+        sentiment=sentiment,
+        legal_significance=legal_significance,
+        risk_flags=risk_flags,
+        confidence_overall=round(confidence, 4)
+    )
+
+
+__all__ = [
+    "PAGE_BREAK",
+    "DEFAULT_CHUNK_TOKENS",
+    "estimate_tokens",
+    "iter_chunks",
+    "split_into_chunks",
+    "merge_chunk_analyses",
+]
@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""Bounded producer/consumer execution for async batches.
+
+``asyncio.gather(*[work(item) for item in items])`` creates every task up
+front: with a semaphore inside ``work`` only ``max_concurrent`` run at once,
+but a 5,000-image batch still holds 5,000 pending tasks, and anything a task
+allocates before reaching the semaphore is held for all of them.
+
+Here a producer feeds items into a queue of ``max_concurrent`` slots and that
+many workers take them one at a time, so at most ``max_concurrent`` items are
+being worked on (and at most as many again are queued). Items may come from a
+lazy iterator; it is only advanced as workers free up.
+"""
+
+import asyncio
+from typing import AsyncIterator, Awaitable, Callable, Dict, Iterable, List, Tuple, TypeVar
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+_WORKER_DONE = object()
+
+
+class _Failure:
+    """Wraps an exception on the results queue (results may be any value)."""
+    def __init__(self, error: Exception):
+        self.error = error
+
+
+async def iter_bounded(
+    items: Iterable[T],
+    func: Callable[[T], Awaitable[R]],
+    max_concurrent: int = 5
+) -> AsyncIterator[Tuple[int, R]]:
+    """Run ``func`` over items with bounded concurrency, yielding results as they complete.
+
+    Args:
+        items: Items to process (any iterable, consumed lazily)
+        func: Async function applied to each item
+        max_concurrent: Items being processed at once
+
+    Yields:
+        (index, result) in completion order - index is the item's position
+
+    Raises:
+        Exception: The first exception raised by ``func`` or the item
+            iterator (remaining work is cancelled)
+    """
+    max_concurrent = max(1, max_concurrent)
+    jobs: asyncio.Queue = asyncio.Queue(maxsize=max_concurrent)
+    results: asyncio.Queue = asyncio.Queue()
+
+    async def produce() -> None:
+        try:
+            for job in enumerate(items):
+                await jobs.put(job)
+        except Exception as e:
+            await results.put(_Failure(e))  # A failing item iterator
+        for _ in range(max_concurrent):
+            await jobs.put(None)
+
+    async def work() -> None:
+        try:
+            while (job := await jobs.get()) is not None:
+                index, item = job
+                await results.put((index, await func(item)))
+        except Exception as e:
+            await results.put(_Failure(e))
+        finally:
+            await results.put(_WORKER_DONE)
+
+    tasks = [asyncio.create_task(produce())]
+    tasks.extend(asyncio.create_task(work()) for _ in range(max_concurrent))
+    try:
+        running = max_concurrent
+        while running:
+            entry = await results.get()
+            if entry is _WORKER_DONE:
+                running -= 1
+            elif isinstance(entry, _Failure):
+                raise entry.error
+            else:
+                yield entry
+    finally:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+
+async def gather_bounded(
+    items: Iterable[T],
+    func: Callable[[T], Awaitable[R]],
+    max_concurrent: int = 5
+) -> List[R]:
+    """Like ``asyncio.gather`` over ``func(item)``, with bounded concurrency.
+
+    Returns:
+        Results in item order
+    """
+    results: Dict[int, R] = {}
+    async for index, result in iter_bounded(items, func, max_concurrent):
+        results[index] = result
+    return [results[index] for index in range(len(results))]
+
+
+__all__ = [
+    "iter_bounded",
+    "gather_bounded",
+]
@@ -0,0 +1,254 @@
+#!/usr/bin/env python3
+"""Image preparation before vision upload.
+
+Vision models never look at more pixels than their detail level allows: in
+high detail an image is fitted inside 2048x2048 and then scaled so its short
+side is at most 768 px; in low detail it is fitted inside 512x512. Sending a
+20 MB phone photo or a 600 dpi TIFF byte-for-byte only adds upload time (and
+base64 bulk in batch files). ImagePreparer therefore:
+
+- applies the EXIF orientation (phones store rotation as a tag, not pixels)
+- downscales to the largest size the chosen detail level uses
+- transcodes to JPEG or WebP (flattening transparency for JPEG)
+- labels the data URL with the real MIME type
+
+Small images in a format the API accepts (PNG, JPEG, WebP, GIF) that need
+no rotation or resizing are sent unchanged. Prepared bytes can be cached in
+derived storage per sha256 and settings (derived/sha256=<h>/prepared/).
+"""
+
+import base64
+import hashlib
+import json
+import time
+from io import BytesIO
+from pathlib import Path
+from typing import TYPE_CHECKING, NamedTuple, Optional, Tuple, Union
+
+from .models import ImagePreparation
+from .utils import ensure_directory, get_evidence_base_dir, read_json_safe
+
+if TYPE_CHECKING:
+    from PIL import Image
+
+
+DETAIL_LEVELS = ("auto", "low", "high")
+FORMATS = ("jpeg", "webp")
+
+# Pixel limits the vision models apply ("auto" behaves like "high" for large images)
+HIGH_DETAIL_MAX_EDGE = 2048
+HIGH_DETAIL_MAX_SHORT_EDGE = 768
+LOW_DETAIL_MAX_EDGE = 512
+
+# Larger originals are transcoded even when their dimensions are already fine
+PASSTHROUGH_MAX_BYTES = 512 * 1024
+
+# Formats accepted by the API as-is (animated GIFs are not)
+SUPPORTED_MIME_TYPES = {
+    "JPEG": "image/jpeg",
+    "PNG": "image/png",
+    "WEBP": "image/webp",
+    "GIF": "image/gif",
+}
+
+_EXIF_ORIENTATION = 0x0112
+
+
+class PreparedImage(NamedTuple):
+    """Image bytes ready for upload, with how they were produced."""
+    data: bytes
+    mime_type: str
+    detail: str
+    stats: ImagePreparation
+
+    @property
+    def base64(self) -> str:
+        return base64.b64encode(self.data).decode('utf-8')
+
+
+def target_size(width: int, height: int, detail: str = "auto") -> Tuple[int, int]:
+    """Largest size the vision model uses for an image at a detail level."""
+    if detail == "low":
+        scale = min(1.0, LOW_DETAIL_MAX_EDGE / max(width, height))
+    else:
+        scale = min(1.0, HIGH_DETAIL_MAX_EDGE / max(width, height))
+        scale *= min(1.0, HIGH_DETAIL_MAX_SHORT_EDGE / (min(width, height) * scale))
+    return max(1, round(width * scale)), max(1, round(height * scale))
+
+
+class ImagePreparer:
+    """Prepares images for vision upload (orientation, size, format, MIME type)."""
+
+    def __init__(
+        self,
+        format: str = "jpeg",
+        quality: int = 85,
+        detail: str = "auto",
+        cache_dir: Optional[Union[str, Path]] = None
+    ):
+        """Initialize image preparer
+
+        Args:
+            format: Transcode target - "jpeg" or "webp"
+            quality: Encoder quality (1-95)
+            detail: Vision detail level - "auto", "low" (512 px, fewest
+                tokens) or "high"; also sets the downscaling limit
+            cache_dir: Derived storage directory for prepared bytes (default:
+                no cache); entries are keyed by file sha256 and settings
+        """
+        if format not in FORMATS:
+            raise ValueError(f"Unknown image format: {format!r} (use one of {', '.join(FORMATS)})")
+        if detail not in DETAIL_LEVELS:
+            raise ValueError(f"Unknown detail level: {detail!r} (use one of {', '.join(DETAIL_LEVELS)})")
+        self.format = format
+        self.quality = quality
+        self.detail = detail
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+
+    @property
+    def settings_key(self) -> str:
+        """Cache key part identifying the preparation settings."""
+        return f"{self.detail}-{self.format}-q{self.quality}"
+
+    def prepare_file(self, image_path: Path) -> PreparedImage:
+        """Prepare an image file, reusing the cached result when there is one."""
+        start_time = time.perf_counter()
+        data = Path(image_path).read_bytes()
+
+        cache_files = None
+        if self.cache_dir:
+            sha256 = hashlib.sha256(data).hexdigest()
+            prepared_dir = get_evidence_base_dir(self.cache_dir, sha256) / "prepared"
+            cache_files = (prepared_dir / f"{self.settings_key}.bin", prepared_dir / f"{self.settings_key}.json")
+            cached = self._read_cache(*cache_files, start_time)
+            if cached:
+                return cached
+
+        prepared = self.prepare_bytes(data)
+        if cache_files:
+            self._write_cache(*cache_files, prepared)
+
+        stats = prepared.stats.model_copy(update={"seconds": time.perf_counter() - start_time})
+        return prepared._replace(stats=stats)
+
+    def prepare_bytes(self, data: bytes) -> PreparedImage:
+        """Prepare encoded image bytes (any format Pillow can read)."""
+        from PIL import Image
+
+        start_time = time.perf_counter()
+        with Image.open(BytesIO(data)) as image:
+            return self._prepare(image, data, start_time)
+
+    def prepare_image(self, image: "Image.Image") -> PreparedImage:
+        """Prepare an in-memory image (e.g. a rasterized PDF page)."""
+        return self._prepare(image, None, time.perf_counter())
+
+    def _prepare(self, image: "Image.Image", data: Optional[bytes], start_time: float) -> PreparedImage:
+        from PIL import Image, ImageOps
+
+        original_size = image.size
+        rotated = image.getexif().get(_EXIF_ORIENTATION, 1) != 1
+        if rotated:
+            image = ImageOps.exif_transpose(image)
+        size = target_size(*image.size, self.detail)
+
+        mime_type = SUPPORTED_MIME_TYPES.get(image.format) if data is not None else None
+        can_pass_through = (
+            mime_type is not None
+            and not rotated
+            and size == image.size
+            and not getattr(image, "is_animated", False)
+        )
+        if can_pass_through and len(data) <= PASSTHROUGH_MAX_BYTES:
+            return self._result(data, mime_type, data, original_size, image.size, False, rotated, start_time)
+
+        if size != image.size:
+            image = image.resize(size, Image.Resampling.LANCZOS)
+        prepared = self._encode(image)
+        if can_pass_through and len(prepared) >= len(data):
+            # Already compact - keep the original bytes
+            return self._result(data, mime_type, data, original_size, image.size, False, rotated, start_time)
+
+        return self._result(
+            prepared, f"image/{self.format}", data, original_size, size, True, rotated, start_time
+        )
+
+    def _encode(self, image: "Image.Image") -> bytes:
+        """Encode as JPEG (transparency flattened onto white) or WebP."""
+        from PIL import Image
+
+        has_alpha = image.mode in ("RGBA", "LA") or (image.mode == "P" and "transparency" in image.info)
+        if self.format == "jpeg":
+            if has_alpha:
+                rgba = image.convert("RGBA")
+                flattened = Image.new("RGB", rgba.size, (255, 255, 255))
+                flattened.paste(rgba, mask=rgba.getchannel("A"))
+                image = flattened
+            elif image.mode != "RGB":
+                image = image.convert("RGB")
+            options = {"format": "JPEG", "quality": self.quality, "optimize": True}
+        else:
+            image = image.convert("RGBA" if has_alpha else "RGB")
+            options = {"format": "WEBP", "quality": self.quality}
+
+        buffer = BytesIO()
+        image.save(buffer, **options)
+        return buffer.getvalue()
+
+    def _result(
+        self,
+        prepared: bytes,
+        mime_type: str,
+        original: Optional[bytes],
+        original_size: Tuple[int, int],
+        size: Tuple[int, int],
+        transcoded: bool,
+        rotated: bool,
+        start_time: float
+    ) -> PreparedImage:
+        stats = ImagePreparation(
+            original_bytes=len(original) if original is not None else len(prepared),
+            prepared_bytes=len(prepared),
+            original_width=original_size[0],
+            original_height=original_size[1],
+            width=size[0],
+            height=size[1],
+            mime_type=mime_type,
+            detail=self.detail,
+            transcoded=transcoded,
+            rotated=rotated,
+            seconds=time.perf_counter() - start_time
+        )
+        return PreparedImage(prepared, mime_type, self.detail, stats)
+
+    @staticmethod
+    def _read_cache(data_file: Path, stats_file: Path, start_time: float) -> Optional[PreparedImage]:
+        stats_data = read_json_safe(stats_file)
+        if not stats_data or not data_file.exists():
+            return None
+        try:
+            stats = ImagePreparation(**stats_data)
+            data = data_file.read_bytes()
+        except Exception:
+            return None  # Unreadable entry - prepare again
+        stats = stats.model_copy(update={"cache_hit": True, "seconds": time.perf_counter() - start_time})
+        return PreparedImage(data, stats.mime_type, stats.detail, stats)
+
+    @staticmethod
+    def _write_cache(data_file: Path, stats_file: Path, prepared: PreparedImage) -> None:
+        try:
+            ensure_directory(data_file.parent)
+            data_file.write_bytes(prepared.data)
+            # Stats last: an entry only counts once both files exist
+            stats_file.write_text(json.dumps(prepared.stats.model_dump(), indent=2))
+        except Exception as e:
+            print(f"Warning: Could not cache prepared image: {e}")
+
+
+__all__ = [
+    "DETAIL_LEVELS",
+    "FORMATS",
+    "PreparedImage",
+    "ImagePreparer",
+    "target_size",
+]
@@ -373,6 +373,15 @@ class UnifiedAnalysis(BaseModel):
     labels: List[str] = Field(default_factory=list, description="Detected labels/categories")
     notes: Optional[str] = None
 
+    # AI calls made while producing this analysis (tokens, latency, cost)
+    ai_usage: List[UsageRecord] = Field(default_factory=list, description="Per-call AI usage records")
+
+    # Model cascade decisions (fast model first, escalated when unclear or high-risk)
+    routing_decisions: List[RoutingDecision] = Field(default_factory=list, description="Model routing decisions")
+
+    # Set when the analysis was copied from a near-duplicate (no AI call was made)
+    duplicate_of: Optional[DuplicateLink] = Field(default=None, description="Near-duplicate whose analysis was reused")
+
     @model_validator(mode='after')
     def sync_case_fields(self):
         """Auto-sync case_id and case_ids for backward compatibility."""
@@ -628,6 +637,9 @@ class EvidenceSummary(BaseModel):
     legal_significance: Optional[str] = Field(None, description="Legal significance level (critical, high, medium, low)")
     risk_flags: List[str] = Field(default_factory=list, description="Risk flags identified in analysis")
     document_type: Optional[str] = Field(None, description="AI-classified document type (email, memo, contract, letter, etc.) - v3.3 Phase B++")
+    shared_analysis_id: Optional[str] = Field(
+        None, description="AI result shared with other evidence (near-duplicate or email thread) - counted once in case totals"
+    )
 
 
 class CaseSummary(BaseModel):
@@ -659,6 +671,9 @@ class IngestionResult(BaseModel):
     storage_path: str
     success: bool
     message: Optional[str] = None
+    parent_sha256: Optional[str] = None  # Container (mbox, email) this was extracted from
+    child_count: int = 0  # Evidence extracted from this container
+    container_only: bool = False  # Analyzed through its children (mailboxes), not itself
 
 
 class ExportResult(BaseModel):
@@ -853,6 +868,384 @@ class BatchEntityResolution(BaseModel):
         }
 
 
+# =============================================================================
+# AI USAGE & COST ACCOUNTING
+# =============================================================================
+
+class UsageRecord(BaseModel):
+    """Token usage, latency and estimated cost of a single AI call.
+
+    Recorded by call_openai_structured() (and the async image path) for every
+    Responses API request, then persisted per evidence item on UnifiedAnalysis
+    and per case in the storage usage log.
+    """
+    stage: str = Field(..., description="Pipeline stage that made the call (e.g. 'document_analysis')")
+    model: str = Field(..., description="Model name sent to the API")
+    input_tokens: int = Field(default=0, ge=0, description="Prompt tokens billed (including cached)")
+    cached_input_tokens: int = Field(default=0, ge=0, description="Prompt tokens served from the prompt cache")
+    output_tokens: int = Field(default=0, ge=0, description="Completion tokens generated")
+    latency_seconds: float = Field(default=0.0, ge=0.0, description="Wall time of the call including retries")
+    retries: int = Field(default=0, ge=0, description="Retries taken by the client before success")
+    estimated_cost_usd: Optional[float] = Field(
+        default=None,
+        description="Estimated cost from the pricing table (None if the model is not priced)"
+    )
+    batch: bool = Field(default=False, description="Served by the offline Batch API (discounted pricing)")
+    timestamp: datetime = Field(..., description="When the call completed")
+    evidence_sha256: Optional[str] = Field(
+        default=None,
+        description="Evidence item the call was made for, in a case usage log (None for case-level calls)"
+    )
+
+
+class UsageTotals(BaseModel):
+    """Aggregated totals over a set of UsageRecords."""
+    calls: int = Field(default=0, ge=0)
+    input_tokens: int = Field(default=0, ge=0)
+    cached_input_tokens: int = Field(default=0, ge=0)
+    output_tokens: int = Field(default=0, ge=0)
+    retries: int = Field(default=0, ge=0)
+    latency_seconds: float = Field(default=0.0, ge=0.0)
+    estimated_cost_usd: float = Field(default=0.0, ge=0.0)
+    unpriced_calls: int = Field(default=0, ge=0, description="Calls whose model has no pricing entry")
+
+
+class UsageSummary(UsageTotals):
+    """UsageTotals with breakdowns by pipeline stage and by model."""
+    by_stage: Dict[str, UsageTotals] = Field(default_factory=dict)
+    by_model: Dict[str, UsageTotals] = Field(default_factory=dict)
+
+
+class CaseCostReport(BaseModel):
+    """Per-case AI usage rollup.
+
+    Used by `evidence-toolkit case cost` and written into package_metadata.json.
+    Both evidence-level usage (every analysis run for the case, including
+    --force re-runs) and case-level usage (correlation, executive summary)
+    come from the case's storage usage log.
+    """
+    case_id: str
+    generated_at: datetime
+    evidence_count: int = Field(default=0, ge=0)
+    evidence_with_usage: int = Field(default=0, ge=0, description="Evidence items with recorded AI calls")
+    evidence_usage: UsageSummary = Field(default_factory=UsageSummary)
+    case_level_usage: UsageSummary = Field(default_factory=UsageSummary)
+    total: UsageSummary = Field(default_factory=UsageSummary)
+    per_evidence: Dict[str, UsageTotals] = Field(
+        default_factory=dict,
+        description="SHA256 -> usage totals for each evidence item"
+    )
+    duplicates_reused: int = Field(
+        default=0, ge=0, description="Evidence items whose analysis was reused from a near-duplicate (AI calls saved)"
+    )
+
+
+class BudgetAction(BaseModel):
+    """A budget controller decision that changed how an evidence item was analyzed."""
+    sha256: str
+    filename: Optional[str] = None
+    evidence_type: Optional[str] = None
+    action: Literal["skipped", "downgraded"]
+    reason: str
+    model_from: Optional[str] = None
+    model_to: Optional[str] = None
+    spent_usd: float = Field(default=0.0, ge=0.0, description="Spend at the time of the decision")
+    elapsed_seconds: float = Field(default=0.0, ge=0.0, description="Run time at the time of the decision")
+
+
+class BudgetReport(BaseModel):
+    """Outcome of a budget-controlled process-case run.
+
+    Lists every item the controller skipped or downgraded so nothing is
+    silently left out of a fixed-fee matter.
+    """
+    case_id: str
+    max_cost_usd: Optional[float] = None
+    deadline_seconds: Optional[float] = None
+    soft_limit: float = Field(..., gt=0.0, le=1.0, description="Fraction of a limit where downgrading starts")
+    spent_usd: float = Field(default=0.0, ge=0.0)
+    elapsed_seconds: float = Field(default=0.0, ge=0.0)
+    items_run: int = Field(default=0, ge=0, description="Items analyzed at the requested model")
+    stopped_reason: Optional[str] = Field(default=None, description="Why AI work was stopped, if it was")
+    downgraded: List[BudgetAction] = Field(default_factory=list)
+    skipped: List[BudgetAction] = Field(default_factory=list)
+
+
+# =============================================================================
+# PACKED ANALYSIS (Several small items per request)
+# =============================================================================
+
+class PackedDocumentItem(DocumentAnalysis):
+    """DocumentAnalysis for one document of a packed request."""
+    evidence_id: str = Field(..., description="Id of the <document> this analysis belongs to")
+
+
+class PackedDocumentAnalysis(BaseModel):
+    """Response schema for several small documents analyzed in one request."""
+    items: List[PackedDocumentItem] = Field(..., description="One analysis per input document")
+
+
+class PackedEmailItem(EmailThreadAnalysis):
+    """EmailThreadAnalysis for one email of a packed request."""
+    evidence_id: str = Field(..., description="Id of the <document> this analysis belongs to")
+
+
+class PackedEmailAnalysis(BaseModel):
+    """Response schema for several short emails analyzed in one request."""
+    items: List[PackedEmailItem] = Field(..., description="One analysis per input email")
+
+
+# =============================================================================
+# OFFLINE BATCH ANALYSIS
+# =============================================================================
+
+class OfflineBatchJob(BaseModel):
+    """A case's pending AI requests submitted as one offline Batch API job.
+
+    Saved under storage batches/<job_id>/job.json next to the request and
+    result JSONL files, so a job can be polled and hydrated later (e.g. the
+    next morning) from a different process.
+    """
+    job_id: str = Field(..., description="Local job identifier")
+    case_id: str
+    status: str = Field(
+        default="prepared",
+        description="prepared, then the batch status (validating, in_progress, completed, "
+                    "failed, expired, cancelled), then hydrated"
+    )
+    batch_id: Optional[str] = Field(default=None, description="Batch ID returned by the endpoint")
+    input_file_id: Optional[str] = None
+    output_file_id: Optional[str] = None
+    error_file_id: Optional[str] = None
+    model: Optional[str] = Field(default=None, description="Model override for every request (None = analyzer defaults)")
+    created_at: datetime
+    submitted_at: Optional[datetime] = None
+    completed_at: Optional[datetime] = None
+    hydrated_at: Optional[datetime] = None
+    requests: Dict[str, str] = Field(default_factory=dict, description="custom_id -> evidence SHA256")
+    not_batched: Dict[str, str] = Field(
+        default_factory=dict,
+        description="SHA256 -> reason for evidence that needs interactive analysis"
+    )
+    hydrated: List[str] = Field(default_factory=list, description="SHA256s saved from batch results")
+    failed: Dict[str, str] = Field(default_factory=dict, description="SHA256 -> error")
+
+
+class ImageBatchCheckpoint(BaseModel):
+    """Progress of an interactive image batch (pipeline.batch).
+
+    Saved to storage batches/images-<case_id>.checkpoint.json after every
+    image, so an interrupted run can report where it stopped. Results are
+    saved as they complete; a rerun skips every image that has an analysis.
+    """
+    case_id: Optional[str] = None
+    status: Literal["running", "completed", "interrupted"] = "running"
+    total: int = Field(..., ge=0, description="Images queued in this run")
+    saved: List[str] = Field(default_factory=list, description="SHA256s saved, in completion order")
+    skipped: List[str] = Field(default_factory=list, description="SHA256s skipped by the budget controller")
+    failed: Dict[str, str] = Field(default_factory=dict, description="SHA256 -> error (analysis not saved)")
+    started_at: datetime
+    updated_at: datetime
+
+
+# =============================================================================
+# CHUNKED DOCUMENT ANALYSIS (Long documents, map-reduce)
+# =============================================================================
+
+class DocumentChunk(BaseModel):
+    """A token-budgeted slice of a long document, cut on page/section boundaries."""
+    index: int = Field(..., ge=0, description="Position of the chunk in the document")
+    text: str
+    start_offset: int = Field(..., ge=0, description="Character offset of the chunk in the document text")
+    end_offset: int = Field(..., ge=0)
+    page_start: int = Field(..., ge=1, description="First page (1-based) the chunk covers")
+    page_end: int = Field(..., ge=1, description="Last page (1-based) the chunk covers")
+    estimated_tokens: int = Field(..., ge=0)
+
+
+class DocumentChunkResult(BaseModel):
+    """Cached AI analysis of one chunk (derived/sha256=<h>/chunks/chunk-NNN.json).
+
+    Keyed by prompt, model and chunk text, so a re-run only calls the API for
+    chunks that failed or changed.
+    """
+    index: int
+    cache_key: str = Field(..., description="SHA256 of prompt, model spec and chunk text")
+    page_start: int
+    page_end: int
+    model_used: Optional[str] = None
+    analysis: DocumentAnalysis
+    created_at: datetime
+
+
+# =============================================================================
+# EXTRACTED TEXT (Derived text artifact)
+# =============================================================================
+
+class ExtractedText(BaseModel):
+    """Index of the text extracted from one evidence item.
+
+    The text itself is stored gzip-compressed next to this index
+    (derived/sha256=<h>/text.v1.txt.gz), pages joined with a form feed.
+    Written once; re-analysis reads it instead of re-extracting.
+    """
+    sha256: str
+    source: Literal["pdfplumber", "text", "email", "vision_ocr"] = Field(
+        ..., description="How the text was obtained"
+    )
+    page_offsets: List[int] = Field(
+        default_factory=list, description="Character offset where each page starts in the text"
+    )
+    ocr_pages: List[int] = Field(
+        default_factory=list, description="Pages (1-based) read with vision OCR - scanned pages of mixed PDFs"
+    )
+    char_count: int = Field(..., ge=0)
+    created_at: datetime
+
+    @property
+    def page_count(self) -> int:
+        return len(self.page_offsets)
+
+
+# =============================================================================
+# IMAGE PREPARATION (Vision upload)
+# =============================================================================
+
+class ImagePreparation(BaseModel):
+    """How an image was prepared for vision upload (see core.imaging)."""
+    original_bytes: int = Field(..., ge=0)
+    prepared_bytes: int = Field(..., ge=0)
+    original_width: int
+    original_height: int
+    width: int
+    height: int
+    mime_type: str = Field(..., description="MIME type sent in the data URL")
+    detail: Literal["auto", "low", "high"] = "auto"
+    transcoded: bool = Field(default=False, description="False when the original bytes were sent unchanged")
+    rotated: bool = Field(default=False, description="EXIF orientation was applied")
+    cache_hit: bool = False
+    seconds: float = Field(default=0.0, ge=0, description="Preparation latency (cache read on a hit)")
+
+    @property
+    def bytes_saved(self) -> int:
+        return self.original_bytes - self.prepared_bytes
+
+
+# =============================================================================
+# NEAR-DUPLICATE DETECTION (Reuse analyses of near-identical evidence)
+# =============================================================================
+
+class PerceptualHash(BaseModel):
+    """Perceptual hashes of one image (see core.similarity), each 64-bit hex."""
+    ahash: str = Field(..., description="Average hash")
+    dhash: str = Field(..., description="Difference (gradient) hash")
+    phash: str = Field(..., description="DCT hash")
+    width: int = Field(..., ge=1, description="Image width after EXIF orientation")
+    height: int = Field(..., ge=1, description="Image height after EXIF orientation")
+
+
+class DuplicateLink(BaseModel):
+    """Why an analysis was copied from a near-duplicate instead of run.
+
+    The reused analysis stays traceable: canonical_sha256 is the evidence
+    that was actually analyzed, and a custody event records the link.
+    Images are matched by perceptual hash distance, documents and emails by
+    MinHash similarity of their text.
+    """
+    canonical_sha256: str = Field(..., description="Evidence whose analysis was reused")
+    method: Literal["perceptual_hash", "minhash"] = Field(..., description="How the duplicate was detected")
+    distance: Optional[int] = Field(default=None, ge=0, description="pHash Hamming distance (of 64 bits)")
+    max_distance: Optional[int] = Field(default=None, ge=0, description="Distance threshold in effect")
+    similarity: Optional[float] = Field(
+        default=None, ge=0.0, le=1.0, description="Estimated share of the text's word shingles found in the canonical text"
+    )
+    threshold: Optional[float] = Field(default=None, ge=0.0, le=1.0, description="Similarity threshold in effect")
+    detected_at: datetime
+
+    @property
+    def summary(self) -> str:
+        """Short human-readable match description (custody events, CLI output)."""
+        if self.method == "minhash":
+            return f"text containment {self.similarity:.2f} >= {self.threshold:.2f}"
+        return f"image distance {self.distance}/{self.max_distance}"
+
+
+# =============================================================================
+# MODEL ROUTING (Cheap-first cascade)
+# =============================================================================
+
+class RoutingDecision(BaseModel):
+    """How the model cascade handled one AI analysis.
+
+    The fast model always runs first; the strong model re-runs the item when
+    confidence is below the threshold or an escalation risk flag is present.
+    """
+    stage: str = Field(..., description="Pipeline stage (e.g. 'document_analysis')")
+    fast_model: str
+    strong_model: str
+    model_used: str = Field(..., description="Model whose result was kept")
+    escalated: bool = False
+    reasons: List[str] = Field(default_factory=list, description="Why the item was escalated")
+    confidence_threshold: float = Field(..., ge=0.0, le=1.0)
+    fast_confidence: Optional[float] = Field(default=None, description="Confidence of the fast pass (None if it failed)")
+    final_confidence: Optional[float] = None
+    timestamp: datetime
+
+
+# =============================================================================
+# PROCESS RUNS (Resumable process-case)
+# =============================================================================
+
+class RunStage(BaseModel):
+    """Progress of one process-case stage (ingest, analyze, summary, package)."""
+    status: Literal["running", "completed", "failed"] = "running"
+    items: List[str] = Field(default_factory=list, description="SHA256s this stage has finished")
+    details: Dict[str, Any] = Field(default_factory=dict, description="Stage outputs (e.g. package_path)")
+    error: Optional[str] = None
+    started_at: datetime
+    completed_at: Optional[datetime] = None
+
+
+class ProcessRun(BaseModel):
+    """Journal of a process-case run (pipeline.journal).
+
+    Saved to storage runs/<run_id>/journal.json as each stage starts and
+    finishes, so a failed run can be resumed from the stage that failed.
+    """
+    run_id: str
+    case_id: str
+    case_directory: str
+    status: Literal["running", "completed", "failed"] = "running"
+    stages: Dict[str, RunStage] = Field(default_factory=dict, description="Stage name -> progress")
+    resumed: int = Field(default=0, ge=0, description="Times the run has been resumed")
+    created_at: datetime
+    updated_at: datetime
+
+
+# =============================================================================
+# WATCH FOLDERS (Continuous ingestion)
+# =============================================================================
+
+class WatchedFile(BaseModel):
+    """A file a watch-folder run has ingested, as it was when ingested."""
+    size: int = Field(..., ge=0)
+    mtime_ns: int = Field(..., description="Modification time (ns) - a change means the file is ingested again")
+    sha256: Optional[str] = Field(default=None, description="Evidence SHA256 (None if ingestion failed)")
+    ingested_at: datetime
+
+
+class WatchState(BaseModel):
+    """Files of a watched case directory that are already ingested (pipeline.watch).
+
+    Saved to storage watch/<case_id>.json after every batch, so a restarted
+    watcher only picks up files added or changed while it was stopped.
+    """
+    case_id: str
+    directory: str = Field(..., description="Resolved path of the watched directory")
+    files: Dict[str, WatchedFile] = Field(default_factory=dict, description="Path relative to directory -> file")
+    updated_at: datetime
+
+
 # =============================================================================
 # EXPORTS
 # =============================================================================
@@ -919,4 +1312,47 @@ __all__ = [
     # v3.3.1: Optimized Batch Entity Resolution
     "EntityGroup",
     "BatchEntityResolution",
+
+    # AI Usage & Cost Accounting
+    "UsageRecord",
+    "UsageTotals",
+    "UsageSummary",
+    "CaseCostReport",
+    "BudgetAction",
+    "BudgetReport",
+
+    # Packed Analysis
+    "PackedDocumentItem",
+    "PackedDocumentAnalysis",
+    "PackedEmailItem",
+    "PackedEmailAnalysis",
+
+    # Offline Batch Analysis
+    "OfflineBatchJob",
+    "ImageBatchCheckpoint",
+
+    # Chunked Document Analysis
+    "DocumentChunk",
+    "DocumentChunkResult",
+
+    # Extracted Text
+    "ExtractedText",
+
+    # Image Preparation
+    "ImagePreparation",
+
+    # Near-Duplicate Detection
+    "PerceptualHash",
+    "DuplicateLink",
+
+    # Model Routing
+    "RoutingDecision",
+
+    # Process Runs
+    "RunStage",
+    "ProcessRun",
+
+    # Watch Folders
+    "WatchedFile",
+    "WatchState",
 ]
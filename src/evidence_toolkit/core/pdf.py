@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+"""PDF text extraction across a process pool.
+
+pdfplumber (pdfminer) layout analysis is pure Python and CPU-bound, so a
+1,500-page production bundle keeps one core busy for minutes while the
+others idle. Large PDFs are split into page ranges that worker processes
+extract independently; results are yielded strictly in page order, so the
+text is identical to a serial pass.
+
+Only a bounded window of ranges is in flight, so pages are still streamed
+(see DocumentAnalyzer.iter_pages) rather than collected. Workers are
+started with "spawn": the caller may have analysis threads running, which
+makes fork unsafe.
+
+Each page is also classified, so mixed PDFs can be routed page by page:
+"text" pages have a usable text layer, "scanned" pages are images with
+(almost) no text and need vision OCR, "blank" pages have neither.
+"""
+
+import itertools
+import multiprocessing
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Iterator, List, NamedTuple, Optional, Union
+
+
+# Pages extracted per worker task
+PAGES_PER_TASK = 20
+
+# Smaller PDFs are extracted in-process (worker start-up costs more than it saves)
+MIN_PARALLEL_PAGES = 40
+
+# Default worker cap when no worker count is given
+MAX_DEFAULT_WORKERS = 8
+
+# A page with at least this many text characters has a usable text layer
+MIN_TEXT_CHARS = 50
+
+PAGE_KINDS = ("text", "scanned", "blank")
+
+
+class PdfPage(NamedTuple):
+    """Extracted text and classification of one PDF page."""
+    number: int  # 1-based
+    text: str
+    kind: str  # One of PAGE_KINDS
+
+
+def classify_page(text: str, has_images: bool) -> str:
+    """Classify a page from its text layer and whether it contains images."""
+    if len(text.strip()) >= MIN_TEXT_CHARS:
+        return "text"
+    if has_images:
+        return "scanned"  # A scan, possibly with a short stamp or header in the text layer
+    return "text" if text.strip() else "blank"
+
+
+def default_workers() -> int:
+    """Worker processes used when none are configured (CPU count, capped)."""
+    return max(1, min(os.cpu_count() or 1, MAX_DEFAULT_WORKERS))
+
+
+def pdf_page_count(file_path: Union[str, Path]) -> int:
+    """Number of pages in a PDF."""
+    import pdfplumber
+
+    with pdfplumber.open(file_path) as pdf:
+        return len(pdf.pages)
+
+
+def extract_page_range(file_path: str, start: int, end: int) -> List[PdfPage]:
+    """Extract and classify pages ``start``..``end - 1`` (0-based).
+
+    Runs in worker processes. Pages without text give "" so page positions
+    are preserved.
+    """
+    import pdfplumber
+
+    pages = []
+    with pdfplumber.open(file_path, pages=list(range(start + 1, end + 1))) as pdf:
+        for number, page in enumerate(pdf.pages, start + 1):
+            pages.append(_read_page(number, page))
+    return pages
+
+
+def _read_page(number: int, page) -> PdfPage:
+    text = page.extract_text() or ""
+    kind = classify_page(text, bool(page.images))
+    page.close()  # Release the page's cached layout objects
+    return PdfPage(number, text, kind)
+
+
+def iter_pdf_pages(
+    file_path: Union[str, Path],
+    workers: Optional[int] = None,
+    pages_per_task: int = PAGES_PER_TASK,
+    min_parallel_pages: int = MIN_PARALLEL_PAGES
+) -> Iterator[PdfPage]:
+    """Yield every page of a PDF (text and classification), in page order.
+
+    Args:
+        file_path: PDF file
+        workers: Worker processes (default: default_workers(); 1 = in-process)
+        pages_per_task: Pages per worker task
+        min_parallel_pages: PDFs with fewer pages are extracted in-process
+
+    Yields:
+        PdfPage for each page
+    """
+    import pdfplumber
+
+    workers = workers or default_workers()
+    page_count = pdf_page_count(file_path)
+
+    if workers <= 1 or page_count < max(min_parallel_pages, 2):
+        with pdfplumber.open(file_path) as pdf:
+            for number, page in enumerate(pdf.pages, 1):
+                yield _read_page(number, page)
+        return
+
+    ranges = iter([
+        (start, min(start + pages_per_task, page_count))
+        for start in range(0, page_count, pages_per_task)
+    ])
+    pool = ProcessPoolExecutor(
+        max_workers=min(workers, -(-page_count // pages_per_task)),
+        mp_context=multiprocessing.get_context("spawn")
+    )
+    try:
+        # Keep every worker busy with one range queued behind it
+        pending = deque(
+            pool.submit(extract_page_range, str(file_path), start, end)
+            for start, end in itertools.islice(ranges, 2 * workers)
+        )
+        while pending:
+            pages = pending.popleft().result()
+            next_range = next(ranges, None)
+            if next_range:
+                pending.append(pool.submit(extract_page_range, str(file_path), *next_range))
+            yield from pages
+    finally:
+        pool.shutdown(wait=True, cancel_futures=True)
+
+
+def iter_page_texts(file_path: Union[str, Path], workers: Optional[int] = None, **options) -> Iterator[str]:
+    """Yield the text of every page of a PDF ("" for pages without a text layer)."""
+    for page in iter_pdf_pages(file_path, workers, **options):
+        yield page.text
+
+
+__all__ = [
+    "PAGES_PER_TASK",
+    "MIN_PARALLEL_PAGES",
+    "MIN_TEXT_CHARS",
+    "PdfPage",
+    "classify_page",
+    "default_workers",
+    "pdf_page_count",
+    "extract_page_range",
+    "iter_pdf_pages",
+    "iter_page_texts",
+]
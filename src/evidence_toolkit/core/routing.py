@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+"""Model cascade: cheap-first analysis with confidence-based escalation.
+
+Every item is first analyzed with a fast, cheap model. The result is kept
+unless it is unclear (``confidence_overall`` below the threshold) or shows a
+high-risk flag (retaliation, harassment, ...), in which case the item is
+re-run with the strong model. If the fast call fails, the strong model is
+used as well.
+
+Each routing decision is reported to the active ``track_usage()`` scopes
+(see core.usage), so analyze_evidence and the image batch can persist it on
+UnifiedAnalysis.routing_decisions next to the per-call usage.
+"""
+
+from datetime import datetime
+from typing import Any, Awaitable, Callable, Iterable, List, Optional, Tuple, TypeVar
+
+from .models import RoutingDecision
+from .usage import record_routing_decision
+
+
+T = TypeVar("T")
+
+DEFAULT_FAST_MODEL = "gpt-4o-mini"
+DEFAULT_STRONG_MODEL = "gpt-4o-2024-08-06"
+DEFAULT_CONFIDENCE_THRESHOLD = 0.7
+
+
+class ModelRouter:
+    """Routes AI analyses through a fast model and escalates unclear items.
+
+    Example:
+        >>> router = ModelRouter(confidence_threshold=0.75)
+        >>> analyzer = DocumentAnalyzer(openai_client=client, router=router)
+        >>> analyzer.analyze_with_ai(text)  # gpt-4o-mini, re-run on gpt-4o if needed
+    """
+
+    def __init__(
+        self,
+        fast_model: str = DEFAULT_FAST_MODEL,
+        strong_model: str = DEFAULT_STRONG_MODEL,
+        confidence_threshold: float = DEFAULT_CONFIDENCE_THRESHOLD,
+        escalation_flags: Optional[Iterable[str]] = None
+    ):
+        """Initialize model router.
+
+        Args:
+            fast_model: Model for the first pass
+            strong_model: Model for escalated items
+            confidence_threshold: Escalate when confidence_overall is below this
+            escalation_flags: Risk flags that always escalate
+                (default: legal_config.ESCALATION_RISK_FLAGS)
+        """
+        if not 0.0 <= confidence_threshold <= 1.0:
+            raise ValueError("confidence_threshold must be between 0 and 1")
+
+        if escalation_flags is None:
+            from evidence_toolkit.domains import legal_config
+            escalation_flags = legal_config.ESCALATION_RISK_FLAGS
+
+        self.fast_model = fast_model
+        self.strong_model = strong_model
+        self.confidence_threshold = confidence_threshold
+        self.escalation_flags = set(escalation_flags)
+
+    def escalation_reasons(self, result: Any) -> List[str]:
+        """Reasons a fast-model result should be re-run on the strong model.
+
+        Args:
+            result: Structured result with ``confidence_overall`` and ``risk_flags``
+                (None if the fast call failed)
+
+        Returns:
+            List of reasons (empty = keep the fast result)
+        """
+        if result is None:
+            return ["fast model returned no result"]
+
+        reasons = []
+        confidence = getattr(result, "confidence_overall", None)
+        if confidence is not None and confidence < self.confidence_threshold:
+            reasons.append(f"confidence {confidence:.2f} below {self.confidence_threshold:.2f}")
+
+        flagged = sorted(set(getattr(result, "risk_flags", None) or []) & self.escalation_flags)
+        if flagged:
+            reasons.append(f"risk flags: {', '.join(flagged)}")
+
+        return reasons
+
+    def route(self, stage: str, call: Callable[[str], Optional[T]]) -> Tuple[Optional[T], RoutingDecision]:
+        """Run ``call(model)`` on the fast model, escalating if needed.
+
+        Errors from the fast pass trigger escalation; errors from the strong
+        pass propagate to the caller.
+
+        Args:
+            stage: Pipeline stage name (for the decision record)
+            call: Function taking a model name and returning the parsed result
+
+        Returns:
+            (result kept, RoutingDecision)
+        """
+        try:
+            fast_result = call(self.fast_model)
+        except Exception:
+            fast_result = None
+
+        reasons = self.escalation_reasons(fast_result)
+        if not reasons:
+            return fast_result, self._decide(stage, fast_result, fast_result, escalated=False, reasons=[])
+
+        strong_result = call(self.strong_model)
+        return strong_result, self._decide(stage, fast_result, strong_result, escalated=True, reasons=reasons)
+
+    async def route_async(
+        self,
+        stage: str,
+        call: Callable[[str], Awaitable[Optional[T]]]
+    ) -> Tuple[Optional[T], RoutingDecision]:
+        """Async version of route() for the concurrent image batch."""
+        try:
+            fast_result = await call(self.fast_model)
+        except Exception:
+            fast_result = None
+
+        reasons = self.escalation_reasons(fast_result)
+        if not reasons:
+            return fast_result, self._decide(stage, fast_result, fast_result, escalated=False, reasons=[])
+
+        strong_result = await call(self.strong_model)
+        return strong_result, self._decide(stage, fast_result, strong_result, escalated=True, reasons=reasons)
+
+    def _decide(
+        self,
+        stage: str,
+        fast_result: Any,
+        final_result: Any,
+        escalated: bool,
+        reasons: List[str]
+    ) -> RoutingDecision:
+        decision = RoutingDecision(
+            stage=stage,
+            fast_model=self.fast_model,
+            strong_model=self.strong_model,
+            model_used=self.strong_model if escalated else self.fast_model,
+            escalated=escalated,
+            reasons=reasons,
+            confidence_threshold=self.confidence_threshold,
+            fast_confidence=getattr(fast_result, "confidence_overall", None),
+            final_confidence=getattr(final_result, "confidence_overall", None),
+            timestamp=datetime.now()
+        )
+        return record_routing_decision(decision)
+
+
+__all__ = [
+    "DEFAULT_FAST_MODEL",
+    "DEFAULT_STRONG_MODEL",
+    "DEFAULT_CONFIDENCE_THRESHOLD",
+    "ModelRouter",
+]
@@ -0,0 +1,330 @@
+#!/usr/bin/env python3
+"""Near-duplicate detection.
+
+Screenshot-heavy cases contain many near-identical images - the same chat
+captured twice, a resized or re-encoded copy, a photo forwarded through a
+messenger. Their sha256s differ, so content addressing cannot merge them and
+each one would cost its own vision call.
+
+Perceptual hashes summarise what an image looks like in 64 bits, so visually
+identical images have hashes a few bits apart (Hamming distance):
+
+- aHash: 8x8 grayscale thumbnail, each pixel above/below the mean
+- dHash: 9x8 thumbnail, each pixel brighter/darker than its right neighbour
+- pHash: 32x32 thumbnail, low-frequency DCT coefficients above/below median
+
+pHash is the most robust to resizing and re-encoding, so it gives the
+distance. aHash and dHash flip bits on flat, near-uniform areas (common in
+screenshots), so they only have to agree within twice the distance - as a
+cross-check, together with the aspect ratio, that keeps two *different*
+screenshots of the same app (same layout, different messages) apart.
+
+Documents and emails are compared by text instead: the same message exported
+as a forward, a reply quoting it, or an .eml and a .msg copy. Each text is
+cut into overlapping word 5-grams (shingles) and summarised by a MinHash
+signature, whose agreement estimates the Jaccard similarity of the shingle
+sets (and with the set sizes, how much of one text is contained in the
+other). Locality-sensitive hashing (LSH) buckets signatures by bands, so
+only texts sharing a band are compared - no all-pairs pass over a case.
+"""
+
+import re
+import zlib
+from io import BytesIO
+from pathlib import Path
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional, Set, Tuple, Union
+
+from .models import PerceptualHash
+
+if TYPE_CHECKING:
+    import numpy as np
+    from PIL import Image
+
+
+HASH_SIZE = 8  # 8x8 = 64-bit hashes
+PHASH_SIZE = 32  # Thumbnail the pHash DCT runs on
+
+# Largest pHash Hamming distance (of 64 bits) still treated as a near-duplicate
+DEFAULT_MAX_DISTANCE = 4
+
+# Relative aspect ratio difference tolerated between near-duplicates
+MAX_ASPECT_DIFFERENCE = 0.05
+
+SHINGLE_SIZE = 5  # Words per shingle
+NUM_PERM = 128  # MinHash signature length
+
+# Smallest share of a text's shingles found in another text for it to count as a near-duplicate
+DEFAULT_CONTAINMENT_THRESHOLD = 0.85
+
+# Texts with fewer shingles are too short to tell apart reliably ("Thanks!")
+MIN_SHINGLES = 10
+
+_MERSENNE_PRIME = (1 << 61) - 1
+_MAX_HASH = (1 << 32) - 1
+_WORD = re.compile(r"\w+")
+
+
+def _bits_to_hex(bits) -> str:
+    value = 0
+    for bit in bits:
+        value = (value << 1) | int(bool(bit))
+    return f"{value:0{HASH_SIZE * HASH_SIZE // 4}x}"
+
+
+def compute_perceptual_hash(image: "Image.Image") -> PerceptualHash:
+    """Compute aHash, dHash and pHash of an image (EXIF orientation applied)."""
+    import numpy as np
+    from PIL import Image, ImageOps
+
+    image = ImageOps.exif_transpose(image)
+    width, height = image.size
+    gray = image.convert("L")
+    resample = Image.Resampling.LANCZOS
+
+    pixels = np.asarray(gray.resize((HASH_SIZE, HASH_SIZE), resample), dtype=np.float64)
+    ahash = _bits_to_hex((pixels > pixels.mean()).flatten())
+
+    pixels = np.asarray(gray.resize((HASH_SIZE + 1, HASH_SIZE), resample), dtype=np.float64)
+    dhash = _bits_to_hex((pixels[:, 1:] > pixels[:, :-1]).flatten())
+
+    # 2D DCT-II as two matrix products; keep the 8x8 lowest frequencies
+    pixels = np.asarray(gray.resize((PHASH_SIZE, PHASH_SIZE), resample), dtype=np.float64)
+    n = np.arange(PHASH_SIZE)
+    dct = np.cos(np.pi * (2 * n[None, :] + 1) * n[:, None] / (2 * PHASH_SIZE))
+    low = (dct @ pixels @ dct.T)[:HASH_SIZE, :HASH_SIZE]
+    phash = _bits_to_hex((low > np.median(low)).flatten())
+
+    return PerceptualHash(ahash=ahash, dhash=dhash, phash=phash, width=width, height=height)
+
+
+def hash_image_file(image_path: Union[str, Path, bytes]) -> PerceptualHash:
+    """Perceptual hash of an image file (or encoded image bytes)."""
+    from PIL import Image
+
+    source = BytesIO(image_path) if isinstance(image_path, bytes) else image_path
+    with Image.open(source) as image:
+        size = image.size
+        # JPEGs can be decoded at reduced size - hashes only need a thumbnail
+        image.draft("RGB", (PHASH_SIZE * 4, PHASH_SIZE * 4))
+        decoded_size = image.size
+        hashes = compute_perceptual_hash(image)
+
+    # Report the full dimensions (swapped when the EXIF orientation rotated the image)
+    rotated = (hashes.width, hashes.height) != decoded_size
+    width, height = size[::-1] if rotated else size
+    return hashes.model_copy(update={"width": width, "height": height})
+
+
+def hamming_distance(a: str, b: str) -> int:
+    """Number of differing bits between two hex-encoded hashes."""
+    return bin(int(a, 16) ^ int(b, 16)).count("1")
+
+
+def perceptual_distance(a: PerceptualHash, b: PerceptualHash) -> int:
+    """Distance between two images (pHash Hamming distance)."""
+    return hamming_distance(a.phash, b.phash)
+
+
+def is_near_duplicate(a: PerceptualHash, b: PerceptualHash, max_distance: int = DEFAULT_MAX_DISTANCE) -> bool:
+    """Whether two images are near-duplicates (see module docstring)."""
+    ratio_a, ratio_b = a.width / a.height, b.width / b.height
+    if abs(ratio_a - ratio_b) > MAX_ASPECT_DIFFERENCE * max(ratio_a, ratio_b):
+        return False
+    return (
+        perceptual_distance(a, b) <= max_distance
+        and hamming_distance(a.ahash, b.ahash) <= 2 * max_distance
+        and hamming_distance(a.dhash, b.dhash) <= 2 * max_distance
+    )
+
+
+class ImageHashIndex:
+    """In-memory index of perceptual hashes, searched by Hamming distance.
+
+    A linear scan - fast enough for the few thousand images of a case.
+    """
+
+    def __init__(self):
+        self._entries: List[Tuple[str, PerceptualHash]] = []
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def add(self, key: str, hashes: PerceptualHash) -> None:
+        self._entries.append((key, hashes))
+
+    def nearest(self, hashes: PerceptualHash, max_distance: int = DEFAULT_MAX_DISTANCE) -> Optional[Tuple[str, int]]:
+        """Closest indexed image within max_distance, as (key, distance), or None."""
+        best = None
+        for key, candidate in self._entries:
+            if not is_near_duplicate(hashes, candidate, max_distance):
+                continue
+            distance = perceptual_distance(hashes, candidate)
+            if best is None or distance < best[1]:
+                best = (key, distance)
+        return best
+
+
+# -----------------------------------------------------------------------------
+# Text: shingles, MinHash, LSH
+# -----------------------------------------------------------------------------
+
+def shingles(text: str, size: int = SHINGLE_SIZE) -> Set[int]:
+    """Hashed word n-grams of a text (case, punctuation and spacing ignored)."""
+    words = _WORD.findall(text.lower())
+    if len(words) < size:
+        return {zlib.crc32(" ".join(words).encode("utf-8"))} if words else set()
+    return {
+        zlib.crc32(" ".join(words[i:i + size]).encode("utf-8"))
+        for i in range(len(words) - size + 1)
+    }
+
+
+class MinHasher:
+    """MinHash signatures from NUM_PERM random linear hash functions."""
+
+    BLOCK = 4096  # Shingles hashed per numpy block (bounds memory on long texts)
+
+    def __init__(self, num_perm: int = NUM_PERM, seed: int = 1):
+        import numpy as np
+
+        rng = np.random.default_rng(seed)
+        # a, b < 2^32 and shingle hashes < 2^32, so a * h + b never overflows uint64
+        self.a = rng.integers(1, _MAX_HASH, num_perm, dtype=np.uint64)
+        self.b = rng.integers(0, _MAX_HASH, num_perm, dtype=np.uint64)
+        self.num_perm = num_perm
+
+    def signature(self, shingle_hashes: Iterable[int]) -> "np.ndarray":
+        """MinHash signature of a set of shingle hashes."""
+        import numpy as np
+
+        values = np.fromiter(shingle_hashes, dtype=np.uint64)
+        signature = np.full(self.num_perm, _MAX_HASH, dtype=np.uint64)
+        for start in range(0, len(values), self.BLOCK):
+            block = values[start:start + self.BLOCK, None]
+            hashed = (block * self.a + self.b) % np.uint64(_MERSENNE_PRIME) & np.uint64(_MAX_HASH)
+            signature = np.minimum(signature, hashed.min(axis=0))
+        return signature
+
+
+def estimate_jaccard(a: "np.ndarray", b: "np.ndarray") -> float:
+    """Jaccard similarity estimated from two MinHash signatures."""
+    return float((a == b).mean())
+
+
+def lsh_bands(threshold: float, num_perm: int = NUM_PERM) -> Tuple[int, int]:
+    """(bands, rows) for an LSH index.
+
+    The S-curve turns at about (1/bands)^(1/rows); the steepest curve turning
+    at or below the threshold is used, so pairs just above the threshold are
+    still found (candidates are verified against the threshold afterwards).
+    """
+    def turn(br: Tuple[int, int]) -> float:
+        return (1 / br[0]) ** (1 / br[1])
+
+    candidates = [(bands, num_perm // bands) for bands in range(1, num_perm + 1) if num_perm % bands == 0]
+    below = [br for br in candidates if turn(br) <= threshold]
+    return max(below, key=turn) if below else min(candidates, key=turn)
+
+
+class MinHashLSH:
+    """LSH index over MinHash signatures: candidates share at least one band."""
+
+    def __init__(self, threshold: float, num_perm: int = NUM_PERM):
+        """Candidates are likely to have at least ``threshold`` Jaccard similarity."""
+        self.bands, self.rows = lsh_bands(threshold, num_perm)
+        self._buckets: List[Dict[bytes, List[str]]] = [{} for _ in range(self.bands)]
+
+    def _band_keys(self, signature: "np.ndarray") -> Iterable[Tuple[int, bytes]]:
+        for band in range(self.bands):
+            yield band, signature[band * self.rows:(band + 1) * self.rows].tobytes()
+
+    def insert(self, key: str, signature: "np.ndarray") -> None:
+        for band, band_key in self._band_keys(signature):
+            self._buckets[band].setdefault(band_key, []).append(key)
+
+    def query(self, signature: "np.ndarray") -> List[str]:
+        """Keys sharing a band with the signature (in insertion order)."""
+        found = {}
+        for band, band_key in self._band_keys(signature):
+            for key in self._buckets[band].get(band_key, ()):
+                found[key] = True
+        return list(found)
+
+
+def estimate_containment(a: "np.ndarray", b: "np.ndarray", size_a: int, size_b: int) -> float:
+    """Share of text A's shingles that also occur in text B.
+
+    Derived from the Jaccard estimate and the set sizes:
+    |A & B| = J * (|A| + |B|) / (1 + J).
+    """
+    jaccard = estimate_jaccard(a, b)
+    return min(1.0, jaccard * (size_a + size_b) / ((1 + jaccard) * size_a))
+
+
+def group_near_duplicates(
+    signatures: Dict[str, "np.ndarray"],
+    sizes: Dict[str, int],
+    threshold: float = DEFAULT_CONTAINMENT_THRESHOLD
+) -> Dict[str, Tuple[str, float]]:
+    """Assign near-duplicate texts to a representative.
+
+    Signatures are taken in order: the first unassigned one becomes a
+    representative and claims every unassigned text whose shingles are
+    contained in it (estimated) at least at the threshold, so each member
+    is covered by its representative itself, not just by a chain of
+    members. Order longest first, so a reply quoting the original
+    represents both.
+
+    Containment rather than Jaccard similarity: a reply adding a few lines
+    above a short quoted message has a low Jaccard similarity to it but
+    contains all of it. LSH candidates are gathered at half the threshold
+    (as Jaccard) and then verified.
+
+    Args:
+        signatures: Key -> MinHash signature, in preference order
+        sizes: Key -> number of shingles
+        threshold: Smallest estimated containment
+
+    Returns:
+        Member key -> (representative key, estimated containment), for every
+        text that is not its own representative
+    """
+    if not signatures:
+        return {}
+    num_perm = len(next(iter(signatures.values())))
+    lsh = MinHashLSH(threshold / 2, num_perm)
+    for key, signature in signatures.items():
+        lsh.insert(key, signature)
+
+    members: Dict[str, Tuple[str, float]] = {}
+    representatives = set()
+    for key, signature in signatures.items():
+        if key in members:
+            continue
+        representatives.add(key)
+        for candidate in lsh.query(signature):
+            if candidate in members or candidate in representatives:
+                continue
+            containment = estimate_containment(signatures[candidate], signature, sizes[candidate], sizes[key])
+            if containment >= threshold:
+                members[candidate] = (key, containment)
+    return members
+
+
+__all__ = [
+    "DEFAULT_MAX_DISTANCE",
+    "compute_perceptual_hash",
+    "hash_image_file",
+    "hamming_distance",
+    "perceptual_distance",
+    "is_near_duplicate",
+    "ImageHashIndex",
+    "DEFAULT_CONTAINMENT_THRESHOLD",
+    "MIN_SHINGLES",
+    "shingles",
+    "MinHasher",
+    "estimate_jaccard",
+    "estimate_containment",
+    "MinHashLSH",
+    "group_near_duplicates",
+]
@@ -12,10 +12,13 @@ v3.0 Changes:
 - All Pydantic models now in single source of truth
 """
 
+import gzip
+import hashlib
 import json
 import shutil
+import uuid
 from pathlib import Path
-from typing import Dict, List, Optional, Union
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Union
 from datetime import datetime
 
 from .utils import (
@@ -51,7 +54,22 @@ from .models import (
 
     # AI analysis models
     DocumentAnalysis,
+
+    # AI usage accounting
+    UsageRecord,
+    CaseCostReport,
+    BudgetReport,
+    OfflineBatchJob,
+    ImageBatchCheckpoint,
+    PerceptualHash,
+    ProcessRun,
+    WatchState,
+
+    # Extracted text
+    ExtractedText,
 )
+from .chunking import PAGE_BREAK
+from .usage import summarize_usage
 
 
 class EvidenceStorage:
@@ -67,16 +85,35 @@ class EvidenceStorage:
     Storage Structure:
         data/storage/
         ├── raw/sha256=<hash>/original.<ext>       # Immutable original files
+        ├── raw/.incoming-<uuid>.<ext>              # Streamed ingest in progress (ingest_stream)
         ├── derived/sha256=<hash>/                  # Analysis and metadata
         │   ├── metadata.json
         │   ├── analysis.v1.json                    # UnifiedAnalysis format
         │   ├── evidence_bundle.v1.json             # EvidenceBundle format
         │   ├── chain_of_custody.json
+        │   ├── text.v1.txt.gz                      # Extracted text (pages form-feed separated)
+        │   ├── text.v1.json                        # ExtractedText index (source, page offsets)
+        │   ├── chunks/chunk-NNN.json               # Cached chunk analyses (long documents)
+        │   ├── prepared/<settings>.bin|.json       # Images prepared for vision upload
+        │   ├── phash.v1.json                       # PerceptualHash (near-duplicate images)
         │   └── exif.json (images only)
         ├── labels/<label>/                         # Hard links by content
-        └── cases/<case-id>/                        # Hard links by case
+        ├── cases/<case-id>/                        # Hard links by case
+        ├── usage/                                  # AI usage accounting
+        │   ├── <case-id>.jsonl                     # Case-level AI usage log
+        │   └── <case-id>.budget.json               # Latest budget report
+        └── batches/
+            ├── <job-id>/                           # Offline Batch API jobs
+            │   ├── job.json                        # OfflineBatchJob state
+            │   ├── requests.jsonl                  # Submitted requests
+            │   └── results.jsonl                   # Downloaded results
+            └── images-<case-id>.checkpoint.json    # Interactive image batch progress
     """
 
+    TEXT_FILE = "text.v1.txt.gz"
+    TEXT_INDEX_FILE = "text.v1.json"
+    IMAGE_HASH_FILE = "phash.v1.json"
+
     def __init__(self, evidence_root: Path = Path("data/storage")):
         """Initialize evidence storage with root directory.
 
@@ -88,6 +125,10 @@ class EvidenceStorage:
         self.derived_dir = self.evidence_root / "derived"
         self.labels_dir = self.evidence_root / "labels"
         self.cases_dir = self.evidence_root / "cases"
+        self.usage_dir = self.evidence_root / "usage"
+        self.batches_dir = self.evidence_root / "batches"
+        self.watch_dir = self.evidence_root / "watch"
+        self.runs_dir = self.evidence_root / "runs"
 
         # Ensure directories exist
         for directory in [self.raw_dir, self.derived_dir, self.labels_dir, self.cases_dir]:
@@ -131,31 +172,12 @@ class EvidenceStorage:
             # Detect file type
             evidence_type = EvidenceType(detect_file_type(file_path))
 
-            # Create storage directories
+            # Copy original file
             raw_hash_dir = get_evidence_base_dir(self.raw_dir, sha256)
-            derived_hash_dir = get_evidence_base_dir(self.derived_dir, sha256)
-
             ensure_directory(raw_hash_dir)
-            ensure_directory(derived_hash_dir)
-
-            # Copy original file
             original_file = raw_hash_dir / f"original{file_path.suffix}"
             shutil.copy2(file_path, original_file)
 
-            # Save metadata
-            metadata_file = derived_hash_dir / "metadata.json"
-            with open(metadata_file, 'w') as f:
-                json.dump(file_metadata.model_dump(), f, indent=2)
-
-            # Extract EXIF for images
-            exif_data = None
-            if evidence_type == EvidenceType.IMAGE:
-                exif_data = extract_exif_data(file_path)
-                if exif_data:
-                    exif_file = derived_hash_dir / "exif.json"
-                    with open(exif_file, 'w') as f:
-                        json.dump(exif_data, f, indent=2)
-
             # Create initial chain of custody
             custody_event = ChainOfCustodyEvent(
                 timestamp=datetime.now(),
@@ -164,16 +186,7 @@ class EvidenceStorage:
                 description=f"File ingested from {file_path}",
                 metadata={"case_id": case_id} if case_id else None
             )
-
-            # Create case link if case_id provided
-            if case_id:
-                case_dir = self.cases_dir / case_id
-                ensure_directory(case_dir)
-                case_link = case_dir / f"{sha256}{file_path.suffix}"
-                create_hard_link(original_file, case_link)
-
-            # Add to chain of custody (preserves existing events for multi-case evidence)
-            self._add_custody_event(sha256, custody_event)
+            self._register_original(original_file, file_metadata, evidence_type, case_id, custody_event)
 
             return IngestionResult(
                 sha256=sha256,
@@ -196,6 +209,131 @@ class EvidenceStorage:
                 message=f"Ingestion failed: {str(e)}"
             )
 
+    def ingest_stream(
+        self,
+        chunks: Iterable[bytes],
+        filename: str,
+        case_id: Optional[str] = None,
+        actor: str = "system",
+        parent_sha256: Optional[str] = None,
+        source: Optional[str] = None,
+        custody_metadata: Optional[Dict[str, Any]] = None
+    ) -> IngestionResult:
+        """Ingest evidence from a stream of bytes (e.g. one message of a mailbox).
+
+        Chunks are hashed while they are spooled to a temporary file under
+        raw/, which is then moved into place - the content is never held in
+        memory as a whole.
+
+        Args:
+            chunks: Byte chunks of the content, in order
+            filename: Name recorded in the metadata (its suffix sets the evidence type)
+            case_id: Optional case identifier for organization
+            actor: Actor performing the ingestion (for chain of custody)
+            parent_sha256: Container evidence this was extracted from (linked in custody)
+            source: Where in the container it came from (e.g. "message 12")
+            custody_metadata: Extra metadata for the ingest custody event
+                (e.g. the path of an archive member)
+
+        Returns:
+            IngestionResult with success status and storage location
+        """
+        suffix = Path(filename).suffix
+        temp_file = self.raw_dir / f".incoming-{uuid.uuid4().hex}{suffix}"
+        try:
+            sha256_hash = hashlib.sha256()
+            with open(temp_file, 'wb') as f:
+                for chunk in chunks:
+                    sha256_hash.update(chunk)
+                    f.write(chunk)
+            sha256 = sha256_hash.hexdigest()
+
+            raw_hash_dir = get_evidence_base_dir(self.raw_dir, sha256)
+            ensure_directory(raw_hash_dir)
+            original_file = raw_hash_dir / f"original{suffix}"
+            temp_file.replace(original_file)
+
+            metadata = get_file_metadata(original_file)
+            metadata["filename"] = Path(filename).name
+            file_metadata = FileMetadata(sha256=sha256, **metadata)
+            evidence_type = EvidenceType(detect_file_type(original_file))
+
+            event_metadata = {"case_id": case_id} if case_id else {}
+            if parent_sha256:
+                event_metadata.update(parent_sha256=parent_sha256, source=source)
+            event_metadata.update(custody_metadata or {})
+            custody_event = ChainOfCustodyEvent(
+                timestamp=datetime.now(),
+                event_type="ingest",
+                actor=actor,
+                description=(
+                    f"Extracted from container {parent_sha256[:12]} ({source or filename})"
+                    if parent_sha256 else f"Stream ingested as {filename}"
+                ),
+                metadata=event_metadata or None
+            )
+            self._register_original(original_file, file_metadata, evidence_type, case_id, custody_event)
+
+            return IngestionResult(
+                sha256=sha256,
+                file_path=f"{parent_sha256[:12]}:{source}" if parent_sha256 and source else filename,
+                evidence_type=evidence_type,
+                metadata=file_metadata,
+                storage_path=str(original_file),
+                success=True,
+                message="Stream successfully ingested",
+                parent_sha256=parent_sha256
+            )
+
+        except Exception as e:
+            temp_file.unlink(missing_ok=True)
+            return IngestionResult(
+                sha256="",
+                file_path=filename,
+                evidence_type=EvidenceType.OTHER,
+                metadata=None,
+                storage_path="",
+                success=False,
+                message=f"Ingestion failed: {str(e)}",
+                parent_sha256=parent_sha256
+            )
+
+    def _register_original(
+        self,
+        original_file: Path,
+        file_metadata: FileMetadata,
+        evidence_type: EvidenceType,
+        case_id: Optional[str],
+        custody_event: ChainOfCustodyEvent
+    ) -> None:
+        """Write metadata (and EXIF), link into the case and record custody for a stored original."""
+        sha256 = file_metadata.sha256
+        derived_hash_dir = get_evidence_base_dir(self.derived_dir, sha256)
+        ensure_directory(derived_hash_dir)
+
+        # Save metadata
+        metadata_file = derived_hash_dir / "metadata.json"
+        with open(metadata_file, 'w') as f:
+            json.dump(file_metadata.model_dump(), f, indent=2)
+
+        # Extract EXIF for images
+        if evidence_type == EvidenceType.IMAGE:
+            exif_data = extract_exif_data(original_file)
+            if exif_data:
+                exif_file = derived_hash_dir / "exif.json"
+                with open(exif_file, 'w') as f:
+                    json.dump(exif_data, f, indent=2)
+
+        # Create case link if case_id provided
+        if case_id:
+            case_dir = self.cases_dir / case_id
+            ensure_directory(case_dir)
+            case_link = case_dir / f"{sha256}{original_file.suffix}"
+            create_hard_link(original_file, case_link)
+
+        # Add to chain of custody (preserves existing events for multi-case evidence)
+        self._add_custody_event(sha256, custody_event)
+
     def get_analysis(self, sha256: str) -> Optional[UnifiedAnalysis]:
         """Retrieve unified analysis for a given SHA256.
 
@@ -237,10 +375,12 @@ class EvidenceStorage:
                 print(f"Error: Derived directory does not exist for {sha256}")
                 return False
 
-            # Save analysis
+            # Save analysis (written aside and renamed, so a crash never leaves half a file)
             analysis_file = derived_hash_dir / "analysis.v1.json"
-            with open(analysis_file, 'w') as f:
+            temp_file = analysis_file.with_name(analysis_file.name + ".partial")
+            with open(temp_file, 'w') as f:
                 json.dump(analysis.model_dump(), f, indent=2, default=str)
+            temp_file.replace(analysis_file)
 
             # Update chain of custody
             self._add_custody_event(
@@ -331,8 +471,8 @@ class EvidenceStorage:
                         parameters=AnalysisParameters(
                             temperature=0.0,  # Deterministic analysis
                             prompt_hash=None,  # Could add prompt hashing in future
-                            token_usage_in=None,  # OpenAI Responses API doesn't expose this yet
-                            token_usage_out=None
+                            token_usage_in=sum(r.input_tokens for r in analysis.ai_usage) if analysis.ai_usage else None,
+                            token_usage_out=sum(r.output_tokens for r in analysis.ai_usage) if analysis.ai_usage else None
                         ),
                         outputs=doc_analysis,
                         confidence_overall=analysis.document_analysis.analysis_confidence or 0.0
@@ -388,6 +528,140 @@ class EvidenceStorage:
             print(f"Error creating evidence bundle for {analysis.file_metadata.sha256}: {e}")
             return False
 
+    def record_extracted_text(
+        self,
+        sha256: str,
+        pages: Iterable[str],
+        source: str,
+        page_breaks: bool = True,
+        ocr_pages: Optional[List[int]] = None,
+        unread_pages: Optional[List[int]] = None
+    ) -> Iterator[str]:
+        """Pass page texts through while writing them to the text artifact.
+
+        The artifact only becomes visible (text.v1.json written) once the
+        pages are exhausted, so an interrupted extraction is never reused.
+        A write failure is reported and the pages keep flowing.
+
+        Args:
+            sha256: Evidence SHA256
+            pages: Page texts in document order
+            source: Extraction source ("pdfplumber", "text", "email", "vision_ocr")
+            page_breaks: False when the pieces are blocks of one page (text
+                files) - they are then stored as a single page
+            ocr_pages: Pages read with vision OCR; may be filled while the
+                pages stream (it is read once they are exhausted)
+            unread_pages: Scanned pages whose text could not be read (no
+                vision analyzer, or OCR failed); filled like ocr_pages. If
+                any, the artifact is discarded so a later run retries them.
+
+        Yields:
+            The same page texts
+        """
+        derived_hash_dir = get_evidence_base_dir(self.derived_dir, sha256)
+        text_file = derived_hash_dir / self.TEXT_FILE
+        temp_file = text_file.with_name(text_file.name + ".partial")
+        page_offsets: List[int] = []
+        offset = 0
+        writer = None
+
+        try:
+            ensure_directory(derived_hash_dir)
+            writer = gzip.open(temp_file, 'wt', encoding='utf-8', newline='')
+        except Exception as e:
+            print(f"Warning: Could not save extracted text for {sha256[:12]}: {e}")
+
+        try:
+            for page in pages:
+                if writer:
+                    try:
+                        if page_breaks and page_offsets:
+                            writer.write(PAGE_BREAK)
+                            offset += len(PAGE_BREAK)
+                        if page_breaks or not page_offsets:
+                            page_offsets.append(offset)
+                        writer.write(page)
+                        offset += len(page)
+                    except Exception as e:
+                        print(f"Warning: Could not save extracted text for {sha256[:12]}: {e}")
+                        writer.close()
+                        writer = None
+                yield page
+
+            if writer and unread_pages:
+                writer.close()
+                writer = None  # Incomplete - the partial file is removed below
+            if writer:
+                writer.close()
+                writer = None
+                temp_file.replace(text_file)
+                index = ExtractedText(
+                    sha256=sha256,
+                    source=source,
+                    page_offsets=page_offsets,
+                    ocr_pages=list(ocr_pages or []),
+                    char_count=offset,
+                    created_at=datetime.now()
+                )
+                with open(derived_hash_dir / self.TEXT_INDEX_FILE, 'w') as f:
+                    f.write(index.model_dump_json(indent=2))
+        finally:
+            if writer:
+                writer.close()
+            temp_file.unlink(missing_ok=True)
+
+    def save_extracted_text(
+        self,
+        sha256: str,
+        pages: Iterable[str],
+        source: str,
+        page_breaks: bool = True,
+        ocr_pages: Optional[List[int]] = None,
+        unread_pages: Optional[List[int]] = None
+    ) -> Optional[ExtractedText]:
+        """Write the text artifact from page texts (see record_extracted_text)."""
+        for _ in self.record_extracted_text(sha256, pages, source, page_breaks, ocr_pages, unread_pages):
+            pass
+        return self.get_extracted_text(sha256)
+
+    def get_extracted_text(self, sha256: str) -> Optional[ExtractedText]:
+        """Load the text artifact index, if the text has been extracted."""
+        derived_hash_dir = get_evidence_base_dir(self.derived_dir, sha256)
+        index_data = read_json_safe(derived_hash_dir / self.TEXT_INDEX_FILE)
+        if not index_data or not (derived_hash_dir / self.TEXT_FILE).exists():
+            return None
+        return ExtractedText(**index_data)
+
+    def iter_extracted_pages(self, sha256: str) -> Iterator[str]:
+        """Stream the stored text page by page (nothing if none is stored)."""
+        index = self.get_extracted_text(sha256)
+        if not index:
+            return
+
+        text_file = get_evidence_base_dir(self.derived_dir, sha256) / self.TEXT_FILE
+        page_ends = index.page_offsets[1:] + [index.char_count + len(PAGE_BREAK)]
+        with gzip.open(text_file, 'rt', encoding='utf-8', newline='') as f:
+            for start, end in zip(index.page_offsets, page_ends):
+                yield f.read(end - start - len(PAGE_BREAK))
+                f.read(len(PAGE_BREAK))
+
+    def read_extracted_text(self, sha256: str) -> Optional[str]:
+        """The stored text (pages joined with form feeds), or None if not extracted."""
+        if not self.get_extracted_text(sha256):
+            return None
+        return PAGE_BREAK.join(self.iter_extracted_pages(sha256))
+
+    def save_image_hash(self, sha256: str, hashes: PerceptualHash) -> None:
+        """Save an image's perceptual hashes (see core.similarity)."""
+        derived_hash_dir = get_evidence_base_dir(self.derived_dir, sha256)
+        ensure_directory(derived_hash_dir)
+        (derived_hash_dir / self.IMAGE_HASH_FILE).write_text(hashes.model_dump_json(indent=2))
+
+    def get_image_hash(self, sha256: str) -> Optional[PerceptualHash]:
+        """Load an image's perceptual hashes, if they have been computed."""
+        hash_data = read_json_safe(get_evidence_base_dir(self.derived_dir, sha256) / self.IMAGE_HASH_FILE)
+        return PerceptualHash(**hash_data) if hash_data else None
+
     def export_analysis(self, sha256: str, output_path: Path) -> ExportResult:
         """Export analysis to specified path.
 
@@ -728,6 +1002,245 @@ class EvidenceStorage:
 
         return sorted(cases, key=lambda x: x.last_modified, reverse=True)
 
+    def append_case_usage(self, case_id: str, records: List[UsageRecord]) -> None:
+        """Append case-level AI usage records (correlation, summaries) to the usage log.
+
+        The log is the case's spend ledger: it also holds the evidence-level
+        calls made for the case (see append_evidence_usage).
+
+        Args:
+            case_id: Case identifier
+            records: UsageRecords to append
+        """
+        if not records:
+            return
+
+        ensure_directory(self.usage_dir)
+        usage_file = self.usage_dir / f"{case_id}.jsonl"
+        with open(usage_file, 'a') as f:
+            for record in records:
+                f.write(record.model_dump_json() + "\n")
+
+    def append_evidence_usage(self, case_id: str, sha256: str, records: List[UsageRecord]) -> List[UsageRecord]:
+        """Log an evidence item's AI usage against the case it was analyzed for.
+
+        UnifiedAnalysis.ai_usage only holds the latest analysis of an item
+        (shared by every case it belongs to); the log keeps each run, for the
+        case that paid for it.
+
+        Args:
+            case_id: Case the analysis ran for
+            sha256: Evidence SHA256
+            records: UsageRecords of the analysis
+
+        Returns:
+            The records tagged with evidence_sha256, to store as ai_usage
+        """
+        records = [record.model_copy(update={"evidence_sha256": sha256}) for record in records]
+        self.append_case_usage(case_id, records)
+        return records
+
+    def get_case_usage(self, case_id: str) -> List[UsageRecord]:
+        """Load case-level AI usage records for a case.
+
+        Args:
+            case_id: Case identifier
+
+        Returns:
+            List of UsageRecords (empty if none recorded)
+        """
+        usage_file = self.usage_dir / f"{case_id}.jsonl"
+        if not usage_file.exists():
+            return []
+
+        records = []
+        with open(usage_file, 'r') as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    records.append(UsageRecord.model_validate_json(line))
+                except Exception as e:
+                    print(f"Warning: Skipping malformed usage record for {case_id}: {e}")
+        return records
+
+    def save_budget_report(self, report: BudgetReport) -> Path:
+        """Save the budget report of the latest budget-controlled run for a case.
+
+        Args:
+            report: BudgetReport from BudgetController.report()
+
+        Returns:
+            Path to the saved report (usage/<case-id>.budget.json)
+        """
+        ensure_directory(self.usage_dir)
+        report_file = self.usage_dir / f"{report.case_id}.budget.json"
+        with open(report_file, 'w') as f:
+            f.write(report.model_dump_json(indent=2))
+        return report_file
+
+    def get_budget_report(self, case_id: str) -> Optional[BudgetReport]:
+        """Load the latest budget report for a case, if one exists."""
+        report_data = read_json_safe(self.usage_dir / f"{case_id}.budget.json")
+        return BudgetReport(**report_data) if report_data else None
+
+    def get_batch_job_dir(self, job_id: str) -> Path:
+        """Directory holding an offline batch job's state and JSONL files."""
+        return self.batches_dir / job_id
+
+    def save_batch_job(self, job: OfflineBatchJob) -> Path:
+        """Save offline batch job state.
+
+        Args:
+            job: OfflineBatchJob to save
+
+        Returns:
+            Path to the saved job.json
+        """
+        job_dir = self.get_batch_job_dir(job.job_id)
+        ensure_directory(job_dir)
+        job_file = job_dir / "job.json"
+        with open(job_file, 'w') as f:
+            f.write(job.model_dump_json(indent=2))
+        return job_file
+
+    def get_image_batch_checkpoint_file(self, case_id: Optional[str]) -> Path:
+        """Checkpoint file of a case's interactive image batch."""
+        return self.batches_dir / f"images-{case_id or 'no-case'}.checkpoint.json"
+
+    def save_image_batch_checkpoint(self, checkpoint: ImageBatchCheckpoint) -> Path:
+        """Save image batch progress (atomically - it is rewritten after every image)."""
+        checkpoint_file = self.get_image_batch_checkpoint_file(checkpoint.case_id)
+        ensure_directory(checkpoint_file.parent)
+        temp_file = checkpoint_file.with_name(checkpoint_file.name + ".partial")
+        temp_file.write_text(checkpoint.model_dump_json(indent=2))
+        temp_file.replace(checkpoint_file)
+        return checkpoint_file
+
+    def get_image_batch_checkpoint(self, case_id: Optional[str]) -> Optional[ImageBatchCheckpoint]:
+        """Load the last image batch checkpoint for a case, if any."""
+        checkpoint_data = read_json_safe(self.get_image_batch_checkpoint_file(case_id))
+        return ImageBatchCheckpoint(**checkpoint_data) if checkpoint_data else None
+
+    def get_run_dir(self, run_id: str) -> Path:
+        """Directory holding a process-case run's journal and checkpoints."""
+        return self.runs_dir / run_id
+
+    def save_run(self, run: ProcessRun) -> Path:
+        """Save a process-case run journal (atomically - it is rewritten after every stage)."""
+        run_dir = self.get_run_dir(run.run_id)
+        ensure_directory(run_dir)
+        journal_file = run_dir / "journal.json"
+        temp_file = journal_file.with_name(journal_file.name + ".partial")
+        temp_file.write_text(run.model_dump_json(indent=2))
+        temp_file.replace(journal_file)
+        return journal_file
+
+    def get_run(self, run_id: str) -> Optional[ProcessRun]:
+        """Load a process-case run journal, if it exists."""
+        run_data = read_json_safe(self.get_run_dir(run_id) / "journal.json")
+        return ProcessRun(**run_data) if run_data else None
+
+    def get_watch_state_file(self, case_id: str) -> Path:
+        """State file of a case's watch-folder run."""
+        return self.watch_dir / f"{case_id}.json"
+
+    def save_watch_state(self, state: WatchState) -> Path:
+        """Save watch-folder state (atomically - it is rewritten after every batch)."""
+        state_file = self.get_watch_state_file(state.case_id)
+        ensure_directory(state_file.parent)
+        temp_file = state_file.with_name(state_file.name + ".partial")
+        temp_file.write_text(state.model_dump_json(indent=2))
+        temp_file.replace(state_file)
+        return state_file
+
+    def get_watch_state(self, case_id: str) -> Optional[WatchState]:
+        """Load a case's watch-folder state, if it has been watched before."""
+        state_data = read_json_safe(self.get_watch_state_file(case_id))
+        return WatchState(**state_data) if state_data else None
+
+    def get_batch_job(self, job_id: str) -> Optional[OfflineBatchJob]:
+        """Load an offline batch job, if it exists."""
+        job_data = read_json_safe(self.get_batch_job_dir(job_id) / "job.json")
+        return OfflineBatchJob(**job_data) if job_data else None
+
+    def list_batch_jobs(self, case_id: Optional[str] = None) -> List[OfflineBatchJob]:
+        """List offline batch jobs (optionally for one case), oldest first."""
+        if not self.batches_dir.exists():
+            return []
+
+        jobs = []
+        for job_dir in self.batches_dir.iterdir():
+            job = self.get_batch_job(job_dir.name) if job_dir.is_dir() else None
+            if job and (case_id is None or job.case_id == case_id):
+                jobs.append(job)
+        return sorted(jobs, key=lambda job: job.created_at)
+
+    def get_case_cost_report(self, case_id: str) -> CaseCostReport:
+        """Roll up AI usage and estimated cost for a case.
+
+        Evidence and case-level usage are both read from the case's usage
+        log, so evidence shared with other cases is charged only to the case
+        it was analyzed for, and earlier --force runs still count. Usage never
+        logged against a case (older stores, analyses run without a case) is
+        taken from UnifiedAnalysis.ai_usage, split evenly across the item's
+        cases.
+
+        Args:
+            case_id: Case identifier
+
+        Returns:
+            CaseCostReport with totals and per-stage/per-model breakdowns
+        """
+        evidence_sha256s = self.list_evidence(case_id)
+        case_records: List[UsageRecord] = []
+        logged: Dict[str, List[UsageRecord]] = {}
+        for record in self.get_case_usage(case_id):
+            if record.evidence_sha256:
+                logged.setdefault(record.evidence_sha256, []).append(record)
+            else:
+                case_records.append(record)
+
+        evidence_records: List[UsageRecord] = []
+        per_evidence = {}
+        duplicates_reused = 0
+
+        for sha256 in dict.fromkeys(evidence_sha256s + list(logged)):
+            analysis = self.get_analysis(sha256)
+            records = logged.get(sha256)
+            if (records is None and analysis and analysis.ai_usage
+                    and not any(record.evidence_sha256 for record in analysis.ai_usage)):
+                share = 1 / max(len(analysis.case_ids), 1)
+                records = [record.model_copy(update={
+                    "input_tokens": round(record.input_tokens * share),
+                    "cached_input_tokens": round(record.cached_input_tokens * share),
+                    "output_tokens": round(record.output_tokens * share),
+                    "estimated_cost_usd": (
+                        record.estimated_cost_usd * share if record.estimated_cost_usd is not None else None
+                    ),
+                }) for record in analysis.ai_usage]
+            if records:
+                evidence_records.extend(records)
+                per_evidence[sha256] = summarize_usage(records)
+            if analysis and analysis.duplicate_of and sha256 in evidence_sha256s:
+                duplicates_reused += 1
+
+        return CaseCostReport(
+            case_id=case_id,
+            generated_at=datetime.now(),
+            evidence_count=len(evidence_sha256s),
+            evidence_with_usage=len(per_evidence),
+            evidence_usage=summarize_usage(evidence_records),
+            case_level_usage=summarize_usage(case_records),
+            total=summarize_usage(evidence_records + case_records),
+            per_evidence={
+                sha256: summary.model_dump(exclude={"by_stage", "by_model"})
+                for sha256, summary in per_evidence.items()
+            },
+            duplicates_reused=duplicates_reused
+        )
+
     def _find_orphaned_evidence(self) -> List[str]:
         """Find evidence not linked to any case.
 
@@ -0,0 +1,290 @@
+#!/usr/bin/env python3
+"""AI usage and cost accounting.
+
+Every Responses API call made by the toolkit reports its token usage, latency
+and retry count here. Records are collected by whichever ``track_usage()``
+scopes are active in the current context, so callers can attribute usage to an
+evidence item (analyze_evidence), a batch item (pipeline.batch) or a whole case
+(package generation) without threading a tracker through every analyzer.
+
+Tracking uses contextvars, so concurrent asyncio tasks each keep their own
+scope stack and nested scopes all receive a copy of the record. Model routing
+decisions (core.routing) are collected the same way.
+"""
+
+import threading
+from contextlib import contextmanager
+from contextvars import ContextVar
+from datetime import datetime
+from types import SimpleNamespace
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from .models import RoutingDecision, UsageRecord, UsageTotals, UsageSummary
+
+
+# Batch API requests are billed at a discount on the synchronous price
+BATCH_DISCOUNT = 0.5
+
+# USD per 1M tokens: (input, cached input, output).
+# Keep in sync with https://openai.com/api/pricing - used for estimates only.
+MODEL_PRICING: Dict[str, Tuple[float, float, float]] = {
+    "gpt-4o": (2.50, 1.25, 10.00),
+    "gpt-4o-2024-08-06": (2.50, 1.25, 10.00),
+    "gpt-4o-mini": (0.15, 0.075, 0.60),
+    "gpt-4.1": (2.00, 0.50, 8.00),
+    "gpt-4.1-mini": (0.40, 0.10, 1.60),
+    "gpt-4.1-nano": (0.10, 0.025, 0.40),
+}
+
+
+def get_model_pricing(model: str) -> Optional[Tuple[float, float, float]]:
+    """Look up pricing for a model name.
+
+    Dated snapshots (e.g. ``gpt-4o-mini-2024-07-18``) fall back to the longest
+    priced prefix.
+
+    Args:
+        model: Model name as sent to the API
+
+    Returns:
+        (input, cached_input, output) USD per 1M tokens, or None if unknown
+    """
+    if model in MODEL_PRICING:
+        return MODEL_PRICING[model]
+
+    matches = [name for name in MODEL_PRICING if model.startswith(name + "-")]
+    if not matches:
+        return None
+    return MODEL_PRICING[max(matches, key=len)]
+
+
+def estimate_cost(
+    model: str,
+    input_tokens: int,
+    output_tokens: int,
+    cached_input_tokens: int = 0
+) -> Optional[float]:
+    """Estimate the USD cost of a call from the pricing table.
+
+    Args:
+        model: Model name
+        input_tokens: Total prompt tokens (cached tokens included)
+        output_tokens: Completion tokens
+        cached_input_tokens: Portion of input_tokens served from the prompt cache
+
+    Returns:
+        Estimated cost in USD, or None if the model is not priced
+    """
+    pricing = get_model_pricing(model)
+    if pricing is None:
+        return None
+
+    input_price, cached_price, output_price = pricing
+    uncached = max(input_tokens - cached_input_tokens, 0)
+    cost = (
+        uncached * input_price
+        + cached_input_tokens * cached_price
+        + output_tokens * output_price
+    ) / 1_000_000
+    return round(cost, 6)
+
+
+class UsageTracker:
+    """Collects UsageRecords for one ``track_usage()`` scope."""
+
+    def __init__(self, label: Optional[str] = None):
+        self.label = label
+        self.records: List[UsageRecord] = []
+        self.routing_decisions: List[RoutingDecision] = []
+        self.estimated_cost_usd = 0.0
+        self._lock = threading.Lock()
+
+    def add(self, record: UsageRecord):
+        with self._lock:
+            self.records.append(record)
+            self.estimated_cost_usd += record.estimated_cost_usd or 0.0
+
+    def add_routing_decision(self, decision: RoutingDecision):
+        with self._lock:
+            self.routing_decisions.append(decision)
+
+    def summary(self) -> UsageSummary:
+        return summarize_usage(self.records)
+
+
+_active_trackers: ContextVar[Tuple[UsageTracker, ...]] = ContextVar(
+    "evidence_toolkit_usage_trackers", default=()
+)
+_batch_pricing: ContextVar[bool] = ContextVar("evidence_toolkit_batch_pricing", default=False)
+
+
+def start_tracking(label: Optional[str] = None, isolated: bool = False) -> Tuple[UsageTracker, Any]:
+    """Start collecting usage records without a ``with`` block.
+
+    Args:
+        label: Optional tracker label
+        isolated: Hide records from enclosing scopes (the caller re-reports
+            them, e.g. split across evidence items)
+
+    Returns:
+        (tracker, token) - pass the token to stop_tracking()
+    """
+    tracker = UsageTracker(label)
+    enclosing = () if isolated else _active_trackers.get()
+    token = _active_trackers.set(enclosing + (tracker,))
+    return tracker, token
+
+
+def stop_tracking(token: Any) -> None:
+    """Stop a scope started with start_tracking()."""
+    _active_trackers.reset(token)
+
+
+@contextmanager
+def track_usage(label: Optional[str] = None, isolated: bool = False) -> Iterator[UsageTracker]:
+    """Collect usage records for every AI call made inside the block.
+
+    Scopes nest: a call inside two scopes is recorded in both, so a per-item
+    tracker inside a per-case tracker still feeds the case total. An
+    ``isolated`` scope keeps its records to itself.
+
+    Example:
+        >>> with track_usage("case-001") as tracker:
+        ...     analyze_evidence(sha256, storage)
+        >>> tracker.summary().estimated_cost_usd
+    """
+    tracker, token = start_tracking(label, isolated=isolated)
+    try:
+        yield tracker
+    finally:
+        stop_tracking(token)
+
+
+@contextmanager
+def batch_pricing() -> Iterator[None]:
+    """Price usage recorded inside the block as offline Batch API usage.
+
+    Used when hydrating batch results through the normal analysis path.
+    """
+    token = _batch_pricing.set(True)
+    try:
+        yield
+    finally:
+        _batch_pricing.reset(token)
+
+
+def _token_count(value: Any) -> int:
+    return value if isinstance(value, int) else 0
+
+
+def record_usage(
+    stage: str,
+    model: str,
+    usage: Any = None,
+    latency_seconds: float = 0.0,
+    retries: int = 0
+) -> UsageRecord:
+    """Build a UsageRecord from a Responses API ``usage`` object and report it.
+
+    Args:
+        stage: Pipeline stage name
+        model: Model name sent to the API
+        usage: ``response.usage`` (ResponseUsage) - missing fields count as 0
+        latency_seconds: Wall time of the call
+        retries: Retries taken by the client
+
+    Returns:
+        The recorded UsageRecord
+    """
+    input_tokens = _token_count(getattr(usage, "input_tokens", 0))
+    output_tokens = _token_count(getattr(usage, "output_tokens", 0))
+    input_details = getattr(usage, "input_tokens_details", None)
+    cached_tokens = _token_count(getattr(input_details, "cached_tokens", 0))
+
+    batch = _batch_pricing.get()
+    cost = estimate_cost(model, input_tokens, output_tokens, cached_tokens)
+    if batch and cost is not None:
+        cost = round(cost * BATCH_DISCOUNT, 6)
+
+    record = UsageRecord(
+        stage=stage,
+        model=model,
+        input_tokens=input_tokens,
+        cached_input_tokens=cached_tokens,
+        output_tokens=output_tokens,
+        latency_seconds=round(max(latency_seconds, 0.0), 4),
+        retries=_token_count(retries),
+        estimated_cost_usd=cost,
+        batch=batch,
+        timestamp=datetime.now()
+    )
+
+    for tracker in _active_trackers.get():
+        tracker.add(record)
+
+    return record
+
+
+def record_routing_decision(decision: RoutingDecision) -> RoutingDecision:
+    """Report a model routing decision to every active tracker."""
+    for tracker in _active_trackers.get():
+        tracker.add_routing_decision(decision)
+    return decision
+
+
+def split_usage(record: UsageRecord, weight: float) -> SimpleNamespace:
+    """Share of one call's usage, shaped like a Responses API ``usage`` object.
+
+    For calls that answer several evidence items at once (packed requests,
+    thread analysis): each item's share can be passed to record_usage or
+    replayed through BatchResultClient.
+
+    Args:
+        record: UsageRecord of the shared call
+        weight: The item's share (0-1)
+    """
+    return SimpleNamespace(
+        input_tokens=round(record.input_tokens * weight),
+        input_tokens_details=SimpleNamespace(cached_tokens=round(record.cached_input_tokens * weight)),
+        output_tokens=round(record.output_tokens * weight)
+    )
+
+
+def _accumulate(totals: UsageTotals, record: UsageRecord):
+    totals.calls += 1
+    totals.input_tokens += record.input_tokens
+    totals.cached_input_tokens += record.cached_input_tokens
+    totals.output_tokens += record.output_tokens
+    totals.retries += record.retries
+    totals.latency_seconds = round(totals.latency_seconds + record.latency_seconds, 4)
+    if record.estimated_cost_usd is None:
+        totals.unpriced_calls += 1
+    else:
+        totals.estimated_cost_usd = round(totals.estimated_cost_usd + record.estimated_cost_usd, 6)
+
+
+def summarize_usage(records: Iterable[UsageRecord]) -> UsageSummary:
+    """Roll usage records up into totals with per-stage and per-model breakdowns."""
+    summary = UsageSummary()
+    for record in records:
+        _accumulate(summary, record)
+        _accumulate(summary.by_stage.setdefault(record.stage, UsageTotals()), record)
+        _accumulate(summary.by_model.setdefault(record.model, UsageTotals()), record)
+    return summary
+
+
+__all__ = [
+    "BATCH_DISCOUNT",
+    "MODEL_PRICING",
+    "get_model_pricing",
+    "estimate_cost",
+    "UsageTracker",
+    "start_tracking",
+    "stop_tracking",
+    "track_usage",
+    "batch_pricing",
+    "record_usage",
+    "record_routing_decision",
+    "split_usage",
+    "summarize_usage",
+]
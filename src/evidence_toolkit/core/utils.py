@@ -7,11 +7,12 @@ v3.0: Cleaned up imports, no changes to functionality.
 import hashlib
 import os
 import mimetypes
+import time
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional, Union
 from datetime import datetime
-from PIL import Image
-from PIL.ExifTags import TAGS
+
+from .usage import record_usage
 
 
 def calculate_sha256(file_path: Path) -> str:
@@ -43,6 +44,10 @@ def extract_exif_data(image_path: Path) -> Optional[Dict[str, Any]]:
     if not is_image_file(image_path):
         return None
 
+    # Imported on first use to keep CLI startup fast
+    from PIL import Image
+    from PIL.ExifTags import TAGS
+
     try:
         with Image.open(image_path) as img:
             exif = img.getexif()
@@ -151,16 +156,28 @@ def detect_file_type(file_path: Path) -> str:
         return "other"
 
 
+# Leading pages sampled when routing a PDF (a scanned cover sheet must not
+# send a text PDF to vision)
+PDF_ROUTING_SAMPLE_PAGES = 5
+
+
 def _can_extract_pdf_text(file_path: Path) -> bool:
-    """Check if PDF has extractable text content."""
+    """Check if PDF has extractable text content.
+
+    Any of the first PDF_ROUTING_SAMPLE_PAGES pages with a text layer routes
+    the PDF to document analysis; its scanned pages are then OCR'd page by
+    page (see DocumentAnalyzer.iter_pdf_pages).
+    """
     try:
         import pdfplumber
-        with pdfplumber.open(file_path) as pdf:
-            if not pdf.pages:
-                return False
-            # Test first page for meaningful text content
-            text = pdf.pages[0].extract_text()
-            return text and len(text.strip()) > 50  # Meaningful text threshold
+        from evidence_toolkit.core.pdf import MIN_TEXT_CHARS
+        # Only the sampled pages are loaded, so large PDFs are classified quickly
+        with pdfplumber.open(file_path, pages=list(range(1, PDF_ROUTING_SAMPLE_PAGES + 1))) as pdf:
+            for page in pdf.pages:
+                text = page.extract_text()
+                if text and len(text.strip()) >= MIN_TEXT_CHARS:  # Meaningful text threshold
+                    return True
+            return False
     except Exception:
         return False  # Encrypted, corrupted, or image-only PDF
 
@@ -223,19 +240,134 @@ def get_evidence_base_dir(derived_dir: Path, sha256: str) -> Path:
     return derived_dir / f"sha256={sha256}"
 
 
+def shared_analysis_id(sha256: str, analysis: Dict[str, Any]) -> str:
+    """ID of the AI result an analysis holds, the same for all evidence sharing it.
+
+    Near-duplicates share their canonical evidence's result, and the members
+    of an email thread share the result of the request their thread (part)
+    was analyzed in. Case totals (entities, risk flags, participants) count
+    each ID once.
+
+    Args:
+        sha256: Evidence SHA256
+        analysis: Analysis dictionary (analysis.v1.json)
+
+    Returns:
+        Canonical SHA256, thread analysis ID, or the evidence's own SHA256
+    """
+    duplicate_of = analysis.get('duplicate_of')
+    if duplicate_of:
+        return duplicate_of['canonical_sha256']
+    return (analysis.get('email_metadata') or {}).get('thread_analysis_id') or sha256
+
+
+def build_input_messages(system_prompt: str, user_content: Union[str, Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Build Responses API input messages from a system prompt and user content.
+
+    Args:
+        system_prompt: System prompt text
+        user_content: User message text, or a full message dict for image inputs
+
+    Returns:
+        List of input messages
+    """
+    if isinstance(user_content, str):
+        return [
+            {"role": "system", "content": system_prompt},
+            {"role": "user", "content": user_content}
+        ]
+
+    # Dict format for image/complex inputs
+    return [
+        {"role": "system", "content": system_prompt},
+        user_content
+    ]
+
+
+def _strict_json_schema(schema: Dict[str, Any], root: Dict[str, Any]) -> Dict[str, Any]:
+    """Make a JSON schema (in place) meet the structured-output strict mode rules.
+
+    Every object lists all of its properties as required and allows no
+    others; ``default: null`` is dropped and a ``$ref`` with sibling keys
+    (e.g. a field description) is replaced by the definition it points to.
+    """
+    for definitions in (schema.get("$defs"), schema.get("definitions")):
+        for definition in (definitions or {}).values():
+            _strict_json_schema(definition, root)
+
+    if schema.get("type") == "object" and "additionalProperties" not in schema:
+        schema["additionalProperties"] = False
+    properties = schema.get("properties")
+    if isinstance(properties, dict):
+        schema["required"] = list(properties)
+        for prop in properties.values():
+            _strict_json_schema(prop, root)
+
+    if isinstance(schema.get("items"), dict):
+        _strict_json_schema(schema["items"], root)
+    for variant in schema.get("anyOf") or []:
+        _strict_json_schema(variant, root)
+    all_of = schema.get("allOf")
+    if isinstance(all_of, list):
+        if len(all_of) == 1:
+            schema.update(_strict_json_schema(all_of[0], root))
+            schema.pop("allOf")
+        else:
+            for variant in all_of:
+                _strict_json_schema(variant, root)
+
+    if "default" in schema and schema["default"] is None:
+        schema.pop("default")
+
+    ref = schema.get("$ref")
+    if ref and len(schema) > 1:
+        resolved: Any = root
+        for key in ref.lstrip("#/").split("/"):
+            resolved = resolved[key]
+        schema.update({**resolved, **schema})
+        schema.pop("$ref")
+        return _strict_json_schema(schema, root)
+    return schema
+
+
+def build_text_format(response_schema) -> Dict[str, Any]:
+    """Responses API ``text.format`` for a Pydantic response schema.
+
+    The strict JSON schema ``client.responses.parse(text_format=...)`` sends,
+    for requests built without the SDK (Batch API request files).
+
+    Args:
+        response_schema: Pydantic model for structured output
+
+    Returns:
+        json_schema text format (name, strict schema)
+    """
+    schema = response_schema.model_json_schema()
+    return {
+        "type": "json_schema",
+        "strict": True,
+        "name": response_schema.__name__,
+        "schema": _strict_json_schema(schema, schema),
+    }
+
+
 def call_openai_structured(
     client,
     model: str,
     system_prompt: str,
     user_content: str,
     response_schema,
-    verbose: bool = False
+    verbose: bool = False,
+    stage: Optional[str] = None
 ):
     """Call OpenAI Responses API with standardized error handling.
 
     This eliminates 9 instances of duplicated API call + error handling code
     across document, email, image, correlation, and summary modules.
 
+    Token usage, latency and retries are reported to any active
+    ``core.usage.track_usage()`` scopes, even when the response is rejected.
+
     Args:
         client: OpenAI client instance
         model: Model name (e.g., "gpt-4o-2024-08-06")
@@ -243,6 +375,7 @@ def call_openai_structured(
         user_content: User message (string or dict for image inputs)
         response_schema: Pydantic model for structured output
         verbose: Enable verbose logging
+        stage: Pipeline stage for usage accounting (default: schema class name)
 
     Returns:
         Parsed response object matching response_schema
@@ -250,25 +383,37 @@ def call_openai_structured(
     Raises:
         Exception: If API call fails, is incomplete, or refused
     """
-    # Build input messages
-    if isinstance(user_content, str):
-        input_messages = [
-            {"role": "system", "content": system_prompt},
-            {"role": "user", "content": user_content}
-        ]
+    input_messages = build_input_messages(system_prompt, user_content)
+
+    # Call API (raw response wrapper exposes the client's retry count)
+    start_time = time.perf_counter()
+    raw_api = getattr(client.responses, "with_raw_response", None)
+    if raw_api is not None:
+        raw_response = raw_api.parse(
+            model=model,
+            input=input_messages,
+            text_format=response_schema
+        )
+        response = raw_response.parse()
+        retries = getattr(raw_response, "retries_taken", 0)
     else:
-        # Dict format for image/complex inputs
-        input_messages = [
-            {"role": "system", "content": system_prompt},
-            user_content
-        ]
-
-    # Call API
-    response = client.responses.parse(
-        model=model,
-        input=input_messages,
-        text_format=response_schema
+        response = client.responses.parse(
+            model=model,
+            input=input_messages,
+            text_format=response_schema
+        )
+        retries = 0
+
+    usage_record = record_usage(
+        stage or response_schema.__name__,
+        model,
+        getattr(response, "usage", None),
+        latency_seconds=time.perf_counter() - start_time,
+        retries=retries
     )
+    if verbose:
+        print(f"   💰 {usage_record.stage}: {usage_record.input_tokens} in / "
+              f"{usage_record.output_tokens} out tokens, {usage_record.latency_seconds:.1f}s")
 
     # Handle response with standard pattern
     if response.status == "completed" and response.output_parsed:
@@ -10,7 +10,8 @@ from .legal_config import (
     EXECUTIVE_SUMMARY_PROMPT,
     CORRELATION_PATTERN_PROMPT,
     ENTITY_MATCH_PROMPT,
-    CRITICAL_RISK_FLAGS
+    CRITICAL_RISK_FLAGS,
+    ESCALATION_RISK_FLAGS
 )
 
 __all__ = [
@@ -20,5 +21,6 @@ __all__ = [
     "EXECUTIVE_SUMMARY_PROMPT",
     "CORRELATION_PATTERN_PROMPT",
     "ENTITY_MATCH_PROMPT",
-    "CRITICAL_RISK_FLAGS"
+    "CRITICAL_RISK_FLAGS",
+    "ESCALATION_RISK_FLAGS"
 ]
@@ -31,6 +31,15 @@ Provide confidence scores (0.0-1.0) for all extractions. Be conservative with co
 For entity relationships, focus on who communicated with whom, who mentioned whom, or who reported to whom. For quotes, only extract statements with clear legal significance (admissions, threats, policy violations, obligations). For date events, be specific about what action or meeting occurred."""
 
 
+# Appended to DOCUMENT/EMAIL_ANALYSIS_PROMPT when several small items share one request
+PACKED_ANALYSIS_INSTRUCTIONS = """
+
+# Multiple Items
+The input contains several INDEPENDENT items, each wrapped in <document id="..."> tags.
+- Analyze each item on its own, exactly as if it were the only input. Never mix content, entities or dates between items.
+- Return exactly one entry in `items` per input item, with `evidence_id` set to that item's id."""
+
+
 # Email Analysis Prompt
 EMAIL_ANALYSIS_PROMPT = """You are a forensic email analyzer for legal evidence processing.
 
@@ -312,6 +321,13 @@ CRITICAL_RISK_FLAGS = {
     'threatening'
 }
 
+# Risk flags that send an item from the fast model to the strong model (model cascade).
+# Includes the document/image spellings of the critical flags.
+ESCALATION_RISK_FLAGS = CRITICAL_RISK_FLAGS | {
+    'retaliation_indicators',
+    'tampering_suspected'
+}
+
 EXECUTIVE_SUMMARY_ENHANCER_PROMPT = """You are a senior employment solicitor transforming forensic analysis into client-ready legal advice.
 
 # Identity
@@ -6,38 +6,105 @@ This package provides the core pipeline operations extracted from the monolithic
 
 - **ingest**: File ingestion into content-addressed storage
 - **analyze**: Evidence analysis orchestration (documents, images, emails)
+- **packing**: Several small documents/emails per AI request
+- **threads**: One AI analysis per reconstructed email thread
+- **watch**: Continuous ingestion of files added to a case directory
+- **journal**: Run journal for resumable process-case runs
+- **offline**: Batch API submission for non-urgent (overnight) analysis
 - **summary**: Case summary generation with AI insights
 - **package**: Client deliverable package creation
 
 All components work with the unified EvidenceStorage and support multi-case evidence reuse.
+
+Exports are resolved on first access (PEP 562), so importing this package
+does not pull in the analyzers (matplotlib, nltk, openai) until they are used.
 """
 
-from evidence_toolkit.pipeline.ingest import (
-    ingest_evidence,
-    ingest_directory,
-    ingest_path,
-    print_ingestion_summary,
-)
+import importlib
+from typing import TYPE_CHECKING
+
+# Public name -> defining module
+_LAZY_IMPORTS = {
+    # Ingestion
+    'ingest_evidence': 'evidence_toolkit.pipeline.ingest',
+    'ingest_directory': 'evidence_toolkit.pipeline.ingest',
+    'ingest_path': 'evidence_toolkit.pipeline.ingest',
+    'print_ingestion_summary': 'evidence_toolkit.pipeline.ingest',
+
+    # Analysis
+    'analyze_evidence': 'evidence_toolkit.pipeline.analyze',
+
+    # Summary
+    'ExecutiveSummaryResponse': 'evidence_toolkit.pipeline.summary',
+    'EvidenceSummary': 'evidence_toolkit.pipeline.summary',
+    'CaseSummary': 'evidence_toolkit.pipeline.summary',
+    'SummaryGenerator': 'evidence_toolkit.pipeline.summary',
+
+    # Package
+    'PackageGenerator': 'evidence_toolkit.pipeline.package',
+
+    # Batch processing (v3.3.1)
+    'analyze_images_batch': 'evidence_toolkit.pipeline.batch',
+    'batch_analyze_case_images': 'evidence_toolkit.pipeline.batch',
+
+    # Packed requests for small items
+    'analyze_packed': 'evidence_toolkit.pipeline.packing',
+
+    # Thread-level email analysis
+    'analyze_email_threads': 'evidence_toolkit.pipeline.threads',
+
+    # Watch-folder ingestion
+    'watch_directory': 'evidence_toolkit.pipeline.watch',
+
+    # Resumable runs
+    'RunJournal': 'evidence_toolkit.pipeline.journal',
+
+    # Offline Batch API analysis
+    'submit_batch_job': 'evidence_toolkit.pipeline.offline',
+    'poll_batch_job': 'evidence_toolkit.pipeline.offline',
+    'hydrate_batch_job': 'evidence_toolkit.pipeline.offline',
+    'LocalBatchEndpoint': 'evidence_toolkit.pipeline.offline',
+}
+
+if TYPE_CHECKING:
+    from evidence_toolkit.pipeline.ingest import (
+        ingest_evidence,
+        ingest_directory,
+        ingest_path,
+        print_ingestion_summary,
+    )
+    from evidence_toolkit.pipeline.analyze import analyze_evidence
+    from evidence_toolkit.pipeline.summary import (
+        ExecutiveSummaryResponse,
+        EvidenceSummary,
+        CaseSummary,
+        SummaryGenerator,
+    )
+    from evidence_toolkit.pipeline.package import PackageGenerator
+    from evidence_toolkit.pipeline.batch import analyze_images_batch, batch_analyze_case_images
+    from evidence_toolkit.pipeline.packing import analyze_packed
+    from evidence_toolkit.pipeline.threads import analyze_email_threads
+    from evidence_toolkit.pipeline.watch import watch_directory
+    from evidence_toolkit.pipeline.journal import RunJournal
+    from evidence_toolkit.pipeline.offline import (
+        submit_batch_job,
+        poll_batch_job,
+        hydrate_batch_job,
+        LocalBatchEndpoint,
+    )
 
-from evidence_toolkit.pipeline.analyze import (
-    analyze_evidence,
-)
 
-from evidence_toolkit.pipeline.summary import (
-    ExecutiveSummaryResponse,
-    EvidenceSummary,
-    CaseSummary,
-    SummaryGenerator,
-)
+def __getattr__(name):
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value  # Cache - later lookups skip __getattr__
+    return value
 
-from evidence_toolkit.pipeline.package import (
-    PackageGenerator,
-)
 
-from evidence_toolkit.pipeline.batch import (
-    analyze_images_batch,
-    batch_analyze_case_images,
-)
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
 
 
 __all__ = [
@@ -54,6 +121,24 @@ __all__ = [
     'analyze_images_batch',
     'batch_analyze_case_images',
 
+    # Packed requests for small items
+    'analyze_packed',
+
+    # Thread-level email analysis
+    'analyze_email_threads',
+
+    # Watch-folder ingestion
+    'watch_directory',
+
+    # Resumable runs
+    'RunJournal',
+
+    # Offline Batch API analysis
+    'submit_batch_job',
+    'poll_batch_job',
+    'hydrate_batch_job',
+    'LocalBatchEndpoint',
+
     # Summary
     'ExecutiveSummaryResponse',
     'EvidenceSummary',
@@ -14,7 +14,7 @@ This module is responsible for:
 import time
 from pathlib import Path
 from datetime import datetime
-from typing import Optional, Tuple, Any, List, Union
+from typing import Optional, Tuple, Any, Iterator, List, Union
 
 from evidence_toolkit.core.storage import EvidenceStorage
 from evidence_toolkit.core.models import (
@@ -27,10 +27,15 @@ from evidence_toolkit.core.models import (
     ChainOfCustodyEvent,
 )
 from evidence_toolkit.core.utils import detect_file_type, extract_exif_data, get_evidence_base_dir, read_json_safe
+from evidence_toolkit.core.usage import track_usage
+from evidence_toolkit.core.chunking import PAGE_BREAK, estimate_tokens
+from evidence_toolkit.core.routing import ModelRouter
+from evidence_toolkit.core.imaging import ImagePreparer
 from evidence_toolkit.analyzers.document import DocumentAnalyzer
 from evidence_toolkit.analyzers.image import ImageAnalyzer
 from evidence_toolkit.analyzers.email import EmailAnalyzer
 from evidence_toolkit.analyzers.email_parser import EmailParser
+from evidence_toolkit.pipeline.dedup import ImageDeduplicator
 
 
 def _generate_labels(
@@ -101,7 +106,12 @@ def analyze_evidence(
     case_id: Optional[str] = None,
     evidence_type: Optional[str] = None,
     force: bool = False,
-    quiet: bool = False
+    quiet: bool = False,
+    model: Optional[str] = None,
+    router: Optional[ModelRouter] = None,
+    pdf_workers: Optional[int] = None,
+    image_preparer: Optional[ImagePreparer] = None,
+    image_deduplicator: Optional[ImageDeduplicator] = None
 ) -> UnifiedAnalysis:
     """Analyze evidence by SHA256 hash.
 
@@ -119,6 +129,16 @@ def analyze_evidence(
         evidence_type: Force evidence type (default: auto-detect)
         force: If True, re-analyze even if analysis exists (default: False)
         quiet: Suppress verbose output
+        model: Override the analyzer's default OpenAI model (e.g. budget downgrade).
+            An explicit model takes precedence over the router.
+        router: Optional model cascade - fast model first, escalate unclear or
+            high-risk items; decisions are stored in routing_decisions
+        pdf_workers: Processes for PDF text extraction (default: CPU count)
+        image_preparer: Image preparation before vision upload (default:
+            JPEG, auto detail, cached in derived storage)
+        image_deduplicator: Optional near-duplicate index - an image matching
+            an analyzed one reuses its analysis (recorded in duplicate_of)
+            instead of a vision call; not used with force
 
     Returns:
         UnifiedAnalysis result object
@@ -173,18 +193,47 @@ def analyze_evidence(
     # Create derived directory path for storing visualizations
     derived_evidence_dir = evidence_dir
 
-    if evidence_type_enum == EvidenceType.DOCUMENT:
-        analysis_result = _analyze_document(original_file, quiet, output_dir=derived_evidence_dir)
-    elif evidence_type_enum == EvidenceType.IMAGE:
-        analysis_result = _analyze_image(original_file, openai_client, quiet)
-    elif evidence_type_enum == EvidenceType.EMAIL:
-        analysis_result, email_metadata = _analyze_email(original_file, openai_client, case_id, quiet)
-    elif evidence_type_enum in (EvidenceType.VIDEO, EvidenceType.AUDIO):
-        # v3.2: VIDEO and AUDIO files are ingested but not analyzed yet
-        # Skip analysis gracefully - they will still be tracked in chain of custody
-        raise ValueError(f"Analysis not yet implemented for {evidence_type_enum.value} files (ingestion only)")
-    else:
-        raise ValueError(f"Cannot analyze evidence type: {evidence_type_enum.value}")
+    # An explicit model (budget downgrade) bypasses the cascade
+    if model:
+        router = None
+    image_preparer = image_preparer or ImagePreparer(cache_dir=storage.derived_dir)
+    duplicate_of = None
+
+    # Track every AI call made for this evidence item (tokens, latency, cost, routing)
+    with track_usage(sha256) as usage_tracker:
+        if evidence_type_enum == EvidenceType.DOCUMENT:
+            analysis_result = _analyze_document(
+                original_file, quiet, output_dir=derived_evidence_dir, model=model, router=router,
+                openai_client=openai_client, storage=storage, sha256=sha256, pdf_workers=pdf_workers,
+                image_preparer=image_preparer
+            )
+        elif evidence_type_enum == EvidenceType.IMAGE:
+            analysis_result = None
+            if image_deduplicator and not force and original_file.suffix.lower() != '.pdf':
+                duplicate_of = image_deduplicator.match(sha256, original_file)
+                if duplicate_of:
+                    analysis_result = image_deduplicator.reuse(sha256, duplicate_of)
+                if analysis_result is None:
+                    duplicate_of = None  # No match, or the match has no usable analysis
+                elif not quiet:
+                    print(f"♻️  Near-duplicate of {duplicate_of.canonical_sha256[:12]}... "
+                          f"(distance {duplicate_of.distance}) - reusing its analysis")
+            if analysis_result is None:
+                analysis_result = _analyze_image(
+                    original_file, openai_client, quiet, model=model, router=router, storage=storage,
+                    sha256=sha256, image_preparer=image_preparer
+                )
+        elif evidence_type_enum == EvidenceType.EMAIL:
+            analysis_result, email_metadata = _analyze_email(
+                original_file, openai_client, case_id, quiet, model=model, router=router,
+                storage=storage, sha256=sha256
+            )
+        elif evidence_type_enum in (EvidenceType.VIDEO, EvidenceType.AUDIO):
+            # v3.2: VIDEO and AUDIO files are ingested but not analyzed yet
+            # Skip analysis gracefully - they will still be tracked in chain of custody
+            raise ValueError(f"Analysis not yet implemented for {evidence_type_enum.value} files (ingestion only)")
+        else:
+            raise ValueError(f"Cannot analyze evidence type: {evidence_type_enum.value}")
 
     # Generate labels for categorization
     labels = _generate_labels(
@@ -192,6 +241,13 @@ def analyze_evidence(
         analysis_result,
         email_metadata
     )
+    if duplicate_of:
+        labels.append("near-duplicate")
+
+    # The case pays for this run, including when the item is shared or re-analyzed
+    ai_usage = usage_tracker.records
+    if case_id:
+        ai_usage = storage.append_evidence_usage(case_id, sha256, ai_usage)
 
     # Create unified analysis
     unified_analysis = UnifiedAnalysis(
@@ -204,7 +260,10 @@ def analyze_evidence(
         email_analysis=analysis_result if evidence_type_enum == EvidenceType.EMAIL else None,
         exif_data=extract_exif_data(original_file) if evidence_type_enum == EvidenceType.IMAGE else None,
         email_metadata=email_metadata,
-        labels=labels
+        labels=labels,
+        ai_usage=ai_usage,
+        routing_decisions=usage_tracker.routing_decisions,
+        duplicate_of=duplicate_of
     )
 
     # Save analysis
@@ -218,13 +277,32 @@ def analyze_evidence(
     return unified_analysis
 
 
-def _analyze_document(file_path: Path, quiet: bool = False, output_dir: Path = None) -> DocumentAnalysisResult:
+def _analyze_document(
+    file_path: Path,
+    quiet: bool = False,
+    output_dir: Path = None,
+    model: Optional[str] = None,
+    router: Optional[ModelRouter] = None,
+    openai_client: Optional[Any] = None,
+    storage: Optional[EvidenceStorage] = None,
+    sha256: Optional[str] = None,
+    pdf_workers: Optional[int] = None,
+    image_preparer: Optional[ImagePreparer] = None
+) -> DocumentAnalysisResult:
     """Analyze document using DocumentAnalyzer.
 
     Args:
         file_path: Path to document file
         quiet: Suppress verbose output
         output_dir: Directory to save visualizations (word cloud, frequency chart)
+        model: Optional OpenAI model override
+        router: Optional model cascade
+        openai_client: Optional OpenAI client (default: created from OPENAI_API_KEY)
+        storage: EvidenceStorage holding the evidence - with sha256, text is
+            read from (or saved to) the derived text artifact
+        sha256: Evidence SHA256
+        pdf_workers: Processes for PDF text extraction (default: CPU count)
+        image_preparer: Preparation of scanned pages before vision upload
 
     Returns:
         DocumentAnalysisResult object
@@ -232,15 +310,33 @@ def _analyze_document(file_path: Path, quiet: bool = False, output_dir: Path = N
     analyzer = DocumentAnalyzer(
         custom_stop_words=None,
         min_word_length=3,
-        verbose=not quiet
+        verbose=not quiet,
+        model=model,
+        router=router,
+        openai_client=openai_client,
+        # Per-chunk results of long documents, so a failed chunk can be retried alone
+        chunk_cache_dir=output_dir / "chunks" if output_dir else None,
+        pdf_workers=pdf_workers
     )
+    if analyzer.ai_enabled and file_path.suffix.lower() == '.pdf':
+        # Scanned pages of a mixed PDF go to vision; text pages stay local
+        analyzer.image_analyzer = ImageAnalyzer(
+            verbose=False, model=model, router=router, client=analyzer.openai_client,
+            image_preparer=image_preparer
+        )
 
     # Analyze the text file
-    result = analyzer.analyze_directory(
-        data_dir=file_path.parent,
-        output_dir=output_dir,  # Save visualizations to derived storage
-        file_pattern=file_path.name
-    )
+    if storage and sha256:
+        result = analyzer.analyze_pages(
+            document_pages(storage, sha256, file_path, analyzer),
+            output_dir=output_dir  # Save visualizations to derived storage
+        )
+    else:
+        result = analyzer.analyze_directory(
+            data_dir=file_path.parent,
+            output_dir=output_dir,  # Save visualizations to derived storage
+            file_pattern=file_path.name
+        )
 
     if result['status'] != 'success':
         raise RuntimeError(f"Document analysis failed: {result.get('message', 'Unknown error')}")
@@ -261,7 +357,7 @@ def _analyze_document(file_path: Path, quiet: bool = False, output_dir: Path = N
         frequency_chart_file=result.get('frequency_chart_file'),
 
         # AI-powered analysis fields (if available)
-        openai_model="gpt-4o-mini" if ai_analysis else None,  # Fixed from gpt-4.1-mini
+        openai_model=analyzer.model_used if ai_analysis else None,
         ai_summary=ai_analysis.get('summary') if ai_analysis else None,
         entities=ai_analysis.get('entities') if ai_analysis else None,
         document_type=ai_analysis.get('document_type') if ai_analysis else None,
@@ -272,10 +368,94 @@ def _analyze_document(file_path: Path, quiet: bool = False, output_dir: Path = N
     )
 
 
+def document_pages(
+    storage: EvidenceStorage,
+    sha256: str,
+    file_path: Path,
+    analyzer: Optional[DocumentAnalyzer] = None
+) -> Iterator[str]:
+    """Stream a document's page texts, extracting them only once.
+
+    Reads the derived text artifact (text.v1.txt.gz) when it exists;
+    otherwise extracts from the original file and saves the artifact as the
+    pages stream past, so later runs (reanalyze, --force, prompt changes)
+    skip extraction. A PDF with scanned pages that vision OCR did not read
+    (no image analyzer, or OCR failed) is not saved, so those pages are
+    retried on the next run.
+
+    Args:
+        storage: EvidenceStorage instance
+        sha256: Evidence SHA256
+        file_path: Path to the original document
+        analyzer: DocumentAnalyzer used for extraction (default: a quiet one)
+
+    Returns:
+        Iterator over page texts (PDF pages; a text file is one page)
+    """
+    if storage.get_extracted_text(sha256):
+        return storage.iter_extracted_pages(sha256)
+
+    analyzer = analyzer or DocumentAnalyzer(verbose=False)
+    if file_path.suffix.lower() == '.pdf':
+        return storage.record_extracted_text(
+            sha256, analyzer.iter_pdf_pages(file_path), "pdfplumber",
+            ocr_pages=analyzer.ocr_pages, unread_pages=analyzer.unread_pages
+        )
+    return storage.record_extracted_text(sha256, analyzer.iter_text_blocks(file_path), "text", page_breaks=False)
+
+
+def evidence_text(storage: EvidenceStorage, sha256: str, file_path: Optional[Path] = None) -> str:
+    """Text of a document or email, for comparing evidence before analysis.
+
+    Uses the derived text artifact when there is one. Text files and emails
+    are extracted and the artifact saved, so analysis reads it later; PDFs
+    are read from their text layer without saving, so scanned pages are
+    still sent to vision when the PDF is analyzed.
+
+    Args:
+        storage: EvidenceStorage instance
+        sha256: Evidence SHA256
+        file_path: Path to the original file (default: looked up in storage)
+
+    Returns:
+        The text ("" for other evidence types or unreadable files)
+    """
+    text = storage.read_extracted_text(sha256)
+    if text is not None:
+        return text
+
+    file_path = file_path or storage.get_original_file_path(sha256)
+    if not file_path:
+        return ""
+    evidence_type = EvidenceType(detect_file_type(file_path))
+
+    if evidence_type == EvidenceType.DOCUMENT:
+        if file_path.suffix.lower() == '.pdf':
+            from evidence_toolkit.core.pdf import iter_page_texts
+            return PAGE_BREAK.join(iter_page_texts(file_path))
+        return PAGE_BREAK.join(document_pages(storage, sha256, file_path))
+
+    if evidence_type == EvidenceType.EMAIL:
+        email_analyzer = EmailAnalyzer(None, verbose=False)
+        email_data = email_analyzer.email_parser.parse_file(file_path)
+        if not email_data:
+            return ""
+        text = email_analyzer._format_thread_for_analysis([email_data], strip_quoted=False)
+        storage.save_extracted_text(sha256, [text], "email")
+        return text
+
+    return ""
+
+
 def _analyze_image(
     file_path: Path,
     openai_client: Optional[Any],
-    quiet: bool = False
+    quiet: bool = False,
+    model: Optional[str] = None,
+    router: Optional[ModelRouter] = None,
+    storage: Optional[EvidenceStorage] = None,
+    sha256: Optional[str] = None,
+    image_preparer: Optional[ImagePreparer] = None
 ) -> ImageAnalysisResult:
     """Analyze image or scanned PDF using ImageAnalyzer with vision AI.
 
@@ -283,26 +463,76 @@ def _analyze_image(
         file_path: Path to image/PDF file
         openai_client: OpenAI client for vision analysis
         quiet: Suppress verbose output
+        model: Optional vision model override
+        router: Optional model cascade
+        storage: EvidenceStorage - with sha256, OCR text is saved as the
+            derived text artifact (first successful run only)
+        sha256: Evidence SHA256
+        image_preparer: Image preparation before vision upload
 
     Returns:
         ImageAnalysisResult object
     """
-    image_analyzer = ImageAnalyzer(verbose=not quiet)
+    image_analyzer = ImageAnalyzer(
+        verbose=not quiet, model=model, router=router, client=openai_client, image_preparer=image_preparer
+    )
 
     # Check if this is a PDF (scanned PDF routed as 'image' type)
     if file_path.suffix.lower() == '.pdf':
         # Scanned PDF - analyze all pages with vision AI
-        return image_analyzer.analyze_pdf(file_path)
+        result = image_analyzer.analyze_pdf(file_path)
+        page_texts = image_analyzer.page_texts
+        ocr_pages = image_analyzer.ocr_pages
+        unread_pages = image_analyzer.unread_pages
     else:
         # Regular image file
-        return image_analyzer.analyze_image(file_path)
+        result = image_analyzer.analyze_image(file_path)
+        page_texts = [result.detected_text or ""]
+        ocr_pages = [1]
+        unread_pages = []
+
+    # Not saved while any scanned page is unread, so a later run OCRs it again
+    if storage and sha256 and any(page_texts) and not storage.get_extracted_text(sha256):
+        storage.save_extracted_text(
+            sha256, page_texts, "vision_ocr", ocr_pages=ocr_pages, unread_pages=unread_pages
+        )
+
+    return result
+
+
+def email_metadata_from_headers(email_data: Optional[dict]) -> Optional[dict]:
+    """Header metadata saved with an email's analysis (email_metadata).
+
+    Args:
+        email_data: Parsed email from EmailParser (parse_file or parse_headers)
+
+    Returns:
+        Dictionary of the email's own headers, or None without headers
+    """
+    if not email_data or 'headers' not in email_data:
+        return None
+    headers = email_data['headers']
+    return {
+        'from': headers.get('from'),
+        'to': headers.get('to'),
+        'cc': headers.get('cc'),
+        'subject': headers.get('subject'),
+        'date': headers.get('date'),
+        'parsed_date': headers.get('parsed_date'),
+        'message_id': headers.get('message_id'),
+        'stripped_ranges': email_data.get('stripped_ranges', [])  # Quoted/signature text left out of the AI input
+    }
 
 
 def _analyze_email(
     file_path: Path,
     openai_client: Optional[Any],
     case_id: Optional[str],
-    quiet: bool = False
+    quiet: bool = False,
+    model: Optional[str] = None,
+    router: Optional[ModelRouter] = None,
+    storage: Optional[EvidenceStorage] = None,
+    sha256: Optional[str] = None
 ) -> Tuple[EmailThreadAnalysis, Optional[dict]]:
     """Analyze email using EmailAnalyzer and extract metadata.
 
@@ -311,6 +541,11 @@ def _analyze_email(
         openai_client: OpenAI client for AI analysis
         case_id: Case ID for analysis
         quiet: Suppress verbose output
+        model: Optional OpenAI model override
+        router: Optional model cascade
+        storage: EvidenceStorage - with sha256, the formatted headers and
+            body are saved as the derived text artifact
+        sha256: Evidence SHA256
 
     Returns:
         Tuple of (EmailThreadAnalysis, email_metadata dict) - v3.1: Returns full analysis with participants
@@ -324,20 +559,14 @@ def _analyze_email(
     email_data = email_parser.parse_file(file_path)
 
     # Extract email metadata from headers
-    email_metadata = None
-    if email_data and 'headers' in email_data:
-        email_metadata = {
-            'from': email_data['headers'].get('from'),
-            'to': email_data['headers'].get('to'),
-            'cc': email_data['headers'].get('cc'),
-            'subject': email_data['headers'].get('subject'),
-            'date': email_data['headers'].get('date'),
-            'parsed_date': email_data['headers'].get('parsed_date'),
-            'message_id': email_data['headers'].get('message_id')
-        }
+    email_metadata = email_metadata_from_headers(email_data)
 
     # Initialize email analyzer
-    email_analyzer = EmailAnalyzer(openai_client, verbose=not quiet)
+    email_analyzer = EmailAnalyzer(openai_client, verbose=not quiet, model=model, router=router)
+
+    if storage and sha256 and email_data and not storage.get_extracted_text(sha256):
+        text = email_analyzer._format_thread_for_analysis([email_data], strip_quoted=False)
+        storage.save_extracted_text(sha256, [text], "email")
 
     # Analyze the email file
     analysis = email_analyzer.analyze_email_files([file_path], case_id=case_id)
@@ -345,10 +574,85 @@ def _analyze_email(
     if not analysis:
         raise RuntimeError("Email analysis failed - no results returned")
 
+    if email_metadata is not None and email_analyzer.token_counts:
+        email_metadata['input_tokens_full'], email_metadata['input_tokens_sent'] = email_analyzer.token_counts
+
     # v3.1: Return full EmailThreadAnalysis (preserves participants with v3.1 fields)
     return analysis, email_metadata
 
 
+def build_ai_input(
+    file_path: Path,
+    evidence_type: EvidenceType,
+    storage: Optional[EvidenceStorage] = None,
+    sha256: Optional[str] = None
+) -> Tuple[str, str, Union[str, dict], str]:
+    """Build the AI request input the analyzers send for one evidence file.
+
+    Used to send the same request outside the synchronous analyzers
+    (offline batches, packed requests).
+
+    Args:
+        file_path: Path to the original evidence file
+        evidence_type: Evidence type
+        storage: EvidenceStorage - with sha256, document text comes from
+            (or, for text files, is saved to) the derived text artifact;
+            prepared images are cached in derived storage
+        sha256: Evidence SHA256
+
+    Returns:
+        (stage, system_prompt, user_content, default_model)
+
+    Raises:
+        ValueError: If the evidence has no AI input (the message says why)
+    """
+    from evidence_toolkit.domains import legal_config
+
+    if evidence_type == EvidenceType.DOCUMENT:
+        analyzer = DocumentAnalyzer(verbose=False)
+        has_artifact = bool(storage and sha256 and storage.get_extracted_text(sha256))
+        if file_path.suffix.lower() == '.pdf' and not has_artifact:
+            # Never saved from here: only the interactive path OCRs scanned pages
+            text = PAGE_BREAK.join(analyzer.iter_pdf_pages(file_path))
+            if analyzer.unread_pages:
+                raise ValueError("PDF with scanned pages (vision OCR runs interactively)")
+        elif storage and sha256:
+            text = PAGE_BREAK.join(document_pages(storage, sha256, file_path, analyzer))
+        else:
+            text, _ = analyzer.process_files(file_path.parent, file_path.name)
+        if not text.strip():
+            raise ValueError("no extractable text")
+        if estimate_tokens(text) > analyzer.chunk_tokens:
+            raise ValueError("long document (chunked analysis runs interactively)")
+        return "document_analysis", legal_config.DOCUMENT_ANALYSIS_PROMPT, text, DocumentAnalyzer.DEFAULT_MODEL
+
+    if evidence_type == EvidenceType.EMAIL:
+        analyzer = EmailAnalyzer(None, verbose=False)
+        email_data = analyzer.email_parser.parse_file(file_path)
+        if not email_data:
+            raise ValueError("email could not be parsed")
+        thread = analyzer.email_parser.build_thread_from_emails([email_data])
+        return (
+            "email_analysis",
+            legal_config.EMAIL_ANALYSIS_PROMPT,
+            analyzer._format_thread_for_analysis(thread),
+            EmailAnalyzer.DEFAULT_MODEL
+        )
+
+    if evidence_type == EvidenceType.IMAGE:
+        if file_path.suffix.lower() == '.pdf':
+            raise ValueError("scanned PDF (multi-page vision analysis runs interactively)")
+        prepared = ImagePreparer(cache_dir=storage.derived_dir if storage else None).prepare_file(file_path)
+        user_content = ImageAnalyzer.prepared_user_content(prepared)
+        return "image_analysis", legal_config.IMAGE_ANALYSIS_PROMPT, user_content, ImageAnalyzer.DEFAULT_MODEL
+
+    raise ValueError(f"no AI analysis for {evidence_type.value} evidence")
+
+
 __all__ = [
     'analyze_evidence',
+    'build_ai_input',
+    'document_pages',
+    'email_metadata_from_headers',
+    'evidence_text',
 ]
@@ -6,8 +6,9 @@ multiple pieces of evidence in parallel, with a focus on image analysis.
 
 Key features:
 - Async/await pattern for concurrent API calls
-- Semaphore-based rate limiting to respect OpenAI API limits
-- Automatic retry logic for transient failures
+- Bounded worker queue to respect OpenAI API limits
+- Each analysis saved as it completes, with a checkpoint of batch progress
+  (an interrupted batch resumes where it stopped when rerun)
 - Progress tracking and reporting
 
 Performance gains:
@@ -22,9 +23,17 @@ from typing import List, Dict, Tuple, Optional, Any
 from datetime import datetime
 
 from evidence_toolkit.core.storage import EvidenceStorage
-from evidence_toolkit.core.models import UnifiedAnalysis, EvidenceType, FileMetadata
+from evidence_toolkit.core.models import (
+    UnifiedAnalysis, EvidenceType, FileMetadata, ImageAnalysisResult, ImageBatchCheckpoint, DuplicateLink
+)
 from evidence_toolkit.analyzers.image import ImageAnalyzer
 from evidence_toolkit.core.utils import get_evidence_base_dir, read_json_safe
+from evidence_toolkit.core.usage import track_usage
+from evidence_toolkit.core.concurrency import iter_bounded
+from evidence_toolkit.core.routing import ModelRouter
+from evidence_toolkit.core.imaging import ImagePreparer
+from evidence_toolkit.pipeline.budget import BudgetController, BudgetDecision
+from evidence_toolkit.pipeline.dedup import ImageDeduplicator
 
 
 async def analyze_images_batch(
@@ -32,22 +41,40 @@ async def analyze_images_batch(
     storage: EvidenceStorage,
     case_id: Optional[str] = None,
     max_concurrent: int = 5,
-    quiet: bool = False
+    quiet: bool = False,
+    model: Optional[str] = None,
+    budget: Optional[BudgetController] = None,
+    router: Optional[ModelRouter] = None,
+    image_preparer: Optional[ImagePreparer] = None,
+    image_deduplicator: Optional[ImageDeduplicator] = None
 ) -> Dict[str, UnifiedAnalysis]:
     """Analyze multiple images in parallel and save results to storage
 
     This function orchestrates batch image analysis:
     1. Identifies which images need analysis (skip already-analyzed)
     2. Processes up to max_concurrent images simultaneously
-    3. Saves each analysis to storage as it completes
+    3. Saves each analysis to storage as it completes (off the event loop)
+       and checkpoints progress to storage batches/
     4. Returns all UnifiedAnalysis results
 
+    Interrupting the batch (Ctrl-C, crash, budget stop) loses only the images
+    in flight; rerunning it skips every saved image and analyzes the rest.
+
     Args:
         sha256_list: List of SHA256 hashes to analyze
         storage: EvidenceStorage instance
         case_id: Optional case ID for tracking
         max_concurrent: Max concurrent API calls (default: 5, recommended: 5-10)
         quiet: Suppress progress output
+        model: Optional vision model override
+        budget: Optional BudgetController - consulted before each image starts;
+            skipped images are left unanalyzed and omitted from the results
+        router: Optional model cascade (a budget downgrade bypasses it for that image)
+        image_preparer: Image preparation before upload (default: JPEG, auto
+            detail, cached in derived storage)
+        image_deduplicator: Optional near-duplicate index - images matching an
+            analyzed (or earlier queued) image reuse its analysis once it is
+            saved, instead of a vision call
 
     Returns:
         Dict mapping SHA256 -> UnifiedAnalysis result
@@ -84,52 +111,162 @@ async def analyze_images_batch(
         print(f"🖼️  Batch analyzing {len(to_analyze)} images ({max_concurrent} concurrent)...")
 
     # Initialize image analyzer
-    analyzer = ImageAnalyzer(verbose=not quiet)
+    analyzer = ImageAnalyzer(
+        verbose=not quiet, model=model, router=router,
+        image_preparer=image_preparer or ImagePreparer(cache_dir=storage.derived_dir)
+    )
 
     # Get file paths for images to analyze
-    image_tasks = []
     sha256_to_path = {}
 
     for sha256 in to_analyze:
         original_file = storage.get_original_file_path(sha256)
         if original_file:
             sha256_to_path[sha256] = original_file
-            image_tasks.append(original_file)
 
-    # Process images in batch
-    image_results = await analyzer.analyze_images_batch(
-        image_tasks,
-        max_concurrent=max_concurrent,
-        quiet=quiet
-    )
-
-    # Create UnifiedAnalysis objects and save to storage
+    # Near-duplicates of analyzed (or queued) images reuse that analysis
+    # instead of a vision call; they run after the queued images are saved
+    duplicates = {}
+    if image_deduplicator:
+        for sha256, original_file in sha256_to_path.items():
+            link = image_deduplicator.match(sha256, original_file)
+            if link:
+                duplicates[sha256] = link
+    queued = [(sha256, original_file) for sha256, original_file in sha256_to_path.items()
+              if sha256 not in duplicates]
+
+    # Process images concurrently, tracking AI usage per image. A bounded
+    # queue feeds max_concurrent workers, so only that many images are read,
+    # prepared and in flight at once whatever the batch size. Each analysis is
+    # saved as soon as it completes, so an interrupted run keeps everything
+    # finished so far and a rerun picks up the remaining images.
+    total = len(sha256_to_path)
     results = {}
 
-    for i, (sha256, original_file) in enumerate(sha256_to_path.items()):
-        image_result = image_results[i]
+    previous = storage.get_image_batch_checkpoint(case_id)
+    if not quiet and previous and previous.status != "completed":
+        print(f"↩️  Resuming {previous.status} batch: {len(already_done)} saved, {total} remaining")
 
-        # Load metadata
+    now = datetime.now()
+    checkpoint = ImageBatchCheckpoint(case_id=case_id, total=total, started_at=now, updated_at=now)
+
+    def save_result(sha256: str, image_result: ImageAnalysisResult, usage_records, routing_decisions,
+                    duplicate_of: Optional[DuplicateLink] = None):
+        """Build and save one image's UnifiedAnalysis (runs in a worker thread)."""
         evidence_dir = get_evidence_base_dir(storage.derived_dir, sha256)
-        metadata_file = evidence_dir / "metadata.json"
-        metadata_dict = read_json_safe(metadata_file)
+        metadata_dict = read_json_safe(evidence_dir / "metadata.json")
         if not metadata_dict:
             raise RuntimeError(f"Failed to load metadata for {sha256}")
-        file_metadata = FileMetadata(**metadata_dict)
 
-        # Create unified analysis
         unified_analysis = UnifiedAnalysis(
             evidence_type=EvidenceType.IMAGE,
             analysis_timestamp=datetime.now(),
-            file_metadata=file_metadata,
+            file_metadata=FileMetadata(**metadata_dict),
             case_id=case_id,
             image_analysis=image_result,
-            labels=[]
+            labels=["near-duplicate"] if duplicate_of else [],
+            ai_usage=storage.append_evidence_usage(case_id, sha256, usage_records),
+            routing_decisions=routing_decisions,
+            duplicate_of=duplicate_of
         )
+        # save_analysis extracts SHA256 from file_metadata
+        if not storage.save_analysis(unified_analysis):
+            raise RuntimeError(f"Failed to save analysis for {sha256}")
+        return unified_analysis
+
+    async def analyze_one(job: Tuple[str, Path]):
+        sha256, original_file = job
+
+        # Budget check happens at start time so it sees spend from finished images
+        image_model = None  # Analyzer default (or the cascade)
+        if budget:
+            decision = budget.decide(
+                sha256,
+                EvidenceType.IMAGE,
+                router.fast_model if router else analyzer.model,  # The cascade starts on its fast model
+                file_size=original_file.stat().st_size,
+                filename=original_file.name
+            )
+            if not decision.should_run:
+                return sha256, None, None
+            if decision.action == BudgetDecision.DOWNGRADE:
+                image_model = decision.model
+
+        with track_usage() as usage_tracker:
+            try:
+                image_result = await analyzer.analyze_image_async(original_file, model=image_model)
+            except Exception as e:
+                # Return error result instead of raising
+                image_result = ImageAnalysisResult(
+                    openai_model=image_model or analyzer.model,
+                    openai_response={"error": str(e)},
+                    scene_description=f"Batch analysis failed: {str(e)}",
+                    analysis_confidence=0.0
+                )
+
+        if budget:
+            budget.record_completed(sha256, EvidenceType.IMAGE)
+
+        # Save off the event loop so other images keep streaming meanwhile
+        try:
+            unified_analysis = await asyncio.to_thread(
+                save_result, sha256, image_result, usage_tracker.records, usage_tracker.routing_decisions
+            )
+        except Exception as e:
+            return sha256, None, str(e)
+        return sha256, unified_analysis, None
+
+    async def reuse_duplicate(job: Tuple[str, DuplicateLink]):
+        sha256, link = job
+        image_result = await asyncio.to_thread(image_deduplicator.reuse, sha256, link)
+        if image_result is None:
+            # The canonical image failed or was skipped - analyze this copy itself
+            return await analyze_one((sha256, sha256_to_path[sha256]))
+        try:
+            unified_analysis = await asyncio.to_thread(save_result, sha256, image_result, [], [], link)
+        except Exception as e:
+            return sha256, None, str(e)
+        return sha256, unified_analysis, None
+
+    async def run(jobs, func):
+        async for _, (sha256, unified_analysis, error) in iter_bounded(jobs, func, max_concurrent):
+            if unified_analysis is not None:
+                results[sha256] = unified_analysis
+                checkpoint.saved.append(sha256)
+            elif error is not None:
+                checkpoint.failed[sha256] = error
+                if not quiet:
+                    print(f"❌ {sha256[:12]}: {error}")
+            else:
+                checkpoint.skipped.append(sha256)  # Skipped by budget controller
+            checkpoint.updated_at = datetime.now()
+            await asyncio.to_thread(storage.save_image_batch_checkpoint, checkpoint)
+
+            done = len(checkpoint.saved) + len(checkpoint.skipped) + len(checkpoint.failed)
+            if not quiet and done % 5 == 0:
+                print(f"   Processed image {done}/{total}...")
+
+    await asyncio.to_thread(storage.save_image_batch_checkpoint, checkpoint)
+    try:
+        await run(queued, analyze_one)
+        await run(duplicates.items(), reuse_duplicate)
+        checkpoint.status = "completed"
+    finally:
+        if checkpoint.status != "completed":
+            checkpoint.status = "interrupted"
+            if not quiet:
+                print(f"⏸️  Batch interrupted: {len(checkpoint.saved)}/{total} saved, rerun to resume")
+        checkpoint.updated_at = datetime.now()
+        storage.save_image_batch_checkpoint(checkpoint)
 
-        # Save to storage (save_analysis extracts SHA256 from file_metadata)
-        storage.save_analysis(unified_analysis)
-        results[sha256] = unified_analysis
+    if not quiet:
+        successful = sum(1 for analysis in results.values() if analysis.image_analysis.analysis_confidence)
+        print(f"✅ Batch complete: {successful}/{len(results)} successful")
+        if checkpoint.skipped:
+            print(f"💸 Budget skipped {len(checkpoint.skipped)} images")
+        reused = [sha256 for sha256 in duplicates if sha256 in image_deduplicator.reused]
+        if reused:
+            print(f"♻️  Reused {len(reused)} near-duplicate analyses ({len(reused)} vision calls saved)")
 
     # Add already-analyzed results
     for sha256 in already_done:
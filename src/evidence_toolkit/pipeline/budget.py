@@ -0,0 +1,388 @@
+#!/usr/bin/env python3
+"""Per-case spend and latency budget controller.
+
+Keeps fixed-fee matters inside an agreed AI budget. The controller watches
+accumulated spend (from core.usage records) and wall time while process-case
+runs, and decides for each evidence item whether to:
+
+- run it at the requested model,
+- downgrade it to a cheaper model once spend or time passes the soft limit,
+- skip it (low-value images near the limit, or anything that would overshoot),
+- stop all remaining AI work once a hard limit is reached.
+
+Every skip and downgrade is recorded in a BudgetReport so nothing is left out
+silently.
+"""
+
+import re
+import time
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from evidence_toolkit.core.models import BudgetAction, BudgetReport, EvidenceType
+from evidence_toolkit.core.storage import EvidenceStorage
+from evidence_toolkit.core.usage import UsageTracker, start_tracking, stop_tracking
+
+
+# Cheaper substitute for each model once the soft limit is reached
+MODEL_DOWNGRADES: Dict[str, str] = {
+    "gpt-4o-2024-08-06": "gpt-4o-mini",
+    "gpt-4o": "gpt-4o-mini",
+    "gpt-4.1": "gpt-4.1-mini",
+    "gpt-4.1-mini": "gpt-4.1-nano",
+    "gpt-4o-mini": "gpt-4.1-nano",
+}
+
+_DURATION_PATTERN = re.compile(r'^\s*(\d+(?:\.\d+)?)\s*([smh]?)\s*$', re.IGNORECASE)
+_DURATION_UNITS = {"": 1, "s": 1, "m": 60, "h": 3600}
+
+
+def parse_duration(value: str) -> float:
+    """Parse a deadline such as ``90``, ``90s``, ``45m`` or ``2h`` into seconds.
+
+    Raises:
+        ValueError: If the value is not a positive duration
+    """
+    match = _DURATION_PATTERN.match(str(value))
+    if not match:
+        raise ValueError(f"Invalid duration: {value!r} (use e.g. 90s, 45m, 2h)")
+
+    seconds = float(match.group(1)) * _DURATION_UNITS[match.group(2).lower()]
+    if seconds <= 0:
+        raise ValueError(f"Duration must be positive: {value!r}")
+    return seconds
+
+
+class BudgetDecision:
+    """What to do with one evidence item."""
+
+    RUN = "run"
+    DOWNGRADE = "downgrade"
+    SKIP = "skip"
+
+    def __init__(self, action: str, model: Optional[str] = None, reason: Optional[str] = None):
+        self.action = action
+        self.model = model
+        self.reason = reason
+
+    @property
+    def should_run(self) -> bool:
+        return self.action != self.SKIP
+
+
+class BudgetController:
+    """Tracks spend and elapsed time for a case and rations remaining AI work.
+
+    Example:
+        >>> budget = BudgetController("CASE-001", max_cost=25.0, deadline_seconds=3600)
+        >>> with budget.tracking():
+        ...     decision = budget.decide(sha256, EvidenceType.DOCUMENT, "gpt-4o-mini")
+        ...     if decision.should_run:
+        ...         analyze_evidence(sha256, storage, model=decision.model)
+        ...         budget.record_completed(sha256, EvidenceType.DOCUMENT)
+        >>> report = budget.report()
+    """
+
+    def __init__(
+        self,
+        case_id: str,
+        max_cost: Optional[float] = None,
+        deadline_seconds: Optional[float] = None,
+        soft_limit: float = 0.8,
+        min_image_bytes: int = 50 * 1024
+    ):
+        """Initialize budget controller.
+
+        Args:
+            case_id: Case being processed
+            max_cost: Hard spend limit in USD (None = unlimited)
+            deadline_seconds: Hard wall-time limit from controller creation (None = unlimited)
+            soft_limit: Fraction of either limit at which models are downgraded
+                and low-value images skipped (default: 0.8)
+            min_image_bytes: Images smaller than this are treated as low value
+                (icons, logos, thumbnails) and skipped past the soft limit
+        """
+        if max_cost is not None and max_cost <= 0:
+            raise ValueError("max_cost must be positive")
+        if not 0.0 < soft_limit <= 1.0:
+            raise ValueError("soft_limit must be in (0, 1]")
+
+        self.case_id = case_id
+        self.max_cost = max_cost
+        self.deadline_seconds = deadline_seconds
+        self.soft_limit = soft_limit
+        self.min_image_bytes = min_image_bytes
+
+        self.started_at = time.monotonic()
+        self.stopped_reason: Optional[str] = None
+        self.items_run = 0
+        self.downgraded: List[BudgetAction] = []
+        self.skipped: List[BudgetAction] = []
+
+        self._tracker: Optional[UsageTracker] = None
+        self._token = None
+        self._cost_at_item_start: Dict[str, float] = {}
+        self._item_costs: Dict[str, List[float]] = {}
+        self._decisions: Dict[str, BudgetDecision] = {}
+
+    def start(self):
+        """Start counting spend from AI calls made in the current context."""
+        if self._token is None:
+            self._tracker, self._token = start_tracking(f"budget:{self.case_id}")
+
+    def stop(self):
+        """Stop counting spend (the accumulated totals are kept)."""
+        if self._token is not None:
+            stop_tracking(self._token)
+            self._token = None
+
+    @contextmanager
+    def tracking(self) -> Iterator["BudgetController"]:
+        """Count spend from every AI call made inside the block."""
+        self.start()
+        try:
+            yield self
+        finally:
+            self.stop()
+
+    # ------------------------------------------------------------------
+    # Current state
+    # ------------------------------------------------------------------
+
+    @property
+    def spent(self) -> float:
+        return self._tracker.estimated_cost_usd if self._tracker else 0.0
+
+    @property
+    def elapsed(self) -> float:
+        return time.monotonic() - self.started_at
+
+    def pressure(self) -> float:
+        """Fraction of the tighter limit already used (0.0 when unlimited)."""
+        fractions = [0.0]
+        if self.max_cost:
+            fractions.append(self.spent / self.max_cost)
+        if self.deadline_seconds:
+            fractions.append(self.elapsed / self.deadline_seconds)
+        return max(fractions)
+
+    def estimated_item_cost(self, evidence_type: EvidenceType) -> float:
+        """Average observed cost of an item of this type (falls back to all types)."""
+        costs = self._item_costs.get(evidence_type.value)
+        if not costs:
+            costs = [c for type_costs in self._item_costs.values() for c in type_costs]
+        return sum(costs) / len(costs) if costs else 0.0
+
+    # ------------------------------------------------------------------
+    # Decisions
+    # ------------------------------------------------------------------
+
+    def decide(
+        self,
+        sha256: str,
+        evidence_type: EvidenceType,
+        model: str,
+        file_size: Optional[int] = None,
+        filename: Optional[str] = None
+    ) -> BudgetDecision:
+        """Decide whether and how to analyze one evidence item.
+
+        Each item is decided once: an item asked about again (packing or
+        threading handed it back for individual analysis) gets its earlier
+        decision, so it is listed once in the report and never downgraded
+        twice - unless AI work has stopped since, which skips it.
+
+        Args:
+            sha256: Evidence SHA256
+            evidence_type: Evidence type
+            model: Model the item would normally be analyzed with
+            file_size: File size in bytes (used to spot low-value images)
+            filename: Original filename (for the report)
+
+        Returns:
+            BudgetDecision with the model to use, or a skip
+        """
+        self._check_limits()
+
+        earlier = self._decisions.get(sha256)
+        if earlier is not None and not (earlier.should_run and self.stopped_reason):
+            if earlier.should_run:
+                self.mark_started(sha256)
+            return earlier
+
+        decision = self._decide(evidence_type, model, file_size, self.estimated_item_cost(evidence_type))
+        self._record(sha256, evidence_type, filename, model, decision)
+        return decision
+
+    def decide_together(
+        self,
+        items: List[Tuple[str, Optional[str]]],
+        evidence_type: EvidenceType,
+        model: str
+    ) -> BudgetDecision:
+        """Decide once for items analyzed in one request (an email thread).
+
+        The decision is made for the items' combined estimated cost and
+        applies to all of them, so they share one model; each item is still
+        listed in the report and keeps the decision if it is handed back.
+
+        Args:
+            items: (SHA256, original filename) of each item
+            evidence_type: Evidence type of the items
+            model: Model the request would normally use
+
+        Returns:
+            BudgetDecision shared by all items
+        """
+        self._check_limits()
+        decision = self._decide(evidence_type, model, None, self.estimated_item_cost(evidence_type) * len(items))
+        for sha256, filename in items:
+            self._record(sha256, evidence_type, filename, model, decision)
+        return decision
+
+    def _check_limits(self):
+        """Stop all remaining AI work once a hard limit is reached."""
+        if self.stopped_reason is None:
+            if self.max_cost and self.spent >= self.max_cost:
+                self.stopped_reason = f"cost limit reached (${self.spent:.4f} of ${self.max_cost:.2f})"
+            elif self.deadline_seconds and self.elapsed >= self.deadline_seconds:
+                self.stopped_reason = f"deadline reached ({self.elapsed:.0f}s of {self.deadline_seconds:.0f}s)"
+
+    def _decide(
+        self,
+        evidence_type: EvidenceType,
+        model: str,
+        file_size: Optional[int],
+        estimated_cost: float
+    ) -> BudgetDecision:
+        """Decision for work of the given estimated cost (recorded by _record)."""
+        if self.stopped_reason:
+            return BudgetDecision(BudgetDecision.SKIP, reason=f"AI work stopped: {self.stopped_reason}")
+
+        # Don't start work that would push spend past the hard limit
+        if self.max_cost and self.spent + estimated_cost > self.max_cost:
+            return BudgetDecision(
+                BudgetDecision.SKIP,
+                reason=f"estimated cost ${estimated_cost:.4f} would exceed remaining "
+                       f"budget ${self.max_cost - self.spent:.4f}"
+            )
+
+        if self.pressure() < self.soft_limit:
+            return BudgetDecision(BudgetDecision.RUN, model=model)
+
+        # Past the soft limit: drop low-value images, downgrade everything else
+        if (evidence_type == EvidenceType.IMAGE and file_size is not None
+                and file_size < self.min_image_bytes):
+            return BudgetDecision(
+                BudgetDecision.SKIP,
+                reason=f"low-value image ({file_size / 1024:.0f} KB) skipped at {self.pressure():.0%} of budget"
+            )
+
+        cheaper = MODEL_DOWNGRADES.get(model)
+        if not cheaper:
+            return BudgetDecision(BudgetDecision.RUN, model=model)
+        return BudgetDecision(BudgetDecision.DOWNGRADE, model=cheaper, reason=f"{self.pressure():.0%} of budget used")
+
+    def _record(
+        self,
+        sha256: str,
+        evidence_type: EvidenceType,
+        filename: Optional[str],
+        model: str,
+        decision: BudgetDecision
+    ):
+        """Remember an item's decision and list skips and downgrades in the report."""
+        self._decisions[sha256] = decision
+        if decision.should_run:
+            self.mark_started(sha256)
+
+        if decision.action == BudgetDecision.SKIP:
+            actions, model_from = self.skipped, None
+        elif decision.action == BudgetDecision.DOWNGRADE:
+            actions, model_from = self.downgraded, model
+        else:
+            return
+        actions.append(BudgetAction(
+            sha256=sha256,
+            filename=filename,
+            evidence_type=evidence_type.value,
+            action="skipped" if actions is self.skipped else "downgraded",
+            reason=decision.reason,
+            model_from=model_from,
+            model_to=decision.model if model_from else None,
+            spent_usd=round(self.spent, 6),
+            elapsed_seconds=round(self.elapsed, 2)
+        ))
+
+    def mark_started(self, sha256: str):
+        """(Re)start measuring an item's cost from the current spend.
+
+        decide() does this for items it lets run; callers that share one
+        request across items (pipeline.packing) call it again just before
+        each item's share is recorded.
+        """
+        self._cost_at_item_start[sha256] = self.spent
+
+    def record_completed(self, sha256: str, evidence_type: EvidenceType):
+        """Record that an item finished, updating the per-type cost estimate.
+
+        With concurrent image analysis the per-item cost is approximate
+        (other in-flight items contribute), which is fine for forecasting.
+        """
+        start_cost = self._cost_at_item_start.pop(sha256, None)
+        if start_cost is not None:
+            self._item_costs.setdefault(evidence_type.value, []).append(max(self.spent - start_cost, 0.0))
+        self.items_run += 1
+
+    def downgrade_model(self, model: str) -> Optional[str]:
+        """Model to use for case-level work (summaries), or None to skip AI entirely."""
+        if self.stopped_reason or self.pressure() >= 1.0:
+            return None
+        if self.pressure() >= self.soft_limit:
+            return MODEL_DOWNGRADES.get(model, model)
+        return model
+
+    def report(self) -> BudgetReport:
+        """Build the report of what was run, downgraded and skipped."""
+        return BudgetReport(
+            case_id=self.case_id,
+            max_cost_usd=self.max_cost,
+            deadline_seconds=self.deadline_seconds,
+            soft_limit=self.soft_limit,
+            spent_usd=round(self.spent, 6),
+            elapsed_seconds=round(self.elapsed, 2),
+            items_run=self.items_run,
+            stopped_reason=self.stopped_reason,
+            downgraded=list(self.downgraded),
+            skipped=list(self.skipped)
+        )
+
+
+def prioritize_images(storage: EvidenceStorage, sha256_list: List[str]) -> List[str]:
+    """Order images so the most valuable vision calls happen first under a budget.
+
+    Largest files first: full photos and scans precede icons, logos and
+    thumbnails, which are the first to be skipped when the budget runs low.
+    (process-case already analyzes documents and emails before images.)
+
+    Args:
+        storage: EvidenceStorage instance
+        sha256_list: Image SHA256 hashes
+
+    Returns:
+        New list in processing order
+    """
+    def file_size(sha256: str) -> int:
+        original_file = storage.get_original_file_path(sha256)
+        return original_file.stat().st_size if original_file else 0
+
+    return sorted(sha256_list, key=file_size, reverse=True)
+
+
+__all__ = [
+    "MODEL_DOWNGRADES",
+    "parse_duration",
+    "BudgetDecision",
+    "BudgetController",
+    "prioritize_images",
+]
@@ -0,0 +1,292 @@
+#!/usr/bin/env python3
+"""Near-duplicate evidence detection for the analysis pipeline.
+
+Near-identical images (the same chat captured twice, resized or re-encoded
+copies) reuse the analysis of the first copy instead of costing another
+vision call. Near-duplicate documents and emails (forwards, replies quoting
+the whole message, .eml and .msg copies) are grouped before analysis and
+one representative per group is analyzed.
+
+Hashing and matching live in core.similarity; this module keeps the indexes
+and records every reuse as a DuplicateLink on the analysis and a custody
+event, so a reused result can always be traced back to the evidence that
+was analyzed.
+"""
+
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+from evidence_toolkit.core.storage import EvidenceStorage
+from evidence_toolkit.core.models import (
+    ChainOfCustodyEvent,
+    DuplicateLink,
+    EvidenceType,
+    FileMetadata,
+    ImageAnalysisResult,
+    PerceptualHash,
+    UnifiedAnalysis,
+)
+from evidence_toolkit.core.similarity import (
+    DEFAULT_CONTAINMENT_THRESHOLD,
+    DEFAULT_MAX_DISTANCE,
+    MIN_SHINGLES,
+    ImageHashIndex,
+    MinHasher,
+    group_near_duplicates,
+    hash_image_file,
+    shingles,
+)
+from evidence_toolkit.core.utils import detect_file_type, get_evidence_base_dir, read_json_safe
+
+
+def _record_reuse(storage: EvidenceStorage, sha256: str, link: DuplicateLink) -> None:
+    """Custody event linking reused evidence to the evidence actually analyzed."""
+    storage._add_custody_event(
+        sha256,
+        ChainOfCustodyEvent(
+            timestamp=datetime.now(),
+            event_type="near_duplicate",
+            actor="system",
+            description=f"Analysis reused from near-duplicate {link.canonical_sha256[:12]} ({link.summary})",
+            metadata=link.model_dump(mode="json")
+        )
+    )
+
+
+class ImageDeduplicator:
+    """Matches images against already-analyzed near-duplicates before analysis.
+
+    Each image that has no near-duplicate becomes a canonical image - it is
+    analyzed, and later copies reuse its result. Perceptual hashes are saved
+    in derived storage (phash.v1.json), so each image is hashed once.
+
+    Example:
+        >>> deduplicator = ImageDeduplicator(storage, case_id="CASE-2024")
+        >>> link = deduplicator.match(sha256, original_file)
+        >>> result = deduplicator.reuse(sha256, link) if link else None
+    """
+
+    def __init__(
+        self,
+        storage: EvidenceStorage,
+        max_distance: int = DEFAULT_MAX_DISTANCE,
+        case_id: Optional[str] = None
+    ):
+        """Initialize image deduplicator
+
+        Args:
+            storage: EvidenceStorage holding the images and their analyses
+            max_distance: Largest pHash Hamming distance (of 64 bits) treated
+                as a near-duplicate
+            case_id: Only match within this case (default: all evidence)
+        """
+        self.storage = storage
+        self.max_distance = max_distance
+        self.case_id = case_id
+        self.reused: Dict[str, DuplicateLink] = {}  # SHA256 -> link, for this run
+        self._index: Optional[ImageHashIndex] = None
+
+    def image_hash(self, sha256: str, image_path: Path) -> Optional[PerceptualHash]:
+        """Stored perceptual hash of an image, computed and saved on first use."""
+        hashes = self.storage.get_image_hash(sha256)
+        if hashes is None:
+            try:
+                hashes = hash_image_file(image_path)
+            except Exception as e:
+                print(f"Warning: Could not hash image {sha256[:12]}: {e}")
+                return None
+            self.storage.save_image_hash(sha256, hashes)
+        return hashes
+
+    def _load_index(self) -> ImageHashIndex:
+        """Index the images that already have an analysis of their own."""
+        index = ImageHashIndex()
+        for sha256 in self.storage.list_evidence(self.case_id):
+            analysis = self.storage.get_analysis(sha256)
+            if not analysis or analysis.evidence_type != EvidenceType.IMAGE or analysis.duplicate_of:
+                continue
+            original_file = self.storage.get_original_file_path(sha256)
+            if not analysis.image_analysis or not original_file or original_file.suffix.lower() == '.pdf':
+                continue
+            hashes = self.image_hash(sha256, original_file)  # Images analyzed before hashing existed
+            if hashes:
+                index.add(sha256, hashes)
+        return index
+
+    def match(self, sha256: str, image_path: Path) -> Optional[DuplicateLink]:
+        """Find a near-duplicate of an image among the canonical images.
+
+        An image without a match is indexed as canonical straight away: the
+        caller is about to analyze it, so copies later in the same run (or
+        batch) link to it.
+
+        Args:
+            sha256: Image SHA256
+            image_path: Path to the image file
+
+        Returns:
+            DuplicateLink to the closest canonical image, or None
+        """
+        if self._index is None:
+            self._index = self._load_index()
+
+        hashes = self.image_hash(sha256, image_path)
+        if hashes is None:
+            return None
+
+        nearest = self._index.nearest(hashes, self.max_distance)
+        if nearest is None:
+            self._index.add(sha256, hashes)
+            return None
+
+        canonical_sha256, distance = nearest
+        if canonical_sha256 == sha256:
+            return None  # Already canonical (re-analysis)
+        return DuplicateLink(
+            canonical_sha256=canonical_sha256,
+            method="perceptual_hash",
+            distance=distance,
+            max_distance=self.max_distance,
+            detected_at=datetime.now()
+        )
+
+    def reuse(self, sha256: str, link: DuplicateLink) -> Optional[ImageAnalysisResult]:
+        """Copy of the canonical image's analysis, with the link recorded in custody.
+
+        Returns:
+            ImageAnalysisResult, or None when the canonical image has no
+            successful analysis (the caller analyzes the image itself)
+        """
+        canonical = self.storage.get_analysis(link.canonical_sha256)
+        if not canonical or not canonical.image_analysis or not canonical.image_analysis.analysis_confidence:
+            return None
+
+        _record_reuse(self.storage, sha256, link)
+        self.reused[sha256] = link
+        return canonical.image_analysis.model_copy(deep=True)
+
+
+class TextDeduplicator:
+    """Groups near-duplicate documents and emails so each group is analyzed once.
+
+    plan() shingles and MinHashes the text of the pending items and groups
+    them with LSH; the longest text of each group is its representative (a
+    reply quoting the original covers both). After the representatives are
+    analyzed, link() saves every other member with a copy of its
+    representative's analysis.
+
+    Example:
+        >>> deduplicator = TextDeduplicator(storage)
+        >>> to_analyze = deduplicator.plan(pending_sha256s)
+        >>> ...  # analyze to_analyze
+        >>> for sha256 in deduplicator.links:
+        ...     deduplicator.link(sha256, case_id)
+    """
+
+    def __init__(self, storage: EvidenceStorage, threshold: float = DEFAULT_CONTAINMENT_THRESHOLD):
+        """Initialize text deduplicator
+
+        Args:
+            storage: EvidenceStorage holding the evidence
+            threshold: Smallest estimated share of a text's word shingles
+                found in its representative for it to count as a near-duplicate
+        """
+        self.storage = storage
+        self.threshold = threshold
+        self.links: Dict[str, DuplicateLink] = {}  # Member SHA256 -> its representative
+        self.reused: Dict[str, DuplicateLink] = {}  # Members saved with a reused analysis
+
+    def plan(self, sha256s: Iterable[str]) -> List[str]:
+        """Group pending documents/emails; returns the ones to analyze.
+
+        Members of a group are left out of the returned list and recorded in
+        links. Texts too short to compare are always analyzed.
+
+        Args:
+            sha256s: Pending (not yet analyzed) evidence SHA256s
+
+        Returns:
+            SHA256s to analyze, in the given order
+        """
+        from evidence_toolkit.pipeline.analyze import evidence_text
+
+        sha256s = list(sha256s)
+        hasher = MinHasher()
+        lengths, signatures = {}, {}
+        for sha256 in sha256s:
+            try:
+                text = evidence_text(self.storage, sha256)
+            except Exception as e:
+                print(f"Warning: Could not read text of {sha256[:12]}: {e}")
+                continue
+            text_shingles = shingles(text)
+            if len(text_shingles) >= MIN_SHINGLES:
+                lengths[sha256] = len(text_shingles)
+                signatures[sha256] = hasher.signature(text_shingles)
+
+        # Longest first (stable for equal lengths), so the fullest copy represents its group
+        ordered = sorted(signatures, key=lambda sha256: -lengths[sha256])
+        members = group_near_duplicates({sha256: signatures[sha256] for sha256 in ordered}, lengths, self.threshold)
+        now = datetime.now()
+        for member, (representative, similarity) in members.items():
+            self.links[member] = DuplicateLink(
+                canonical_sha256=representative,
+                method="minhash",
+                similarity=similarity,
+                threshold=self.threshold,
+                detected_at=now
+            )
+        return [sha256 for sha256 in sha256s if sha256 not in self.links]
+
+    def _email_metadata(self, sha256: str) -> Optional[dict]:
+        """The member's own parsed email headers (sender, recipients, date, subject)."""
+        from evidence_toolkit.analyzers.email_parser import EmailParser
+        from evidence_toolkit.pipeline.analyze import email_metadata_from_headers
+
+        original_file = self.storage.get_original_file_path(sha256)
+        if not original_file or detect_file_type(original_file) != EvidenceType.EMAIL.value:
+            return None
+        return email_metadata_from_headers(EmailParser(verbose=False).parse_headers(original_file))
+
+    def link(self, sha256: str, case_id: Optional[str] = None) -> Optional[UnifiedAnalysis]:
+        """Save a group member with a copy of its representative's analysis.
+
+        Only the AI analysis is shared: an email member keeps its own header
+        metadata (a forward has its own sender, recipients and date), so it
+        still has its own place in the case timeline.
+
+        Returns:
+            The saved UnifiedAnalysis, or None when the representative has no
+            analysis (failed or skipped) - the caller analyzes the member
+        """
+        link = self.links[sha256]
+        representative = self.storage.get_analysis(link.canonical_sha256)
+        if not representative or not (representative.document_analysis or representative.email_analysis):
+            return None
+        metadata_dict = read_json_safe(get_evidence_base_dir(self.storage.derived_dir, sha256) / "metadata.json")
+        if not metadata_dict:
+            return None
+
+        analysis = UnifiedAnalysis(
+            evidence_type=representative.evidence_type,
+            analysis_timestamp=datetime.now(),
+            file_metadata=FileMetadata(**metadata_dict),
+            case_id=case_id,
+            document_analysis=representative.document_analysis,
+            email_analysis=representative.email_analysis,
+            email_metadata=self._email_metadata(sha256),
+            labels=[label for label in representative.labels if label != "near-duplicate"] + ["near-duplicate"],
+            duplicate_of=link
+        )
+        _record_reuse(self.storage, sha256, link)
+        if not self.storage.save_analysis(analysis):
+            return None
+        self.reused[sha256] = link
+        return analysis
+
+
+__all__ = [
+    "ImageDeduplicator",
+    "TextDeduplicator",
+]
@@ -9,13 +9,20 @@ This module is responsible for:
 - Metadata extraction and preservation
 - Chain of custody initialization
 - Deduplication based on SHA256 hashing
+- Container expansion: each member of a ZIP/TAR archive, each message of
+  an .mbox and each attachment of an email becomes its own evidence item,
+  streamed into storage and linked to its container in custody
+  (recursively, with a limit on archive nesting)
 """
 
-from pathlib import Path
-from typing import List, Optional
+import tarfile
+import zipfile
+from datetime import datetime
+from pathlib import Path, PurePosixPath
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
 
 from evidence_toolkit.core.storage import EvidenceStorage
-from evidence_toolkit.core.models import IngestionResult
+from evidence_toolkit.core.models import ChainOfCustodyEvent, IngestionResult
 
 
 def ingest_evidence(
@@ -38,12 +45,374 @@ def ingest_evidence(
     return storage.ingest_file(file_path, case_id=case_id, actor=actor)
 
 
+def expand_mbox(
+    container: IngestionResult,
+    storage: EvidenceStorage,
+    case_id: Optional[str] = None,
+    actor: str = "system"
+) -> Iterator[IngestionResult]:
+    """Split an ingested mailbox into one evidence item per message.
+
+    Messages are streamed from the stored original straight into storage, so
+    memory stays bounded by one line however large the mailbox is. Each
+    message is stored as .eml with a custody event naming the mailbox and its
+    position; the mailbox gets an "expand" event with the message count.
+
+    Args:
+        container: IngestionResult of the .mbox file
+        storage: EvidenceStorage instance for storage operations
+        case_id: Optional case ID to associate with the messages
+        actor: Actor performing the ingestion (default: system)
+
+    Yields:
+        IngestionResult per message (container.child_count is set when done)
+    """
+    from evidence_toolkit.analyzers.email_parser import iter_mbox_messages
+
+    stem = Path(container.metadata.filename if container.metadata else container.file_path).stem
+    extracted = 0
+    for index, lines in enumerate(iter_mbox_messages(Path(container.storage_path)), 1):
+        result = storage.ingest_stream(
+            lines,
+            f"{stem}-{index:06d}.eml",
+            case_id=case_id,
+            actor=actor,
+            parent_sha256=container.sha256,
+            source=f"message {index}"
+        )
+        extracted += result.success
+        yield result
+
+    container.child_count = extracted
+    container.container_only = True  # The messages are the evidence
+    storage._add_custody_event(container.sha256, ChainOfCustodyEvent(
+        timestamp=datetime.now(),
+        event_type="expand",
+        actor=actor,
+        description=f"Mailbox split into {extracted} messages",
+        metadata={"case_id": case_id, "children": extracted} if case_id else {"children": extracted}
+    ))
+
+
+def expand_email_attachments(
+    container: IngestionResult,
+    storage: EvidenceStorage,
+    case_id: Optional[str] = None,
+    actor: str = "system"
+) -> Iterator[IngestionResult]:
+    """Ingest the attachments of an ingested .eml/.msg as child evidence.
+
+    Attachments are stored once by SHA256 - the same PDF attached to ten
+    emails is one evidence item with an ingest event per email. The email
+    gets an "expand" custody event listing its attachments, and stays
+    evidence in its own right.
+
+    Args:
+        container: IngestionResult of the email
+        storage: EvidenceStorage instance for storage operations
+        case_id: Optional case ID to associate with the attachments
+        actor: Actor performing the ingestion (default: system)
+
+    Yields:
+        IngestionResult per attachment (container.child_count is set when done)
+    """
+    from evidence_toolkit.analyzers.email_parser import EmailParser
+
+    attachments = []
+    parser = EmailParser(verbose=False)
+    try:
+        for index, (filename, content) in enumerate(parser.iter_attachments(Path(container.storage_path)), 1):
+            result = storage.ingest_stream(
+                [content],
+                filename,
+                case_id=case_id,
+                actor=actor,
+                parent_sha256=container.sha256,
+                source=f"attachment {index}: {filename}"
+            )
+            if result.success:
+                attachments.append({"filename": filename, "sha256": result.sha256})
+            yield result
+    except Exception as e:
+        print(f"Warning: Could not extract attachments of {container.sha256[:12]}: {e}")
+
+    container.child_count = len(attachments)
+    if attachments:
+        storage._add_custody_event(container.sha256, ChainOfCustodyEvent(
+            timestamp=datetime.now(),
+            event_type="expand",
+            actor=actor,
+            description=f"{len(attachments)} attachments extracted",
+            metadata={"case_id": case_id, "attachments": attachments} if case_id else {"attachments": attachments}
+        ))
+
+
+# Archive members are read (and hashed) in chunks of this size
+ARCHIVE_CHUNK_BYTES = 1024 * 1024
+
+# Archives nested deeper than this are stored but not expanded (zip bombs, quines)
+MAX_ARCHIVE_DEPTH = 4
+
+# Expansion limits per archive (zip bombs): members read, uncompressed bytes
+# of one member, and uncompressed bytes of all members together
+MAX_ARCHIVE_MEMBERS = 10_000
+MAX_ARCHIVE_MEMBER_BYTES = 2 * 1024 ** 3
+MAX_ARCHIVE_TOTAL_BYTES = 20 * 1024 ** 3
+
+
+class ArchiveLimitError(ValueError):
+    """An archive member went past an expansion limit while it was read."""
+
+
+def _limit_chunks(chunks: Iterator[bytes], limit: int, counted: List[int], what: str) -> Iterator[bytes]:
+    """Pass chunks through, counting bytes into ``counted[0]``; stop past ``limit``.
+
+    Sizes declared in archive headers can lie, so the bytes actually
+    decompressed are counted.
+    """
+    for chunk in chunks:
+        counted[0] += len(chunk)
+        if counted[0] > limit:
+            raise ArchiveLimitError(f"{what} limit ({limit:,} bytes) exceeded")
+        yield chunk
+
+
+def _skip_member(name: str) -> bool:
+    """Hidden files and macOS resource forks, as ingest_directory skips them."""
+    path = PurePosixPath(name)
+    return path.name.startswith('.') or '__MACOSX' in path.parts
+
+
+def _iter_archive_members(archive_file: Path) -> Iterator[Tuple[str, Iterator[bytes]]]:
+    """Regular files of a ZIP or TAR archive (any compression), as chunk iterators.
+
+    Each member is opened when its chunks are first read, so a member that
+    cannot be read (encrypted, corrupt) fails on its own.
+    """
+    def read_chunks(open_member) -> Iterator[bytes]:
+        with open_member() as member:
+            while chunk := member.read(ARCHIVE_CHUNK_BYTES):
+                yield chunk
+
+    if zipfile.is_zipfile(archive_file):
+        with zipfile.ZipFile(archive_file) as archive:
+            for info in archive.infolist():
+                name = info.filename.replace('\\', '/')
+                if not info.is_dir() and not _skip_member(name):
+                    yield name, read_chunks(lambda info=info: archive.open(info))
+    elif tarfile.is_tarfile(archive_file):
+        with tarfile.open(archive_file, 'r:*') as archive:
+            for info in archive:  # Streams through the archive; members are read in order
+                if info.isfile() and not _skip_member(info.name):
+                    yield info.name, read_chunks(lambda info=info: archive.extractfile(info))
+
+
+def expand_archive(
+    container: IngestionResult,
+    storage: EvidenceStorage,
+    case_id: Optional[str] = None,
+    actor: str = "system",
+    max_members: int = MAX_ARCHIVE_MEMBERS,
+    max_member_bytes: int = MAX_ARCHIVE_MEMBER_BYTES,
+    max_total_bytes: int = MAX_ARCHIVE_TOTAL_BYTES
+) -> Iterator[IngestionResult]:
+    """Ingest the members of a ZIP or TAR archive without extracting it to disk.
+
+    Each member is streamed out of the stored archive into content-addressed
+    storage (hashed while written, so every byte is written once). Its result
+    file_path and custody metadata carry the member's path through the
+    archive, e.g. ``matter.zip/inbox.zip/2024/notes.txt``. Symlinks, devices,
+    hidden files and __MACOSX entries are skipped. Files that are not
+    archives (e.g. a plain .gz) yield nothing.
+
+    A member larger than ``max_member_bytes`` is not stored (it yields a
+    failed result); expansion stops after ``max_members`` members or
+    ``max_total_bytes`` in total. Either is recorded on the archive as an
+    "expand_skipped" custody event.
+
+    Args:
+        container: IngestionResult of the archive
+        storage: EvidenceStorage instance for storage operations
+        case_id: Optional case ID to associate with the members
+        actor: Actor performing the ingestion (default: system)
+        max_members: Members read from the archive at most
+        max_member_bytes: Uncompressed size of one member at most
+        max_total_bytes: Uncompressed size of all members at most
+
+    Yields:
+        IngestionResult per member (container.child_count is set when done)
+    """
+    archive_file = Path(container.storage_path)
+    if not (zipfile.is_zipfile(archive_file) or tarfile.is_tarfile(archive_file)):
+        return
+
+    extracted = 0
+    members = 0
+    total_bytes = 0
+    skipped: List[str] = []
+    stopped = None
+    try:
+        for name, chunks in _iter_archive_members(archive_file):
+            if members >= max_members:
+                stopped = f"member limit ({max_members:,}) reached"
+                break
+            members += 1
+
+            archive_path = f"{container.file_path}/{name}"
+            counted = [0]
+            member_limit = min(max_member_bytes, max_total_bytes - total_bytes)
+            what = "member size" if member_limit == max_member_bytes else "archive total size"
+            result = storage.ingest_stream(
+                _limit_chunks(chunks, member_limit, counted, what),
+                PurePosixPath(name).name,
+                case_id=case_id,
+                actor=actor,
+                parent_sha256=container.sha256,
+                source=name,
+                custody_metadata={"archive_path": archive_path}
+            )
+            result.file_path = archive_path
+            total_bytes += counted[0]
+            if not result.success and counted[0] > member_limit:
+                if what == "member size":
+                    skipped.append(name)
+                else:
+                    stopped = f"{what} limit ({max_total_bytes:,} bytes) reached at {name}"
+            extracted += result.success
+            yield result
+            if stopped:
+                break
+    except (zipfile.BadZipFile, tarfile.TarError, OSError) as e:
+        print(f"Warning: Archive {container.sha256[:12]} is damaged - stopped after {extracted} members: {e}")
+
+    if skipped or stopped:
+        reason = "; ".join(filter(None, [
+            f"{len(skipped)} members over {max_member_bytes:,} bytes not stored" if skipped else None,
+            f"expansion stopped: {stopped}" if stopped else None,
+        ]))
+        print(f"Warning: Archive {container.file_path} only partly expanded - {reason}")
+        storage._add_custody_event(container.sha256, ChainOfCustodyEvent(
+            timestamp=datetime.now(),
+            event_type="expand_skipped",
+            actor=actor,
+            description=f"Archive expansion limits reached - {reason}",
+            metadata={"archive_path": container.file_path, "skipped_members": skipped, "stopped": stopped}
+        ))
+
+    container.child_count = extracted
+    container.container_only = True  # The members are the evidence
+    storage._add_custody_event(container.sha256, ChainOfCustodyEvent(
+        timestamp=datetime.now(),
+        event_type="expand",
+        actor=actor,
+        description=f"Archive expanded into {extracted} members",
+        metadata={"case_id": case_id, "children": extracted} if case_id else {"children": extracted}
+    ))
+
+
+# Container suffix -> expander yielding the child evidence
+CONTAINER_EXPANDERS: Dict[str, Callable[..., Iterator[IngestionResult]]] = {
+    '.mbox': expand_mbox,
+    '.mbx': expand_mbox,
+    '.eml': expand_email_attachments,
+    '.msg': expand_email_attachments,
+    # Stored originals keep only the last suffix (.tar.gz -> .gz); expand_archive checks the content
+    '.zip': expand_archive,
+    '.tar': expand_archive,
+    '.tgz': expand_archive,
+    '.gz': expand_archive,
+    '.tbz2': expand_archive,
+    '.bz2': expand_archive,
+    '.txz': expand_archive,
+    '.xz': expand_archive,
+}
+
+
+def expand_evidence(
+    container: IngestionResult,
+    storage: EvidenceStorage,
+    case_id: Optional[str] = None,
+    actor: str = "system",
+    max_archive_depth: int = MAX_ARCHIVE_DEPTH,
+    _archive_depth: int = 0
+) -> Iterator[IngestionResult]:
+    """Evidence extracted from an ingested container, recursively (depth first).
+
+    Args:
+        container: IngestionResult of any ingested file (non-containers yield nothing)
+        storage: EvidenceStorage instance for storage operations
+        case_id: Optional case ID to associate with the extracted evidence
+        actor: Actor performing the ingestion (default: system)
+        max_archive_depth: Levels of nested archives expanded; deeper
+            archives are kept as evidence files (with an "expand_skipped"
+            custody event) but not opened
+
+    Yields:
+        IngestionResult per extracted item, each followed by its own children
+    """
+    expander = CONTAINER_EXPANDERS.get(Path(container.storage_path).suffix.lower())
+    if not container.success or expander is None:
+        return
+
+    child_depth = _archive_depth
+    if expander is expand_archive:
+        if _archive_depth >= max_archive_depth:
+            print(f"Warning: Not expanding {container.file_path} - archives nested more than "
+                  f"{max_archive_depth} deep")
+            storage._add_custody_event(container.sha256, ChainOfCustodyEvent(
+                timestamp=datetime.now(),
+                event_type="expand_skipped",
+                actor=actor,
+                description=f"Archive nesting limit ({max_archive_depth}) reached - not expanded",
+                metadata={"archive_path": container.file_path, "max_archive_depth": max_archive_depth}
+            ))
+            return
+        child_depth += 1
+
+    for child in expander(container, storage, case_id=case_id, actor=actor):
+        yield child
+        yield from expand_evidence(
+            child, storage, case_id=case_id, actor=actor,
+            max_archive_depth=max_archive_depth, _archive_depth=child_depth
+        )
+
+
+def _ingest_with_children(
+    file_path: Path,
+    storage: EvidenceStorage,
+    case_id: Optional[str],
+    actor: str,
+    expand_containers: bool,
+    quiet: bool,
+    max_archive_depth: int = MAX_ARCHIVE_DEPTH
+) -> List[IngestionResult]:
+    """Ingest a file and, for a container, the evidence extracted from it.
+
+    The container itself is stored too, on purpose: it is the original
+    evidence the members are verified against, and expansion reads the
+    stored copy rather than a source file that may change.
+    """
+    result = storage.ingest_file(file_path, case_id=case_id, actor=actor)
+    if not expand_containers:
+        return [result]
+
+    results = [result]
+    results.extend(expand_evidence(
+        result, storage, case_id=case_id, actor=actor, max_archive_depth=max_archive_depth
+    ))
+    if not quiet and len(results) > 1:
+        print(f"   📬 {file_path.name}: {len(results) - 1} items extracted")
+    return results
+
+
 def ingest_directory(
     directory_path: Path,
     storage: EvidenceStorage,
     case_id: Optional[str] = None,
     actor: str = "system",
-    quiet: bool = False
+    quiet: bool = False,
+    expand_containers: bool = True,
+    max_archive_depth: int = MAX_ARCHIVE_DEPTH
 ) -> List[IngestionResult]:
     """Ingest all files from a directory into evidence storage.
 
@@ -53,20 +422,21 @@ def ingest_directory(
         case_id: Optional case ID to associate with all evidence
         actor: Actor performing the ingestion (default: system)
         quiet: Suppress verbose output
+        expand_containers: Also ingest each member of ZIP/TAR archives, each
+            message of .mbox files and each email attachment as its own evidence
+        max_archive_depth: Levels of nested archives expanded
 
     Returns:
-        List of IngestionResult objects, one per file
+        List of IngestionResult objects, one per file (followed by the
+        results of any evidence extracted from it)
     """
     ingested_files = []
 
     for file_path in directory_path.rglob('*'):
         if file_path.is_file() and not file_path.name.startswith('.'):
-            result = storage.ingest_file(
-                file_path,
-                case_id=case_id,
-                actor=actor
-            )
-            ingested_files.append(result)
+            ingested_files.extend(_ingest_with_children(
+                file_path, storage, case_id, actor, expand_containers, quiet, max_archive_depth
+            ))
 
     return ingested_files
 
@@ -76,7 +446,9 @@ def ingest_path(
     storage: EvidenceStorage,
     case_id: Optional[str] = None,
     actor: str = "system",
-    quiet: bool = False
+    quiet: bool = False,
+    expand_containers: bool = True,
+    max_archive_depth: int = MAX_ARCHIVE_DEPTH
 ) -> List[IngestionResult]:
     """Ingest file(s) from path (file or directory) into evidence storage.
 
@@ -89,6 +461,9 @@ def ingest_path(
         case_id: Optional case ID to associate with evidence
         actor: Actor performing the ingestion (default: system)
         quiet: Suppress verbose output
+        expand_containers: Also ingest each member of ZIP/TAR archives, each
+            message of .mbox files and each email attachment as its own evidence
+        max_archive_depth: Levels of nested archives expanded
 
     Returns:
         List of IngestionResult objects
@@ -102,12 +477,13 @@ def ingest_path(
 
     if input_path.is_file():
         # Single file ingestion
-        result = ingest_evidence(input_path, storage, case_id, actor)
-        return [result]
+        return _ingest_with_children(
+            input_path, storage, case_id, actor, expand_containers, quiet, max_archive_depth
+        )
 
     elif input_path.is_dir():
         # Directory ingestion
-        return ingest_directory(input_path, storage, case_id, actor, quiet)
+        return ingest_directory(input_path, storage, case_id, actor, quiet, expand_containers, max_archive_depth)
 
     else:
         raise ValueError(f"Input path '{input_path}' is neither a file nor a directory")
@@ -148,6 +524,17 @@ def print_ingestion_summary(
 
 
 __all__ = [
+    'ARCHIVE_CHUNK_BYTES',
+    'MAX_ARCHIVE_DEPTH',
+    'MAX_ARCHIVE_MEMBERS',
+    'MAX_ARCHIVE_MEMBER_BYTES',
+    'MAX_ARCHIVE_TOTAL_BYTES',
+    'ArchiveLimitError',
+    'CONTAINER_EXPANDERS',
+    'expand_evidence',
+    'expand_archive',
+    'expand_mbox',
+    'expand_email_attachments',
     'ingest_evidence',
     'ingest_directory',
     'ingest_path',
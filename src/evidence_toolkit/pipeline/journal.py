@@ -0,0 +1,235 @@
+#!/usr/bin/env python3
+"""Run journal for resumable process-case runs.
+
+process-case runs four stages: ingest, analyze, summary (correlation and the
+executive summary) and package. The journal records, under storage
+runs/<run_id>/, which stages finished and the evidence each one finished, so
+``process-case --resume <run_id>`` after a failure:
+
+- skips ingestion (no re-hashing) and reuses the run's evidence list,
+- analyzes only the evidence without a saved analysis (items interrupted or
+  failed earlier in the run are retried),
+- reuses the saved case summary (no new correlation or summary AI calls) when
+  packaging failed - unless the resumed analysis saved new analyses, which
+  the summary would miss.
+
+Each run has its own directory and a lock file naming the process that owns
+it, so runs on other cases (or other runs of the same case) never share
+state, and a run cannot be resumed twice at once. A lock left by a process
+that no longer exists (crash, Ctrl+C) is taken over.
+"""
+
+import json
+import os
+import socket
+import uuid
+from datetime import datetime
+from typing import Any, Iterable, List, Optional
+
+from evidence_toolkit.core.storage import EvidenceStorage
+from evidence_toolkit.core.models import CaseSummary, ProcessRun, RunStage
+from evidence_toolkit.core.utils import ensure_directory, read_json_safe
+
+
+# process-case stages, in order
+RUN_STAGES = ("ingest", "analyze", "summary", "package")
+
+
+def _process_alive(pid: int) -> bool:
+    """Whether a process with this ID exists on this host."""
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True  # Exists, owned by another user
+    return True
+
+
+class RunJournal:
+    """Records the progress of one process-case run.
+
+    Example:
+        >>> journal = RunJournal.start(storage, "CASE-2024", case_directory)
+        >>> if not journal.is_done("ingest"):
+        ...     journal.start_stage("ingest")
+        ...     ...
+        ...     journal.complete_stage("ingest", items=sha256s)
+        >>> journal.complete()
+    """
+
+    CASE_SUMMARY_FILE = "case_summary.json"
+    LOCK_FILE = "lock"
+
+    def __init__(self, storage: EvidenceStorage, run: ProcessRun):
+        """Initialize run journal
+
+        Args:
+            storage: EvidenceStorage the journal is saved in
+            run: ProcessRun state (new or loaded)
+        """
+        self.storage = storage
+        self.run = run
+        self.run_dir = storage.get_run_dir(run.run_id)
+        self._locked = False
+
+    @classmethod
+    def start(cls, storage: EvidenceStorage, case_id: str, case_directory: Any) -> "RunJournal":
+        """Journal of a new run, with a unique run ID (locked by this process)."""
+        now = datetime.now()
+        run = ProcessRun(
+            run_id=f"{case_id}-{now:%Y%m%d-%H%M%S}-{uuid.uuid4().hex[:6]}",
+            case_id=case_id,
+            case_directory=str(case_directory),
+            created_at=now,
+            updated_at=now
+        )
+        journal = cls(storage, run)
+        journal.acquire()
+        journal.save()
+        return journal
+
+    @classmethod
+    def resume(cls, storage: EvidenceStorage, run_id: str, case_id: Optional[str] = None) -> "RunJournal":
+        """Journal of an earlier run, to continue it (locked by this process).
+
+        Raises:
+            ValueError: If the run does not exist, belongs to another case or already completed
+            RuntimeError: If another process is running it
+        """
+        run = storage.get_run(run_id)
+        if run is None:
+            raise ValueError(f"No run {run_id!r} in {storage.runs_dir}")
+        if case_id and run.case_id != case_id:
+            raise ValueError(f"Run {run_id} belongs to case {run.case_id}, not {case_id}")
+
+        journal = cls(storage, run)
+        journal.acquire()
+        journal.run = storage.get_run(run_id)  # As left by the previous owner
+        if journal.run.status == "completed":
+            journal.release()
+            raise ValueError(f"Run {run_id} already completed")
+
+        journal.run.resumed += 1
+        journal.run.status = "running"
+        journal.save()
+        return journal
+
+    @property
+    def run_id(self) -> str:
+        return self.run.run_id
+
+    def save(self) -> None:
+        """Save the journal."""
+        self.run.updated_at = datetime.now()
+        self.storage.save_run(self.run)
+
+    def acquire(self) -> None:
+        """Take the run's lock (this process now owns the run).
+
+        Raises:
+            RuntimeError: If another live process is running it
+        """
+        ensure_directory(self.run_dir)
+        lock_file = self.run_dir / self.LOCK_FILE
+        host = socket.gethostname()
+        for _ in range(2):
+            try:
+                fd = os.open(lock_file, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+            except FileExistsError:
+                owner = read_json_safe(lock_file) or {}
+                if owner.get("host") == host and not _process_alive(owner.get("pid", 0)):
+                    lock_file.unlink(missing_ok=True)  # Left by a process that died
+                    continue
+                raise RuntimeError(
+                    f"Run {self.run_id} is in progress (process {owner.get('pid', '?')} on {owner.get('host', '?')})"
+                )
+            with os.fdopen(fd, 'w') as f:
+                json.dump({"pid": os.getpid(), "host": host}, f)
+            self._locked = True
+            return
+        raise RuntimeError(f"Could not lock run {self.run_id}")
+
+    def release(self) -> None:
+        """Release the run's lock, if this process holds it."""
+        if self._locked:
+            (self.run_dir / self.LOCK_FILE).unlink(missing_ok=True)
+            self._locked = False
+
+    def is_done(self, stage: str) -> bool:
+        """Whether a stage completed (in this run or before it was resumed)."""
+        return stage in self.run.stages and self.run.stages[stage].status == "completed"
+
+    def items(self, stage: str) -> List[str]:
+        """SHA256s a stage has finished."""
+        return list(self.run.stages[stage].items) if stage in self.run.stages else []
+
+    def details(self, stage: str) -> dict:
+        """Outputs recorded by a stage."""
+        return dict(self.run.stages[stage].details) if stage in self.run.stages else {}
+
+    def start_stage(self, stage: str) -> None:
+        """Mark a stage as running (items finished by an earlier attempt are kept)."""
+        existing = self.run.stages.get(stage)
+        self.run.stages[stage] = RunStage(
+            items=existing.items if existing else [],
+            started_at=datetime.now()
+        )
+        self.save()
+
+    def record_items(self, stage: str, sha256s: Iterable[str]) -> None:
+        """Add finished evidence to a stage."""
+        record = self.run.stages[stage]
+        record.items = list(dict.fromkeys(record.items + list(sha256s)))
+        self.save()
+
+    def complete_stage(self, stage: str, items: Optional[Iterable[str]] = None, **details: Any) -> None:
+        """Mark a stage as completed, with its finished evidence and outputs."""
+        record = self.run.stages.get(stage) or RunStage(started_at=datetime.now())
+        if items is not None:
+            record.items = list(dict.fromkeys(items))
+        record.details.update(details)
+        record.status = "completed"
+        record.error = None
+        record.completed_at = datetime.now()
+        self.run.stages[stage] = record
+        self.save()
+
+    def fail(self, stage: str, error: Any) -> None:
+        """Record that a stage failed (and the run with it), releasing the lock."""
+        record = self.run.stages.get(stage) or RunStage(started_at=datetime.now())
+        record.status = "failed"
+        record.error = str(error)
+        self.run.stages[stage] = record
+        self.run.status = "failed"
+        self.save()
+        self.release()
+
+    def complete(self) -> None:
+        """Record that the run completed, releasing the lock."""
+        self.run.status = "completed"
+        self.save()
+        self.release()
+
+    def save_case_summary(self, case_summary: CaseSummary) -> None:
+        """Checkpoint the case summary, so packaging can be retried without regenerating it."""
+        (self.run_dir / self.CASE_SUMMARY_FILE).write_text(case_summary.model_dump_json(indent=2))
+
+    def load_case_summary(self) -> Optional[CaseSummary]:
+        """The checkpointed case summary, if the summary stage completed."""
+        if not self.is_done("summary"):
+            return None
+        summary_data = read_json_safe(self.run_dir / self.CASE_SUMMARY_FILE)
+        return CaseSummary(**summary_data) if summary_data else None
+
+    def invalidate_case_summary(self) -> None:
+        """Discard the checkpointed case summary (evidence was analyzed after it was generated)."""
+        if self.run.stages.pop("summary", None) is not None:
+            self.save()
+        (self.run_dir / self.CASE_SUMMARY_FILE).unlink(missing_ok=True)
+
+
+__all__ = [
+    "RUN_STAGES",
+    "RunJournal",
+]
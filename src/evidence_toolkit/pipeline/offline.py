@@ -0,0 +1,559 @@
+#!/usr/bin/env python3
+"""Offline batch analysis for non-urgent AI work.
+
+Overnight reanalysis does not need synchronous-request prices or the
+interactive rate limits. This module turns a case's pending AI requests into
+one JSONL file for the Batch API (``/v1/responses`` endpoint), submits it,
+polls until the batch finishes and then hydrates the results into storage.
+
+Hydration re-runs ``analyze_evidence`` for each item with a client that
+replays the batch result instead of calling the API, so word frequencies,
+labels, email metadata, chain of custody and ``save_analysis`` all follow
+the normal path. Usage is recorded with batch pricing.
+
+Workflow:
+    >>> job = submit_batch_job(storage, client, "CASE-001", sha256s)
+    >>> job = poll_batch_job(storage, client, job)
+    >>> results = hydrate_batch_job(storage, client, job)
+
+``LocalBatchEndpoint`` implements the subset of the Files and Batch APIs used
+here in-process, for tests and dry runs.
+"""
+
+import json
+import time
+import uuid
+from datetime import datetime
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from evidence_toolkit.core.storage import EvidenceStorage
+from evidence_toolkit.core.models import (
+    DocumentAnalysis,
+    EmailThreadAnalysis,
+    EvidenceType,
+    ImageAnalysisStructured,
+    OfflineBatchJob,
+    UnifiedAnalysis,
+)
+from evidence_toolkit.core.usage import batch_pricing
+from evidence_toolkit.core.utils import build_input_messages, build_text_format, detect_file_type
+from evidence_toolkit.pipeline.analyze import analyze_evidence, build_ai_input
+
+
+BATCH_ENDPOINT = "/v1/responses"
+COMPLETION_WINDOW = "24h"
+
+# Batch statuses after which no more results will arrive
+TERMINAL_STATUSES = {"completed", "failed", "expired", "cancelled"}
+
+# not_batched reason of emails in multi-message threads: one request per file
+# would lose the thread, so they are analyzed interactively (analyze_email_threads)
+THREADED_EMAIL_REASON = "email thread (thread analysis runs interactively)"
+
+# Response schema per analysis stage
+STAGE_SCHEMAS = {
+    "document_analysis": DocumentAnalysis,
+    "email_analysis": EmailThreadAnalysis,
+    "image_analysis": ImageAnalysisStructured,
+}
+
+
+# =============================================================================
+# REQUEST PREPARATION
+# =============================================================================
+
+def build_analysis_request(
+    storage: EvidenceStorage,
+    sha256: str,
+    model: Optional[str] = None
+) -> Tuple[Optional[Dict[str, Any]], Optional[str]]:
+    """Build the Batch API request that analyze_evidence would send for one item.
+
+    The prompt and user content match the synchronous analyzers exactly.
+
+    Args:
+        storage: EvidenceStorage instance
+        sha256: Evidence SHA256
+        model: Model override (default: the analyzer's default model)
+
+    Returns:
+        (batch request line, None) or (None, reason the item cannot be batched)
+    """
+    original_file = storage.get_original_file_path(sha256)
+    if not original_file:
+        return None, "original file not found"
+
+    try:
+        stage, prompt, content, default_model = build_ai_input(
+            original_file, EvidenceType(detect_file_type(original_file)), storage, sha256
+        )
+    except ValueError as e:
+        return None, str(e)
+
+    request = {
+        "custom_id": f"{sha256}:{stage}",
+        "method": "POST",
+        "url": BATCH_ENDPOINT,
+        "body": {
+            "model": model or default_model,
+            "input": build_input_messages(prompt, content),
+            # Same strict JSON schema that responses.parse(text_format=...) sends
+            "text": {"format": build_text_format(STAGE_SCHEMAS[stage])},
+        },
+    }
+    return request, None
+
+
+def prepare_batch_job(
+    storage: EvidenceStorage,
+    case_id: str,
+    sha256_list: List[str],
+    model: Optional[str] = None,
+    quiet: bool = False
+) -> OfflineBatchJob:
+    """Write every pending AI request for a case into a batch JSONL file.
+
+    Emails that are part of a thread (with each other or with the case's
+    other emails) are not batched: they are listed in ``not_batched`` with
+    THREADED_EMAIL_REASON, for analyze_email_threads.
+
+    Args:
+        storage: EvidenceStorage instance
+        case_id: Case identifier
+        sha256_list: Evidence to analyze
+        model: Model override for every request
+        quiet: Suppress progress output
+
+    Returns:
+        OfflineBatchJob in "prepared" state (requests.jsonl written)
+    """
+    job = OfflineBatchJob(
+        job_id=f"{case_id}-{datetime.now().strftime('%Y%m%dT%H%M%S')}-{uuid.uuid4().hex[:6]}",
+        case_id=case_id,
+        model=model,
+        created_at=datetime.now()
+    )
+
+    job_dir = storage.get_batch_job_dir(job.job_id)
+    job_dir.mkdir(parents=True, exist_ok=True)
+
+    from evidence_toolkit.pipeline.threads import build_case_threads  # threads imports this module
+
+    threaded = {
+        email_data['sha256']
+        for thread in build_case_threads(storage, sha256_list, case_id, quiet=quiet) if len(thread) > 1
+        for email_data in thread
+    }
+
+    with open(job_dir / "requests.jsonl", 'w') as f:
+        for sha256 in sha256_list:
+            if sha256 in threaded:
+                job.not_batched[sha256] = THREADED_EMAIL_REASON
+                continue
+            try:
+                request, reason = build_analysis_request(storage, sha256, model)
+            except Exception as e:
+                request, reason = None, f"request preparation failed: {e}"
+
+            if request is None:
+                job.not_batched[sha256] = reason
+                continue
+
+            f.write(json.dumps(request) + "\n")
+            job.requests[request["custom_id"]] = sha256
+
+    storage.save_batch_job(job)
+
+    if not quiet:
+        print(f"📝 Prepared {len(job.requests)} batch requests ({job_dir / 'requests.jsonl'})")
+        if job.not_batched:
+            print(f"   ⚠️  {len(job.not_batched)} items need interactive analysis")
+
+    return job
+
+
+# =============================================================================
+# SUBMIT / POLL
+# =============================================================================
+
+def submit_batch_job(
+    storage: EvidenceStorage,
+    client: Any,
+    case_id: str,
+    sha256_list: List[str],
+    model: Optional[str] = None,
+    quiet: bool = False
+) -> OfflineBatchJob:
+    """Prepare a case's requests and submit them as one batch.
+
+    Args:
+        storage: EvidenceStorage instance
+        client: OpenAI client (or LocalBatchEndpoint)
+        case_id: Case identifier
+        sha256_list: Evidence to analyze
+        model: Model override for every request
+        quiet: Suppress progress output
+
+    Returns:
+        Submitted OfflineBatchJob (saved to storage)
+    """
+    job = prepare_batch_job(storage, case_id, sha256_list, model=model, quiet=quiet)
+    if not job.requests:
+        job.status = "completed"
+        job.completed_at = datetime.now()
+        storage.save_batch_job(job)
+        return job
+
+    requests_file = storage.get_batch_job_dir(job.job_id) / "requests.jsonl"
+    with open(requests_file, 'rb') as f:
+        input_file = client.files.create(file=f, purpose="batch")
+
+    batch = client.batches.create(
+        input_file_id=input_file.id,
+        endpoint=BATCH_ENDPOINT,
+        completion_window=COMPLETION_WINDOW,
+        metadata={"case_id": case_id, "job_id": job.job_id}
+    )
+
+    job.input_file_id = input_file.id
+    job.batch_id = batch.id
+    job.status = batch.status
+    job.submitted_at = datetime.now()
+    storage.save_batch_job(job)
+
+    if not quiet:
+        print(f"📤 Submitted batch {batch.id} for case {case_id} (job: {job.job_id})")
+
+    return job
+
+
+def poll_batch_job(
+    storage: EvidenceStorage,
+    client: Any,
+    job: OfflineBatchJob,
+    poll_interval: float = 60.0,
+    timeout: Optional[float] = None,
+    quiet: bool = False,
+    sleep: Callable[[float], None] = time.sleep
+) -> OfflineBatchJob:
+    """Poll a submitted batch until it reaches a terminal status.
+
+    Args:
+        storage: EvidenceStorage instance
+        client: OpenAI client (or LocalBatchEndpoint)
+        job: Submitted OfflineBatchJob
+        poll_interval: Seconds between status checks
+        timeout: Give up (leaving the job pending) after this many seconds
+        quiet: Suppress progress output
+        sleep: Sleep function (injectable for tests)
+
+    Returns:
+        Updated OfflineBatchJob (saved to storage)
+    """
+    if job.batch_id is None or job.status in TERMINAL_STATUSES | {"hydrated"}:
+        return job
+
+    started = time.monotonic()
+    while True:
+        batch = client.batches.retrieve(job.batch_id)
+        job.status = batch.status
+        job.output_file_id = getattr(batch, "output_file_id", None)
+        job.error_file_id = getattr(batch, "error_file_id", None)
+
+        if job.status in TERMINAL_STATUSES:
+            job.completed_at = datetime.now()
+            storage.save_batch_job(job)
+            if not quiet:
+                print(f"✅ Batch {job.batch_id} {job.status}")
+            return job
+
+        storage.save_batch_job(job)
+        if timeout is not None and time.monotonic() - started >= timeout:
+            if not quiet:
+                print(f"⏳ Batch {job.batch_id} still {job.status} - collect later with job {job.job_id}")
+            return job
+
+        if not quiet:
+            counts = getattr(batch, "request_counts", None)
+            progress = f" ({counts.completed}/{counts.total})" if counts else ""
+            print(f"   ⏳ Batch {job.status}{progress}, checking again in {poll_interval:.0f}s...")
+        sleep(poll_interval)
+
+
+# =============================================================================
+# HYDRATION
+# =============================================================================
+
+class BatchResultClient:
+    """Client that answers ``responses.parse`` from one item's precomputed results.
+
+    Passed to analyze_evidence when hydrating batch (or packed-request)
+    results so the analyzers take their normal path without calling the API.
+    """
+
+    def __init__(self, results: Dict[str, Tuple[Any, Any]]):
+        """Initialize with results keyed by response schema name.
+
+        Args:
+            results: Schema class name -> (parsed result, usage)
+        """
+        self.responses = SimpleNamespace(parse=self._parse)
+        self._results = results
+
+    def _parse(self, model: str, input: Any, text_format: Any, **kwargs):
+        if text_format.__name__ not in self._results:
+            raise RuntimeError(f"No batch result for {text_format.__name__}")
+        parsed, usage = self._results[text_format.__name__]
+        return SimpleNamespace(status="completed", output_parsed=parsed, output=[], usage=usage)
+
+
+def _to_namespace(value: Any) -> Any:
+    if isinstance(value, dict):
+        return SimpleNamespace(**{k: _to_namespace(v) for k, v in value.items()})
+    return value
+
+
+def _output_text(body: Dict[str, Any]) -> str:
+    """Extract the structured JSON text from a Responses API response body."""
+    if body.get("status") not in (None, "completed"):
+        raise RuntimeError(f"response {body.get('status')}: {body.get('incomplete_details')}")
+
+    for item in body.get("output") or []:
+        if item.get("type") != "message":
+            continue
+        for content in item.get("content") or []:
+            if content.get("type") == "refusal":
+                raise RuntimeError(f"API refused: {content.get('refusal')}")
+            if content.get("type") == "output_text":
+                return content["text"]
+    raise RuntimeError("response contained no output text")
+
+
+def parse_batch_results(
+    job: OfflineBatchJob,
+    lines: List[str]
+) -> Tuple[Dict[str, Dict[str, Tuple[Any, Any]]], Dict[str, str]]:
+    """Parse batch output/error JSONL lines.
+
+    Args:
+        job: OfflineBatchJob the lines belong to
+        lines: JSONL lines from the output and error files
+
+    Returns:
+        (SHA256 -> {schema name: (parsed, usage)}, SHA256 -> error)
+    """
+    results: Dict[str, Dict[str, Tuple[Any, Any]]] = {}
+    errors: Dict[str, str] = {}
+
+    for line in lines:
+        if not line.strip():
+            continue
+        entry = json.loads(line)
+        custom_id = entry.get("custom_id", "")
+        sha256 = job.requests.get(custom_id)
+        if sha256 is None:
+            continue
+
+        stage = custom_id.rsplit(":", 1)[-1]
+        schema = STAGE_SCHEMAS[stage]
+        try:
+            response = entry.get("response") or {}
+            if entry.get("error") or response.get("status_code", 200) != 200:
+                error = entry.get("error") or response.get("body", {}).get("error") or {}
+                raise RuntimeError(error.get("message") or f"status {response.get('status_code')}")
+
+            body = response["body"]
+            parsed = schema.model_validate_json(_output_text(body))
+            results.setdefault(sha256, {})[schema.__name__] = (parsed, _to_namespace(body.get("usage")))
+        except Exception as e:
+            errors[sha256] = str(e)
+
+    return results, errors
+
+
+def hydrate_batch_job(
+    storage: EvidenceStorage,
+    client: Any,
+    job: OfflineBatchJob,
+    quiet: bool = False
+) -> Dict[str, UnifiedAnalysis]:
+    """Download a finished batch and save each result through analyze_evidence.
+
+    Items without a usable result are recorded in ``job.failed`` and keep
+    their previous analysis.
+
+    Args:
+        storage: EvidenceStorage instance
+        client: OpenAI client (or LocalBatchEndpoint)
+        job: OfflineBatchJob in a terminal status
+        quiet: Suppress progress output
+
+    Returns:
+        Dict mapping SHA256 -> saved UnifiedAnalysis
+    """
+    if job.status not in TERMINAL_STATUSES:
+        raise ValueError(f"Batch job {job.job_id} is not finished (status: {job.status})")
+
+    job_dir = storage.get_batch_job_dir(job.job_id)
+    lines: List[str] = []
+    with open(job_dir / "results.jsonl", 'w') as f:
+        for file_id in (job.output_file_id, job.error_file_id):
+            if file_id:
+                content = client.files.content(file_id).text
+                f.write(content if content.endswith("\n") or not content else content + "\n")
+                lines.extend(content.splitlines())
+
+    results, errors = parse_batch_results(job, lines)
+    job.failed.update(errors)
+
+    # Requests the batch never answered (expired/cancelled/failed)
+    for sha256 in job.requests.values():
+        if sha256 not in results and sha256 not in job.failed:
+            job.failed[sha256] = f"no result (batch {job.status})"
+
+    hydrated = {}
+    with batch_pricing():
+        for sha256, item_results in results.items():
+            try:
+                hydrated[sha256] = analyze_evidence(
+                    sha256=sha256,
+                    storage=storage,
+                    openai_client=BatchResultClient(item_results),
+                    case_id=job.case_id,
+                    evidence_type='auto',
+                    force=True,
+                    quiet=True,
+                    model=job.model
+                )
+                job.hydrated.append(sha256)
+            except Exception as e:
+                job.failed[sha256] = f"hydration failed: {e}"
+
+    job.status = "hydrated"
+    job.hydrated_at = datetime.now()
+    storage.save_batch_job(job)
+
+    if not quiet:
+        print(f"💾 Hydrated {len(hydrated)} analyses from batch {job.batch_id}")
+        for sha256, error in job.failed.items():
+            print(f"   ❌ {sha256[:12]}...: {error}")
+
+    return hydrated
+
+
+# =============================================================================
+# LOCAL STAND-IN ENDPOINT
+# =============================================================================
+
+class LocalBatchEndpoint:
+    """In-process stand-in for the Files and Batch APIs.
+
+    Implements ``files.create``, ``files.content``, ``batches.create`` and
+    ``batches.retrieve``. Each request body is answered by ``handler``, which
+    returns a Responses API response body (dict). Batches report
+    ``in_progress`` for ``polls_until_complete`` retrievals before completing.
+
+    Example:
+        >>> endpoint = LocalBatchEndpoint(lambda body: client.responses.create(**body).model_dump())
+        >>> job = submit_batch_job(storage, endpoint, "CASE-001", sha256s)
+    """
+
+    def __init__(self, handler: Callable[[Dict[str, Any]], Dict[str, Any]], polls_until_complete: int = 1):
+        self.handler = handler
+        self.polls_until_complete = polls_until_complete
+        self.stored_files: Dict[str, str] = {}
+        self.batch_records: Dict[str, SimpleNamespace] = {}
+        self.files = SimpleNamespace(create=self._create_file, content=self._file_content)
+        self.batches = SimpleNamespace(create=self._create_batch, retrieve=self._retrieve_batch)
+
+    def _create_file(self, file: Any, purpose: str, **kwargs) -> SimpleNamespace:
+        if isinstance(file, (str, Path)):
+            content = Path(file).read_bytes()
+        elif isinstance(file, tuple):
+            content = file[1]
+        else:
+            content = file.read()
+        if isinstance(content, bytes):
+            content = content.decode("utf-8")
+
+        file_id = f"file-local-{uuid.uuid4().hex[:12]}"
+        self.stored_files[file_id] = content
+        return SimpleNamespace(id=file_id, purpose=purpose, bytes=len(content))
+
+    def _file_content(self, file_id: str) -> SimpleNamespace:
+        return SimpleNamespace(text=self.stored_files[file_id])
+
+    def _create_batch(self, input_file_id: str, endpoint: str, completion_window: str, **kwargs) -> SimpleNamespace:
+        lines = [line for line in self.stored_files[input_file_id].splitlines() if line.strip()]
+        batch = SimpleNamespace(
+            id=f"batch-local-{uuid.uuid4().hex[:12]}",
+            status="validating",
+            endpoint=endpoint,
+            input_file_id=input_file_id,
+            output_file_id=None,
+            error_file_id=None,
+            request_counts=SimpleNamespace(total=len(lines), completed=0, failed=0),
+            metadata=kwargs.get("metadata"),
+            polls_remaining=self.polls_until_complete,
+        )
+        self.batch_records[batch.id] = batch
+        return batch
+
+    def _retrieve_batch(self, batch_id: str) -> SimpleNamespace:
+        batch = self.batch_records[batch_id]
+        if batch.status != "completed":
+            if batch.polls_remaining > 0:
+                batch.polls_remaining -= 1
+                batch.status = "in_progress"
+            else:
+                self._run(batch)
+        return batch
+
+    def _run(self, batch: SimpleNamespace):
+        outputs, errors = [], []
+        for line in self.stored_files[batch.input_file_id].splitlines():
+            if not line.strip():
+                continue
+            request = json.loads(line)
+            try:
+                body = self.handler(request["body"])
+                outputs.append({
+                    "id": f"batch_req_{uuid.uuid4().hex[:12]}",
+                    "custom_id": request["custom_id"],
+                    "response": {"status_code": 200, "body": body},
+                    "error": None,
+                })
+            except Exception as e:
+                errors.append({
+                    "id": f"batch_req_{uuid.uuid4().hex[:12]}",
+                    "custom_id": request["custom_id"],
+                    "response": None,
+                    "error": {"code": "handler_error", "message": str(e)},
+                })
+
+        for records, attribute in ((outputs, "output_file_id"), (errors, "error_file_id")):
+            if records:
+                file_id = f"file-local-{uuid.uuid4().hex[:12]}"
+                self.stored_files[file_id] = "".join(json.dumps(record) + "\n" for record in records)
+                setattr(batch, attribute, file_id)
+
+        batch.request_counts.completed = len(outputs)
+        batch.request_counts.failed = len(errors)
+        batch.status = "completed"
+
+
+__all__ = [
+    "BATCH_ENDPOINT",
+    "TERMINAL_STATUSES",
+    "THREADED_EMAIL_REASON",
+    "build_analysis_request",
+    "prepare_batch_job",
+    "submit_batch_job",
+    "poll_batch_job",
+    "hydrate_batch_job",
+    "parse_batch_results",
+    "BatchResultClient",
+    "LocalBatchEndpoint",
+]
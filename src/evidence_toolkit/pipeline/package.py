@@ -18,6 +18,7 @@ from datetime import datetime
 from evidence_toolkit.core.storage import EvidenceStorage
 from evidence_toolkit.pipeline.summary import SummaryGenerator, CaseSummary
 from evidence_toolkit.core.utils import get_evidence_base_dir
+from evidence_toolkit.core.usage import track_usage
 
 
 class PackageGenerator:
@@ -26,7 +27,8 @@ class PackageGenerator:
     v3.0: Renamed from ClientPackager, now uses EvidenceStorage
     """
 
-    def __init__(self, storage: EvidenceStorage, openai_client=None, case_type: str = 'generic', ai_resolve: bool = False):
+    def __init__(self, storage: EvidenceStorage, openai_client=None, case_type: str = 'generic', ai_resolve: bool = False,
+                 summary_model: Optional[str] = None):
         """Initialize package generator.
 
         Args:
@@ -34,18 +36,31 @@ class PackageGenerator:
             openai_client: Optional OpenAI client for AI summaries
             case_type: Type of case for domain-specific prompts (generic, workplace, contract)
             ai_resolve: If True, use AI to resolve ambiguous entity matches (v3.2 feature)
+            summary_model: Optional model override for executive summaries
         """
         self.storage = storage
-        self.summary_generator = SummaryGenerator(storage, openai_client, case_type=case_type, ai_resolve=ai_resolve)
+        self.summary_generator = SummaryGenerator(storage, openai_client, case_type=case_type, ai_resolve=ai_resolve,
+                                                  model=summary_model)
         self.case_type = case_type
         self.ai_resolve = ai_resolve
 
+    def generate_case_summary(self, case_id: str) -> CaseSummary:
+        """Generate the case summary (correlation + executive summary) a package is built from.
+
+        The AI calls are recorded as case-level usage.
+        """
+        with track_usage(case_id) as usage_tracker:
+            case_summary = self.summary_generator.generate_case_summary(case_id)
+        self.storage.append_case_usage(case_id, usage_tracker.records)
+        return case_summary
+
     def create_client_package(
         self,
         case_id: str,
         output_directory: Path,
         include_raw_evidence: bool = False,
-        package_format: str = "zip"
+        package_format: str = "zip",
+        case_summary: Optional[CaseSummary] = None
     ) -> Dict[str, Any]:
         """Create a comprehensive client package for a case.
 
@@ -54,6 +69,8 @@ class PackageGenerator:
             output_directory: Directory to create the package in
             include_raw_evidence: Whether to include original evidence files
             package_format: Format for package ('zip' or 'directory')
+            case_summary: Case summary generated earlier (e.g. by a run being
+                resumed); generated now when not given
 
         Returns:
             Dictionary with package creation results
@@ -72,8 +89,8 @@ class PackageGenerator:
             # Create package structure
             self._create_package_structure(package_dir)
 
-            # Generate case summary
-            case_summary = self.summary_generator.generate_case_summary(case_id)
+            if case_summary is None:
+                case_summary = self.generate_case_summary(case_id)
 
             # Create all package components
             components = self._create_package_components(case_summary, package_dir, include_raw_evidence)
@@ -598,7 +615,7 @@ This methodology is designed for professional legal evidence analysis and mainta
         Returns:
             Package metadata dictionary
         """
-        return {
+        metadata = {
             "package_info": {
                 "created": datetime.now().isoformat(),
                 "case_id": case_summary.case_id,
@@ -617,9 +634,17 @@ This methodology is designed for professional legal evidence analysis and mainta
             "file_counts": {
                 component_type: len(files)
                 for component_type, files in components.items()
-            }
+            },
+            "ai_usage": self.storage.get_case_cost_report(case_summary.case_id).model_dump(mode='json')
         }
 
+        # Record what a budget-controlled run skipped or downgraded
+        budget_report = self.storage.get_budget_report(case_summary.case_id)
+        if budget_report:
+            metadata["budget"] = budget_report.model_dump(mode='json')
+
+        return metadata
+
 
 __all__ = [
     'PackageGenerator',
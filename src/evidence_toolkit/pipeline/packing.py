@@ -0,0 +1,284 @@
+#!/usr/bin/env python3
+"""Packed analysis: several small documents per AI request.
+
+Cases often hold hundreds of one-paragraph notes and short emails. Sent one
+by one, each carries the full analysis prompt and a full round trip. This
+stage groups small items of the same kind up to a token budget, sends each
+group as one request with a list-typed response schema, and splits the
+results back out to each SHA256.
+
+Each item's result is then saved through analyze_evidence with a client that
+replays it (see pipeline.offline.BatchResultClient), so word frequencies,
+labels and save_analysis follow the normal path. The packed call's token
+usage is split across the items in proportion to their size.
+
+Items that are too large, missing from the response, or (with a cascade
+router) unclear or high-risk are returned for individual analysis.
+"""
+
+import time
+from collections import defaultdict
+from typing import Any, Dict, List, Optional, Tuple
+
+from evidence_toolkit.core.storage import EvidenceStorage
+from evidence_toolkit.core.models import (
+    DocumentAnalysis,
+    EmailThreadAnalysis,
+    EvidenceType,
+    PackedDocumentAnalysis,
+    PackedEmailAnalysis,
+    UnifiedAnalysis,
+    UsageRecord,
+)
+from evidence_toolkit.core.chunking import estimate_tokens
+from evidence_toolkit.core.routing import ModelRouter
+from evidence_toolkit.core.usage import record_usage, split_usage, track_usage
+from evidence_toolkit.core.utils import call_openai_structured, detect_file_type
+from evidence_toolkit.pipeline.analyze import analyze_evidence, build_ai_input
+from evidence_toolkit.pipeline.budget import BudgetController, BudgetDecision
+from evidence_toolkit.pipeline.offline import BatchResultClient
+
+
+# Items up to this many estimated tokens are packed
+SMALL_ITEM_TOKENS = 1500
+
+# Estimated input tokens per packed request (excluding the system prompt)
+PACK_TOKEN_BUDGET = 12000
+
+# Keep packs small enough that per-item output stays well inside the output limit
+MAX_ITEMS_PER_PACK = 12
+
+# Stage -> (single-item schema, packed schema)
+PACKABLE_STAGES = {
+    "document_analysis": (DocumentAnalysis, PackedDocumentAnalysis),
+    "email_analysis": (EmailThreadAnalysis, PackedEmailAnalysis),
+}
+
+
+def plan_packs(
+    sizes: List[Tuple[str, int]],
+    token_budget: int = PACK_TOKEN_BUDGET,
+    max_items: int = MAX_ITEMS_PER_PACK
+) -> List[List[str]]:
+    """Group items into packs, keeping input order.
+
+    Args:
+        sizes: (item id, estimated tokens) in processing order
+        token_budget: Maximum estimated tokens per pack
+        max_items: Maximum items per pack
+
+    Returns:
+        List of packs (lists of item ids)
+    """
+    packs: List[List[str]] = []
+    current: List[str] = []
+    current_tokens = 0
+
+    for item_id, tokens in sizes:
+        if current and (current_tokens + tokens > token_budget or len(current) >= max_items):
+            packs.append(current)
+            current, current_tokens = [], 0
+        current.append(item_id)
+        current_tokens += tokens
+
+    if current:
+        packs.append(current)
+    return packs
+
+
+def format_pack(contents: List[str]) -> str:
+    """Wrap each item's content in a <document id="Dn"> tag."""
+    return "\n\n".join(
+        f'<document id="D{index}">\n{content}\n</document>'
+        for index, content in enumerate(contents, 1)
+    )
+
+
+def analyze_pack(
+    client: Any,
+    stage: str,
+    system_prompt: str,
+    contents: List[str],
+    model: str,
+    verbose: bool = False
+) -> Tuple[Dict[int, Any], Optional[UsageRecord]]:
+    """Analyze several small items in one structured request.
+
+    Args:
+        client: OpenAI client
+        stage: Packable stage ("document_analysis" or "email_analysis")
+        system_prompt: The single-item analysis prompt
+        contents: User content of each item
+        model: Model name
+        verbose: Print usage for the call
+
+    Returns:
+        (item index -> single-item analysis, usage record of the packed call)
+    """
+    from evidence_toolkit.domains import legal_config
+
+    schema, packed_schema = PACKABLE_STAGES[stage]
+
+    # Isolated: the caller re-reports this usage split across the items
+    with track_usage(isolated=True) as tracker:
+        packed = call_openai_structured(
+            client,
+            model,
+            system_prompt + legal_config.PACKED_ANALYSIS_INSTRUCTIONS,
+            format_pack(contents),
+            packed_schema,
+            verbose=verbose,
+            stage=f"{stage}_packed"
+        )
+
+    results = {}
+    for item in packed.items:
+        item_id = item.evidence_id.strip()
+        if item_id.startswith("D") and item_id[1:].isdigit():
+            index = int(item_id[1:]) - 1
+            if 0 <= index < len(contents) and index not in results:
+                results[index] = schema.model_validate(item.model_dump(exclude={"evidence_id"}))
+
+    return results, tracker.records[0] if tracker.records else None
+
+
+def analyze_packed(
+    storage: EvidenceStorage,
+    sha256_list: List[str],
+    openai_client: Any,
+    case_id: Optional[str] = None,
+    quiet: bool = False,
+    model: Optional[str] = None,
+    router: Optional[ModelRouter] = None,
+    budget: Optional[BudgetController] = None,
+    token_budget: int = PACK_TOKEN_BUDGET,
+    max_item_tokens: int = SMALL_ITEM_TOKENS,
+    max_items: int = MAX_ITEMS_PER_PACK
+) -> Tuple[Dict[str, UnifiedAnalysis], List[str]]:
+    """Analyze small documents and emails in packed requests.
+
+    Args:
+        storage: EvidenceStorage instance
+        sha256_list: Evidence to analyze (any type; only small documents/emails are packed)
+        openai_client: OpenAI client
+        case_id: Optional case ID for the analyses
+        quiet: Suppress progress output
+        model: Model override (default: analyzer defaults, or the router's fast model)
+        router: Optional model cascade - items whose packed result needs
+            escalation are returned for individual (cascaded) analysis
+        budget: Optional BudgetController - consulted for each item before packing
+        token_budget: Maximum estimated input tokens per packed request
+        max_item_tokens: Largest item (estimated tokens) that is packed
+        max_items: Maximum items per packed request
+
+    Returns:
+        (SHA256 -> saved UnifiedAnalysis, SHA256s left for individual analysis)
+    """
+    remaining: List[str] = []
+    # (stage, model) -> list of (sha256, system prompt, content)
+    groups: Dict[Tuple[str, str], List[Tuple[str, str, str]]] = defaultdict(list)
+
+    for sha256 in sha256_list:
+        original_file = storage.get_original_file_path(sha256)
+        evidence_type = EvidenceType(detect_file_type(original_file)) if original_file else None
+        if evidence_type not in (EvidenceType.DOCUMENT, EvidenceType.EMAIL):
+            remaining.append(sha256)
+            continue
+
+        try:
+            stage, system_prompt, content, default_model = build_ai_input(original_file, evidence_type, storage, sha256)
+        except Exception:
+            remaining.append(sha256)
+            continue
+
+        if estimate_tokens(content) > max_item_tokens:
+            remaining.append(sha256)
+            continue
+
+        item_model = model or (router.fast_model if router else default_model)
+        if budget:
+            decision = budget.decide(
+                sha256, evidence_type, item_model,
+                file_size=original_file.stat().st_size, filename=original_file.name
+            )
+            if not decision.should_run:
+                continue
+            if decision.action == BudgetDecision.DOWNGRADE:
+                item_model = decision.model
+
+        groups[(stage, item_model)].append((sha256, system_prompt, content))
+
+    results: Dict[str, UnifiedAnalysis] = {}
+    request_count = 0
+    start_time = time.perf_counter()
+
+    for (stage, pack_model), items in groups.items():
+        by_sha256 = {sha256: (system_prompt, content) for sha256, system_prompt, content in items}
+        sizes = [(sha256, estimate_tokens(content)) for sha256, _, content in items]
+
+        for pack in plan_packs(sizes, token_budget, max_items):
+            if len(pack) == 1:
+                remaining.extend(pack)  # Nothing to share the prompt with
+                continue
+
+            contents = [by_sha256[sha256][1] for sha256 in pack]
+            request_count += 1
+            try:
+                pack_results, usage_record = analyze_pack(
+                    openai_client, stage, by_sha256[pack[0]][0], contents, pack_model, verbose=not quiet
+                )
+            except Exception as e:
+                if not quiet:
+                    print(f"   ⚠️  Packed {stage} request failed ({len(pack)} items): {e}")
+                remaining.extend(pack)
+                continue
+
+            total_tokens = sum(estimate_tokens(content) for content in contents)
+            for index, sha256 in enumerate(pack):
+                weight = estimate_tokens(contents[index]) / total_tokens
+                usage = split_usage(usage_record, weight) if usage_record else None
+
+                parsed = pack_results.get(index)
+                if parsed is None or (router and router.escalation_reasons(parsed)):
+                    # Still report this item's share so case and budget totals stay complete
+                    if usage_record:
+                        record_usage(f"{stage}_packed", pack_model, usage)
+                    remaining.append(sha256)
+                    continue
+
+                if budget:
+                    budget.mark_started(sha256)
+                try:
+                    results[sha256] = analyze_evidence(
+                        sha256=sha256,
+                        storage=storage,
+                        openai_client=BatchResultClient({type(parsed).__name__: (parsed, usage)}),
+                        case_id=case_id,
+                        evidence_type='auto',
+                        force=True,
+                        quiet=True,
+                        model=pack_model
+                    )
+                    if budget:
+                        budget.record_completed(sha256, results[sha256].evidence_type)
+                except Exception as e:
+                    if not quiet:
+                        print(f"   ⚠️  Failed to save packed result for {sha256[:8]}: {e}")
+                    remaining.append(sha256)
+
+    if not quiet and request_count:
+        print(f"   📦 Packed {len(results)} small items into {request_count} requests "
+              f"({time.perf_counter() - start_time:.1f}s)")
+
+    return results, remaining
+
+
+__all__ = [
+    "SMALL_ITEM_TOKENS",
+    "PACK_TOKEN_BUDGET",
+    "MAX_ITEMS_PER_PACK",
+    "plan_packs",
+    "format_pack",
+    "analyze_pack",
+    "analyze_packed",
+]
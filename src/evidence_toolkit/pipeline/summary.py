@@ -21,7 +21,7 @@ from evidence_toolkit.core.models import (
     CaseSummary,      # v3.1: Moved from @dataclass to Pydantic in models.py
 )
 from evidence_toolkit.analyzers.correlation import CorrelationAnalyzer
-from evidence_toolkit.core.utils import read_json_safe, call_openai_structured, get_evidence_base_dir
+from evidence_toolkit.core.utils import read_json_safe, call_openai_structured, get_evidence_base_dir, shared_analysis_id
 
 
 class ExecutiveSummaryResponse(BaseModel):
@@ -138,7 +138,10 @@ class SummaryGenerator:
     v3.0: Renamed from CaseSummaryGenerator, now uses EvidenceStorage
     """
 
-    def __init__(self, storage: EvidenceStorage, openai_client=None, case_type: str = 'generic', ai_resolve: bool = False):
+    DEFAULT_MODEL = "gpt-4o-2024-08-06"
+
+    def __init__(self, storage: EvidenceStorage, openai_client=None, case_type: str = 'generic', ai_resolve: bool = False,
+                 model: Optional[str] = None):
         """Initialize summary generator.
 
         Args:
@@ -146,6 +149,7 @@ class SummaryGenerator:
             openai_client: Optional OpenAI client for AI executive summaries
             case_type: Type of case for domain-specific prompts (generic, workplace, contract)
             ai_resolve: If True, use AI to resolve ambiguous entity matches (v3.2 feature)
+            model: OpenAI model for executive/chunk summaries (default: DEFAULT_MODEL)
         """
         self.storage = storage
         # v3.1: Pass openai_client to CorrelationAnalyzer for AI pattern detection
@@ -154,6 +158,7 @@ class SummaryGenerator:
         self.ai_enabled = openai_client is not None
         self.case_type = case_type.lower()
         self.ai_resolve = ai_resolve  # Store for correlation analysis
+        self.model = model or self.DEFAULT_MODEL
 
     def generate_case_summary(self, case_id: str) -> CaseSummary:
         """Generate a comprehensive summary for a case.
@@ -290,6 +295,7 @@ class SummaryGenerator:
             if evidence_type == 'document' and analysis.get('document_analysis'):
                 document_type = analysis['document_analysis'].get('document_type')
 
+            source = shared_analysis_id(sha256, analysis)
             evidence_summaries.append(EvidenceSummary(
                 sha256=sha256,
                 evidence_type=evidence_type,
@@ -299,7 +305,8 @@ class SummaryGenerator:
                 key_findings=key_findings,
                 legal_significance=legal_significance,
                 risk_flags=risk_flags,
-                document_type=document_type
+                document_type=document_type,
+                shared_analysis_id=source if source != sha256 else None
             ))
 
         return evidence_summaries
@@ -405,11 +412,12 @@ class SummaryGenerator:
             # Call OpenAI Responses API using standardized utility
             return call_openai_structured(
                 self.openai_client,
-                "gpt-4o-2024-08-06",
+                self.model,
                 executive_summary_prompt,
                 case_context,
                 ExecutiveSummaryResponse,
-                verbose=False
+                verbose=False,
+                stage="executive_summary"
             )
 
         except Exception as e:
@@ -501,11 +509,12 @@ Confidence: {forensic_response.confidence_overall:.2f}
             # Call OpenAI for enhancement using standardized utility
             result = call_openai_structured(
                 self.openai_client,
-                "gpt-4o-2024-08-06",
+                self.model,
                 legal_config.EXECUTIVE_SUMMARY_ENHANCER_PROMPT,
                 enhancement_context,
                 EnhancedExecutiveSummary,
-                verbose=False
+                verbose=False,
+                stage="summary_enhancement"
             )
 
             print("   ✨ Executive summary enhanced with tribunal probability & financial estimates")
@@ -578,11 +587,12 @@ Be concise but thorough. Focus on legally significant information."""
         # Call OpenAI using standardized utility
         return call_openai_structured(
             self.openai_client,
-            "gpt-4o-2024-08-06",
+            self.model,
             chunk_prompt,
             chunk_context,
             ChunkSummaryResponse,
-            verbose=False
+            verbose=False,
+            stage="chunk_summary"
         )
 
     def _build_case_context_for_ai(self, case_summary: CaseSummary) -> str:
@@ -903,10 +913,14 @@ Be concise but thorough. Focus on legally significant information."""
         confidences = [s.analysis_confidence for s in evidence_summaries if s.analysis_confidence]
         avg_confidence = sum(confidences) / len(confidences) if confidences else 0.0
 
-        # Count risk flags
+        # Count risk flags (once per AI result: thread members and near-duplicates share one)
         all_risk_flags = []
+        counted = set()
         for summary in evidence_summaries:
-            all_risk_flags.extend(summary.risk_flags)
+            source = summary.shared_analysis_id or summary.sha256
+            if source not in counted:
+                counted.add(source)
+                all_risk_flags.extend(summary.risk_flags)
 
         # Count legal significance levels
         legal_significance_counts: Dict[str, int] = {}
@@ -987,11 +1001,16 @@ Be concise but thorough. Focus on legally significant information."""
             Power dynamics summary dict or None if no email evidence
         """
         participants_data = []
+        counted = set()  # AI results already read (thread members and near-duplicates share one)
 
         # Find email analysis files and extract participant data
         # Note: Check for email_analysis presence, not evidence_type
         # (emails can be .txt files, PDFs, or image screenshots)
         for evidence in evidence_summaries:
+            source = evidence.shared_analysis_id or evidence.sha256
+            if source in counted:
+                continue
+            counted.add(source)
             evidence_dir = get_evidence_base_dir(self.storage.derived_dir, evidence.sha256)
             analysis_file = evidence_dir / "analysis.v1.json"
             if analysis_file.exists():
@@ -0,0 +1,287 @@
+#!/usr/bin/env python3
+"""Thread-level email analysis.
+
+Analyzed one file at a time, a 40-message conversation costs 40 AI calls,
+and each call sees a single message without the rest of the exchange. This
+stage threads all of a case's emails from their Message-ID, In-Reply-To and
+References headers (EmailParser.build_thread_index; only header blocks are
+read), loads the bodies of each thread that has new emails, analyzes it
+once, and saves the thread's result for every new member through
+analyze_evidence with a client that replays it (as packed requests do).
+Each member's email_metadata records its place in the thread and the
+thread_analysis_id of the result it shares, so case totals count that
+result once (core.utils.shared_analysis_id).
+
+Emails already analyzed are sent as thread context but keep their own
+analysis. Single-message threads are returned for the normal path (packing
+or individual analysis). A thread too long for one request is analyzed in
+consecutive parts of up to THREAD_TOKEN_BUDGET estimated tokens; parts
+without new emails are not sent.
+"""
+
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+from evidence_toolkit.core.storage import EvidenceStorage
+from evidence_toolkit.core.models import EvidenceType, UnifiedAnalysis
+from evidence_toolkit.core.chunking import estimate_tokens
+from evidence_toolkit.core.routing import ModelRouter
+from evidence_toolkit.core.usage import record_usage, split_usage, track_usage
+from evidence_toolkit.core.utils import detect_file_type
+from evidence_toolkit.analyzers.email import EmailAnalyzer
+from evidence_toolkit.analyzers.email_parser import EmailParser
+from evidence_toolkit.pipeline.analyze import analyze_evidence
+from evidence_toolkit.pipeline.budget import BudgetController, BudgetDecision
+from evidence_toolkit.pipeline.offline import BatchResultClient
+
+
+# Fields build_thread_index adds to each email, carried over when its body is loaded
+THREAD_FIELDS = ('sha256', 'thread_id', 'thread_position', 'thread_size', 'thread_parent', 'normalized_subject')
+
+# Estimated tokens of thread text per request (leaves room in a 128k context for the prompt and output)
+THREAD_TOKEN_BUDGET = 60_000
+
+
+def build_case_threads(
+    storage: EvidenceStorage,
+    sha256_list: List[str],
+    case_id: Optional[str] = None,
+    quiet: bool = False
+) -> List[List[Dict[str, Any]]]:
+    """Thread the case's emails together with the given ones, from their headers.
+
+    Only each email's header block is read, so threading a large case does
+    not load (or keep) message bodies; load_thread_emails parses one
+    thread's emails in full when it is analyzed.
+
+    Args:
+        storage: EvidenceStorage instance
+        sha256_list: Evidence to include (non-emails are ignored)
+        case_id: Also include every email of this case, as context
+        quiet: Suppress warnings for unparseable emails
+
+    Returns:
+        Threads of header-only email dictionaries (each with its 'sha256')
+    """
+    parser = EmailParser(verbose=False)
+    candidates = list(dict.fromkeys(list(sha256_list) + (storage.list_evidence(case_id) if case_id else [])))
+
+    emails = []
+    for sha256 in candidates:
+        original_file = storage.get_original_file_path(sha256)
+        if not original_file or detect_file_type(original_file) != EvidenceType.EMAIL.value:
+            continue
+        email_data = parser.parse_headers(original_file)
+        if not email_data:
+            if not quiet:
+                print(f"   ⚠️  Could not parse email {sha256[:8]} for threading")
+            continue
+        email_data['sha256'] = sha256
+        emails.append(email_data)
+
+    return parser.build_thread_index(emails)
+
+
+def load_thread_emails(
+    storage: EvidenceStorage,
+    thread: List[Dict[str, Any]],
+    quiet: bool = False
+) -> List[Dict[str, Any]]:
+    """Parse the emails of one thread from build_case_threads in full.
+
+    Args:
+        storage: EvidenceStorage instance
+        thread: Header-only emails of the thread
+        quiet: Suppress warnings for unparseable emails
+
+    Returns:
+        Parsed email dictionaries (bodies included) with their thread fields,
+        in thread order; emails that cannot be parsed are left out
+    """
+    parser = EmailParser(verbose=False)
+    emails = []
+    for entry in thread:
+        email_data = parser.parse_file(storage.get_original_file_path(entry['sha256']))
+        if not email_data:
+            if not quiet:
+                print(f"   ⚠️  Could not parse email {entry['sha256'][:8]} - left out of its thread")
+            continue
+        email_data.pop('html_body', None)  # Not sent
+        email_data.update({field: entry[field] for field in THREAD_FIELDS})
+        emails.append(email_data)
+    return emails
+
+
+def split_thread(
+    thread: List[Dict[str, Any]],
+    analyzer: EmailAnalyzer,
+    token_budget: int = THREAD_TOKEN_BUDGET
+) -> List[Tuple[int, List[Dict[str, Any]]]]:
+    """Split a thread into consecutive parts that each fit one request.
+
+    Each email is measured as the analyzer formats it (quoted replies
+    stripped); an email larger than the budget is a part of its own.
+
+    Args:
+        thread: Parsed emails of the thread, in thread order
+        analyzer: EmailAnalyzer that formats the request
+        token_budget: Estimated tokens of thread text per part
+
+    Returns:
+        (position of the part's first email in the thread, emails) per part
+    """
+    parts, part, part_tokens, start = [], [], 0, 0
+    for position, email_data in enumerate(thread):
+        tokens = estimate_tokens(analyzer._format_thread_for_analysis([email_data]))
+        if part and part_tokens + tokens > token_budget:
+            parts.append((start, part))
+            part, part_tokens, start = [], 0, position
+        part.append(email_data)
+        part_tokens += tokens
+    if part:
+        parts.append((start, part))
+    return parts
+
+
+def analyze_email_threads(
+    storage: EvidenceStorage,
+    sha256_list: List[str],
+    openai_client: Any,
+    case_id: Optional[str] = None,
+    quiet: bool = False,
+    model: Optional[str] = None,
+    router: Optional[ModelRouter] = None,
+    budget: Optional[BudgetController] = None,
+    token_budget: int = THREAD_TOKEN_BUDGET
+) -> Tuple[Dict[str, UnifiedAnalysis], List[str]]:
+    """Analyze emails once per reconstructed thread.
+
+    Args:
+        storage: EvidenceStorage instance
+        sha256_list: Evidence to analyze (any type; only emails in threads
+            of two or more messages are handled here)
+        openai_client: OpenAI client
+        case_id: Optional case ID - the case's other emails join the threads as context
+        quiet: Suppress progress output
+        model: Model override (default: EmailAnalyzer default, or the cascade)
+        router: Optional model cascade for the thread analyses
+        budget: Optional BudgetController - decides once per thread for all
+            of its new emails (see BudgetController.decide_together)
+        token_budget: Estimated tokens of thread text per request (longer
+            threads are analyzed in parts, see split_thread)
+
+    Returns:
+        (SHA256 -> saved UnifiedAnalysis, SHA256s left for the normal path)
+    """
+    pending = set(sha256_list)
+    handled = set()
+    results: Dict[str, UnifiedAnalysis] = {}
+    request_count = 0
+    start_time = time.perf_counter()
+
+    for thread in build_case_threads(storage, sha256_list, case_id, quiet=quiet):
+        members = [entry for entry in thread if entry['sha256'] in pending]
+        if len(thread) < 2 or not members:
+            continue
+
+        thread_model = model
+        if budget:
+            # One decision for the whole thread, shared by its new members
+            decision = budget.decide_together(
+                [(entry['sha256'], storage.get_original_file_path(entry['sha256']).name) for entry in members],
+                EvidenceType.EMAIL,
+                thread_model or (router.fast_model if router else EmailAnalyzer.DEFAULT_MODEL)
+            )
+            if not decision.should_run:
+                handled.update(entry['sha256'] for entry in members)  # Budget skips are final, as in packing
+                continue
+            if decision.action == BudgetDecision.DOWNGRADE:
+                thread_model = decision.model
+
+        # Bodies are loaded for this thread only
+        member_sha256s = {entry['sha256'] for entry in members}
+        thread = load_thread_emails(storage, thread, quiet=quiet)
+        members = [email_data for email_data in thread if email_data['sha256'] in member_sha256s]
+        if len(thread) < 2 or not members:
+            continue
+
+        # An explicit model (budget downgrade) bypasses the cascade
+        analyzer = EmailAnalyzer(
+            openai_client, verbose=False, model=thread_model, router=None if thread_model else router
+        )
+        thread_sha256s = [email_data['sha256'] for email_data in thread]
+        for start, part in split_thread(thread, analyzer, token_budget):
+            part_members = [email_data for email_data in part if email_data['sha256'] in member_sha256s]
+            if not part_members:
+                continue  # Only already-analyzed emails
+            with track_usage(isolated=True) as tracker:  # Re-reported below, split across the new members
+                result = analyzer.analyze_email_thread(part)
+            if result is None:
+                if not quiet:
+                    print(f"   ⚠️  Thread analysis failed ({len(part)} emails) - analyzing them one by one")
+                continue
+            request_count += 1
+            if start:
+                # Escalation positions are relative to the part sent; members match them by thread position
+                result = result.model_copy(update={'escalation_events': [
+                    event.model_copy(update={'email_position': event.email_position + start})
+                    for event in result.escalation_events
+                ]})
+
+            sizes = [estimate_tokens(email_data.get('new_content') or email_data.get('body') or '') + 1
+                     for email_data in part_members]
+            for email_data, size in zip(part_members, sizes):
+                sha256 = email_data['sha256']
+                weight = size / sum(sizes)
+                if budget:
+                    budget.mark_started(sha256)
+                # Earlier attempts (cascade escalation) are reported directly; the kept call is replayed
+                for record in tracker.records[:-1]:
+                    record_usage(record.stage, record.model, split_usage(record, weight))
+                usage = split_usage(tracker.records[-1], weight) if tracker.records else None
+                try:
+                    analysis = analyze_evidence(
+                        sha256=sha256,
+                        storage=storage,
+                        openai_client=BatchResultClient({type(result).__name__: (result, usage)}),
+                        case_id=case_id,
+                        evidence_type='email',
+                        force=True,
+                        quiet=True,
+                        model=analyzer.model_used
+                    )
+                except Exception as e:
+                    if not quiet:
+                        print(f"   ⚠️  Failed to save thread result for {sha256[:8]}: {e}")
+                    continue
+
+                analysis.email_metadata = dict(analysis.email_metadata or {})
+                analysis.email_metadata.update({
+                    'thread_id': email_data['thread_id'],
+                    'thread_position': email_data['thread_position'],
+                    'thread_size': email_data['thread_size'],
+                    'thread_parent': email_data['thread_parent'],
+                    'thread_members': thread_sha256s,
+                    'thread_analysis_id': f"{email_data['thread_id']}#{start}",  # Result shared by the part's members
+                })
+                storage.save_analysis(analysis)
+                if budget:
+                    budget.record_completed(sha256, analysis.evidence_type)
+                results[sha256] = analysis
+                handled.add(sha256)
+
+    if not quiet and request_count:
+        print(f"   🧵 Analyzed {len(results)} emails in {request_count} thread requests "
+              f"({len(results) - request_count} AI calls saved, {time.perf_counter() - start_time:.1f}s)")
+
+    return results, [sha256 for sha256 in sha256_list if sha256 not in handled]
+
+
+__all__ = [
+    "THREAD_FIELDS",
+    "THREAD_TOKEN_BUDGET",
+    "split_thread",
+    "build_case_threads",
+    "load_thread_emails",
+    "analyze_email_threads",
+]
@@ -0,0 +1,282 @@
+#!/usr/bin/env python3
+"""Watch-folder ingestion for case directories.
+
+Intake drops files into case folders throughout the day; re-running
+process-case re-walks (and re-hashes) the whole directory each time. The
+watcher polls a case directory instead, ingests only files that are new or
+changed since they were last ingested, and hands each batch of new evidence
+to a callback (the CLI analyzes it with the process-case stages).
+
+- Debouncing: a file is ingested once its size and modification time have
+  not changed for ``settle_seconds`` (or it was last written longer ago than
+  that), so files still being copied or downloaded are not hashed
+  half-written. Browser and office temporary files (.part, .crdownload,
+  ~$...) and hidden files are ignored.
+- Idle cost: a directory is re-listed only when its modification time
+  changes (a file was added, removed or renamed in it), so an idle poll is
+  one stat() per directory. Files waiting to settle are re-checked directly.
+  Files rewritten in place without changing their directory are picked up
+  on the next restart.
+- Restarts: what was ingested and handed to the callback is saved in
+  storage (watch/<case_id>.json), so a restarted watcher only picks up what
+  changed while it was stopped - and re-ingests a batch whose callback
+  (analysis) did not finish.
+
+Polling works on every platform and on network shares, where change
+notifications (inotify) are not delivered.
+"""
+
+import os
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+
+from evidence_toolkit.core.storage import EvidenceStorage
+from evidence_toolkit.core.models import IngestionResult, WatchedFile, WatchState
+from evidence_toolkit.pipeline.ingest import MAX_ARCHIVE_DEPTH, _ingest_with_children
+
+
+# Seconds between polls of the case directory
+DEFAULT_POLL_INTERVAL = 10.0
+
+# Seconds a file's size and modification time must stay unchanged before it is ingested
+DEFAULT_SETTLE_SECONDS = 5.0
+
+# Files still being written by browsers, download managers and office suites
+PARTIAL_SUFFIXES = ('.part', '.partial', '.crdownload', '.download', '.tmp')
+PARTIAL_PREFIXES = ('.', '~$')
+
+# (size, mtime_ns) of a file
+Signature = Tuple[int, int]
+
+
+def _is_partial(name: str) -> bool:
+    """Hidden and temporary files that are never ingested."""
+    return name.startswith(PARTIAL_PREFIXES) or name.lower().endswith(PARTIAL_SUFFIXES)
+
+
+class FolderWatcher:
+    """Finds files in a directory tree that are new or changed and have settled.
+
+    Example:
+        >>> watcher = FolderWatcher(case_directory, known=state.files)
+        >>> for file_path in watcher.poll():
+        ...     ingest(file_path)
+        ...     watcher.mark_ingested(file_path, sha256)
+    """
+
+    def __init__(
+        self,
+        directory: Path,
+        settle_seconds: float = DEFAULT_SETTLE_SECONDS,
+        known: Optional[Dict[str, WatchedFile]] = None
+    ):
+        """Initialize folder watcher
+
+        Args:
+            directory: Directory to watch (recursively)
+            settle_seconds: Seconds a file must stay unchanged before poll() returns it
+            known: Files already ingested (relative path -> WatchedFile), e.g.
+                from a saved WatchState
+        """
+        self.directory = Path(directory)
+        self.settle_seconds = settle_seconds
+        self.known: Dict[str, WatchedFile] = dict(known or {})
+        self._pending: Dict[str, Tuple[Signature, float]] = {}  # Path -> (signature, unchanged since)
+        self._listings: Dict[Path, Tuple[int, Dict[str, Signature], List[Path]]] = {}
+
+    def _list_directory(self, directory: Path) -> Tuple[Dict[str, Signature], List[Path]]:
+        """Files (relative path -> signature) and subdirectories of one directory."""
+        files, subdirectories = {}, []
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if entry.name.startswith('.'):
+                        continue
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            subdirectories.append(Path(entry.path))
+                        elif entry.is_file() and not _is_partial(entry.name):
+                            stat = entry.stat()
+                            relative_path = Path(entry.path).relative_to(self.directory).as_posix()
+                            files[relative_path] = (stat.st_size, stat.st_mtime_ns)
+                    except OSError:
+                        continue  # Removed while listing
+        except OSError as e:
+            print(f"Warning: Could not list {directory}: {e}")
+        return files, subdirectories
+
+    def scan(self) -> Dict[str, Signature]:
+        """Signature of every file, re-listing only directories that changed.
+
+        A directory modified within the settle window is re-listed even if
+        its modification time looks unchanged (coarse timestamps on FAT and
+        network file systems).
+        """
+        files: Dict[str, Signature] = {}
+        listings = {}
+        stack = [self.directory]
+        now_ns = time.time_ns()
+        while stack:
+            directory = stack.pop()
+            try:
+                mtime_ns = directory.stat().st_mtime_ns
+            except OSError:
+                continue  # Removed since its parent was listed
+            listing = self._listings.get(directory)
+            recent = now_ns - mtime_ns < (self.settle_seconds + 2) * 1e9
+            if listing is None or listing[0] != mtime_ns or recent:
+                listing = (mtime_ns, *self._list_directory(directory))
+            listings[directory] = listing
+            files.update(listing[1])
+            stack.extend(listing[2])
+        self._listings = listings
+        return files
+
+    def poll(self, now: Optional[float] = None) -> List[Path]:
+        """Files that are new or changed since ingested and have settled.
+
+        Args:
+            now: Current time.monotonic() value (for tests)
+
+        Returns:
+            Paths of the files to ingest, in path order
+        """
+        now = time.monotonic() if now is None else now
+        files = self.scan()
+
+        # Files waiting to settle may be growing inside an unchanged directory
+        for relative_path in self._pending:
+            try:
+                stat = (self.directory / relative_path).stat()
+                files[relative_path] = (stat.st_size, stat.st_mtime_ns)
+            except OSError:
+                files.pop(relative_path, None)
+
+        pending = {}
+        settled = []
+        settled_before_ns = time.time_ns() - self.settle_seconds * 1e9
+        for relative_path, signature in files.items():
+            known = self.known.get(relative_path)
+            if known and (known.size, known.mtime_ns) == signature:
+                continue
+            previous = self._pending.get(relative_path)
+            since = previous[1] if previous and previous[0] == signature else now
+            # Unchanged across polls for the settle time, or last written longer ago than that
+            if now - since >= self.settle_seconds or signature[1] <= settled_before_ns:
+                settled.append(relative_path)
+            pending[relative_path] = (signature, since)
+        self._pending = pending
+
+        return [self.directory / relative_path for relative_path in sorted(settled)]
+
+    def mark_ingested(self, file_path: Path, sha256: Optional[str]) -> None:
+        """Record a file returned by poll() as ingested (sha256 None if it failed).
+
+        A failed file is retried only once it changes.
+        """
+        relative_path = Path(file_path).relative_to(self.directory).as_posix()
+        signature, _ = self._pending.pop(relative_path)
+        self.known[relative_path] = WatchedFile(
+            size=signature[0],
+            mtime_ns=signature[1],
+            sha256=sha256 or None,
+            ingested_at=datetime.now()
+        )
+
+
+def watch_directory(
+    directory: Path,
+    storage: EvidenceStorage,
+    case_id: str,
+    on_ingested: Optional[Callable[[List[IngestionResult]], None]] = None,
+    interval: float = DEFAULT_POLL_INTERVAL,
+    settle_seconds: float = DEFAULT_SETTLE_SECONDS,
+    actor: str = "system",
+    quiet: bool = False,
+    max_polls: Optional[int] = None,
+    max_archive_depth: int = MAX_ARCHIVE_DEPTH,
+    sleep: Callable[[float], None] = time.sleep
+) -> int:
+    """Ingest new files from a case directory as they arrive.
+
+    Runs until interrupted (Ctrl+C) or for max_polls polls. Each poll's
+    settled files are ingested (containers expanded, as by ingest_path),
+    passed to on_ingested and, once it returns, recorded in the case's
+    WatchState.
+
+    Args:
+        directory: Case directory to watch
+        storage: EvidenceStorage instance
+        case_id: Case ID the evidence is ingested into
+        on_ingested: Called with the IngestionResults of each batch (e.g. to analyze them)
+        interval: Seconds between polls
+        settle_seconds: Seconds a file must stay unchanged before it is ingested
+        actor: Actor performing the ingestion (default: system)
+        quiet: Suppress progress output
+        max_polls: Stop after this many polls (default: run until interrupted)
+        max_archive_depth: Levels of nested archives expanded
+        sleep: Sleep function between polls (for tests)
+
+    Returns:
+        Number of files ingested
+    """
+    directory = Path(directory).resolve()
+    state = storage.get_watch_state(case_id)
+    if state and state.directory != str(directory):
+        if not quiet:
+            print(f"   ⚠️  Case {case_id} was watched in {state.directory} - starting fresh for {directory}")
+        state = None
+    state = state or WatchState(case_id=case_id, directory=str(directory), updated_at=datetime.now())
+
+    watcher = FolderWatcher(directory, settle_seconds=settle_seconds, known=state.files)
+    ingested_count = 0
+    polls = 0
+
+    try:
+        while max_polls is None or polls < max_polls:
+            if polls:
+                sleep(interval)
+            polls += 1
+
+            settled = watcher.poll()
+            if not settled:
+                continue
+
+            batch = []
+            for file_path in settled:
+                results = _ingest_with_children(
+                    file_path, storage, case_id, actor,
+                    expand_containers=True, quiet=quiet, max_archive_depth=max_archive_depth
+                )
+                if not results[0].success and not quiet:
+                    print(f"   ⚠️  {file_path.name}: {results[0].message}")
+                watcher.mark_ingested(file_path, results[0].sha256 if results[0].success else None)
+                batch.extend(results)
+            ingested_count += len(settled)
+
+            if not quiet:
+                print(f"📥 {datetime.now():%H:%M:%S} Ingested {len(settled)} new files "
+                      f"({sum(1 for result in batch if result.success)} evidence items)")
+            if on_ingested:
+                on_ingested(batch)
+
+            # Saved only once the batch is handled: if on_ingested fails or is
+            # interrupted, a restarted watcher picks the same files up again
+            state.files = dict(watcher.known)
+            state.updated_at = datetime.now()
+            storage.save_watch_state(state)
+    except KeyboardInterrupt:
+        if not quiet:
+            print("\n⏹️  Watch stopped")
+
+    return ingested_count
+
+
+__all__ = [
+    "DEFAULT_POLL_INTERVAL",
+    "DEFAULT_SETTLE_SECONDS",
+    "FolderWatcher",
+    "watch_directory",
+]
@@ -306,6 +306,104 @@ def mock_openai_client(mock_openai_responses):
     return MockOpenAI(mock_openai_responses)
 
 
+@pytest.fixture
+def mock_responses_client(mock_openai_responses):
+    """Create a mock client implementing the Responses API used by call_openai_structured.
+
+    responses.parse / responses.with_raw_response.parse return parsed Pydantic
+    objects built from mock_openai_responses, picked by the requested
+    text_format schema, along with deterministic token usage.
+    Every call is recorded in ``client.calls``.
+
+    Args:
+        mock_openai_responses: Mock responses fixture
+
+    Returns:
+        Mock client with a ``responses`` attribute
+    """
+    from types import SimpleNamespace
+    from evidence_toolkit.core.models import (
+        DocumentAnalysis,
+        EmailThreadAnalysis,
+        ImageAnalysisStructured,
+    )
+
+    schema_data = {
+        DocumentAnalysis: mock_openai_responses["document"],
+        EmailThreadAnalysis: mock_openai_responses["email"],
+        ImageAnalysisStructured: mock_openai_responses["image"],
+    }
+
+    class MockResponses:
+        def __init__(self, client):
+            self._client = client
+            self.with_raw_response = SimpleNamespace(parse=self._raw_parse)
+
+        def parse(self, model, input, text_format, **kwargs):
+            self._client.calls.append({"model": model, "input": input, "text_format": text_format})
+            data = self._client.overrides.get(text_format, schema_data.get(text_format))
+            return SimpleNamespace(
+                status="completed",
+                output_parsed=text_format(**data),
+                output=[],
+                usage=SimpleNamespace(
+                    input_tokens=1000,
+                    input_tokens_details=SimpleNamespace(cached_tokens=200),
+                    output_tokens=250,
+                ),
+            )
+
+        def _raw_parse(self, **kwargs):
+            response = self.parse(**kwargs)
+            return SimpleNamespace(parse=lambda: response, retries_taken=self._client.retries_taken)
+
+    class MockResponsesClient:
+        def __init__(self):
+            self.calls = []
+            self.overrides = {}
+            self.retries_taken = 0
+            self.responses = MockResponses(self)
+
+    return MockResponsesClient()
+
+
+@pytest.fixture
+def mock_async_responses_client(mock_responses_client):
+    """Create an async mock client for the Responses API (ImageAnalyzer async paths).
+
+    ``await responses.with_raw_response.parse(...)`` sleeps for ``latency``
+    seconds, then answers like mock_responses_client (sharing its ``calls``).
+    The largest number of concurrent requests is kept in ``max_in_flight``.
+
+    Args:
+        mock_responses_client: Sync mock client fixture
+
+    Returns:
+        Mock client with an async ``responses`` attribute
+    """
+    import asyncio
+    from types import SimpleNamespace
+
+    class MockAsyncResponsesClient:
+        def __init__(self):
+            self.calls = mock_responses_client.calls
+            self.latency = 0.0
+            self.in_flight = 0
+            self.max_in_flight = 0
+            self.responses = SimpleNamespace(with_raw_response=SimpleNamespace(parse=self._raw_parse))
+
+        async def _raw_parse(self, **kwargs):
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+            try:
+                await asyncio.sleep(self.latency)
+            finally:
+                self.in_flight -= 1
+            return mock_responses_client.responses.with_raw_response.parse(**kwargs)
+
+    return MockAsyncResponsesClient()
+
+
 # Test utilities
 def create_test_file_metadata(filename: str, sha256: str) -> FileMetadata:
     """Create test FileMetadata instance.
@@ -344,3 +442,98 @@ def create_test_custody_event(event_type: str = "ingest") -> ChainOfCustodyEvent
         description=f"Test {event_type} event",
         metadata={"test": True}
     )
+
+
+def create_text_pdf(path: Path, pages: list) -> Path:
+    """Write a minimal PDF with a Helvetica text layer (one string list per page).
+
+    Args:
+        path: Output path
+        pages: One list of text lines per page (an empty list gives a blank
+            page, None a scanned page - a full-page image with no text)
+
+    Returns:
+        Path to the PDF
+    """
+    def escape(line: str) -> str:
+        return line.replace("\\", "\\\\").replace("(", "\\(").replace(")", "\\)")
+
+    page_ids = [4 + 2 * i for i in range(len(pages))]
+    image_id = 4 + 2 * len(pages)
+    objects = {
+        1: "<< /Type /Catalog /Pages 2 0 R >>",
+        2: f"<< /Type /Pages /Kids [{' '.join(f'{i} 0 R' for i in page_ids)}] /Count {len(pages)} >>",
+        3: "<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>",
+        image_id: ("<< /Type /XObject /Subtype /Image /Width 1 /Height 1 /ColorSpace /DeviceGray "
+                   "/BitsPerComponent 8 /Length 1 >>\nstream\n\x80\nendstream"),
+    }
+    for page_id, lines in zip(page_ids, pages):
+        if lines is None:
+            stream = "q 612 0 0 792 0 0 cm /Im1 Do Q"
+        else:
+            stream = "BT /F1 11 Tf 14 TL 72 760 Td " + " ".join(f"({escape(line)}) '" for line in lines) + " ET"
+        objects[page_id] = ("<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] "
+                            f"/Resources << /Font << /F1 3 0 R >> /XObject << /Im1 {image_id} 0 R >> >> "
+                            f"/Contents {page_id + 1} 0 R >>")
+        objects[page_id + 1] = f"<< /Length {len(stream)} >>\nstream\n{stream}\nendstream"
+
+    output = bytearray(b"%PDF-1.4\n")
+    offsets = {}
+    for object_id in sorted(objects):
+        offsets[object_id] = len(output)
+        output += f"{object_id} 0 obj\n{objects[object_id]}\nendobj\n".encode("latin-1")
+    xref = len(output)
+    output += f"xref\n0 {len(objects) + 1}\n0000000000 65535 f \n".encode("latin-1")
+    output += "".join(f"{offsets[i]:010d} 00000 n \n" for i in sorted(objects)).encode("latin-1")
+    output += f"trailer\n<< /Size {len(objects) + 1} /Root 1 0 R >>\nstartxref\n{xref}\n%%EOF\n".encode("latin-1")
+
+    path.write_bytes(bytes(output))
+    return path
+
+
+def create_chat_screenshot(seed: int):
+    """Draw a messenger-style screenshot: same layout, different bubbles per seed.
+
+    Args:
+        seed: Random seed for the message bubbles
+
+    Returns:
+        375x667 PIL image
+    """
+    import random
+    from PIL import Image, ImageDraw
+
+    rng = random.Random(seed)
+    image = Image.new("RGB", (375, 667), (236, 229, 221))
+    draw = ImageDraw.Draw(image)
+    draw.rectangle((0, 0, 375, 60), fill=(7, 94, 84))
+    y = 80
+    while y < 590:
+        height, left = rng.randint(30, 80), rng.random() < 0.5
+        x0 = 15 if left else rng.randint(100, 170)
+        draw.rectangle((x0, y, x0 + rng.randint(120, 190), y + height),
+                       fill=(255, 255, 255) if left else (220, 248, 198))
+        y += height + 10
+    return image
+
+
+# Email body shared by the near-duplicate tests (long enough for MinHash)
+NEAR_DUPLICATE_BODY = """Hi Sarah,
+
+Following up on the grievance meeting on 12 March. I raised the rota changes
+that were made after my complaint about the night shift supervisor, and I was
+told that the decision had already been taken by the regional manager. I asked
+for the minutes of the meeting and for the policy the decision was based on,
+but nobody has sent either of them to me yet. Please treat this email as a
+formal request for both documents before the appeal deadline on 30 March.
+
+I would also like to note that the new rota was published two days after I
+submitted my complaint, and that I am the only person on the team whose shifts
+were moved from days to nights. When I raised this with the supervisor he told
+me that the changes were final and that I should take it up with HR if I was
+unhappy. I have kept copies of the old and new rotas and of my original
+complaint, and I can provide them if they are needed for the appeal.
+
+Regards,
+John
+"""
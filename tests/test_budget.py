@@ -0,0 +1,85 @@
+"""Tests for the budget controller (pipeline/budget.py)."""
+
+import pytest
+
+from evidence_toolkit.core.models import EvidenceType
+
+
+def _spend(usd_per_million_output: float, model: str = "gpt-4o-mini"):
+    """Report one AI call costing roughly ``usd_per_million_output`` dollars."""
+    from types import SimpleNamespace
+    from evidence_toolkit.core.usage import MODEL_PRICING, record_usage
+
+    output_price = MODEL_PRICING[model][2]
+    usage = SimpleNamespace(input_tokens=0, output_tokens=int(usd_per_million_output / output_price * 1_000_000))
+    record_usage("document_analysis", model, usage)
+
+
+def test_parse_duration():
+    """Test deadline parsing for --deadline."""
+    from evidence_toolkit.pipeline.budget import parse_duration
+
+    assert parse_duration("90") == 90
+    assert parse_duration("90s") == 90
+    assert parse_duration("45m") == 45 * 60
+    assert parse_duration("2h") == 7200
+
+    for bad in ("", "soon", "-5m", "0"):
+        with pytest.raises(ValueError):
+            parse_duration(bad)
+
+
+def test_budget_downgrades_and_skips_past_soft_limit():
+    """Test that spend past the soft limit downgrades models and drops small images."""
+    from evidence_toolkit.pipeline.budget import BudgetController, BudgetDecision
+
+    budget = BudgetController("CASE-BUDGET", max_cost=1.0, soft_limit=0.5)
+
+    with budget.tracking():
+        for sha256 in ("a" * 64, "d" * 64):
+            decision = budget.decide(sha256, EvidenceType.DOCUMENT, "gpt-4o-mini")
+            assert decision.action == BudgetDecision.RUN
+            _spend(0.3)
+            budget.record_completed(sha256, EvidenceType.DOCUMENT)
+
+        # 60% spent: large items are downgraded, small images skipped
+        decision = budget.decide("b" * 64, EvidenceType.IMAGE, "gpt-4o", file_size=500_000, filename="scan.jpg")
+        assert decision.action == BudgetDecision.DOWNGRADE
+        assert decision.model == "gpt-4o-mini"
+
+        decision = budget.decide("c" * 64, EvidenceType.IMAGE, "gpt-4o", file_size=2_000, filename="logo.png")
+        assert not decision.should_run
+
+    # Spend outside the tracking block is not counted
+    _spend(5.0)
+    assert budget.spent == pytest.approx(0.6, rel=0.01)
+
+    report = budget.report()
+    assert report.items_run == 2
+    assert [a.filename for a in report.downgraded] == ["scan.jpg"]
+    assert [a.filename for a in report.skipped] == ["logo.png"]
+    assert "low-value image" in report.skipped[0].reason
+
+
+def test_budget_hard_stop_and_report_persistence(tmp_storage):
+    """Test that reaching the limit stops AI work and the report is persisted."""
+    from evidence_toolkit.pipeline.budget import BudgetController
+
+    budget = BudgetController("CASE-BUDGET", max_cost=0.5)
+
+    with budget.tracking():
+        assert budget.decide("a" * 64, EvidenceType.EMAIL, "gpt-4o-mini").should_run
+        _spend(0.6)
+        budget.record_completed("a" * 64, EvidenceType.EMAIL)
+
+        decision = budget.decide("b" * 64, EvidenceType.DOCUMENT, "gpt-4o-mini", filename="contract.pdf")
+        assert not decision.should_run
+        assert budget.downgrade_model("gpt-4o-2024-08-06") is None
+
+    assert "cost limit reached" in budget.stopped_reason
+
+    tmp_storage.save_budget_report(budget.report())
+    reloaded = tmp_storage.get_budget_report("CASE-BUDGET")
+    assert reloaded.max_cost_usd == 0.5
+    assert reloaded.skipped[0].filename == "contract.pdf"
+    assert tmp_storage.get_budget_report("NO-SUCH-CASE") is None
@@ -0,0 +1,104 @@
+"""Tests for chunked analysis of long documents (core/chunking.py and the
+DocumentAnalyzer page stream)."""
+
+import pytest
+
+
+def test_split_into_chunks_prefers_page_boundaries():
+    """Test that chunks stay under budget, follow page breaks and cover the whole text."""
+    from evidence_toolkit.core.chunking import PAGE_BREAK, estimate_tokens, split_into_chunks
+
+    pages = [f"Page {n} heading\n\n" + ("word " * 60 + "\n") * 3 for n in range(1, 6)]
+    text = PAGE_BREAK.join(pages)
+
+    chunks = split_into_chunks(text, max_tokens=500)
+
+    assert "".join(chunk.text for chunk in chunks) == text
+    assert all(estimate_tokens(chunk.text) <= 500 for chunk in chunks)
+    assert [(c.page_start, c.page_end) for c in chunks] == [(1, 2), (3, 4), (5, 5)]
+    assert all(chunk.text.startswith("Page") for chunk in chunks)
+
+    # A single oversized page is cut on paragraph boundaries, never lost
+    long_page = "\n\n".join("sentence " * 100 for _ in range(6))
+    parts = split_into_chunks(long_page, max_tokens=300)
+    assert len(parts) > 1 and "".join(p.text for p in parts) == long_page
+    assert all(p.page_start == p.page_end == 1 for p in parts)
+
+
+def test_merge_chunk_analyses_is_deterministic(mock_openai_responses):
+    """Test entity de-duplication, flag union and severity rules when merging chunks."""
+    from evidence_toolkit.core.chunking import merge_chunk_analyses, split_into_chunks
+    from evidence_toolkit.core.models import DocumentAnalysis
+
+    base = mock_openai_responses["document"]
+    first = DocumentAnalysis(**dict(
+        base, sentiment="professional", legal_significance="medium", risk_flags=["deadline"],
+        confidence_overall=0.9,
+        entities=[
+            {"name": "John Smith", "type": "person", "confidence": 0.7, "context": "p1"},
+            {"name": "January 30, 2024", "type": "date", "confidence": 0.9, "context": "p1"},
+        ],
+    ))
+    second = DocumentAnalysis(**dict(
+        base, sentiment="hostile", legal_significance="high", risk_flags=["retaliation_indicators", "deadline"],
+        confidence_overall=0.5,
+        entities=[
+            {"name": "john  smith", "type": "person", "confidence": 0.95, "context": "p2"},
+            {"name": "Acme Ltd", "type": "organization", "confidence": 0.8, "context": "p2"},
+        ],
+    ))
+    chunks = split_into_chunks("a" * 400 + "\f" + "b" * 400, max_tokens=110)
+    assert len(chunks) == 2
+
+    merged = merge_chunk_analyses([first, second], chunks)
+
+    assert [(e.name, e.context) for e in merged.entities] == [
+        ("john  smith", "p2"), ("January 30, 2024", "p1"), ("Acme Ltd", "p2")
+    ]
+    assert merged.risk_flags == ["deadline", "retaliation_indicators"]
+    assert merged.legal_significance == "high"
+    assert merged.sentiment == "hostile"
+    assert merged.confidence_overall == pytest.approx(0.7, abs=0.01)
+    assert merged.summary.startswith("[Part 1/2, page 1]")
+    assert merge_chunk_analyses([first, second], chunks) == merged
+
+
+def test_iter_chunks_pulls_pages_lazily():
+    """Test that streamed chunking matches split_into_chunks and reads pages on demand."""
+    from evidence_toolkit.core.chunking import PAGE_BREAK, iter_chunks, split_into_chunks
+
+    pages = [f"Page {n}\n\n" + "word " * 150 for n in range(1, 21)]
+    pulled = []
+
+    def page_source():
+        for page in pages:
+            pulled.append(page)
+            yield page
+
+    chunks = iter_chunks(page_source(), max_tokens=400)
+    first = next(chunks)
+    assert len(pulled) == 4  # Two pages per chunk, the page that overflows it, one lookahead
+    assert [first] + list(chunks) == split_into_chunks(PAGE_BREAK.join(pages), max_tokens=400)
+
+
+def test_streamed_pages_match_joined_text(tmp_path, mock_responses_client):
+    """Test that page-by-page word counts and chunked AI analysis need no joined text."""
+    from evidence_toolkit.analyzers.document import DocumentAnalyzer
+
+    for name in ("a.txt", "b.txt"):
+        (tmp_path / name).write_text(
+            "Grievance hearing notes for HR.\n" * 40 + "Contact hr-team@example.org today.\n", encoding="utf-8"
+        )
+
+    analyzer = DocumentAnalyzer(verbose=False, openai_client=mock_responses_client, chunk_tokens=300)
+    analyzer._stop_words = {"for"}  # Skip NLTK data
+    analyzer.TEXT_BLOCK_CHARS = 100  # Many blocks per file
+
+    text, file_count = analyzer.process_files(tmp_path, "*.txt")
+    pages = [page for _, page in analyzer.iter_pages(tmp_path, "*.txt")]
+    assert file_count == 2 and len(pages) > 2
+    assert list(analyzer.generate_word_frequency(pages).items()) == list(analyzer.generate_word_frequency(text).items())
+
+    result = analyzer.analyze_pages_with_ai(iter(pages))
+    assert result is not None and result.summary.startswith("[Part 1/")
+    assert len(mock_responses_client.calls) > 1
@@ -0,0 +1,83 @@
+"""Tests for bounded concurrent AI requests (core/concurrency.py and the
+ImageAnalyzer batch and scanned-PDF paths)."""
+
+
+def test_image_batch_runs_as_bounded_queue(tmp_dir, mock_responses_client, mock_async_responses_client):
+    """Test that batches pull work lazily and keep at most max_concurrent images in flight."""
+    import asyncio
+    from PIL import Image
+    from evidence_toolkit.analyzers.image import ImageAnalyzer
+    from evidence_toolkit.core.concurrency import gather_bounded
+
+    pulled, running, peak = [], [0], [0]
+
+    def items():
+        for i in range(20):
+            pulled.append(i)
+            yield i
+
+    async def work(i):
+        running[0] += 1
+        peak[0] = max(peak[0], running[0])
+        # The producer may only run ahead by one queue of max_concurrent items
+        assert len(pulled) <= i + 2 * 3
+        await asyncio.sleep(0.001 * (i % 4))
+        running[0] -= 1
+        return i * i
+
+    assert asyncio.run(gather_bounded(items(), work, 3)) == [i * i for i in range(20)]
+    assert peak[0] == 3
+
+    paths = []
+    for i in range(8):
+        Image.new("RGB", (64, 64), (i * 30, 0, 0)).save(tmp_dir / f"photo{i}.png")
+        paths.append(tmp_dir / f"photo{i}.png")
+    mock_async_responses_client.latency = 0.01
+    analyzer = ImageAnalyzer(verbose=False, client=mock_responses_client, async_client=mock_async_responses_client)
+
+    results = asyncio.run(analyzer.analyze_images_batch(paths, max_concurrent=3, quiet=True))
+
+    assert len(results) == 8 and all(result.analysis_confidence == 0.95 for result in results)
+    assert mock_async_responses_client.max_in_flight == 3
+
+
+def test_scanned_pdf_pages_stream_with_bounded_concurrency(
+    tmp_dir, monkeypatch, mock_responses_client, mock_async_responses_client
+):
+    """Test that scanned pages are rendered one at a time and analyzed concurrently, in page order."""
+    import threading
+    import time
+    from PIL import Image
+    from tests.conftest import create_text_pdf
+    from evidence_toolkit.analyzers.image import ImageAnalyzer
+
+    pdf_path = create_text_pdf(tmp_dir / "scan.pdf", [None] * 12)
+    page_image = Image.new("RGB", (850, 1100), "white")
+    rendering = {"now": 0, "max": 0, "pages": []}
+    lock = threading.Lock()
+
+    def render_pdf_page(self, path, page_number):
+        with lock:
+            rendering["now"] += 1
+            rendering["max"] = max(rendering["max"], rendering["now"])
+            rendering["pages"].append(page_number)
+        time.sleep(0.01)  # Poppler stand-in (not installed in CI)
+        with lock:
+            rendering["now"] -= 1
+        return self.image_preparer.prepare_image(page_image)
+
+    monkeypatch.setattr(ImageAnalyzer, "render_pdf_page", render_pdf_page)
+    mock_async_responses_client.latency = 0.05
+
+    analyzer = ImageAnalyzer(
+        verbose=False, client=mock_responses_client, async_client=mock_async_responses_client
+    )
+    result = analyzer.analyze_pdf(pdf_path, max_concurrent=4)
+
+    assert sorted(rendering["pages"]) == list(range(1, 13))  # Each page rasterized once
+    assert rendering["max"] <= 4  # Never more pages in memory than requests in flight
+    assert mock_async_responses_client.max_in_flight == 4
+    assert len(mock_async_responses_client.calls) == 12
+    assert result.openai_response["vision_pages"] == 12
+    assert analyzer.unread_pages == list(range(1, 13)) and analyzer.ocr_pages == []  # Mock vision reads no text
+    assert len(analyzer.page_texts) == 12
@@ -0,0 +1,113 @@
+"""Tests for email body cleaning and threading (analyzers/email_parser.py)."""
+
+
+def test_strip_quoted_content_keeps_new_text_and_audit_ranges():
+    """Test that quoted copies, signatures and disclaimers are stripped with their offsets kept."""
+    from evidence_toolkit.analyzers.email_parser import EmailParser
+
+    parser = EmailParser(verbose=False)
+    reply = (
+        "I will send both documents today.\n\n"
+        "-- \nSarah Johnson\nHR Business Partner\n\n"
+        "On Mon, 15 Jan 2024 at 14:30, John Smith <john.smith@company.com>\nwrote:\n"
+        "> Please send the minutes of the meeting.\n> Regards, John\n"
+    )
+    result = parser.strip_quoted_content(reply)
+    assert result["new_content"] == "I will send both documents today."
+    assert [r["kind"] for r in result["stripped_ranges"]] == ["signature", "quoted_reply"]
+    quoted = result["stripped_ranges"][1]
+    assert reply[quoted["start"]:quoted["end"]].startswith("On Mon, 15 Jan 2024")
+    assert quoted["end"] == len(reply)
+
+    outlook = (
+        "Approved.\n\nThis email and any attachments are confidential and intended solely for the addressee.\n"
+        "________________________________\nFrom: John Smith\nSent: 15 January 2024 14:30\nSubject: Leave\n\nCan I take Friday off?\n"
+    )
+    result = parser.strip_quoted_content(outlook)
+    assert result["new_content"] == "Approved."
+    assert [r["kind"] for r in result["stripped_ranges"]] == ["disclaimer", "quoted_reply"]
+
+    # Inline answers survive; only the quoted lines and the header go
+    inline = "On Monday, John wrote:\n> Did you get the rota?\nYes, on Tuesday.\n> And the minutes?\nNot yet.\n"
+    assert parser.strip_quoted_content(inline)["new_content"] == "Yes, on Tuesday.\nNot yet."
+
+    # A forward is the substance of the message; a body that is all quote is kept whole
+    forward = "FYI\n\n---------- Forwarded message ---------\nFrom: John Smith\nDate: Mon, 15 Jan 2024\n\nPlease send the minutes.\n"
+    assert parser.strip_quoted_content(forward) == {"new_content": forward.strip(), "stripped_ranges": []}
+    assert parser.strip_quoted_content("> only quoted\n")["new_content"] == "> only quoted"
+
+
+def test_strip_quoted_content_keeps_substantive_text():
+    """Test that message text resembling a disclaimer or an attribution is not stripped."""
+    from evidence_toolkit.analyzers.email_parser import EmailParser
+
+    parser = EmailParser(verbose=False)
+    unchanged = [
+        # "intended to" is not a confidentiality notice
+        "Hi John,\n\nThis email is intended to confirm that your employment is terminated "
+        "with effect from 31 January.\n\nRegards,\nSarah\n",
+        # A notice followed by more message text is not the trailing disclaimer
+        "This message is intended solely for the named recipient, so do not forward it.\n\n"
+        "The disciplinary hearing is on Friday at 10am.\n",
+        # "wrote:" in the body, with no date or address and no quoted lines after it
+        "On Monday the manager said my contract would not be renewed. He wrote:\n"
+        "Your role is at risk and you should start looking elsewhere.\n\nI have kept the note.\n",
+    ]
+    for body in unchanged:
+        assert parser.strip_quoted_content(body) == {"new_content": body.strip(), "stripped_ranges": []}
+
+    notice = (
+        "See attached.\n\nCONFIDENTIALITY NOTICE\n\n"
+        "This e-mail is intended only for the addressee and may contain privileged information.\n\n"
+        "If you have received this email in error, please notify the sender immediately.\n"
+    )
+    result = parser.strip_quoted_content(notice)
+    assert result["new_content"] == "See attached."
+    assert [r["kind"] for r in result["stripped_ranges"]] == ["disclaimer"]
+    assert notice[result["stripped_ranges"][0]["start"]:].startswith("CONFIDENTIALITY NOTICE")
+
+
+def _headers(message_id, subject, date, in_reply_to=None, references=None):
+    return {"headers": {"message_id": message_id, "subject": subject, "parsed_date": date,
+                        "in_reply_to": in_reply_to, "references": references}}
+
+
+def test_build_thread_index_follows_references():
+    """Test that threads follow References through missing messages and merge header-less replies by subject."""
+    from evidence_toolkit.analyzers.email_parser import EmailParser
+
+    emails = [
+        _headers("<c@x>", "Re: Rota", "2024-01-03", in_reply_to="<b@x>", references="<a@x> <b@x>"),
+        _headers("<a@x>", "Rota", "2024-01-01"),
+        _headers("<d@x>", "Lunch", "2024-01-02"),
+        _headers("<e@x>", "RE: Re: Rota", "2024-01-04"),  # Client dropped the reply headers
+        _headers("<g@x>", "Re: Budget", "2024-01-06", in_reply_to="<f@x>", references="<missing@x> <f@x>"),
+        _headers("<f@x>", "Budget", "2024-01-05", in_reply_to="<missing@x>"),
+        _headers("<h@x>", "Re: Loop", "2024-01-07", references="<i@x>"),
+        _headers("<i@x>", "Re: Loop", "2024-01-08", references="<h@x>"),
+    ]
+    threads = EmailParser(verbose=False).build_thread_index(emails)
+
+    ids = [[email["headers"]["message_id"] for email in thread] for thread in threads]
+    assert ids == [["<a@x>", "<c@x>", "<e@x>"], ["<d@x>"], ["<f@x>", "<g@x>"], ["<h@x>", "<i@x>"]]
+    rota = threads[0]
+    assert [email["thread_position"] for email in rota] == [0, 1, 2]
+    assert {email["thread_id"] for email in rota} == {"a@x"} and rota[0]["thread_size"] == 3
+    assert rota[1]["thread_parent"] == "a@x"  # <b@x> is missing; its parent stands in
+    assert threads[2][1]["thread_parent"] == "f@x"
+
+
+def test_build_thread_index_keeps_unrelated_same_subject_emails_apart():
+    """Test that emails sharing a generic subject are only merged with replies, not with each other."""
+    from evidence_toolkit.analyzers.email_parser import EmailParser
+
+    emails = [
+        _headers("<a@x>", "Update", "2024-01-01"),
+        _headers("<b@x>", "Update", "2024-02-01"),
+        _headers("<c@x>", "Re: Update", "2024-01-02"),  # Reply whose client dropped the reply headers
+    ]
+    threads = EmailParser(verbose=False).build_thread_index(emails)
+
+    ids = [[email["headers"]["message_id"] for email in thread] for thread in threads]
+    assert ids == [["<a@x>", "<c@x>"], ["<b@x>"]]
+    assert threads[1][0]["thread_size"] == 1 and threads[1][0]["thread_id"] == "b@x"
@@ -0,0 +1,43 @@
+"""Tests for preparing images for vision upload (core/imaging.py)."""
+
+
+def test_image_preparation_orients_downscales_and_caches(tmp_dir, mock_responses_client):
+    """Test that photos are rotated, fitted to the model's resolution, labelled and cached per settings."""
+    from io import BytesIO
+    from PIL import Image
+    from evidence_toolkit.analyzers.image import ImageAnalyzer
+    from evidence_toolkit.core.imaging import ImagePreparer
+
+    # 2400x1800 sensor image stored sideways (EXIF orientation 6 = rotate 90° clockwise)
+    photo = Image.effect_noise((2400, 1800), 60).convert("RGB")
+    exif = Image.Exif()
+    exif[0x0112] = 6
+    photo_path = tmp_dir / "phone.jpg"
+    photo.save(photo_path, "JPEG", quality=95, exif=exif)
+
+    prepared = ImagePreparer().prepare_file(photo_path)
+    assert prepared.stats.rotated and prepared.stats.transcoded
+    assert (prepared.stats.width, prepared.stats.height) == (768, 1024)  # Portrait, 768px short side
+    assert Image.open(BytesIO(prepared.data)).size == (768, 1024)
+    assert prepared.stats.bytes_saved > 0 and prepared.mime_type == "image/jpeg"
+
+    low = ImagePreparer(detail="low", format="webp").prepare_file(photo_path)
+    assert max(low.stats.width, low.stats.height) == 512 and low.mime_type == "image/webp"
+
+    # Small PNGs go through unchanged, with their real MIME type
+    screenshot_path = tmp_dir / "screenshot.png"
+    Image.new("RGBA", (300, 200), (255, 0, 0, 128)).save(screenshot_path)
+    passthrough = ImagePreparer().prepare_file(screenshot_path)
+    assert passthrough.data == screenshot_path.read_bytes() and passthrough.mime_type == "image/png"
+
+    # Cached per sha256 and settings
+    preparer = ImagePreparer(cache_dir=tmp_dir / "derived")
+    first, second = preparer.prepare_file(photo_path), preparer.prepare_file(photo_path)
+    assert not first.stats.cache_hit and second.stats.cache_hit and second.data == first.data
+    assert not ImagePreparer(detail="low", cache_dir=tmp_dir / "derived").prepare_file(photo_path).stats.cache_hit
+
+    analyzer = ImageAnalyzer(verbose=False, client=mock_responses_client, image_preparer=ImagePreparer(detail="high"))
+    result = analyzer.analyze_image(photo_path)
+    image_content = mock_responses_client.calls[-1]["input"][1]["content"][0]
+    assert image_content["image_url"].startswith("data:image/jpeg;base64,") and image_content["detail"] == "high"
+    assert result.openai_response["image_preparation"]["prepared_bytes"] < photo_path.stat().st_size
@@ -0,0 +1,10 @@
+"""Tests for packing small items into shared requests (pipeline/packing.py)."""
+
+
+def test_plan_packs_respects_token_and_item_limits():
+    """Test greedy packing keeps order and both limits."""
+    from evidence_toolkit.pipeline.packing import plan_packs
+
+    sizes = [("a", 400), ("b", 400), ("c", 400), ("d", 100), ("e", 100), ("f", 100)]
+    assert plan_packs(sizes, token_budget=1000, max_items=10) == [["a", "b"], ["c", "d", "e", "f"]]
+    assert plan_packs(sizes, token_budget=10_000, max_items=4) == [["a", "b", "c", "d"], ["e", "f"]]
@@ -0,0 +1,21 @@
+"""Tests for PDF page text extraction (core/pdf.py)."""
+
+
+def test_parallel_pdf_extraction_matches_serial(tmp_dir):
+    """Test that page-range workers reassemble the exact serial text in page order."""
+    from tests.conftest import create_text_pdf
+    from evidence_toolkit.analyzers.document import DocumentAnalyzer
+    from evidence_toolkit.core.pdf import iter_page_texts
+
+    pages = [[f"Page {n} witness statement line {i}" for i in range(4)] if n % 5 else [] for n in range(1, 12)]
+    pdf_path = create_text_pdf(tmp_dir / "bundle.pdf", pages)
+
+    serial = list(iter_page_texts(pdf_path, workers=1))
+    parallel = list(iter_page_texts(pdf_path, workers=3, pages_per_task=2, min_parallel_pages=1))
+
+    assert parallel == serial
+    assert len(serial) == 11 and serial[4] == ""  # Blank pages keep their position
+    assert serial[10].startswith("Page 11 witness")
+
+    analyzer = DocumentAnalyzer(verbose=False, pdf_workers=1)
+    assert analyzer._extract_pdf_text(pdf_path) == "\f".join(serial)
@@ -22,6 +22,7 @@ from evidence_toolkit.pipeline import (
     PackageGenerator,
 )
 from evidence_toolkit.analyzers.correlation import CorrelationAnalyzer
+from tests.conftest import NEAR_DUPLICATE_BODY, create_chat_screenshot
 
 
 # =============================================================================
@@ -490,3 +491,1262 @@ def test_package_metadata_is_valid_json(
     assert "metadata" in result, "Result should include metadata"
     assert result["case_id"] == case_id
     assert result["evidence_count"] >= 2
+
+
+# =============================================================================
+# AI USAGE & COST ACCOUNTING
+# =============================================================================
+
+
+def test_analysis_persists_usage_and_case_cost_rollup(
+    tmp_storage, sample_email, case_id, mock_responses_client
+):
+    """Test per-evidence usage persistence and the per-case cost report."""
+    from evidence_toolkit.core.usage import record_usage, track_usage
+
+    results = ingest_path(sample_email, tmp_storage, case_id=case_id)
+    evidence_hash = results[0].sha256
+
+    analysis = analyze_evidence(
+        evidence_hash, tmp_storage, mock_responses_client, case_id, quiet=True
+    )
+    assert [r.stage for r in analysis.ai_usage] == ["email_analysis"]
+
+    # Usage survives the round trip through analysis.v1.json
+    reloaded = tmp_storage.get_analysis(evidence_hash)
+    assert reloaded.ai_usage[0].input_tokens == 1000
+
+    # Case-level calls (correlation, summaries) go to the case usage log
+    with track_usage() as tracker:
+        record_usage("executive_summary", "gpt-4o-2024-08-06", None, latency_seconds=1.5)
+    tmp_storage.append_case_usage(case_id, tracker.records)
+
+    report = tmp_storage.get_case_cost_report(case_id)
+    assert report.evidence_with_usage == 1
+    assert report.total.calls == 2
+    assert set(report.total.by_stage) == {"email_analysis", "executive_summary"}
+    assert report.case_level_usage.latency_seconds == pytest.approx(1.5)
+    assert report.per_evidence[evidence_hash].output_tokens == 250
+
+
+def test_case_cost_report_charges_each_run_to_the_case_that_paid(tmp_storage, sample_email, mock_responses_client):
+    """Test that shared evidence is charged only to the analyzing case, and --force runs add to its spend."""
+    evidence_hash = ingest_path(sample_email, tmp_storage, case_id="CASE-1")[0].sha256
+    ingest_path(sample_email, tmp_storage, case_id="CASE-2")
+
+    analyze_evidence(evidence_hash, tmp_storage, mock_responses_client, "CASE-1", quiet=True)
+    analyze_evidence(evidence_hash, tmp_storage, mock_responses_client, "CASE-1", force=True, quiet=True)
+
+    report = tmp_storage.get_case_cost_report("CASE-1")
+    assert report.per_evidence[evidence_hash].calls == 2
+    assert report.evidence_usage.output_tokens == 500
+
+    shared = tmp_storage.get_case_cost_report("CASE-2")
+    assert shared.evidence_count == 1 and shared.evidence_with_usage == 0
+    assert shared.total.calls == 0
+
+
+# =============================================================================
+# MODEL CASCADE
+# =============================================================================
+
+
+def test_cascade_escalation_is_recorded_on_analysis(
+    tmp_storage, sample_email, case_id, mock_responses_client
+):
+    """Test that a risk-flagged email is re-run on the strong model and the decision persisted."""
+    from evidence_toolkit.core.routing import ModelRouter
+
+    results = ingest_path(sample_email, tmp_storage, case_id=case_id)
+    evidence_hash = results[0].sha256
+
+    router = ModelRouter("gpt-4o-mini", "gpt-4o-2024-08-06")
+    analyze_evidence(
+        evidence_hash, tmp_storage, mock_responses_client, case_id, quiet=True, router=router
+    )
+
+    # Mock email analysis is flagged "threatening" -> escalated
+    assert [call["model"] for call in mock_responses_client.calls] == ["gpt-4o-mini", "gpt-4o-2024-08-06"]
+
+    reloaded = tmp_storage.get_analysis(evidence_hash)
+    assert len(reloaded.ai_usage) == 2
+    decision = reloaded.routing_decisions[0]
+    assert decision.stage == "email_analysis"
+    assert decision.escalated
+    assert decision.model_used == "gpt-4o-2024-08-06"
+    assert decision.reasons == ["risk flags: threatening"]
+
+
+# =============================================================================
+# OFFLINE BATCH ANALYSIS
+# =============================================================================
+
+
+def test_offline_batch_round_trip(
+    tmp_storage, sample_email, sample_image, case_id, mock_openai_responses
+):
+    """Test submit → poll → hydrate through the local batch endpoint."""
+    from evidence_toolkit.pipeline.offline import (
+        LocalBatchEndpoint,
+        submit_batch_job,
+        poll_batch_job,
+        hydrate_batch_job,
+    )
+
+    email_hash = ingest_path(sample_email, tmp_storage, case_id=case_id)[0].sha256
+    image_hash = ingest_path(sample_image, tmp_storage, case_id=case_id)[0].sha256
+
+    schema_data = {
+        "EmailThreadAnalysis": mock_openai_responses["email"],
+        "ImageAnalysisStructured": mock_openai_responses["image"],
+    }
+    seen_bodies = []
+
+    def handler(body):
+        seen_bodies.append(body)
+        return {
+            "status": "completed",
+            "output": [{"type": "message", "content": [{
+                "type": "output_text",
+                "text": json.dumps(schema_data[body["text"]["format"]["name"]]),
+            }]}],
+            "usage": {"input_tokens": 1000, "input_tokens_details": {"cached_tokens": 0}, "output_tokens": 200},
+        }
+
+    endpoint = LocalBatchEndpoint(handler, polls_until_complete=2)
+    job = submit_batch_job(tmp_storage, endpoint, case_id, [email_hash, image_hash], quiet=True)
+    assert set(job.requests.values()) == {email_hash, image_hash}
+    assert (tmp_storage.get_batch_job_dir(job.job_id) / "requests.jsonl").exists()
+
+    sleeps = []
+    job = poll_batch_job(tmp_storage, endpoint, job, poll_interval=5, quiet=True, sleep=sleeps.append)
+    assert job.status == "completed"
+    assert sleeps == [5, 5]
+
+    results = hydrate_batch_job(tmp_storage, endpoint, job, quiet=True)
+    assert set(results) == {email_hash, image_hash}
+    assert all(body["text"]["format"]["strict"] for body in seen_bodies)
+
+    # Saved through the normal path, usage priced as batch
+    email_analysis = tmp_storage.get_analysis(email_hash)
+    assert email_analysis.email_analysis.thread_summary == mock_openai_responses["email"]["thread_summary"]
+    assert email_analysis.ai_usage[0].batch
+    assert email_analysis.ai_usage[0].estimated_cost_usd == pytest.approx((1000 * 0.15 + 200 * 0.60) / 1_000_000 / 2)
+    assert tmp_storage.get_analysis(image_hash).image_analysis.analysis_confidence == 0.95
+
+    reloaded_job = tmp_storage.get_batch_job(job.job_id)
+    assert reloaded_job.status == "hydrated"
+    assert sorted(reloaded_job.hydrated) == sorted([email_hash, image_hash])
+
+
+def test_offline_batch_records_failed_requests(tmp_storage, sample_email, case_id):
+    """Test that failed batch requests are reported and leave storage untouched."""
+    from evidence_toolkit.pipeline.offline import (
+        LocalBatchEndpoint,
+        submit_batch_job,
+        poll_batch_job,
+        hydrate_batch_job,
+    )
+
+    email_hash = ingest_path(sample_email, tmp_storage, case_id=case_id)[0].sha256
+
+    def handler(body):
+        raise RuntimeError("rate limited")
+
+    endpoint = LocalBatchEndpoint(handler, polls_until_complete=0)
+    job = submit_batch_job(tmp_storage, endpoint, case_id, [email_hash], quiet=True)
+    job = poll_batch_job(tmp_storage, endpoint, job, quiet=True, sleep=lambda seconds: None)
+    results = hydrate_batch_job(tmp_storage, endpoint, job, quiet=True)
+
+    assert results == {}
+    assert job.failed == {email_hash: "rate limited"}
+    assert tmp_storage.get_analysis(email_hash) is None
+
+
+def test_offline_batch_leaves_email_threads_to_thread_analysis(tmp_dir, tmp_storage):
+    """Test that threaded emails are not batched one file per request, and the request schema is strict."""
+    from evidence_toolkit.core.models import EmailThreadAnalysis
+    from evidence_toolkit.pipeline.offline import THREADED_EMAIL_REASON, prepare_batch_job
+
+    quoted = "\n".join(f"> {line}" for line in NEAR_DUPLICATE_BODY.splitlines())
+    paths = [
+        _write_email(tmp_dir / "original.eml", "Grievance meeting", NEAR_DUPLICATE_BODY),
+        _write_email(tmp_dir / "reply.eml", "RE: Grievance meeting",
+                     f"Thanks John, I will send both today.\n\nOn 15 Jan John wrote:\n{quoted}",
+                     sender="sarah.johnson@company.com"),
+        _write_email(tmp_dir / "other.eml", "Parking", "The car park will be closed on Friday."),
+    ]
+    original, reply, other = [tmp_storage.ingest_file(path, "CASE-1").sha256 for path in paths]
+
+    job = prepare_batch_job(tmp_storage, "CASE-1", [reply, other], quiet=True)
+    assert job.not_batched == {reply: THREADED_EMAIL_REASON}
+    assert list(job.requests.values()) == [other]
+
+    request = json.loads((tmp_storage.get_batch_job_dir(job.job_id) / "requests.jsonl").read_text())
+    text_format = request["body"]["text"]["format"]
+    assert text_format["name"] == "EmailThreadAnalysis" and text_format["strict"]
+    schema = text_format["schema"]
+    assert schema["additionalProperties"] is False
+    assert schema["required"] == list(EmailThreadAnalysis.model_fields)
+
+
+# =============================================================================
+# PACKED ANALYSIS
+# =============================================================================
+
+
+def test_packed_emails_share_one_request(tmp_storage, sample_email, case_id, mock_responses_client, mock_openai_responses):
+    """Test that small emails are analyzed in one request and results/usage split per item."""
+    from evidence_toolkit.core.models import PackedEmailAnalysis
+    from evidence_toolkit.core.usage import track_usage
+    from evidence_toolkit.pipeline.packing import analyze_packed
+
+    hashes = [ingest_path(sample_email, tmp_storage, case_id=case_id)[0].sha256]
+    for index in (2, 3):
+        email_path = sample_email.parent / f"email_{index}.eml"
+        email_path.write_text(sample_email.read_text().replace("<abc123@", f"<msg{index}@") + f"\nPS {index}\n")
+        hashes.append(ingest_path(email_path, tmp_storage, case_id=case_id)[0].sha256)
+
+    # The model answers for D1 and D2 only
+    mock_responses_client.overrides[PackedEmailAnalysis] = {
+        "items": [dict(mock_openai_responses["email"], evidence_id=item_id) for item_id in ("D2", "D1")]
+    }
+
+    with track_usage() as tracker:
+        results, remaining = analyze_packed(tmp_storage, hashes, mock_responses_client, case_id, quiet=True)
+
+    assert len(mock_responses_client.calls) == 1
+    assert mock_responses_client.calls[0]["text_format"] is PackedEmailAnalysis
+    assert set(results) == set(hashes[:2])
+    assert remaining == [hashes[2]]
+
+    analysis = tmp_storage.get_analysis(hashes[0])
+    assert analysis.email_analysis.thread_summary == mock_openai_responses["email"]["thread_summary"]
+    assert case_id in analysis.case_ids
+    assert 0 < analysis.ai_usage[0].input_tokens < 1000
+
+    # Shares of the single call add back up to its usage
+    assert sum(record.input_tokens for record in tracker.records) == pytest.approx(1000, abs=2)
+    assert sum(record.output_tokens for record in tracker.records) == pytest.approx(250, abs=2)
+
+
+def test_failed_pack_items_are_budgeted_once(tmp_storage, sample_email, case_id, mock_responses_client):
+    """Test that items handed back by a failed pack keep their budget decision."""
+    from types import SimpleNamespace
+    from evidence_toolkit.cli import _analyze_ingested
+    from evidence_toolkit.core.models import PackedEmailAnalysis
+    from evidence_toolkit.core.usage import record_usage
+    from evidence_toolkit.pipeline.budget import BudgetController
+
+    hashes = [ingest_path(sample_email, tmp_storage, case_id=case_id)[0].sha256]
+    for index in (2, 3):
+        email_path = sample_email.parent / f"email_{index}.eml"
+        email_path.write_text(sample_email.read_text().replace("<abc123@", f"<msg{index}@") + f"\nPS {index}\n")
+        hashes.append(ingest_path(email_path, tmp_storage, case_id=case_id)[0].sha256)
+
+    # The packed answer does not validate, so every item goes back to individual analysis
+    mock_responses_client.overrides[PackedEmailAnalysis] = {}
+
+    budget = BudgetController(case_id, max_cost=1.0, soft_limit=0.5)
+    with budget.tracking():
+        record_usage("document_analysis", "gpt-4o-mini", SimpleNamespace(input_tokens=0, output_tokens=1_000_000))
+        _analyze_ingested(tmp_storage, hashes, mock_responses_client, case_id, "tester", quiet=True,
+                          budget=budget, no_email_threads=True, no_text_dedup=True)
+
+    assert mock_responses_client.calls[0]["text_format"] is PackedEmailAnalysis
+    report = budget.report()
+    assert sorted(action.sha256 for action in report.downgraded) == sorted(hashes)
+    assert {(action.model_from, action.model_to) for action in report.downgraded} == {("gpt-4o-mini", "gpt-4.1-nano")}
+    assert [call["model"] for call in mock_responses_client.calls[1:]] == ["gpt-4.1-nano"] * 3
+    assert report.items_run == 3
+
+
+# =============================================================================
+# EXTRACTED TEXT ARTIFACT
+# =============================================================================
+
+
+def test_extracted_text_round_trip(tmp_storage):
+    """Test that stored text keeps page boundaries and offsets (including empty pages)."""
+    sha256 = "ab" * 32
+    pages = ["Page one\r\n", "", "Page three  "]
+
+    index = tmp_storage.save_extracted_text(sha256, iter(pages), "pdfplumber")
+
+    assert index.page_offsets == [0, 11, 12] and index.char_count == 24
+    assert list(tmp_storage.iter_extracted_pages(sha256)) == pages
+    assert tmp_storage.read_extracted_text(sha256) == "\f".join(pages)
+
+    # Blocks of a text file are stored as one page
+    tmp_storage.save_extracted_text(sha256, ["first block ", "second block"], "text", page_breaks=False)
+    assert list(tmp_storage.iter_extracted_pages(sha256)) == ["first block second block"]
+
+
+def test_document_text_is_extracted_once(tmp_storage, sample_document, case_id):
+    """Test that the first read saves the text artifact and later reads skip extraction."""
+    from evidence_toolkit.analyzers.document import DocumentAnalyzer
+    from evidence_toolkit.pipeline.analyze import build_ai_input, document_pages
+
+    sha256 = ingest_path(sample_document, tmp_storage, case_id=case_id)[0].sha256
+    original = tmp_storage.get_original_file_path(sha256)
+
+    # An interrupted extraction leaves no artifact behind
+    partial = document_pages(tmp_storage, sha256, original)
+    next(partial)
+    partial.close()
+    assert tmp_storage.get_extracted_text(sha256) is None
+
+    pages = list(document_pages(tmp_storage, sha256, original))
+    assert "".join(pages) == sample_document.read_text()
+    assert tmp_storage.get_extracted_text(sha256).source == "text"
+
+    class NoExtraction(DocumentAnalyzer):
+        def iter_text_blocks(self, file_path):
+            raise AssertionError("text should come from the artifact")
+
+    analyzer = NoExtraction(verbose=False)
+    assert list(document_pages(tmp_storage, sha256, original, analyzer)) == pages
+    _, _, content, _ = build_ai_input(original, EvidenceType.DOCUMENT, tmp_storage, sha256)
+    assert content == sample_document.read_text()
+
+
+# =============================================================================
+# MIXED AND SCANNED PDFS
+# =============================================================================
+
+
+def test_mixed_pdf_sends_only_scanned_pages_to_vision(tmp_dir, monkeypatch, mock_responses_client):
+    """Test that a mixed PDF is routed per page: text pages locally, scanned pages to vision."""
+    from tests.conftest import create_text_pdf
+    from evidence_toolkit.analyzers.document import DocumentAnalyzer
+    from evidence_toolkit.analyzers.image import ImageAnalyzer
+    from evidence_toolkit.core.models import ImageAnalysisResult
+    from evidence_toolkit.core.pdf import iter_pdf_pages
+    from evidence_toolkit.core.storage import EvidenceStorage
+    from evidence_toolkit.core.utils import detect_file_type
+    from evidence_toolkit.pipeline.analyze import document_pages
+
+    text_page = [f"Grievance hearing minutes, item {i}, recorded by the chair." for i in range(3)]
+    pdf_path = create_text_pdf(tmp_dir / "bundle.pdf", [None, text_page, [], text_page])
+
+    assert [page.kind for page in iter_pdf_pages(pdf_path, workers=1)] == ["scanned", "text", "blank", "text"]
+    assert detect_file_type(pdf_path) == "document"  # Scanned cover no longer sends it all to vision
+
+    vision_calls = []
+
+    def render_pdf_page(self, path, page_number):
+        vision_calls.append(page_number)
+        return f"page {page_number}"
+
+    def ocr_result(prepared):
+        return ImageAnalysisResult(
+            openai_model="gpt-4o-mini", openai_response={}, detected_text=f"Signed letter {prepared}"
+        )
+
+    async def analyze_prepared_async(self, prepared, model=None):
+        return ocr_result(prepared)
+
+    monkeypatch.setattr(ImageAnalyzer, "render_pdf_page", render_pdf_page)
+    monkeypatch.setattr(ImageAnalyzer, "_analyze_prepared", lambda self, prepared: ocr_result(prepared))
+    monkeypatch.setattr(ImageAnalyzer, "_analyze_prepared_async", analyze_prepared_async)
+    image_analyzer = ImageAnalyzer(verbose=False, client=mock_responses_client)
+
+    # Document route: OCR text takes the scanned page's place in the stream
+    storage = EvidenceStorage(tmp_dir / "storage")
+    analyzer = DocumentAnalyzer(verbose=False, pdf_workers=1, image_analyzer=image_analyzer)
+    pages = list(document_pages(storage, "a" * 64, pdf_path, analyzer))
+
+    assert vision_calls == [1]
+    assert pages[0] == "Signed letter page 1" and pages[1].startswith("Grievance hearing")
+    assert storage.get_extracted_text("a" * 64).ocr_pages == [1]
+
+    # Image route: text-layer pages are read locally, not sent to vision
+    vision_calls.clear()
+    result = image_analyzer.analyze_pdf(pdf_path)
+
+    assert vision_calls == [1]
+    assert result.openai_response["vision_pages"] == 1
+    assert image_analyzer.page_texts[0] == "Signed letter page 1"
+    assert image_analyzer.page_texts[3].startswith("Grievance hearing")
+
+
+def test_unread_scanned_pages_keep_text_artifact_unpublished(tmp_dir, monkeypatch, mock_responses_client):
+    """Test that scanned pages without OCR text fall back to their text layer and are retried later."""
+    from pdf2image.exceptions import PDFInfoNotInstalledError
+    from tests.conftest import create_text_pdf
+    from evidence_toolkit.analyzers.document import DocumentAnalyzer
+    from evidence_toolkit.analyzers.image import ImageAnalyzer
+    from evidence_toolkit.core.models import ImageAnalysisResult
+    from evidence_toolkit.core.storage import EvidenceStorage
+    from evidence_toolkit.pipeline.analyze import document_pages
+
+    text_page = [f"Grievance hearing minutes, item {i}, recorded by the chair." for i in range(3)]
+    pdf_path = create_text_pdf(tmp_dir / "bundle.pdf", [None, text_page, None])
+    storage = EvidenceStorage(tmp_dir / "storage")
+    sha256 = "b" * 64
+
+    # No image analyzer: scanned pages are read as "" and nothing is saved
+    analyzer = DocumentAnalyzer(verbose=False, pdf_workers=1)
+    pages = list(document_pages(storage, sha256, pdf_path, analyzer))
+    assert pages[0] == "" and pages[1].startswith("Grievance hearing")
+    assert analyzer.unread_pages == [1, 3] and analyzer.ocr_pages == []
+    assert storage.get_extracted_text(sha256) is None
+
+    # Poppler missing on page 1, vision returns no text for page 3: the document still reads
+    def render_pdf_page(self, path, page_number):
+        if page_number == 1:
+            raise PDFInfoNotInstalledError("Unable to get page count. Is poppler installed and in PATH?")
+        return f"page {page_number}"
+
+    detected = {"text": None}
+
+    async def analyze_prepared_async(self, prepared, model=None):
+        return ImageAnalysisResult(openai_model="gpt-4o-mini", openai_response={}, detected_text=detected["text"])
+
+    monkeypatch.setattr(ImageAnalyzer, "render_pdf_page", render_pdf_page)
+    monkeypatch.setattr(ImageAnalyzer, "_analyze_prepared_async", analyze_prepared_async)
+    image_analyzer = ImageAnalyzer(verbose=False, client=mock_responses_client)
+    analyzer = DocumentAnalyzer(verbose=False, pdf_workers=1, image_analyzer=image_analyzer)
+
+    pages = list(document_pages(storage, sha256, pdf_path, analyzer))
+    assert len(pages) == 3 and pages[1].startswith("Grievance hearing")
+    assert analyzer.unread_pages == [1, 3] and analyzer.ocr_pages == []
+    assert storage.get_extracted_text(sha256) is None
+    assert not list((storage.derived_dir).rglob("*.partial"))
+
+    # Once every scanned page is read, the artifact is published
+    monkeypatch.setattr(ImageAnalyzer, "render_pdf_page", lambda self, path, page_number: f"page {page_number}")
+    detected["text"] = "Signed letter"
+    pages = list(document_pages(storage, sha256, pdf_path, analyzer))
+    assert pages[0] == pages[2] == "Signed letter"
+    assert storage.get_extracted_text(sha256).ocr_pages == [1, 3]
+
+
+def test_packed_input_leaves_mixed_pdfs_to_individual_analysis(tmp_dir):
+    """Test that a PDF with scanned pages gets no packed request and no text artifact."""
+    from tests.conftest import create_text_pdf
+    from evidence_toolkit.core.storage import EvidenceStorage
+    from evidence_toolkit.pipeline.analyze import build_ai_input
+
+    text_page = [f"Grievance hearing minutes, item {i}, recorded by the chair." for i in range(3)]
+    storage = EvidenceStorage(tmp_dir / "storage")
+
+    mixed = create_text_pdf(tmp_dir / "mixed.pdf", [None, text_page])
+    with pytest.raises(ValueError, match="scanned pages"):
+        build_ai_input(mixed, EvidenceType.DOCUMENT, storage, "c" * 64)
+    assert storage.get_extracted_text("c" * 64) is None
+
+    text_only = create_text_pdf(tmp_dir / "minutes.pdf", [text_page])
+    _, _, content, _ = build_ai_input(text_only, EvidenceType.DOCUMENT, storage, "d" * 64)
+    assert content.startswith("Grievance hearing")
+    assert storage.get_extracted_text("d" * 64) is None
+
+
+# =============================================================================
+# IMAGE BATCH ANALYSIS
+# =============================================================================
+
+
+def test_interrupted_image_batch_keeps_saved_results_and_resumes(tmp_dir, tmp_storage, monkeypatch):
+    """Test that batch results are saved as they complete and a rerun analyzes only the rest."""
+    import asyncio
+    from PIL import Image
+    from evidence_toolkit.analyzers.image import ImageAnalyzer
+    from evidence_toolkit.core.models import ImageAnalysisResult
+    from evidence_toolkit.pipeline.batch import analyze_images_batch
+
+    sha256s = []
+    for i in range(8):
+        Image.new("RGB", (32, 32), (i * 30, 0, 0)).save(tmp_dir / f"photo{i}.png")
+        sha256s.append(tmp_storage.ingest_file(tmp_dir / f"photo{i}.png", "CASE-1").sha256)
+
+    monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+    analyzed, interrupt_after = [], [4]
+
+    async def analyze_image_async(self, image_path, model=None):
+        analyzed.append(image_path.name)
+        if len(analyzed) > interrupt_after[0]:
+            main_task.cancel()  # Ctrl-C: asyncio.run cancels the main task
+        await asyncio.sleep(0)
+        return ImageAnalysisResult(openai_model=self.model, openai_response={},
+                                   scene_description=image_path.name, analysis_confidence=0.9)
+
+    monkeypatch.setattr(ImageAnalyzer, "analyze_image_async", analyze_image_async)
+
+    async def run_batch():
+        nonlocal main_task
+        main_task = asyncio.current_task()
+        return await analyze_images_batch(sha256s, tmp_storage, case_id="CASE-1", max_concurrent=1, quiet=True)
+
+    main_task = None
+    try:
+        asyncio.run(run_batch())
+        assert False, "batch should have been interrupted"
+    except asyncio.CancelledError:
+        pass
+
+    # Every image finished before the interrupt is on disk
+    saved = [sha256 for sha256 in sha256s if tmp_storage.get_analysis(sha256)]
+    assert len(saved) == 4 and len(analyzed) == 5
+    checkpoint = tmp_storage.get_image_batch_checkpoint("CASE-1")
+    assert checkpoint.status == "interrupted" and checkpoint.total == 8
+    assert set(checkpoint.saved) <= set(saved)
+
+    analyzed.clear()
+    interrupt_after[0] = 100
+    results = asyncio.run(run_batch())
+
+    assert len(analyzed) == 4  # Only the images the first run did not save
+    assert len(results) == 8 and all(results[sha256].image_analysis for sha256 in sha256s)
+    checkpoint = tmp_storage.get_image_batch_checkpoint("CASE-1")
+    assert checkpoint.status == "completed" and checkpoint.total == 4
+    assert sorted(checkpoint.saved) == sorted(set(sha256s) - set(saved))
+
+
+def test_image_batch_budget_prices_the_cascade_fast_model(tmp_dir, tmp_storage, monkeypatch):
+    """Test that under a router the budget is consulted with the model the cascade starts on."""
+    import asyncio
+    from PIL import Image
+    from evidence_toolkit.analyzers.image import ImageAnalyzer
+    from evidence_toolkit.core.models import ImageAnalysisResult
+    from evidence_toolkit.core.routing import ModelRouter
+    from evidence_toolkit.pipeline.batch import analyze_images_batch
+    from evidence_toolkit.pipeline.budget import BudgetController
+
+    Image.new("RGB", (32, 32), "red").save(tmp_dir / "photo.png")
+    sha256 = tmp_storage.ingest_file(tmp_dir / "photo.png", "CASE-1").sha256
+    monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+
+    async def analyze_image_async(self, image_path, model=None):
+        return ImageAnalysisResult(openai_model=model or self.model, openai_response={}, analysis_confidence=0.9)
+
+    monkeypatch.setattr(ImageAnalyzer, "analyze_image_async", analyze_image_async)
+    priced = []
+
+    class RecordingBudget(BudgetController):
+        def decide(self, sha256, evidence_type, model, **kwargs):
+            priced.append(model)
+            return super().decide(sha256, evidence_type, model, **kwargs)
+
+    router = ModelRouter(fast_model="gpt-4.1-nano", strong_model="gpt-4o")
+    asyncio.run(analyze_images_batch([sha256], tmp_storage, case_id="CASE-1", quiet=True, model="gpt-4o",
+                                     budget=RecordingBudget("CASE-1", max_cost=10.0), router=router))
+    assert priced == ["gpt-4.1-nano"]
+
+
+# =============================================================================
+# NEAR-DUPLICATE DETECTION
+# =============================================================================
+
+def test_near_duplicate_images_reuse_analysis(tmp_dir, tmp_storage, mock_responses_client):
+    """Test that resized copies reuse the first copy's analysis and different screenshots do not."""
+    from evidence_toolkit.core.similarity import hash_image_file
+    from evidence_toolkit.pipeline.analyze import analyze_evidence
+    from evidence_toolkit.pipeline.dedup import ImageDeduplicator
+
+    original = create_chat_screenshot(1)
+    original.save(tmp_dir / "chat.png")
+    original.resize((300, 534)).save(tmp_dir / "chat-forwarded.jpg", quality=70)
+    create_chat_screenshot(2).save(tmp_dir / "other-chat.png")
+
+    names = ("chat.png", "chat-forwarded.jpg", "other-chat.png")
+    sha256s = [tmp_storage.ingest_file(tmp_dir / name, "CASE-1").sha256 for name in names]
+    deduplicator = ImageDeduplicator(tmp_storage, case_id="CASE-1")
+    analyses = [
+        analyze_evidence(sha256, tmp_storage, openai_client=mock_responses_client, case_id="CASE-1",
+                         quiet=True, image_deduplicator=deduplicator)
+        for sha256 in sha256s
+    ]
+
+    assert len(mock_responses_client.calls) == 2  # The forwarded copy made no vision call
+    canonical, copy, other = analyses
+    assert copy.duplicate_of.canonical_sha256 == sha256s[0] and "near-duplicate" in copy.labels
+    assert copy.image_analysis == canonical.image_analysis and copy.ai_usage == []
+    assert canonical.duplicate_of is None and other.duplicate_of is None
+    assert list(deduplicator.reused) == [sha256s[1]]
+    assert tmp_storage.get_image_hash(sha256s[1]) == hash_image_file(tmp_dir / "chat-forwarded.jpg")
+
+    from evidence_toolkit.core.utils import get_evidence_base_dir, read_json_safe
+
+    custody = read_json_safe(get_evidence_base_dir(tmp_storage.derived_dir, sha256s[1]) / "chain_of_custody.json")
+    assert any(event["event_type"] == "near_duplicate" for event in custody)
+
+    # A new run loads the analyzed images from storage
+    create_chat_screenshot(1).resize((250, 445)).save(tmp_dir / "chat-small.png")
+    small_sha256 = tmp_storage.ingest_file(tmp_dir / "chat-small.png", "CASE-1").sha256
+    link = ImageDeduplicator(tmp_storage, case_id="CASE-1").match(small_sha256, tmp_dir / "chat-small.png")
+    assert link.canonical_sha256 == sha256s[0]
+
+
+def test_image_batch_analyzes_one_copy_of_near_duplicates(tmp_dir, tmp_storage, monkeypatch):
+    """Test that a batch sends one copy of each near-duplicate group to vision and links the rest."""
+    import asyncio
+    from evidence_toolkit.analyzers.image import ImageAnalyzer
+    from evidence_toolkit.core.models import ImageAnalysisResult
+    from evidence_toolkit.pipeline.batch import analyze_images_batch
+    from evidence_toolkit.pipeline.dedup import ImageDeduplicator
+
+    sha256s = []
+    for seed in (1, 2):
+        for i, size in enumerate([(375, 667), (300, 534), (250, 445)]):
+            create_chat_screenshot(seed).resize(size).save(tmp_dir / f"chat{seed}-{i}.png")
+            sha256s.append(tmp_storage.ingest_file(tmp_dir / f"chat{seed}-{i}.png", "CASE-1").sha256)
+
+    monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+    analyzed = []
+
+    async def analyze_image_async(self, image_path, model=None):
+        analyzed.append(image_path.name)
+        return ImageAnalysisResult(openai_model=self.model, openai_response={},
+                                   scene_description=image_path.name, analysis_confidence=0.9)
+
+    monkeypatch.setattr(ImageAnalyzer, "analyze_image_async", analyze_image_async)
+    deduplicator = ImageDeduplicator(tmp_storage, case_id="CASE-1")
+    results = asyncio.run(analyze_images_batch(sha256s, tmp_storage, case_id="CASE-1", quiet=True,
+                                               image_deduplicator=deduplicator))
+
+    assert len(analyzed) == 2 and len(results) == 6 and len(deduplicator.reused) == 4
+    for group in (sha256s[:3], sha256s[3:]):
+        assert results[group[0]].duplicate_of is None
+        assert all(results[sha256].duplicate_of.canonical_sha256 == group[0] for sha256 in group[1:])
+
+
+def _write_email(path, subject, body, sender="john.smith@company.com", date="Mon, 15 Jan 2024 14:30:00 -0500"):
+    path.write_text(f"From: {sender}\nTo: sarah.johnson@company.com\nSubject: {subject}\n"
+                    f"Date: {date}\n\n{body}")
+    return path
+
+
+def test_near_duplicate_emails_are_analyzed_once_per_group(tmp_dir, tmp_storage):
+    """Test that forwards and quoting replies link to one representative and other emails do not."""
+    from evidence_toolkit.core.models import EmailThreadAnalysis, FileMetadata, UnifiedAnalysis
+    from evidence_toolkit.core.utils import get_evidence_base_dir, read_json_safe
+    from evidence_toolkit.pipeline.dedup import TextDeduplicator
+
+    quoted = "\n".join(f"> {line}" for line in NEAR_DUPLICATE_BODY.splitlines())
+    paths = [
+        _write_email(tmp_dir / "original.eml", "Grievance meeting", NEAR_DUPLICATE_BODY),
+        _write_email(tmp_dir / "reply.eml", "RE: Grievance meeting",
+                     f"Thanks John, I will send both today.\n\nOn 15 Jan John wrote:\n{quoted}",
+                     sender="sarah.johnson@company.com"),
+        _write_email(tmp_dir / "forward.eml", "Fwd: Grievance meeting",
+                     f"---------- Forwarded message ----------\n{NEAR_DUPLICATE_BODY}"),
+        _write_email(tmp_dir / "other.eml", "Parking", "The car park will be closed on Friday for "
+                     "resurfacing, please use the overflow car park behind the warehouse instead."),
+    ]
+    original, reply, forward, other = [tmp_storage.ingest_file(path, "CASE-1").sha256 for path in paths]
+
+    deduplicator = TextDeduplicator(tmp_storage)
+    to_analyze = deduplicator.plan([original, reply, forward, other])
+
+    # The reply quotes the whole original, so as the longest text it represents the group
+    assert to_analyze == [reply, other]
+    assert {sha256: link.canonical_sha256 for sha256, link in deduplicator.links.items()} == {
+        original: reply, forward: reply
+    }
+    assert all(link.method == "minhash" and link.similarity >= 0.85 for link in deduplicator.links.values())
+    assert deduplicator.links[original].summary.startswith("text containment")
+
+    # No analysis for the representative yet - members must be analyzed themselves
+    assert deduplicator.link(original, "CASE-1") is None
+
+    metadata = read_json_safe(get_evidence_base_dir(tmp_storage.derived_dir, reply) / "metadata.json")
+    tmp_storage.save_analysis(UnifiedAnalysis(
+        evidence_type=EvidenceType.EMAIL, analysis_timestamp=datetime.now(),
+        file_metadata=FileMetadata(**metadata), case_id="CASE-1", labels=["email"],
+        email_analysis=EmailThreadAnalysis(
+            thread_summary="Request for grievance minutes", communication_pattern="professional",
+            sentiment_progression=[0.6], legal_significance="medium", confidence_overall=0.9
+        )
+    ))
+    linked = deduplicator.link(original, "CASE-1")
+    assert linked.email_analysis.thread_summary == "Request for grievance minutes"
+    assert linked.duplicate_of.canonical_sha256 == reply and "near-duplicate" in linked.labels
+    assert deduplicator.link(forward, "CASE-1") and len(deduplicator.reused) == 2
+
+    assert tmp_storage.get_case_cost_report("CASE-1").duplicates_reused == 2
+    correlation = CorrelationAnalyzer(tmp_storage, verbose=False).analyze_case_correlations("CASE-1")
+    assert correlation.evidence_count == 3  # Linked copies are evidence; their shared analysis is not recounted
+
+
+def test_near_duplicate_forward_keeps_its_own_timeline_event(tmp_dir, tmp_storage):
+    """Test that a linked forward keeps its own headers and date in the timeline, without recounted entities."""
+    from evidence_toolkit.core.models import EmailParticipant, EmailThreadAnalysis, FileMetadata, UnifiedAnalysis
+    from evidence_toolkit.core.utils import get_evidence_base_dir, read_json_safe
+    from evidence_toolkit.pipeline.dedup import TextDeduplicator
+
+    original = tmp_storage.ingest_file(_write_email(tmp_dir / "original.eml", "Grievance meeting",
+                                                    NEAR_DUPLICATE_BODY + "\nP.S. " + NEAR_DUPLICATE_BODY), "CASE-1").sha256
+    forward = tmp_storage.ingest_file(_write_email(
+        tmp_dir / "forward.eml", "Fwd: Grievance meeting", f"FYI\n\n{NEAR_DUPLICATE_BODY}",
+        sender="sarah.johnson@company.com", date="Tue, 20 Feb 2024 09:00:00 +0000"
+    ), "CASE-1").sha256
+
+    deduplicator = TextDeduplicator(tmp_storage)
+    assert deduplicator.plan([original, forward]) == [original]
+
+    metadata = read_json_safe(get_evidence_base_dir(tmp_storage.derived_dir, original) / "metadata.json")
+    tmp_storage.save_analysis(UnifiedAnalysis(
+        evidence_type=EvidenceType.EMAIL, analysis_timestamp=datetime.now(),
+        file_metadata=FileMetadata(**metadata), case_id="CASE-1", labels=["email"],
+        email_metadata={"from": "john.smith@company.com", "subject": "Grievance meeting",
+                        "date": "Mon, 15 Jan 2024 14:30:00 -0500"},
+        email_analysis=EmailThreadAnalysis(
+            thread_summary="Request for grievance minutes", communication_pattern="professional",
+            sentiment_progression=[0.6], legal_significance="medium", confidence_overall=0.9,
+            participants=[EmailParticipant(email_address="john.smith@company.com", role="sender",
+                                           authority_level="employee", confidence=0.9)]
+        )
+    ))
+    linked = deduplicator.link(forward, "CASE-1")
+    assert linked.email_metadata["from"] == "sarah.johnson@company.com"
+    assert linked.email_metadata["subject"] == "Fwd: Grievance meeting"
+    assert linked.email_metadata["date"] == "Tue, 20 Feb 2024 09:00:00 +0000"
+
+    correlation = CorrelationAnalyzer(tmp_storage, verbose=False).analyze_case_correlations("CASE-1")
+    communications = {event.evidence_sha256: event for event in correlation.timeline_events
+                      if event.event_type == "communication"}
+    assert communications[forward].timestamp == datetime(2024, 2, 20, 9, 0)
+    assert communications[forward].description == "Email: Fwd: Grievance meeting"
+    assert communications[original].timestamp.date() == datetime(2024, 1, 15).date()
+    assert not any(event.event_type == "analysis_performed" and event.evidence_sha256 == forward
+                   for event in correlation.timeline_events)
+    # The shared participants come from one analysis: no cross-evidence correlation
+    assert correlation.entity_correlations == []
+
+
+# =============================================================================
+# QUOTED-REPLY AND SIGNATURE STRIPPING
+# =============================================================================
+
+
+def test_email_analysis_sends_only_new_content(tmp_dir, tmp_storage, mock_responses_client):
+    """Test that the AI input leaves out the quoted copy, and the audit and token counts are saved."""
+    quoted = "\n".join(f"> {line}" for line in NEAR_DUPLICATE_BODY.splitlines())
+    reply = _write_email(
+        tmp_dir / "reply.eml", "RE: Grievance meeting",
+        f"Thanks John, I will send both today.\n\nOn 15 Jan John wrote:\n{quoted}\n",
+        sender="sarah.johnson@company.com"
+    )
+    sha256 = tmp_storage.ingest_file(reply, "CASE-1").sha256
+
+    analysis = analyze_evidence(sha256, tmp_storage, mock_responses_client, case_id="CASE-1", quiet=True)
+
+    sent = mock_responses_client.calls[0]["input"][-1]["content"]
+    assert "Thanks John, I will send both today." in sent
+    assert "appeal deadline" not in sent and "[Omitted: quoted reply]" in sent
+    metadata = analysis.email_metadata
+    assert [r["kind"] for r in metadata["stripped_ranges"]] == ["quoted_reply"]
+    assert metadata["input_tokens_sent"] < metadata["input_tokens_full"] / 3
+    assert "appeal deadline" in tmp_storage.read_extracted_text(sha256)  # Artifact keeps the full email
+
+
+# =============================================================================
+# EMAIL THREADING
+# =============================================================================
+
+
+def test_email_thread_is_analyzed_once(tmp_dir, tmp_storage, mock_responses_client, mock_openai_responses):
+    """Test that a case's thread costs one AI call and its result is saved for each member."""
+    from evidence_toolkit.pipeline.threads import analyze_email_threads, build_case_threads
+
+    def write(name, message_id, subject, body, reply_to=None):
+        headers = f"Message-ID: <{message_id}@company.com>\n"
+        if reply_to:
+            headers += f"In-Reply-To: <{reply_to}@company.com>\nReferences: <{reply_to}@company.com>\n"
+        path = tmp_dir / name
+        path.write_text(f"From: john.smith@company.com\nTo: hr@company.com\nSubject: {subject}\n"
+                        f"Date: Mon, 1{len(name)} Jan 2024 14:30:00 -0500\n{headers}\n{body}\n")
+        return tmp_storage.ingest_file(path, "CASE-1").sha256
+
+    first = write("a.eml", "m1", "Night shifts", "Why were my shifts moved?")
+    second = write("bb.eml", "m2", "Re: Night shifts", "The rota was final.", reply_to="m1")
+    third = write("ccc.eml", "m3", "Re: Night shifts", "I am raising a grievance.", reply_to="m2")
+    other = write("dddd.eml", "m4", "Parking", "Where do visitors park?")
+
+    # Threading reads headers only; bodies are loaded per thread for analysis
+    threads = build_case_threads(tmp_storage, [first], case_id="CASE-1", quiet=True)
+    assert [[entry["sha256"] for entry in thread] for thread in threads] == [[first, second, third], [other]]
+    assert not any("body" in entry for thread in threads for entry in thread)
+
+    results, remaining = analyze_email_threads(
+        tmp_storage, [first, second, third, other], mock_responses_client, case_id="CASE-1", quiet=True
+    )
+
+    assert len(mock_responses_client.calls) == 1
+    prompt = mock_responses_client.calls[0]["input"][-1]["content"]
+    assert "EMAIL 3/3" in prompt and "Parking" not in prompt
+    assert set(results) == {first, second, third} and remaining == [other]
+
+    analysis = tmp_storage.get_analysis(third)
+    assert analysis.email_analysis.thread_summary == mock_openai_responses["email"]["thread_summary"]
+    assert analysis.email_metadata["thread_position"] == 2 and analysis.email_metadata["thread_size"] == 3
+    assert analysis.email_metadata["thread_members"] == [first, second, third]
+    assert sum(tmp_storage.get_analysis(sha256).ai_usage[0].input_tokens for sha256 in results) == pytest.approx(1000, abs=2)
+
+
+def test_thread_result_is_counted_once_in_case_totals(tmp_dir, tmp_storage, mock_responses_client, mock_openai_responses):
+    """Test that a thread's shared result adds its entities, risk flags and participants once, not per member."""
+    from evidence_toolkit.pipeline.summary import SummaryGenerator
+    from evidence_toolkit.pipeline.threads import analyze_email_threads
+
+    sha256s = []
+    for i in range(3):
+        headers = f"Message-ID: <m{i}@company.com>\n"
+        if i:
+            headers += f"In-Reply-To: <m{i - 1}@company.com>\nReferences: <m{i - 1}@company.com>\n"
+        path = tmp_dir / f"{i}.eml"
+        path.write_text(f"From: john.smith@company.com\nTo: hr@company.com\nSubject: {'Re: ' if i else ''}Rota\n"
+                        f"Date: Mon, 1{i} Jan 2024 14:30:00 -0500\n{headers}\nMessage {i} about the rota.\n")
+        sha256s.append(tmp_storage.ingest_file(path, "CASE-1").sha256)
+
+    results, _ = analyze_email_threads(tmp_storage, sha256s, mock_responses_client, case_id="CASE-1", quiet=True)
+    assert len(mock_responses_client.calls) == 1
+    assert len({analysis.email_metadata["thread_analysis_id"] for analysis in results.values()}) == 1
+
+    correlation = CorrelationAnalyzer(tmp_storage, verbose=False).analyze_case_correlations("CASE-1")
+    assert correlation.evidence_count == 3
+    assert correlation.entity_correlations == []  # Participants of one result are not "seen" in three items
+    assert sum(event.event_type == "communication" for event in correlation.timeline_events) == 3
+
+    summary = SummaryGenerator(tmp_storage).generate_case_summary("CASE-1")
+    email_response = mock_openai_responses["email"]
+    assert summary.overall_assessment["total_risk_flags"] == len(email_response.get("risk_flags", []))
+    participants = summary.overall_assessment["power_dynamics"]["top_participants"]
+    assert sorted(p["email"] for p in participants) == sorted(p["email_address"] for p in email_response["participants"])
+
+
+def test_long_thread_is_analyzed_in_parts_within_token_budget(tmp_dir, tmp_storage, mock_responses_client):
+    """Test that a thread over the token budget is sent in parts, skipping parts with no new emails."""
+    from evidence_toolkit.analyzers.email import EmailAnalyzer
+    from evidence_toolkit.core.chunking import estimate_tokens
+    from evidence_toolkit.pipeline.threads import (
+        analyze_email_threads, build_case_threads, load_thread_emails, split_thread
+    )
+
+    sha256s = []
+    for i in range(5):
+        headers = f"Message-ID: <m{i}@company.com>\n"
+        if i:
+            headers += f"In-Reply-To: <m{i - 1}@company.com>\nReferences: <m{i - 1}@company.com>\n"
+        path = tmp_dir / f"{i}.eml"
+        path.write_text(f"From: john.smith@company.com\nTo: hr@company.com\nSubject: {'Re: ' if i else ''}Rota\n"
+                        f"Date: Mon, 1{i} Jan 2024 14:30:00 -0500\n{headers}\n{'Message %d about the rota. ' % i * 20}\n")
+        sha256s.append(tmp_storage.ingest_file(path, "CASE-1").sha256)
+
+    thread = load_thread_emails(tmp_storage, build_case_threads(tmp_storage, sha256s, quiet=True)[0])
+    analyzer = EmailAnalyzer(None, verbose=False)
+    email_tokens = max(estimate_tokens(analyzer._format_thread_for_analysis([email])) for email in thread)
+    token_budget = 2 * email_tokens + 1
+    parts = split_thread(thread, analyzer, token_budget)
+    assert [(start, len(part)) for start, part in parts] == [(0, 2), (2, 2), (4, 1)]
+
+    # Emails 0-2 are context only: the first part has nothing new and is not sent
+    results, remaining = analyze_email_threads(
+        tmp_storage, sha256s[3:], mock_responses_client, case_id="CASE-1", quiet=True, token_budget=token_budget
+    )
+
+    assert len(mock_responses_client.calls) == 2
+    for call in mock_responses_client.calls:
+        assert estimate_tokens(call["input"][-1]["content"]) <= token_budget
+    assert set(results) == set(sha256s[3:]) and remaining == []
+    assert [results[sha256].email_metadata["thread_position"] for sha256 in sha256s[3:]] == [3, 4]
+    assert results[sha256s[4]].email_metadata["thread_members"] == sha256s
+    # Escalation positions refer to the whole thread, not the part sent
+    assert results[sha256s[3]].email_analysis.escalation_events[0].email_position == 2
+    assert results[sha256s[4]].email_analysis.escalation_events[0].email_position == 4
+
+
+def test_thread_budget_is_decided_once_for_all_members(tmp_dir, tmp_storage, mock_responses_client):
+    """Test that a thread shares one budget decision, which members keep when the thread analysis fails."""
+    from types import SimpleNamespace
+    from evidence_toolkit.core.models import EmailThreadAnalysis, EvidenceType
+    from evidence_toolkit.core.usage import record_usage
+    from evidence_toolkit.pipeline.budget import BudgetController
+    from evidence_toolkit.pipeline.threads import analyze_email_threads
+
+    sha256s = []
+    for i in range(3):
+        headers = f"Message-ID: <m{i}@company.com>\n"
+        if i:
+            headers += f"In-Reply-To: <m{i - 1}@company.com>\nReferences: <m{i - 1}@company.com>\n"
+        path = tmp_dir / f"{i}.eml"
+        path.write_text(f"From: john.smith@company.com\nTo: hr@company.com\nSubject: {'Re: ' if i else ''}Rota\n"
+                        f"Date: Mon, 1{i} Jan 2024 14:30:00 -0500\n{headers}\nMessage {i} about the rota.\n")
+        sha256s.append(tmp_storage.ingest_file(path, "CASE-1").sha256)
+
+    # The thread answer does not validate, so every member goes back to individual analysis
+    mock_responses_client.overrides[EmailThreadAnalysis] = {}
+
+    budget = BudgetController("CASE-1", max_cost=1.0, soft_limit=0.5)
+    with budget.tracking():
+        record_usage("document_analysis", "gpt-4o-mini", SimpleNamespace(input_tokens=0, output_tokens=1_000_000))
+        results, remaining = analyze_email_threads(
+            tmp_storage, sha256s, mock_responses_client, case_id="CASE-1", quiet=True, budget=budget
+        )
+        # What the one-by-one stage asks for the handed-back members
+        decisions = [budget.decide(sha256, EvidenceType.EMAIL, "gpt-4o-mini") for sha256 in remaining]
+
+    assert results == {} and remaining == sha256s
+    assert [call["model"] for call in mock_responses_client.calls] == ["gpt-4.1-nano"]
+    assert [decision.model for decision in decisions] == ["gpt-4.1-nano"] * 3
+    report = budget.report()
+    assert [action.sha256 for action in report.downgraded] == sha256s
+    assert {(action.model_from, action.model_to) for action in report.downgraded} == {("gpt-4o-mini", "gpt-4.1-nano")}
+
+# =============================================================================
+# CONTAINER EXPANSION (MBOX)
+# =============================================================================
+
+
+def _eml_bytes(message_id, subject, body):
+    return (f"From: john.smith@company.com\nTo: hr@company.com\nSubject: {subject}\n"
+            f"Message-ID: <{message_id}@company.com>\n\n{body}\n").encode()
+
+
+def test_mbox_is_expanded_into_message_evidence(tmp_dir, tmp_storage):
+    """Test that each mbox message is stored as its own .eml evidence linked to the mailbox."""
+    import hashlib
+    from evidence_toolkit.analyzers.email_parser import EmailParser
+    from evidence_toolkit.core.utils import get_evidence_base_dir, read_json_safe
+
+    messages = [
+        _eml_bytes("m1", "Rota", "Why were my shifts moved?"),
+        _eml_bytes("m2", "Re: Rota", ">From the minutes, nothing was agreed."),
+        _eml_bytes("m3", "Parking", "Where do visitors park?"),
+    ]
+    mbox = tmp_dir / "inbox.mbox"
+    mbox.write_bytes(b"".join(
+        b"From john.smith@company.com Mon Jan 15 14:30:00 2024\n" + message + b"\n" for message in messages
+    ))
+
+    results = ingest_path(mbox, tmp_storage, case_id="CASE-1", quiet=True)
+
+    container, children = results[0], results[1:]
+    assert container.child_count == 3 and all(child.success for child in children)
+    # Same bytes (and SHA256) as the messages stored on their own
+    assert [child.sha256 for child in children] == [hashlib.sha256(message).hexdigest() for message in messages]
+    assert [child.evidence_type for child in children] == [EvidenceType.EMAIL] * 3
+    assert children[0].metadata.filename == "inbox-000001.eml"
+    assert not list(tmp_storage.raw_dir.glob(".incoming-*"))
+
+    custody = read_json_safe(get_evidence_base_dir(tmp_storage.derived_dir, children[1].sha256) / "chain_of_custody.json")
+    assert custody[-1]["metadata"]["parent_sha256"] == container.sha256
+    assert custody[-1]["metadata"]["source"] == "message 2"
+    assert set(tmp_storage.list_evidence("CASE-1")) == {container.sha256} | {child.sha256 for child in children}
+
+    parsed = tmp_storage.get_original_file_path(children[1].sha256)
+    assert EmailParser(verbose=False).parse_file(parsed)["body"].startswith(">From the minutes")
+    assert [e["headers"]["subject"] for e in EmailParser(verbose=False).parse_mbox_file(mbox)] == ["Rota", "Re: Rota", "Parking"]
+
+
+def _email_with_attachments(subject, attachments, attached_email=None):
+    from email.message import EmailMessage
+
+    message = EmailMessage()
+    message["From"], message["To"], message["Subject"] = "john.smith@company.com", "hr@company.com", subject
+    message.set_content("Please see attached.")
+    for filename, content, maintype, subtype in attachments:
+        message.add_attachment(content, maintype=maintype, subtype=subtype, filename=filename)
+    if attached_email is not None:
+        message.add_attachment(attached_email)
+    return message
+
+
+def test_email_attachments_become_child_evidence(tmp_dir, tmp_storage):
+    """Test that attachments are stored once by SHA256, linked to each email, and nested emails expanded once."""
+    import hashlib
+    from io import BytesIO
+    from PIL import Image
+    from evidence_toolkit.core.utils import get_evidence_base_dir, read_json_safe
+
+    buffer = BytesIO()
+    Image.new("RGB", (40, 30), (200, 30, 30)).save(buffer, format="PNG")
+    photo = buffer.getvalue()
+    policy_text = b"Rota policy: changes need two weeks notice.\n"
+
+    inner = _email_with_attachments("Original complaint", [("complaint.txt", b"I object to the rota.\n", "text", "plain")])
+    first = _email_with_attachments("Evidence", [("policy.txt", policy_text, "text", "plain"),
+                                                 ("photo.png", photo, "image", "png")], attached_email=inner)
+    second = _email_with_attachments("Policy again", [("policy copy.txt", policy_text, "text", "plain")])
+    mbox = tmp_dir / "evidence.mbox"
+    mbox.write_bytes(b"".join(b"From - Mon Jan 15 14:30:00 2024\n" + m.as_bytes() + b"\n" for m in (first, second)))
+
+    results = ingest_path(mbox, tmp_storage, case_id="CASE-1", quiet=True)
+
+    by_name = {}
+    for result in results[1:]:
+        by_name.setdefault(result.metadata.filename, []).append(result)
+    assert sorted(by_name) == ["attachment-3.eml", "complaint.txt", "evidence-000001.eml", "evidence-000002.eml",
+                               "photo.png", "policy copy.txt", "policy.txt"]
+    assert by_name["photo.png"][0].evidence_type == EvidenceType.IMAGE
+    assert by_name["photo.png"][0].sha256 == hashlib.sha256(photo).hexdigest()
+    assert by_name["policy.txt"][0].sha256 == by_name["policy copy.txt"][0].sha256  # Stored once
+
+    # The shared attachment's custody names both emails; the nested email's attachment is extracted once
+    policy_custody = read_json_safe(
+        get_evidence_base_dir(tmp_storage.derived_dir, by_name["policy.txt"][0].sha256) / "chain_of_custody.json"
+    )
+    parents = {event["metadata"]["parent_sha256"] for event in policy_custody if event["event_type"] == "ingest"}
+    assert parents == {by_name["evidence-000001.eml"][0].sha256, by_name["evidence-000002.eml"][0].sha256}
+    assert len(by_name["complaint.txt"]) == 1
+    assert by_name["complaint.txt"][0].parent_sha256 == by_name["attachment-3.eml"][0].sha256
+
+    message = by_name["evidence-000001.eml"][0]
+    assert message.child_count == 3 and not message.container_only  # Emails are still analyzed
+    assert results[0].container_only
+
+
+def _zip_bytes(members):
+    """In-memory ZIP archive of (name, bytes) members."""
+    from io import BytesIO
+
+    buffer = BytesIO()
+    with zipfile.ZipFile(buffer, "w") as archive:
+        for name, data in members:
+            archive.writestr(name, data)
+    return buffer.getvalue()
+
+
+def test_archive_members_are_streamed_into_storage(tmp_dir, tmp_storage):
+    """Test that tar.gz and nested zip members are stored by SHA256 with their archive path, up to the depth limit."""
+    import hashlib
+    import io
+    import tarfile
+    from evidence_toolkit.core.utils import get_evidence_base_dir, read_json_safe
+
+    notes = b"Meeting notes: the rota changed without notice.\n"
+    innermost = _zip_bytes([("deep.txt", b"Too deep to open.\n")])
+    inner = _zip_bytes([("2024/notes.txt", notes), ("__MACOSX/._notes.txt", b"fork"), ("level3.zip", innermost)])
+    archive = tmp_dir / "matter.tar.gz"
+    with tarfile.open(archive, "w:gz") as tar:
+        for name, data in (("bundle/inbox.zip", inner), ("bundle/.DS_Store", b"x")):
+            info = tarfile.TarInfo(name)
+            info.size = len(data)
+            tar.addfile(info, io.BytesIO(data))
+
+    results = ingest_path(archive, tmp_storage, case_id="CASE-1", quiet=True, max_archive_depth=2)
+
+    by_name = {result.metadata.filename: result for result in results[1:]}
+    assert sorted(by_name) == ["inbox.zip", "level3.zip", "notes.txt"]
+    assert results[0].container_only and results[0].child_count == 1
+    assert by_name["inbox.zip"].container_only and by_name["inbox.zip"].child_count == 2
+    assert not by_name["level3.zip"].container_only  # Past the limit: kept, not opened
+    assert by_name["notes.txt"].sha256 == hashlib.sha256(notes).hexdigest()
+    assert by_name["notes.txt"].file_path == f"{archive}/bundle/inbox.zip/2024/notes.txt"
+    assert not list(tmp_storage.raw_dir.glob(".incoming-*"))
+
+    custody = read_json_safe(
+        get_evidence_base_dir(tmp_storage.derived_dir, by_name["notes.txt"].sha256) / "chain_of_custody.json"
+    )
+    ingest_event = next(event for event in custody if event["event_type"] == "ingest")
+    assert ingest_event["metadata"]["archive_path"] == by_name["notes.txt"].file_path
+    assert ingest_event["metadata"]["parent_sha256"] == by_name["inbox.zip"].sha256
+
+    deep_custody = read_json_safe(
+        get_evidence_base_dir(tmp_storage.derived_dir, by_name["level3.zip"].sha256) / "chain_of_custody.json"
+    )
+    assert any(event["event_type"] == "expand_skipped" for event in deep_custody)
+
+
+def test_archive_expansion_stops_at_size_and_member_limits(tmp_dir, tmp_storage):
+    """Test that a zip bomb member is not stored and expansion stops at the total size and member limits."""
+    import zipfile
+    from evidence_toolkit.core.utils import get_evidence_base_dir, read_json_safe
+    from evidence_toolkit.pipeline.ingest import expand_archive
+
+    archive = tmp_dir / "bomb.zip"
+    with zipfile.ZipFile(archive, "w", zipfile.ZIP_DEFLATED) as bundle:
+        bundle.writestr("a.txt", b"First note.\n")
+        bundle.writestr("bomb.txt", b"\0" * (4 * 1024 * 1024))  # A few KB compressed
+        for name in ("b.txt", "c.txt", "d.txt"):
+            bundle.writestr(name, f"Note {name}.\n" * 1000)
+    assert archive.stat().st_size < 64 * 1024
+
+    def expand(**limits):
+        container = tmp_storage.ingest_file(archive, "CASE-1")
+        results = list(expand_archive(container, tmp_storage, case_id="CASE-1", **limits))
+        custody = read_json_safe(get_evidence_base_dir(tmp_storage.derived_dir, container.sha256) / "chain_of_custody.json")
+        return container, results, [event for event in custody if event["event_type"] == "expand_skipped"][-1]
+
+    container, results, event = expand(max_member_bytes=1024 * 1024)
+    assert [(result.file_path.rsplit("/", 1)[-1], result.success) for result in results] == [
+        ("a.txt", True), ("bomb.txt", False), ("b.txt", True), ("c.txt", True), ("d.txt", True)
+    ]
+    assert "member size limit" in results[1].message and container.child_count == 4
+    assert event["metadata"]["skipped_members"] == ["bomb.txt"] and event["metadata"]["stopped"] is None
+    assert not list(tmp_storage.raw_dir.glob(".incoming-*"))
+
+    # b.txt alone fits the total, c.txt would not: nothing after it is read
+    _, results, event = expand(max_total_bytes=len(b"First note.\n") + 4 * 1024 * 1024 + 15000)
+    assert [result.file_path.rsplit("/", 1)[-1] for result in results] == ["a.txt", "bomb.txt", "b.txt", "c.txt"]
+    assert not results[-1].success and "archive total size" in event["metadata"]["stopped"]
+
+    _, results, event = expand(max_members=2)
+    assert [result.file_path.rsplit("/", 1)[-1] for result in results] == ["a.txt", "bomb.txt"]
+    assert event["metadata"]["stopped"] == "member limit (2) reached"
+
+
+# =============================================================================
+# WATCH FOLDERS
+# =============================================================================
+
+
+def test_watch_directory_ingests_only_new_files(tmp_dir, tmp_storage):
+    """Test that each poll ingests new files once, and a restarted watcher resumes from the saved state."""
+    from evidence_toolkit.pipeline.watch import watch_directory
+
+    case_dir = tmp_dir / "CASE-1"
+    case_dir.mkdir()
+    (case_dir / "letter.txt").write_text("Dear HR, I raise a grievance about the rota.")
+    batches = []
+
+    def drop_file(seconds):
+        (case_dir / f"note-{len(batches)}.txt").write_text(f"File note {len(batches)} about the rota.")
+
+    count = watch_directory(case_dir, tmp_storage, "CASE-1", on_ingested=batches.append,
+                            settle_seconds=0, quiet=True, max_polls=3, sleep=drop_file)
+
+    assert count == 3
+    assert [[result.metadata.filename for result in batch] for batch in batches] == [
+        ["letter.txt"], ["note-1.txt"], ["note-2.txt"]
+    ]
+    state = tmp_storage.get_watch_state("CASE-1")
+    assert sorted(state.files) == ["letter.txt", "note-1.txt", "note-2.txt"]
+    assert state.files["letter.txt"].sha256 == batches[0][0].sha256
+    assert len(tmp_storage.list_evidence("CASE-1")) == 3
+
+    # Restart: only the file added while stopped is ingested
+    (case_dir / "late.txt").write_text("Added while the watcher was stopped.")
+    restarted = []
+    assert watch_directory(case_dir, tmp_storage, "CASE-1", on_ingested=restarted.append,
+                           settle_seconds=0, quiet=True, max_polls=1) == 1
+    assert [result.metadata.filename for result in restarted[0]] == ["late.txt"]
+
+    # A batch whose analysis fails is not recorded, so the next start hands it over again
+    (case_dir / "unanalyzed.txt").write_text("Ingested, but the analysis was interrupted.")
+
+    def fail_analysis(batch):
+        raise RuntimeError("analysis interrupted")
+
+    with pytest.raises(RuntimeError):
+        watch_directory(case_dir, tmp_storage, "CASE-1", on_ingested=fail_analysis,
+                        settle_seconds=0, quiet=True, max_polls=1)
+    assert "unanalyzed.txt" not in tmp_storage.get_watch_state("CASE-1").files
+    retried = []
+    assert watch_directory(case_dir, tmp_storage, "CASE-1", on_ingested=retried.append,
+                           settle_seconds=0, quiet=True, max_polls=1) == 1
+    assert [result.metadata.filename for result in retried[0]] == ["unanalyzed.txt"]
+
+
+# =============================================================================
+# RUN JOURNAL (RESUMABLE PROCESS-CASE)
+# =============================================================================
+
+def test_run_journal_resumes_from_failed_stage(tmp_dir, tmp_storage):
+    """Test that a failed run keeps its finished stages and items, and only one process can resume it."""
+    import json
+    import subprocess
+    import sys
+    from evidence_toolkit.core.models import CaseSummary, CorrelationAnalysis
+    from evidence_toolkit.pipeline.journal import RunJournal
+
+    journal = RunJournal.start(tmp_storage, "CASE-1", tmp_dir)
+    other = RunJournal.start(tmp_storage, "CASE-2", tmp_dir)  # Concurrent run on another case
+    assert journal.run_id != other.run_id
+
+    journal.start_stage("ingest")
+    journal.complete_stage("ingest", items=["a" * 64, "b" * 64, "c" * 64])
+    journal.start_stage("analyze")
+    journal.record_items("analyze", ["a" * 64])
+    journal.fail("analyze", RuntimeError("API outage"))
+    other.complete()
+
+    # Interrupted again while another process holds the run
+    resumed = RunJournal.resume(tmp_storage, journal.run_id, case_id="CASE-1")
+    with pytest.raises(RuntimeError, match="in progress"):
+        RunJournal.resume(tmp_storage, journal.run_id)
+    with pytest.raises(ValueError, match="belongs to case CASE-1"):
+        RunJournal.resume(tmp_storage, journal.run_id, case_id="CASE-2")
+    with pytest.raises(ValueError, match="already completed"):
+        RunJournal.resume(tmp_storage, other.run_id)
+
+    assert resumed.is_done("ingest") and not resumed.is_done("analyze")
+    assert resumed.items("ingest") == ["a" * 64, "b" * 64, "c" * 64]
+    assert resumed.items("analyze") == ["a" * 64]
+    resumed.start_stage("analyze")
+    resumed.complete_stage("analyze")
+    assert resumed.items("analyze") == ["a" * 64]  # Items from the failed attempt are kept
+
+    summary = CaseSummary(
+        case_id="CASE-1", generation_timestamp=datetime.now(), evidence_count=3,
+        correlation_result=CorrelationAnalysis(case_id="CASE-1", evidence_count=3, analysis_timestamp=datetime.now())
+    )
+    resumed.start_stage("summary")
+    resumed.save_case_summary(summary)
+    resumed.complete_stage("summary")
+
+    # The owning process died (no release): its lock is taken over
+    dead = subprocess.run([sys.executable, "-c", "import os; print(os.getpid())"], capture_output=True, text=True)
+    lock_file = tmp_storage.get_run_dir(journal.run_id) / RunJournal.LOCK_FILE
+    lock_file.write_text(json.dumps({"pid": int(dead.stdout), "host": json.loads(lock_file.read_text())["host"]}))
+    again = RunJournal.resume(tmp_storage, journal.run_id)
+    assert again.run.resumed == 2
+    assert again.load_case_summary().evidence_count == 3
+
+    # New analyses saved on resume make the checkpointed summary stale
+    again.invalidate_case_summary()
+    assert again.load_case_summary() is None and not again.is_done("summary")
+    assert not (tmp_storage.get_run_dir(journal.run_id) / RunJournal.CASE_SUMMARY_FILE).exists()
+    again.complete_stage("package", package_path="pkg.zip")
+    again.complete()
+    assert tmp_storage.get_run(journal.run_id).status == "completed"
+    assert not lock_file.exists()
+
+
+# =============================================================================
+# STARTUP (LAZY IMPORTS)
+# =============================================================================
+
+HEAVY_MODULES = ("openai", "nltk", "matplotlib", "wordcloud", "pdfplumber", "PIL")
+
+# Generous ceiling for `import evidence_toolkit.cli` (~0.4s locally; was >2s)
+CLI_IMPORT_BUDGET_SECONDS = 1.5
+
+
+def test_cli_import_skips_heavy_dependencies():
+    """Test that importing the CLI loads no analyzer dependencies and stays inside the time budget."""
+    import subprocess
+    import sys
+
+    code = (
+        "import sys, evidence_toolkit, evidence_toolkit.cli; "
+        f"print(','.join(m for m in {HEAVY_MODULES!r} if m in sys.modules))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True, text=True, check=True
+    )
+
+    assert result.stdout.strip() == ""
+
+    # -X importtime lines: "import time: self [us] | cumulative | imported package"
+    cumulative = {
+        line.split("|")[2].strip(): int(line.split("|")[1])
+        for line in result.stderr.splitlines()
+        if line.startswith("import time:") and line.count("|") == 2 and line.split("|")[1].strip().isdigit()
+    }
+    assert cumulative["evidence_toolkit.cli"] / 1_000_000 < CLI_IMPORT_BUDGET_SECONDS
+
+
+def test_lazy_package_exports_resolve():
+    """Test that PEP 562 package exports still resolve to the defining objects."""
+    import evidence_toolkit
+    from evidence_toolkit import pipeline
+    from evidence_toolkit.pipeline.packing import analyze_packed
+
+    assert pipeline.analyze_packed is analyze_packed
+    assert evidence_toolkit.analyze_evidence is pipeline.analyze_evidence
+    assert "DocumentAnalyzer" in dir(evidence_toolkit)
+    with pytest.raises(AttributeError):
+        evidence_toolkit.not_an_export
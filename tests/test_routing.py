@@ -0,0 +1,33 @@
+"""Tests for the fast/strong model cascade (core/routing.py)."""
+
+
+def test_model_router_escalation_rules():
+    """Test that only low-confidence, high-risk or failed fast results are escalated."""
+    from types import SimpleNamespace
+    from evidence_toolkit.core.routing import ModelRouter
+    from evidence_toolkit.core.usage import track_usage
+
+    router = ModelRouter("fast", "strong", confidence_threshold=0.7)
+    results = {
+        "clear": SimpleNamespace(confidence_overall=0.9, risk_flags=["deadline"]),
+        "unclear": SimpleNamespace(confidence_overall=0.4, risk_flags=[]),
+        "risky": SimpleNamespace(confidence_overall=0.95, risk_flags=["harassment", "retaliation_indicators"]),
+    }
+
+    def call_for(kind):
+        def call(model):
+            if model == "fast" and kind == "error":
+                raise RuntimeError("timeout")
+            return results.get(kind) if model == "fast" else SimpleNamespace(confidence_overall=0.99, risk_flags=[])
+        return call
+
+    with track_usage() as tracker:
+        for kind in ("clear", "unclear", "risky", "error"):
+            router.route("document_analysis", call_for(kind))
+
+    clear, unclear, risky, error = tracker.routing_decisions
+    assert not clear.escalated and clear.model_used == "fast"
+    assert unclear.escalated and unclear.model_used == "strong"
+    assert unclear.fast_confidence == 0.4 and unclear.final_confidence == 0.99
+    assert risky.reasons == ["risk flags: harassment, retaliation_indicators"]
+    assert error.escalated and error.fast_confidence is None
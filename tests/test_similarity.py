@@ -0,0 +1,35 @@
+"""Tests for near-duplicate signatures (core/similarity.py)."""
+
+from tests.conftest import NEAR_DUPLICATE_BODY, create_chat_screenshot
+
+
+def test_minhash_containment_detects_quoting_replies():
+    """Test that a reply quoting a short original is found by containment, not Jaccard similarity."""
+    from evidence_toolkit.core.similarity import MinHasher, estimate_containment, estimate_jaccard, shingles
+
+    quoted = "\n".join(f"> {line}" for line in NEAR_DUPLICATE_BODY.splitlines())
+    reply_text = ("Thanks John, I will send both documents today and copy in HR so that the appeal is not "
+                  "delayed. The regional manager has also asked to join the appeal hearing, I hope that is "
+                  f"acceptable to you.\n{quoted}")
+
+    # A reply shares few shingles with a short original overall, but contains all of it
+    hasher = MinHasher()
+    body_shingles, reply_shingles = shingles(NEAR_DUPLICATE_BODY), shingles(reply_text)
+    body, reply_signature = hasher.signature(body_shingles), hasher.signature(reply_shingles)
+    assert estimate_jaccard(body, reply_signature) < 0.85
+    assert estimate_containment(body, reply_signature, len(body_shingles), len(reply_shingles)) > 0.9
+
+
+def test_perceptual_hash_matches_resized_copies(tmp_dir):
+    """Test that a resized, recompressed copy is a near-duplicate and a different screenshot is not."""
+    from evidence_toolkit.core.similarity import hash_image_file, is_near_duplicate, perceptual_distance
+
+    original = create_chat_screenshot(1)
+    original.save(tmp_dir / "chat.png")
+    original.resize((300, 534)).save(tmp_dir / "chat-forwarded.jpg", quality=70)
+    create_chat_screenshot(2).save(tmp_dir / "other-chat.png")
+
+    hashes = {name: hash_image_file(tmp_dir / name) for name in ("chat.png", "chat-forwarded.jpg", "other-chat.png")}
+    assert is_near_duplicate(hashes["chat.png"], hashes["chat-forwarded.jpg"])
+    assert not is_near_duplicate(hashes["chat.png"], hashes["other-chat.png"])
+    assert perceptual_distance(hashes["chat.png"], hashes["other-chat.png"]) > 10
@@ -0,0 +1,38 @@
+"""Tests for the fast word tokenizer (analyzers/tokenizer.py)."""
+
+import pytest
+
+
+TOKENIZER_SAMPLE = (
+    "Re: Meeting on 12/05/2023 at 14:30 - Sarah Johnson (sarah.j@acme.co.uk) said she "
+    "cannot attend; we're gonna reschedule. Call 01234 567890 or 07700900123. "
+    "Café costs £4,500 — see para. 12. Wanna/gotta/lemme gimme the HR grievance, "
+    "HR grievance again! Contact hr-team@example.org.\n\nDisciplinary hearing 1-2-99."
+)
+
+
+def _nltk_word_frequency(text, stop_words):
+    """Original clean_text + word_tokenize + filter path (no punkt data needed)."""
+    from collections import Counter
+    from nltk.tokenize import word_tokenize
+    from evidence_toolkit.analyzers.document import DocumentAnalyzer
+
+    cleaned = DocumentAnalyzer.clean_text(object.__new__(DocumentAnalyzer), text)
+    words = [w for w in word_tokenize(cleaned, preserve_line=True) if len(w) >= 3 and w not in stop_words]
+    return dict(Counter(words))
+
+
+def test_count_words_matches_nltk_path():
+    """Test that the regex tokenizer reproduces the NLTK word frequencies exactly."""
+    from evidence_toolkit.analyzers.tokenizer import count_words
+
+    stop_words = {"the", "and", "said", "she", "see", "not"}
+    for text in [TOKENIZER_SAMPLE, TOKENIZER_SAMPLE.replace("@", " at "), "", "12/05/2023 14:30"]:
+        expected = _nltk_word_frequency(text, stop_words)
+        for backend in ("python", "numpy"):
+            result = count_words(text, stop_words, backend=backend)
+            assert list(result.items()) == list(expected.items())
+
+    assert count_words("cannot cannot gonna", set()) == {"can": 2, "not": 2, "gon": 1}
+    with pytest.raises(ValueError):
+        count_words("text", set(), backend="fortran")
@@ -0,0 +1,36 @@
+"""Tests for AI usage and cost accounting (core/usage.py)."""
+
+import pytest
+
+
+def test_call_openai_structured_records_usage(mock_responses_client):
+    """Test that every structured call reports tokens, latency, retries and cost."""
+    from evidence_toolkit.core.models import DocumentAnalysis
+    from evidence_toolkit.core.usage import track_usage, estimate_cost
+    from evidence_toolkit.core.utils import call_openai_structured
+
+    mock_responses_client.retries_taken = 2
+
+    with track_usage() as outer:
+        with track_usage() as inner:
+            call_openai_structured(
+                mock_responses_client, "gpt-4o-mini", "prompt", "text",
+                DocumentAnalysis, stage="document_analysis"
+            )
+
+    # Nested scopes both receive the record
+    assert len(inner.records) == 1
+    assert outer.records == inner.records
+
+    record = inner.records[0]
+    assert record.stage == "document_analysis"
+    assert record.model == "gpt-4o-mini"
+    assert record.input_tokens == 1000
+    assert record.cached_input_tokens == 200
+    assert record.output_tokens == 250
+    assert record.retries == 2
+    assert record.estimated_cost_usd == pytest.approx((800 * 0.15 + 200 * 0.075 + 250 * 0.60) / 1_000_000)
+
+    # Dated snapshots fall back to the base model price; unknown models are unpriced
+    assert estimate_cost("gpt-4o-mini-2024-07-18", 1000, 0) == estimate_cost("gpt-4o-mini", 1000, 0)
+    assert estimate_cost("some-unknown-model", 1000, 1000) is None
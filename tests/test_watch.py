@@ -0,0 +1,27 @@
+"""Tests for the watch-folder file poller (pipeline/watch.py)."""
+
+
+def test_folder_watcher_waits_for_files_to_settle(tmp_dir):
+    """Test that files being written are held back until unchanged, and ingested files are not returned again."""
+    import os
+    import time
+    from evidence_toolkit.pipeline.watch import FolderWatcher
+
+    old = time.time() - 3600
+    (tmp_dir / "letter.txt").write_text("Dear HR, I raise a grievance.")
+    os.utime(tmp_dir / "letter.txt", (old, old))
+    (tmp_dir / "upload.pdf.crdownload").write_text("partial download")
+    (tmp_dir / "inbox").mkdir()
+    growing = tmp_dir / "inbox" / "notes.txt"
+    growing.write_text("first half")
+
+    watcher = FolderWatcher(tmp_dir, settle_seconds=30)
+    assert watcher.poll(now=0) == [tmp_dir / "letter.txt"]  # Written long ago: settled already
+    watcher.mark_ingested(tmp_dir / "letter.txt", "a" * 64)
+
+    growing.write_text("first half, second half")  # Still being written
+    assert watcher.poll(now=20) == []
+    assert watcher.poll(now=40) == []  # Changed at 20, not yet 30s ago
+    assert watcher.poll(now=55) == [growing]
+    watcher.mark_ingested(growing, "b" * 64)
+    assert watcher.poll(now=100) == []